@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Microbenchmark of the calculator engine against the previous eval() path.
+
+Three variants are timed over a set of typical pricing expressions:
+the old regex sanitizer plus eval(), the Decimal engine with a cold cache
+(parse and compile every time) and the engine with memoized programs.
+
+Usage:
+    PYTHONPATH=src python scripts/bench_calculator.py --iterations 20000
+"""
+import argparse
+import re
+import timeit
+
+from business_assistant.infrastructure.tools.arithmetic import ArithmeticEngine
+
+EXPRESSIONS = [
+    "12000 * 3",
+    "(45000 + 12500) * 0.9",
+    "85000 * 1.19",
+    "(3 * 15900 + 2 * 8400) - 5000",
+    "150000 / 4",
+]
+
+HELPER_EXPRESSIONS = [
+    "total_linea(12000, 3, 10)",
+    "con_iva(85000)",
+    "descuento(45000 + 12500, 10)",
+]
+
+
+def eval_path(expression: str) -> str:
+    """Reproduce the previous implementation."""
+    sanitized = re.sub(r'[^0-9+\-*/().%\s]', '', expression)
+    return f"{eval(sanitized):.2f}"
+
+
+def main():
+    """Run the microbenchmark and print microseconds per expression."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=20000)
+    args = parser.parse_args()
+
+    cold = ArithmeticEngine(cache_size=0)
+    warm = ArithmeticEngine()
+
+    variants = [
+        ("eval()", lambda: [eval_path(e) for e in EXPRESSIONS]),
+        ("engine, cold cache", lambda: [cold.evaluate(e) for e in EXPRESSIONS]),
+        ("engine, memoized", lambda: [warm.evaluate(e) for e in EXPRESSIONS]),
+        ("engine helpers, memoized", lambda: [warm.evaluate(e) for e in HELPER_EXPRESSIONS]),
+    ]
+
+    print(f"{'variant':<26} {'us/expr':>9}")
+    for label, run in variants:
+        count = len(HELPER_EXPRESSIONS) if "helpers" in label else len(EXPRESSIONS)
+        seconds = min(timeit.repeat(run, number=args.iterations // count, repeat=3))
+        per_expression = seconds / (args.iterations // count * count) * 1e6
+        print(f"{label:<26} {per_expression:>9.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Benchmark order reservations under contention on a single product variant.
+
+The script sets the stock of one variant, then has N threads reserve one unit
+at a time until the stock is exhausted. It reports reservation throughput,
+latency percentiles and verifies that exactly the available units were sold
+(no oversell, no lost units). It runs against the database configured in the
+environment, so point it at a disposable database.
+
+Usage:
+    PYTHONPATH=src python scripts/bench_inventory_contention.py --variant-id 1 --stock 500 --threads 8
+"""
+import argparse
+import statistics
+import threading
+import time
+
+from business_assistant.domain.exceptions import InsufficientStockError
+from business_assistant.domain.models.order import OrderItem
+from business_assistant.infrastructure.persistence.connection import get_db_cursor
+from business_assistant.infrastructure.persistence.repositories.order_repository import PostgresOrderRepository
+
+# Lots are reset in place: order lines of earlier runs reference them, so they cannot be deleted
+SET_VARIANT_STOCK = """
+UPDATE inventory SET quantity = 0, updated_at = CURRENT_TIMESTAMP WHERE variant_id = %(variant_id)s;
+UPDATE inventory SET quantity = %(stock)s, expiration_date = NULL
+WHERE inventory_id = (SELECT MIN(inventory_id) FROM inventory WHERE variant_id = %(variant_id)s);
+INSERT INTO inventory (variant_id, quantity)
+SELECT %(variant_id)s, %(stock)s
+WHERE NOT EXISTS (SELECT 1 FROM inventory WHERE variant_id = %(variant_id)s);
+"""
+
+GET_VARIANT_STOCK = """
+SELECT COALESCE(SUM(quantity), 0) AS quantity FROM inventory WHERE variant_id = %(variant_id)s;
+"""
+
+
+def run_buyers(variant_id: int, threads: int) -> dict:
+    """Reserve one unit per order from ``threads`` concurrent buyers until stock runs out."""
+    repository = PostgresOrderRepository()
+    latencies = []
+    sold_out = [0]
+    errors = [0]
+    lock = threading.Lock()
+
+    def buyer(index: int) -> None:
+        number = f"+57310{index:07d}"
+        while True:
+            start = time.perf_counter()
+            try:
+                repository.reserve_order(number, [OrderItem(variant_id=variant_id, quantity=1)])
+            except InsufficientStockError:
+                with lock:
+                    sold_out[0] += 1
+                return
+            except Exception:
+                with lock:
+                    errors[0] += 1
+                return
+            elapsed = time.perf_counter() - start
+            with lock:
+                latencies.append(elapsed)
+
+    workers = [threading.Thread(target=buyer, args=(i,)) for i in range(threads)]
+    started = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    wall_time = time.perf_counter() - started
+
+    ordered = sorted(latencies)
+    return {
+        "orders": len(latencies),
+        "errors": errors[0],
+        "wall_time": wall_time,
+        "rps": len(latencies) / wall_time if wall_time else 0.0,
+        "p50": statistics.median(ordered) if ordered else 0.0,
+        "p95": ordered[int(0.95 * (len(ordered) - 1))] if ordered else 0.0,
+    }
+
+
+def main():
+    """Run the contention benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--variant-id", type=int, required=True)
+    parser.add_argument("--stock", type=int, default=500)
+    # Threads beyond DB_POOL_MAX_SIZE wait for a free connection
+    parser.add_argument("--threads", type=int, default=8)
+    args = parser.parse_args()
+
+    with get_db_cursor(commit=True) as cursor:
+        cursor.execute(SET_VARIANT_STOCK, {"variant_id": args.variant_id, "stock": args.stock})
+
+    result = run_buyers(args.variant_id, args.threads)
+
+    with get_db_cursor() as cursor:
+        cursor.execute(GET_VARIANT_STOCK, {"variant_id": args.variant_id})
+        remaining = cursor.fetchone()["quantity"]
+
+    print(f"orders:     {result['orders']} in {result['wall_time']:.2f}s ({result['rps']:.1f} orders/s)")
+    print(f"latency:    p50 {result['p50'] * 1000:.1f} ms, p95 {result['p95'] * 1000:.1f} ms")
+    print(f"errors:     {result['errors']}")
+    print(f"remaining:  {remaining}")
+    consistent = remaining == 0 and result["orders"] == args.stock
+    print(f"consistent: {'yes' if consistent else 'NO (oversell or lost units)'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Microbenchmark of the logging cost a conversation turn pays on its own thread.
+
+A turn logs a handful of INFO lines and, at DEBUG, dumps its state and the
+graph events. Three variants are timed at INFO level, the production
+setting, writing to a sink that stalls for --sink-latency-us per write the
+way a stdout pipe to a busy log collector does:
+
+- eager f-strings and a StreamHandler writing synchronously
+  (the previous setup, where debug messages were built even when dropped),
+- lazy %-style arguments with the same synchronous handler,
+- lazy arguments through the queue handler, with JSON formatting and the
+  write moved to the listener thread.
+
+Usage:
+    PYTHONPATH=src python scripts/bench_logging.py --turns 5000 --sink-latency-us 50
+
+The queue variant reports the time the turn's thread spends logging; the
+listener thread formats and writes concurrently.
+"""
+import argparse
+import logging
+import queue
+import time
+from logging.handlers import QueueListener
+
+from business_assistant.config.logging_config import (
+    CorrelationFilter,
+    DroppingQueueHandler,
+    JsonFormatter,
+    TEXT_FORMAT,
+    log_context,
+)
+
+# A restored conversation context and a graph event of typical size
+CONTEXT = {
+    "listed_products": [
+        {"position": i, "product_id": 100 + i, "name": f"Producto {i}", "price": 12000 + i * 500}
+        for i in range(1, 21)
+    ],
+    "cart": {"lines": [{"product_id": 101, "quantity": 2}], "total": "24000"},
+}
+EVENT = {"chatbot": {"messages": ["respuesta " * 40], "context": CONTEXT}}
+
+logger = logging.getLogger("bench.turn")
+
+
+class SlowSink:
+    """File-like sink whose writes block for a fixed time."""
+
+    def __init__(self, latency: float):
+        self.latency = latency
+
+    def write(self, text: str) -> None:
+        if self.latency:
+            time.sleep(self.latency)
+
+    def flush(self) -> None:
+        pass
+
+
+def eager_turn(user_id: str) -> None:
+    """Log one turn the way the code did before: f-strings everywhere."""
+    logger.info(f"Using restored context for user {user_id} from checkpoint")
+    logger.debug(f"Retrieved existing context for user {user_id}: {CONTEXT}")
+    logger.debug(f"Processing message with context: {CONTEXT}")
+    for _ in range(4):
+        logger.debug(f"Event: {EVENT}")
+        logger.debug(f"Updated context: {CONTEXT}")
+    logger.info(f"Reply to {user_id} for message 42: {'respuesta ' * 8}")
+
+
+def lazy_turn(user_id: str) -> None:
+    """Log one turn with arguments rendered only when the record is emitted."""
+    logger.info("Using restored context for user %s from checkpoint", user_id)
+    logger.debug("Retrieved existing context for user %s: %s", user_id, CONTEXT)
+    logger.debug("Processing message with context: %s", CONTEXT)
+    for _ in range(4):
+        logger.debug("Event: %s", EVENT)
+        logger.debug("Updated context: %s", CONTEXT)
+    logger.info("Reply to %s for message 42: %s", user_id, "respuesta " * 8)
+
+
+def run(turn, handler: logging.Handler, turns: int) -> float:
+    """Time turns with a handler installed and return microseconds per turn."""
+    logger.handlers[:] = [handler]
+    logger.propagate = False
+    logger.setLevel(logging.INFO)
+    start = time.perf_counter()
+    with log_context(request_id="bench", conversation_id="bench"):
+        for i in range(turns):
+            turn(f"+5730000{i % 100:05d}")
+    return (time.perf_counter() - start) / turns * 1e6
+
+
+def main():
+    """Run the microbenchmark and print microseconds per turn."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--turns", type=int, default=5000)
+    parser.add_argument("--sink-latency-us", type=float, default=50.0)
+    args = parser.parse_args()
+
+    sink = SlowSink(args.sink_latency_us / 1e6)
+    sync_handler = logging.StreamHandler(sink)
+    sync_handler.setFormatter(logging.Formatter(TEXT_FORMAT))
+    sync_handler.addFilter(CorrelationFilter())
+
+    sink_handler = logging.StreamHandler(sink)
+    sink_handler.setFormatter(JsonFormatter())
+    queue_handler = DroppingQueueHandler(queue.Queue(maxsize=100_000))
+    queue_handler.addFilter(CorrelationFilter())
+    listener = QueueListener(queue_handler.queue, sink_handler)
+
+    print(f"{'variant':<28} {'us/turn':>9}")
+    print(f"{'eager f-strings, sync':<28} {run(eager_turn, sync_handler, args.turns):>9.2f}")
+    print(f"{'lazy args, sync':<28} {run(lazy_turn, sync_handler, args.turns):>9.2f}")
+    listener.start()
+    queued = run(lazy_turn, queue_handler, args.turns)
+    listener.stop()
+    print(f"{'lazy args, queue + json':<28} {queued:>9.2f}")
+    print(f"dropped records: {queue_handler.dropped}")
+
+
+if __name__ == "__main__":
+    main()
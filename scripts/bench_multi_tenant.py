@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""
+Benchmark many businesses (tenants) sharing one process and one connection pool.
+
+The script registers N businesses with a one-product catalog each, then has
+several threads serve turns for random tenants: resolve the business profile,
+render its system prompt and quote its variant through the tenant-filtered
+price query. Every quote also asks for another tenant's variant to check that
+it is never returned. It reports throughput, latency percentiles, cache hit
+ratios and the memory used. It runs against the database configured in the
+environment, so point it at a disposable database (migrations applied).
+
+Usage:
+    PYTHONPATH=src python scripts/bench_multi_tenant.py --tenants 300 --requests 5000 --threads 8
+"""
+import argparse
+import random
+import statistics
+import threading
+import time
+import uuid
+
+from business_assistant.infrastructure.ai.prompts import get_system_prompt
+from business_assistant.infrastructure.monitoring import metrics
+from business_assistant.infrastructure.monitoring.resources import current_rss_mb
+from business_assistant.infrastructure.persistence.connection import get_connection_pool, get_db_cursor
+from business_assistant.infrastructure.persistence.repositories.order_repository import PostgresOrderRepository
+from business_assistant.infrastructure.services.business_registry import get_business
+
+# One business with one category, product, variant and lot per tenant, in a single statement
+SEED_TENANTS = """
+WITH b AS (
+    INSERT INTO businesses (slug, name, hours)
+    SELECT 'bench-' || %(run)s || '-' || g, 'Negocio ' || g, 'Lunes a Sábado de 7:00 AM a 7:00 PM (UTC-5)'
+    FROM generate_series(1, %(tenants)s) g
+    RETURNING business_id
+), c AS (
+    INSERT INTO categories (business_id, name)
+    SELECT business_id, 'Alimentos' FROM b
+    RETURNING category_id, business_id
+), p AS (
+    INSERT INTO products (business_id, category_id, name, description)
+    SELECT business_id, category_id, 'Miel', 'Miel de abejas' FROM c
+    RETURNING product_id, business_id
+), v AS (
+    INSERT INTO product_variants (product_id, name, sku, price)
+    SELECT product_id, 'Miel 500g', 'BENCH-' || %(run)s || '-' || business_id, 10000 + business_id FROM p
+    RETURNING variant_id, product_id
+), i AS (
+    INSERT INTO inventory (variant_id, quantity)
+    SELECT variant_id, 100 FROM v
+)
+SELECT p.business_id, v.variant_id FROM p JOIN v ON v.product_id = p.product_id;
+"""
+
+DELETE_TENANTS = """
+DELETE FROM inventory WHERE variant_id = ANY(%(variant_ids)s);
+DELETE FROM product_variants WHERE variant_id = ANY(%(variant_ids)s);
+DELETE FROM products WHERE business_id = ANY(%(business_ids)s);
+DELETE FROM categories WHERE business_id = ANY(%(business_ids)s);
+DELETE FROM businesses WHERE business_id = ANY(%(business_ids)s);
+"""
+
+
+def seed_tenants(tenants: int) -> dict:
+    """Register the tenants and return their variant by business_id."""
+    run = uuid.uuid4().hex[:8]
+    with get_db_cursor(commit=True) as cursor:
+        cursor.execute(SEED_TENANTS, {"run": run, "tenants": tenants})
+        return {row["business_id"]: row["variant_id"] for row in cursor.fetchall()}
+
+
+def run_turns(variants: dict, requests: int, threads: int) -> dict:
+    """Serve ``requests`` turns for random tenants from ``threads`` threads."""
+    repository = PostgresOrderRepository()
+    business_ids = list(variants)
+    latencies = []
+    leaks = [0]
+    errors = [0]
+    lock = threading.Lock()
+    per_thread = requests // threads
+
+    def serve() -> None:
+        for _ in range(per_thread):
+            business_id, other_id = random.sample(business_ids, 2)
+            start = time.perf_counter()
+            try:
+                business = get_business(business_id)
+                get_system_prompt(business)
+                rows = repository.get_variant_prices(
+                    [variants[business_id], variants[other_id]], [], business_id=business_id
+                )
+            except Exception:
+                with lock:
+                    errors[0] += 1
+                continue
+            elapsed = time.perf_counter() - start
+            with lock:
+                latencies.append(elapsed)
+                if [row["variant_id"] for row in rows] != [variants[business_id]]:
+                    leaks[0] += 1
+
+    workers = [threading.Thread(target=serve) for _ in range(threads)]
+    started = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    wall_time = time.perf_counter() - started
+
+    ordered = sorted(latencies)
+    return {
+        "turns": len(latencies),
+        "errors": errors[0],
+        "leaks": leaks[0],
+        "wall_time": wall_time,
+        "rps": len(latencies) / wall_time if wall_time else 0.0,
+        "p50": statistics.median(ordered) if ordered else 0.0,
+        "p95": ordered[int(0.95 * (len(ordered) - 1))] if ordered else 0.0,
+    }
+
+
+def hit_ratio(cache: str) -> float:
+    """Hit ratio of a named LRU cache."""
+    hits = metrics.get_counter("cache_hits_total", cache=cache)
+    misses = metrics.get_counter("cache_misses_total", cache=cache)
+    return hits / (hits + misses) if hits + misses else 0.0
+
+
+def main():
+    """Run the multi-tenant benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tenants", type=int, default=300)
+    parser.add_argument("--requests", type=int, default=5000)
+    # The application pool holds at most 10 connections
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--keep", action="store_true", help="Keep the benchmark tenants")
+    args = parser.parse_args()
+
+    rss_before = current_rss_mb()
+    variants = seed_tenants(args.tenants)
+    try:
+        result = run_turns(variants, args.requests, args.threads)
+    finally:
+        if not args.keep:
+            with get_db_cursor(commit=True) as cursor:
+                cursor.execute(DELETE_TENANTS, {
+                    "variant_ids": list(variants.values()),
+                    "business_ids": list(variants),
+                })
+
+    print(f"tenants:    {len(variants)} sharing a pool of {get_connection_pool().maxconn} connections")
+    print(f"turns:      {result['turns']} in {result['wall_time']:.2f}s ({result['rps']:.1f} turns/s)")
+    print(f"latency:    p50 {result['p50'] * 1000:.1f} ms, p95 {result['p95'] * 1000:.1f} ms")
+    print(f"caches:     businesses {hit_ratio('businesses'):.1%} hits, prompts {hit_ratio('system_prompts'):.1%} hits")
+    print(f"memory:     +{current_rss_mb() - rss_before:.1f} MB RSS")
+    print(f"errors:     {result['errors']}")
+    isolated = "yes" if result["leaks"] == 0 else f"NO ({result['leaks']} turns saw another tenant's variant)"
+    print(f"isolated:   {isolated}")
+
+
+if __name__ == "__main__":
+    main()
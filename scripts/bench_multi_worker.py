@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Benchmark chat throughput of the shared-state deployment mode across worker counts.
+
+For each worker count the script starts uvicorn with DEPLOYMENT_MODE=shared,
+drives /chat/message with many simulated WhatsApp numbers for a fixed time and
+reports throughput, latency percentiles and scaling efficiency relative to one
+worker. It needs the same services as the application (PostgreSQL, Toolbox and
+an OpenRouter key, or a cheap model configured through OPENROUTER_MODEL).
+
+Usage:
+    python scripts/bench_multi_worker.py --workers 1 2 4 --concurrency 32 --duration 30
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import threading
+import time
+
+import httpx
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+API_PREFIX = os.environ.get("API_PREFIX", "/ai-business-assistant/api/v1")
+
+
+def wait_until_healthy(base_url: str, timeout: float = 60.0) -> None:
+    """Wait until the server answers the health endpoint."""
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        try:
+            if httpx.get(f"{base_url}{API_PREFIX}/health", timeout=2).status_code == 200:
+                return
+        except httpx.HTTPError:
+            pass
+        time.sleep(0.5)
+    raise RuntimeError(f"Server at {base_url} did not become healthy")
+
+
+def start_server(workers: int, port: int) -> subprocess.Popen:
+    """Start uvicorn in shared deployment mode."""
+    env = dict(os.environ, DEPLOYMENT_MODE="shared", SERVER_RELOAD="False")
+    return subprocess.Popen(
+        [
+            sys.executable, "-m", "uvicorn", "main:app",
+            "--app-dir", os.path.join(ROOT_DIR, "src"),
+            "--host", "127.0.0.1", "--port", str(port),
+            "--workers", str(workers), "--log-level", "warning",
+        ],
+        env=env,
+    )
+
+
+def run_load(base_url: str, concurrency: int, duration: float, message: str) -> dict:
+    """Send chat messages from ``concurrency`` simulated users for ``duration`` seconds."""
+    latencies = []
+    errors = [0]
+    lock = threading.Lock()
+    deadline = time.time() + duration
+
+    def user_loop(index: int) -> None:
+        number = f"+57300{index:07d}"
+        with httpx.Client(base_url=base_url, timeout=120) as client:
+            while time.time() < deadline:
+                start = time.perf_counter()
+                try:
+                    response = client.post(
+                        f"{API_PREFIX}/chat/message",
+                        json={"message": message, "whatsapp_number": number},
+                    )
+                    ok = response.status_code == 200
+                except httpx.HTTPError:
+                    ok = False
+                elapsed = time.perf_counter() - start
+                with lock:
+                    if ok:
+                        latencies.append(elapsed)
+                    else:
+                        errors[0] += 1
+
+    threads = [threading.Thread(target=user_loop, args=(i,)) for i in range(concurrency)]
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    wall_time = time.perf_counter() - started
+
+    ordered = sorted(latencies)
+    return {
+        "requests": len(latencies),
+        "errors": errors[0],
+        "rps": len(latencies) / wall_time if wall_time else 0.0,
+        "p50": statistics.median(ordered) if ordered else 0.0,
+        "p95": ordered[int(0.95 * (len(ordered) - 1))] if ordered else 0.0,
+    }
+
+
+def main():
+    """Run the benchmark for every requested worker count."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--duration", type=float, default=30.0)
+    parser.add_argument("--port", type=int, default=8099)
+    parser.add_argument("--message", default="Hola, ¿qué productos tienen?")
+    args = parser.parse_args()
+
+    base_url = f"http://127.0.0.1:{args.port}"
+    results = []
+    for workers in args.workers:
+        server = start_server(workers, args.port)
+        try:
+            wait_until_healthy(base_url)
+            result = run_load(base_url, args.concurrency, args.duration, args.message)
+            results.append((workers, result))
+        finally:
+            server.terminate()
+            server.wait()
+
+    baseline_rps = results[0][1]["rps"] / results[0][0] if results and results[0][1]["rps"] else 0.0
+    print(f"{'workers':>7} {'requests':>9} {'errors':>7} {'req/s':>8} {'p50 s':>7} {'p95 s':>7} {'scaling':>8}")
+    for workers, result in results:
+        efficiency = result["rps"] / (baseline_rps * workers) if baseline_rps else 0.0
+        print(
+            f"{workers:>7} {result['requests']:>9} {result['errors']:>7} {result['rps']:>8.2f} "
+            f"{result['p50']:>7.2f} {result['p95']:>7.2f} {efficiency:>7.0%}"
+        )
+
+
+if __name__ == "__main__":
+    main()
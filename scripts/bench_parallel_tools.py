@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Benchmark per-turn tool latency with 1, 3 and 5 simultaneous tool calls.
+
+Each turn is an assistant message with N tool calls executed by the tools
+node. The stock ToolNode limited to one worker (sequential execution) is
+compared with ParallelToolNode. By default tools are simulated with a fixed
+latency; --toolbox runs the real search_available_variant_products tool
+against the Toolbox server configured in the environment.
+
+Usage:
+    PYTHONPATH=src python scripts/bench_parallel_tools.py --latency 0.25 --turns 10
+    PYTHONPATH=src python scripts/bench_parallel_tools.py --toolbox --turns 5
+"""
+import argparse
+import statistics
+import time
+
+from langchain_core.messages import AIMessage
+from langchain_core.tools import tool
+from langgraph.prebuilt import ToolNode
+
+from business_assistant.infrastructure.langgraph.nodes.tool_executor import ParallelToolNode
+
+SEARCH_TERMS = ["miel", "café", "panela", "queso", "arepa"]
+
+
+def simulated_tools(latency: float) -> list:
+    """Create a search tool that sleeps like a database round-trip."""
+
+    @tool
+    def search_available_variant_products(product_search_term: str) -> str:
+        """Search product variants."""
+        time.sleep(latency)
+        return f"[{{\"product_name\": \"{product_search_term}\"}}]"
+
+    return [search_available_variant_products]
+
+
+def toolbox_tools() -> list:
+    """Load the real search tool from the Toolbox server."""
+    from toolbox_langchain import ToolboxClient
+    from business_assistant.config.settings import settings
+
+    return [ToolboxClient(settings.toolbox_base_url).load_tool("search_available_variant_products")]
+
+
+def turn_message(calls: int) -> AIMessage:
+    """Build an assistant message searching ``calls`` products at once."""
+    return AIMessage(content="", tool_calls=[
+        {
+            "name": "search_available_variant_products",
+            "args": {"product_search_term": SEARCH_TERMS[i % len(SEARCH_TERMS)]},
+            "id": f"call-{i}",
+        }
+        for i in range(calls)
+    ])
+
+
+def measure(node, config: dict, calls: int, turns: int) -> float:
+    """Return the median turn latency in seconds."""
+    latencies = []
+    for _ in range(turns):
+        start = time.perf_counter()
+        node.invoke({"messages": [turn_message(calls)]}, config=config)
+        latencies.append(time.perf_counter() - start)
+    return statistics.median(latencies)
+
+
+def main():
+    """Run the benchmark and print a latency table."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--latency", type=float, default=0.25, help="Simulated tool latency in seconds")
+    parser.add_argument("--turns", type=int, default=10)
+    parser.add_argument("--toolbox", action="store_true", help="Use the real Toolbox search tool")
+    args = parser.parse_args()
+
+    tools = toolbox_tools() if args.toolbox else simulated_tools(args.latency)
+    sequential = ToolNode(tools)
+    parallel = ParallelToolNode(tools)
+
+    print(f"{'tool calls':>10} {'sequential ms':>14} {'parallel ms':>12} {'speedup':>8}")
+    for calls in (1, 3, 5):
+        sequential_latency = measure(sequential, {"max_concurrency": 1, "configurable": {}}, calls, args.turns)
+        parallel_latency = measure(parallel, {"configurable": {}}, calls, args.turns)
+        print(
+            f"{calls:>10} {sequential_latency * 1000:>14.1f} {parallel_latency * 1000:>12.1f} "
+            f"{sequential_latency / parallel_latency:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
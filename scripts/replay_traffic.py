@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Replay captured conversation traffic against this build of the assistant.
+
+Turns captured with TRAFFIC_CAPTURE_ENABLED are sent again through
+ChatService, keeping each customer's order and the original pacing divided
+by --speed (0 sends every turn as soon as the previous one of the customer
+is answered). The model and the Toolbox are replaced by doubles that return
+the captured responses after the captured latency, so results are
+deterministic and two builds can be compared on the same traffic. Session
+state is kept in memory unless --postgres is given.
+
+Usage:
+    PYTHONPATH=src python scripts/replay_traffic.py traffic/ --speed 1
+    PYTHONPATH=src python scripts/replay_traffic.py traffic/traffic-20261019-42.jsonl.gz --speed 0 --json
+"""
+import argparse
+import json
+
+from langgraph.checkpoint.memory import MemorySaver
+
+from business_assistant.application.services.chat_service import ChatService
+from business_assistant.infrastructure.langgraph.workflows.conversation_workflow import ConversationWorkflow
+from business_assistant.infrastructure.monitoring.traffic_recorder import read_traffic, traffic_recorder
+from business_assistant.infrastructure.monitoring.traffic_replay import (
+    RecordedChatModel,
+    TrafficRecording,
+    recorded_tools,
+    replay_turns,
+)
+from business_assistant.infrastructure.monitoring.usage_ledger import usage_ledger
+from business_assistant.infrastructure.services.conversation_manager import ConversationManager
+
+
+def main():
+    """Run the replay."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("paths", nargs="+", help="Capture files or directories")
+    parser.add_argument("--speed", type=float, default=1.0, help="Speed-up factor; 0 removes every wait")
+    parser.add_argument("--workers", type=int, default=32, help="Customers replayed at the same time")
+    parser.add_argument("--postgres", action="store_true", help="Keep session state in PostgreSQL")
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    args = parser.parse_args()
+
+    turns = list(read_traffic(args.paths))
+    recording = TrafficRecording(turns, speed=args.speed)
+    llm = RecordedChatModel(recording=recording)
+    tools = recorded_tools(recording)
+    checkpointer = None if args.postgres else MemorySaver()
+
+    # Replayed turns are neither captured again nor charged to the ledger
+    traffic_recorder.enabled = False
+    usage_ledger.enabled = False
+    ConversationManager().workflow_factory = lambda: ConversationWorkflow(
+        llm=llm, small_llm=llm, tools=tools, checkpointer=checkpointer
+    )
+
+    report = replay_turns(turns, ChatService().process_message, recording, max_workers=args.workers)
+    result = report.to_dict()
+    if args.json:
+        print(json.dumps(result, indent=2))
+        return
+
+    customers = len({(turn["user"], turn.get("business_id")) for turn in turns})
+    print(f"turns:      {result['turns']} from {customers} customers in {result['wall_seconds']:.2f}s "
+          f"({result['turns_per_second']:.1f} turns/s at speed {args.speed:g})")
+    print(f"latency:    p50 {result['latency_ms']['p50']} ms, p95 {result['latency_ms']['p95']} ms, "
+          f"p99 {result['latency_ms']['p99']} ms")
+    print(f"captured:   p50 {result['captured_latency_ms']['p50']} ms, p95 {result['captured_latency_ms']['p95']} ms, "
+          f"p99 {result['captured_latency_ms']['p99']} ms")
+    print(f"errors:     {result['errors']}")
+    print(f"diverged:   {result['missing_events']} model or tool calls without a captured response")
+
+
+if __name__ == "__main__":
+    main()
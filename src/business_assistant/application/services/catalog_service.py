@@ -0,0 +1,228 @@
+"""Catalog service for bulk import and export."""
+
+import csv
+import io
+import json
+import logging
+import queue
+import threading
+import time
+from typing import Any, Dict, IO, Iterable, Iterator, List, Optional, Union
+
+from business_assistant.domain.models.business import DEFAULT_BUSINESS_ID
+from business_assistant.domain.models.catalog import CatalogImportReport
+from business_assistant.infrastructure.monitoring import metrics
+from business_assistant.infrastructure.persistence.queries.catalog_bulk_queries import CATALOG_COLUMNS
+from business_assistant.infrastructure.persistence.repositories.catalog_repository import PostgresCatalogRepository
+from business_assistant.infrastructure.services.catalog_index import invalidate_catalog_index
+from business_assistant.infrastructure.services.category_tree import invalidate_category_tree
+
+logger = logging.getLogger(__name__)
+
+CATALOG_FORMATS = ("csv", "json")
+
+# Chunks buffered between the COPY thread and the export consumer
+EXPORT_QUEUE_SIZE = 64
+
+
+class _RecordsCSVStream(io.TextIOBase):
+    """Read-only text stream rendering catalog records as CSV rows on demand.
+
+    COPY pulls from this stream, so JSON records are converted lazily and
+    never held in memory as a whole CSV document.
+    """
+
+    def __init__(self, records: Iterable[Dict[str, Any]]):
+        self._records = iter(records)
+        self._buffer = ""
+        self._line = io.StringIO()
+        self._writer = csv.writer(self._line, lineterminator="\n")
+
+    def readable(self) -> bool:
+        return True
+
+    def read(self, size: int = -1) -> str:
+        while size < 0 or len(self._buffer) < size:
+            record = next(self._records, None)
+            if record is None:
+                break
+            self._buffer += self._render(record)
+        if size < 0:
+            chunk, self._buffer = self._buffer, ""
+        else:
+            chunk, self._buffer = self._buffer[:size], self._buffer[size:]
+        return chunk
+
+    def _render(self, record: Dict[str, Any]) -> str:
+        if not isinstance(record, dict):
+            raise ValueError("Cada registro del catálogo debe ser un objeto JSON")
+        self._line.seek(0)
+        self._line.truncate()
+        self._writer.writerow([self._format_value(record.get(column)) for column in CATALOG_COLUMNS])
+        return self._line.getvalue()
+
+    @staticmethod
+    def _format_value(value: Any) -> str:
+        if value is None:
+            return ""
+        if isinstance(value, bool):
+            return "true" if value else "false"
+        return str(value)
+
+
+class _QueueWriter(io.TextIOBase):
+    """Writable text stream that hands chunks to a consumer thread."""
+
+    def __init__(self, chunks: "queue.Queue", cancelled: threading.Event):
+        self._chunks = chunks
+        self._cancelled = cancelled
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data: str) -> int:
+        while True:
+            if self._cancelled.is_set():
+                raise IOError("Exportación cancelada por el cliente")
+            try:
+                self._chunks.put(data, timeout=1)
+                return len(data)
+            except queue.Full:
+                continue
+
+
+class CatalogService:
+    """Service for bulk loading and exporting the product catalog."""
+
+    def __init__(self):
+        """Initialize the catalog service."""
+        self.repository = PostgresCatalogRepository()
+
+    def import_catalog(
+        self,
+        stream: Union[IO[str], IO[bytes]],
+        file_format: str = "csv",
+        create_missing_categories: bool = False,
+        business_id: int = DEFAULT_BUSINESS_ID,
+    ) -> CatalogImportReport:
+        """Import a catalog file through COPY.
+
+        Args:
+            stream: The CSV (with header) or JSON file. JSON may be an array of
+                objects or one object per line.
+            file_format: Either "csv" or "json".
+            create_missing_categories: Create unknown categories instead of
+                rejecting their rows.
+            business_id: The business whose catalog is loaded.
+
+        Returns:
+            The import report with row counts and throughput.
+
+        Raises:
+            ValueError: If the format or the file layout is not supported.
+        """
+        if file_format not in CATALOG_FORMATS:
+            raise ValueError(f"Formato no soportado: {file_format}")
+
+        text_stream = self._as_text(stream)
+        if file_format == "csv":
+            columns = self._read_csv_header(text_stream)
+            csv_stream = text_stream
+        else:
+            columns = list(CATALOG_COLUMNS)
+            csv_stream = _RecordsCSVStream(self._iter_json_records(text_stream))
+
+        start = time.perf_counter()
+        result = self.repository.bulk_import(
+            csv_stream,
+            columns,
+            create_missing_categories=create_missing_categories,
+            business_id=business_id,
+        )
+        report = CatalogImportReport(elapsed_seconds=time.perf_counter() - start, **result)
+        invalidate_catalog_index(business_id)
+        if report.categories_created or report.products_created:
+            invalidate_category_tree(business_id)
+
+        metrics.increment("catalog_import_rows_total", report.rows_imported, status="imported")
+        metrics.increment("catalog_import_rows_total", report.rows_rejected, status="rejected")
+        metrics.observe("catalog_import_rows_per_second", report.rows_per_second)
+        logger.info(f"Catalog import finished at {report.rows_per_second:.0f} rows/s")
+        return report
+
+    def stream_export(self, business_id: int = DEFAULT_BUSINESS_ID) -> Iterator[str]:
+        """Stream the catalog as CSV chunks while COPY is still running.
+
+        Args:
+            business_id: The business whose catalog is exported.
+
+        Returns:
+            Iterator over CSV text chunks, starting with the header.
+        """
+        chunks: "queue.Queue" = queue.Queue(maxsize=EXPORT_QUEUE_SIZE)
+        cancelled = threading.Event()
+        done = object()
+        errors: List[Exception] = []
+
+        def run_copy() -> None:
+            try:
+                self.repository.export(_QueueWriter(chunks, cancelled), business_id)
+            except Exception as e:
+                errors.append(e)
+            finally:
+                while not cancelled.is_set():
+                    try:
+                        chunks.put(done, timeout=1)
+                        break
+                    except queue.Full:
+                        continue
+
+        worker = threading.Thread(target=run_copy, name="catalog-export", daemon=True)
+        worker.start()
+        try:
+            while True:
+                chunk = chunks.get()
+                if chunk is done:
+                    break
+                yield chunk
+            if errors:
+                raise errors[0]
+        finally:
+            # Unblocks the COPY thread if the consumer went away early
+            cancelled.set()
+
+    @staticmethod
+    def _as_text(stream: Union[IO[str], IO[bytes]]) -> IO[str]:
+        """Wrap binary streams so the rest of the pipeline reads text."""
+        if isinstance(stream, io.TextIOBase):
+            return stream
+        # utf-8-sig drops the BOM spreadsheet tools add to CSV exports
+        return io.TextIOWrapper(stream, encoding="utf-8-sig", newline="")
+
+    @staticmethod
+    def _read_csv_header(stream: IO[str]) -> List[str]:
+        """Consume the header line and return the normalized column names."""
+        header_line = stream.readline()
+        if not header_line.strip():
+            raise ValueError("El archivo CSV no tiene encabezado")
+        columns = [column.strip().lower() for column in next(csv.reader([header_line]))]
+        missing = [column for column in ("sku", "price") if column not in columns]
+        if missing:
+            raise ValueError(f"Faltan columnas obligatorias: {', '.join(missing)}")
+        return columns
+
+    @staticmethod
+    def _iter_json_records(stream: IO[str]) -> Iterator[Dict[str, Any]]:
+        """Yield records from a JSON array or from newline-delimited JSON."""
+        first_char: Optional[str] = None
+        while first_char is None or first_char.isspace():
+            first_char = stream.read(1)
+            if not first_char:
+                return
+        if first_char == "[":
+            yield from json.loads(first_char + stream.read())
+            return
+        yield json.loads(first_char + stream.readline())
+        for line in stream:
+            if line.strip():
+                yield json.loads(line)
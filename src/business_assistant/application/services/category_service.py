@@ -0,0 +1,116 @@
+"""Category service for browsing and editing the category hierarchy."""
+
+import logging
+from typing import Any, Dict, List, Optional
+
+from business_assistant.domain.exceptions import CategoryNotFoundError, InvalidCategoryParentError
+from business_assistant.domain.models.business import DEFAULT_BUSINESS_ID
+from business_assistant.infrastructure.persistence.repositories.category_repository import PostgresCategoryRepository
+from business_assistant.infrastructure.services.catalog_index import invalidate_catalog_index
+from business_assistant.infrastructure.services.category_tree import get_category_tree, invalidate_category_tree
+
+logger = logging.getLogger(__name__)
+
+
+class CategoryService:
+    """Service for the category hierarchy of a business."""
+
+    def __init__(self, business_id: int = DEFAULT_BUSINESS_ID):
+        """Initialize the category service.
+
+        Args:
+            business_id: The business whose categories are served.
+        """
+        self.business_id = business_id
+        self.repository = PostgresCategoryRepository()
+
+    def browse(self, category_id: Optional[int] = None, depth: int = 1) -> Dict[str, Any]:
+        """Get a category with its breadcrumbs and subcategories.
+
+        Args:
+            category_id: The category. None browses the root categories.
+            depth: Levels of subcategories included.
+
+        Returns:
+            The category (None at the root), its ``path`` and its ``subcategories``.
+
+        Raises:
+            CategoryNotFoundError: If the category does not exist in the business.
+        """
+        tree = get_category_tree(self.business_id)
+        if category_id is None:
+            return {
+                "category": None,
+                "path": [],
+                "subcategories": [tree.to_dict(root.category_id, depth - 1) for root in tree.children()],
+            }
+        node = tree.to_dict(category_id, depth)
+        return {
+            "category": {key: value for key, value in node.items() if key != "subcategories"},
+            "path": [{"category_id": c.category_id, "name": c.name} for c in tree.path(category_id)],
+            "subcategories": node.get("subcategories", []),
+        }
+
+    def list_products(self, category_id: int, limit: int, offset: int = 0) -> List[Dict[str, Any]]:
+        """List the products of a category and all its subcategories in one query.
+
+        Args:
+            category_id: The category.
+            limit: Maximum number of variants.
+            offset: Variants to skip.
+
+        Returns:
+            One row per active variant with its non-expired stock.
+
+        Raises:
+            CategoryNotFoundError: If the category does not exist in the business.
+        """
+        category_ids = get_category_tree(self.business_id).subtree_ids(category_id)
+        return self.repository.get_products(self.business_id, category_ids, limit, offset)
+
+    def create_category(
+        self, name: str, description: Optional[str] = None, parent_id: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """Create a category.
+
+        Raises:
+            CategoryNotFoundError: If the parent does not exist in the business.
+        """
+        row = self.repository.create_category(self.business_id, name, description, parent_id)
+        if row is None:
+            raise CategoryNotFoundError(parent_id)
+        invalidate_category_tree(self.business_id)
+        return row
+
+    def update_category(
+        self, category_id: int, name: str, description: Optional[str] = None, parent_id: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """Rename, describe or move a category with its subtree.
+
+        Raises:
+            CategoryNotFoundError: If the category or the parent does not exist in the business.
+            InvalidCategoryParentError: If the parent is the category or one of its descendants.
+        """
+        if parent_id is not None:
+            # Moves are checked against a fresh tree, so a category is not moved into its own subtree
+            invalidate_category_tree(self.business_id)
+            if parent_id in get_category_tree(self.business_id).subtree_ids(category_id):
+                raise InvalidCategoryParentError(category_id, parent_id)
+        row = self.repository.update_category(self.business_id, category_id, name, description, parent_id)
+        if row is None:
+            raise CategoryNotFoundError(category_id if parent_id is None else parent_id)
+        invalidate_category_tree(self.business_id)
+        # Searches match category names, which no variant's updated_at reflects
+        invalidate_catalog_index(self.business_id, reload=True)
+        return row
+
+    def delete_category(self, category_id: int) -> None:
+        """Delete a category without subcategories or products.
+
+        Raises:
+            CategoryNotFoundError: If the category does not exist in the business.
+            psycopg2.errors.ForeignKeyViolation: If subcategories or products reference it.
+        """
+        if not self.repository.delete_category(self.business_id, category_id):
+            raise CategoryNotFoundError(category_id)
+        invalidate_category_tree(self.business_id)
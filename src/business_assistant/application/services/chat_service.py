@@ -1,8 +1,13 @@
 """Chat service implementation with React agent integration."""
 
 import logging
+from typing import Optional
+from business_assistant.config.logging_config import log_context
 from business_assistant.domain.models.conversation import Message, Conversation
+from business_assistant.infrastructure.monitoring.traffic_recorder import traffic_recorder
+from business_assistant.infrastructure.services.business_registry import tenant_user_key
 from business_assistant.infrastructure.services.conversation_manager import ConversationManager
+from business_assistant.infrastructure.web.routing_hints import session_affinity_key
 from business_assistant.config.settings import settings
 
 logger = logging.getLogger(__name__)
@@ -21,32 +26,50 @@ class ChatService:
         
         logger.debug("ChatService initialized with ConversationManager")
 
-    def process_message(self, phone_number: str, user_message: str) -> str:
+    def process_message(
+        self, phone_number: str, user_message: str, business_id: Optional[int] = None, raise_errors: bool = False
+    ) -> str:
         """Process a user message and get the assistant's response using React agent.
 
         Args:
             phone_number: The WhatsApp number of the user (used as user_id)
             user_message: The message from the user.
+            business_id: The business the user writes to. Defaults to the default business.
+            raise_errors: Raise when the turn fails instead of answering with an
+                apology. Queue and batch workers set it so the failure is retried
+                or reported; the synchronous chat route keeps the apology.
 
         Returns:
             The assistant's response.
+
+        Raises:
+            TurnProcessingError: If the turn failed and ``raise_errors`` is set.
         """
-        # Create and add user message to conversation
-        message = Message(role="user", content=user_message)
-        self.conversation.add_message(phone_number, message)
+        # The logs of the turn carry a conversation id that does not expose the number
+        with log_context(conversation_id=session_affinity_key(tenant_user_key(phone_number, business_id))):
+            # Create and add user message to conversation
+            message = Message(role="user", content=user_message)
+            self.conversation.add_message(phone_number, message)
 
-        # Get the appropriate workflow for this user from the manager
-        workflow = self.conversation_manager.get_workflow(phone_number)
-        logger.debug(f"Retrieved workflow for user {phone_number}")
-        
-        # Process through workflow with user_id (phone_number)
-        response = workflow.process_message(phone_number, user_message)
+            # Get the appropriate workflow for this user from the manager
+            workflow = self.conversation_manager.get_workflow(phone_number, business_id)
+            logger.debug("Retrieved workflow for user %s", phone_number)
+            
+            # Sampled turns are captured, anonymized, for replay
+            capture = traffic_recorder.capture(phone_number, user_message, business_id)
+            
+            # Process through workflow with user_id (phone_number)
+            response = workflow.process_message(
+                phone_number, user_message, business_id,
+                callbacks=[capture] if capture else None, raise_errors=raise_errors,
+            )
+            traffic_recorder.record(capture, response)
 
-        # Add assistant response to conversation
-        assistant_message = Message(role="assistant", content=response)
-        self.conversation.add_message(phone_number, assistant_message)
+            # Add assistant response to conversation
+            assistant_message = Message(role="assistant", content=response)
+            self.conversation.add_message(phone_number, assistant_message)
 
-        return response
+            return response
 
     def get_conversation_history(self) -> list:
         """Get the full conversation history.
@@ -0,0 +1,196 @@
+"""Logging pipeline: non-blocking handlers, JSON output and correlation ids.
+
+Application threads only put records on a bounded in-memory queue; a
+background listener formats them and writes them to stdout. Records carry
+the request id and the conversation id of the turn that produced them,
+read from context variables that follow the request into worker threads.
+"""
+import atexit
+import contextvars
+import json
+import logging
+import queue
+import random
+import sys
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+from typing import Dict, Iterator, Optional
+
+from business_assistant.config.settings import settings
+
+# Output formats
+LOG_FORMAT_JSON = "json"
+LOG_FORMAT_TEXT = "text"
+
+TEXT_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - [%(request_id)s %(conversation_id)s] %(message)s"
+
+# Correlation ids of the code running in the current context
+request_id_var: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar("request_id", default=None)
+conversation_id_var: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar("conversation_id", default=None)
+
+_listener: Optional[QueueListener] = None
+
+
+@contextmanager
+def log_context(request_id: Optional[str] = None, conversation_id: Optional[str] = None) -> Iterator[None]:
+    """Tag the records logged inside the block with correlation ids.
+
+    Args:
+        request_id: Id of the HTTP request or queued message being served.
+        conversation_id: Id of the conversation of the turn.
+    """
+    tokens = []
+    if request_id is not None:
+        tokens.append((request_id_var, request_id_var.set(request_id)))
+    if conversation_id is not None:
+        tokens.append((conversation_id_var, conversation_id_var.set(conversation_id)))
+    try:
+        yield
+    finally:
+        for var, token in reversed(tokens):
+            var.reset(token)
+
+
+def parse_log_sampling(spec: str) -> Dict[str, float]:
+    """Parse per-logger sampling rates written as ``logger=rate,...``.
+
+    Args:
+        spec: The rates, e.g. ``business_assistant.infrastructure.langgraph=0.1``.
+
+    Returns:
+        Dictionary of logger name prefix to the fraction of records kept.
+    """
+    rates = {}
+    for entry in spec.split(","):
+        if not entry.strip():
+            continue
+        name, _, rate = entry.partition("=")
+        rates[name.strip()] = float(rate)
+    return rates
+
+
+class CorrelationFilter(logging.Filter):
+    """Copy the correlation ids of the current context onto each record."""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.request_id = request_id_var.get() or "-"
+        record.conversation_id = conversation_id_var.get() or "-"
+        return True
+
+
+class SamplingFilter(logging.Filter):
+    """Keep a fraction of the records of chatty loggers.
+
+    Warnings and errors are never dropped. The longest matching logger name
+    prefix decides the rate.
+    """
+
+    def __init__(self, rates: Dict[str, float]):
+        super().__init__()
+        # Longest prefixes first, so the most specific rate wins
+        self.rates = sorted(rates.items(), key=lambda item: len(item[0]), reverse=True)
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.WARNING:
+            return True
+        for prefix, rate in self.rates:
+            if record.name == prefix or record.name.startswith(prefix + "."):
+                return rate >= 1 or random.random() < rate
+        return True
+
+
+class JsonFormatter(logging.Formatter):
+    """Format records as one JSON object per line."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "request_id": getattr(record, "request_id", "-"),
+            "conversation_id": getattr(record, "conversation_id", "-"),
+            "thread": record.threadName,
+        }
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            entry["exception"] = record.exc_text
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+class DroppingQueueHandler(QueueHandler):
+    """Queue handler that never blocks the logging thread.
+
+    The message is rendered in the calling thread only as far as needed to
+    release its arguments; formatting and I/O happen on the listener
+    thread. When the queue is full the record is dropped and counted.
+    """
+
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # This handler is the only one on the root logger, so the record is
+        # changed in place instead of copied. Arguments may be mutated after
+        # the call returns, so the message is fixed now
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+def configure_logging(
+    level: Optional[str] = None,
+    log_format: Optional[str] = None,
+    sampling: Optional[Dict[str, float]] = None,
+    queue_size: Optional[int] = None,
+) -> QueueListener:
+    """Route every log record through the background logging pipeline.
+
+    Args:
+        level: Root log level. Defaults to LOG_LEVEL.
+        log_format: "json" or "text". Defaults to LOG_FORMAT.
+        sampling: Kept fraction by logger prefix. Defaults to LOG_SAMPLING.
+        queue_size: Records buffered before new ones are dropped. Defaults to LOG_QUEUE_SIZE.
+
+    Returns:
+        The listener writing the records, already started.
+    """
+    global _listener
+    level = (level or settings.log_level).upper()
+    log_format = log_format or settings.log_format
+    sampling = sampling if sampling is not None else parse_log_sampling(settings.log_sampling)
+    queue_size = queue_size if queue_size is not None else settings.log_queue_size
+
+    stream_handler = logging.StreamHandler(sys.stdout)
+    if log_format == LOG_FORMAT_JSON:
+        stream_handler.setFormatter(JsonFormatter())
+    else:
+        stream_handler.setFormatter(logging.Formatter(TEXT_FORMAT))
+
+    queue_handler = DroppingQueueHandler(queue.Queue(maxsize=queue_size))
+    queue_handler.addFilter(CorrelationFilter())
+    if sampling:
+        queue_handler.addFilter(SamplingFilter(sampling))
+
+    if _listener is not None:
+        _listener.stop()
+    root = logging.getLogger()
+    root.handlers[:] = [queue_handler]
+    root.setLevel(level)
+
+    _listener = QueueListener(queue_handler.queue, stream_handler, respect_handler_level=True)
+    _listener.start()
+    atexit.register(_listener.stop)
+    return _listener
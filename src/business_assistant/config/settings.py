@@ -1,6 +1,7 @@
 """Application settings module."""
 import os
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from typing import List
 from pathlib import Path
 from dotenv import load_dotenv
 
@@ -9,6 +10,10 @@ root_dir = Path(__file__).resolve().parent.parent.parent.parent
 env_path = root_dir / '.env'
 load_dotenv(dotenv_path=env_path)
 
+# Deployment modes
+DEPLOYMENT_MODE_SINGLE = "single"  # One process; per-user workflows and context cached in memory
+DEPLOYMENT_MODE_SHARED = "shared"  # Several workers or nodes; session state read from PostgreSQL
+
 
 @dataclass
 class ServerSettings:
@@ -18,11 +23,34 @@ class ServerSettings:
     port: int = int(os.getenv("SERVER_PORT", "8000"))
     reload: bool = os.getenv("SERVER_RELOAD", "True").lower() in ("true", "t", "yes", "y", "1")
     api_prefix: str = os.getenv("API_PREFIX", "/ai-business-assistant/api/v1")
+    workers: int = int(os.getenv("SERVER_WORKERS", "1"))
+    
+    # Deployment settings
+    deployment_mode: str = os.getenv("DEPLOYMENT_MODE", DEPLOYMENT_MODE_SINGLE)
+    sticky_routing_header: str = os.getenv("STICKY_ROUTING_HEADER", "")
     
     # OpenRouter settings
     openrouter_api_key: str = os.getenv("OPENROUTER_API_KEY", "")
     openrouter_base_url: str = os.getenv("OPENROUTER_BASE_URL", "https://openrouter.ai/api/v1")
     openrouter_model: str = os.getenv("OPENROUTER_MODEL", "")
+    openrouter_small_model: str = os.getenv("OPENROUTER_SMALL_MODEL", "")
+    openrouter_fallback_models: List[str] = field(default_factory=lambda: [
+        model.strip() for model in os.getenv("OPENROUTER_FALLBACK_MODELS", "").split(",") if model.strip()
+    ])
+    model_routing_enabled: bool = os.getenv("MODEL_ROUTING_ENABLED", "True").lower() in ("true", "t", "yes", "y", "1")
+    
+    # LLM HTTP client settings
+    llm_timeout_seconds: float = float(os.getenv("LLM_TIMEOUT_SECONDS", "60"))
+    llm_connect_timeout_seconds: float = float(os.getenv("LLM_CONNECT_TIMEOUT_SECONDS", "5"))
+    llm_max_connections: int = int(os.getenv("LLM_MAX_CONNECTIONS", "50"))
+    llm_keepalive_expiry: float = float(os.getenv("LLM_KEEPALIVE_EXPIRY", "30"))
+    llm_http2: bool = os.getenv("LLM_HTTP2", "True").lower() in ("true", "t", "yes", "y", "1")
+    llm_max_retries: int = int(os.getenv("LLM_MAX_RETRIES", "2"))
+    llm_backoff_base_seconds: float = float(os.getenv("LLM_BACKOFF_BASE_SECONDS", "0.5"))
+    llm_backoff_max_seconds: float = float(os.getenv("LLM_BACKOFF_MAX_SECONDS", "8"))
+    llm_hedge_delay_seconds: float = float(os.getenv("LLM_HEDGE_DELAY_SECONDS", "0"))
+    llm_circuit_failure_threshold: int = int(os.getenv("LLM_CIRCUIT_FAILURE_THRESHOLD", "5"))
+    llm_circuit_reset_seconds: float = float(os.getenv("LLM_CIRCUIT_RESET_SECONDS", "30"))
     
     # Site settings
     site_url: str = os.getenv("SITE_URL", "http://localhost:8080")
@@ -34,8 +62,107 @@ class ServerSettings:
     db_name: str = os.getenv("POSTGRES_DB", "business_assistant")
     db_user: str = os.getenv("POSTGRES_USER", "postgres")
     db_password: str = os.getenv("POSTGRES_PASSWORD", "postgres")
+    # Connections shared by requests and background workers; getconn waits up to DB_POOL_TIMEOUT_SECONDS when all are busy
+    db_pool_min_size: int = int(os.getenv("DB_POOL_MIN_SIZE", "1"))
+    db_pool_max_size: int = int(os.getenv("DB_POOL_MAX_SIZE", "10"))
+    db_pool_timeout_seconds: float = float(os.getenv("DB_POOL_TIMEOUT_SECONDS", "30"))
     
     # Toolbox settings
     toolbox_base_url: str = os.getenv("TOOLBOX_BASE_URL", "http://0.0.0.0:5000")
+    
+    # Chat admission settings (CHAT_RATE_LIMIT_PER_MINUTE=0 disables the per-number limit)
+    chat_rate_limit_per_minute: float = float(os.getenv("CHAT_RATE_LIMIT_PER_MINUTE", "20"))
+    chat_rate_limit_burst: int = int(os.getenv("CHAT_RATE_LIMIT_BURST", "5"))
+    chat_max_concurrency: int = int(os.getenv("CHAT_MAX_CONCURRENCY", "32"))
+    chat_max_queue: int = int(os.getenv("CHAT_MAX_QUEUE", "64"))
+    chat_queue_timeout_seconds: float = float(os.getenv("CHAT_QUEUE_TIMEOUT_SECONDS", "10"))
+    
+    # Inbound queue settings (INBOUND_WORKERS threads poll the queue; 0, the default, accepts webhooks without processing them here)
+    inbound_workers: int = int(os.getenv("INBOUND_WORKERS", "0"))
+    inbound_poll_interval: float = float(os.getenv("INBOUND_POLL_INTERVAL", "0.5"))
+    inbound_max_attempts: int = int(os.getenv("INBOUND_MAX_ATTEMPTS", "5"))
+    inbound_retry_backoff_seconds: float = float(os.getenv("INBOUND_RETRY_BACKOFF_SECONDS", "5"))
+    inbound_visibility_timeout: float = float(os.getenv("INBOUND_VISIBILITY_TIMEOUT", "300"))
+    
+    # Batch chat settings (BATCH_WORKERS bounds the turns batches run at once)
+    batch_workers: int = int(os.getenv("BATCH_WORKERS", "4"))
+    batch_max_items: int = int(os.getenv("BATCH_MAX_ITEMS", "1000"))
+    batch_max_jobs: int = int(os.getenv("BATCH_MAX_JOBS", "100"))
+    batch_job_ttl_seconds: float = float(os.getenv("BATCH_JOB_TTL_SECONDS", "3600"))
+    
+    # Outbound delivery settings (OUTBOUND_SENDER: log | http)
+    outbound_sender: str = os.getenv("OUTBOUND_SENDER", "log")
+    outbound_webhook_url: str = os.getenv("OUTBOUND_WEBHOOK_URL", "")
+    outbound_timeout_seconds: float = float(os.getenv("OUTBOUND_TIMEOUT_SECONDS", "10"))
+    
+    # Tenant settings (profiles are reloaded from the businesses table after BUSINESS_CACHE_TTL seconds)
+    business_cache_size: int = int(os.getenv("BUSINESS_CACHE_SIZE", "1000"))
+    business_cache_ttl: float = float(os.getenv("BUSINESS_CACHE_TTL", "300"))
+    
+    # Catalog search index settings (CATALOG_INDEX_ENABLED=False searches through the Toolbox SQL tools)
+    catalog_index_enabled: bool = os.getenv("CATALOG_INDEX_ENABLED", "True").lower() in ("true", "t", "yes", "y", "1")
+    catalog_index_refresh_seconds: float = float(os.getenv("CATALOG_INDEX_REFRESH_SECONDS", "30"))
+    catalog_index_max_businesses: int = int(os.getenv("CATALOG_INDEX_MAX_BUSINESSES", "200"))
+    
+    # Category tree settings (trees are reloaded after CATEGORY_TREE_REFRESH_SECONDS or when a category is edited)
+    category_tree_refresh_seconds: float = float(os.getenv("CATEGORY_TREE_REFRESH_SECONDS", "300"))
+    category_tree_max_businesses: int = int(os.getenv("CATEGORY_TREE_MAX_BUSINESSES", "200"))
+    category_products_limit: int = int(os.getenv("CATEGORY_PRODUCTS_LIMIT", "20"))
+    
+    # Inventory alert settings (INVENTORY_ALERT_NOTIFIER: log | outbound, sent to the business phone)
+    inventory_alerts_enabled: bool = os.getenv("INVENTORY_ALERTS_ENABLED", "False").lower() in ("true", "t", "yes", "y", "1")
+    inventory_alert_interval_seconds: float = float(os.getenv("INVENTORY_ALERT_INTERVAL_SECONDS", "300"))
+    inventory_low_stock_threshold: int = int(os.getenv("INVENTORY_LOW_STOCK_THRESHOLD", "5"))
+    inventory_expiration_days: int = int(os.getenv("INVENTORY_EXPIRATION_DAYS", "7"))
+    inventory_alert_notifier: str = os.getenv("INVENTORY_ALERT_NOTIFIER", "log")
+    
+    # Conversation state settings
+    thread_state_cache_size: int = int(os.getenv("THREAD_STATE_CACHE_SIZE", "1024"))
+    
+    # Workflow registry settings
+    workflow_registry_size: int = int(os.getenv("WORKFLOW_REGISTRY_SIZE", "500"))
+    workflow_idle_ttl: int = int(os.getenv("WORKFLOW_IDLE_TTL", "3600"))
+    workflow_registry_max_rss_mb: int = int(os.getenv("WORKFLOW_REGISTRY_MAX_RSS_MB", "0"))
+    workflow_sweep_interval: int = int(os.getenv("WORKFLOW_SWEEP_INTERVAL", "60"))
+    
+    # Agent budget settings
+    agent_max_tool_iterations: int = int(os.getenv("AGENT_MAX_TOOL_ITERATIONS", "6"))
+    agent_turn_deadline_seconds: float = float(os.getenv("AGENT_TURN_DEADLINE_SECONDS", "45"))
+    # Extra time for the answer without tools once the deadline has passed (0 sends a fixed apology instead)
+    agent_degraded_answer_seconds: float = float(os.getenv("AGENT_DEGRADED_ANSWER_SECONDS", "10"))
+    # Recent messages sent to the agent each turn (0 sends the whole history)
+    agent_history_messages: int = int(os.getenv("AGENT_HISTORY_MESSAGES", "20"))
+    
+    # Tool execution settings (TOOL_TIMEOUTS: "tool_name=seconds,..." overrides; reserve_order is always waited for)
+    tool_max_concurrency: int = int(os.getenv("TOOL_MAX_CONCURRENCY", "16"))
+    tool_timeout_seconds: float = float(os.getenv("TOOL_TIMEOUT_SECONDS", "20"))
+    tool_timeouts: str = os.getenv("TOOL_TIMEOUTS", "")
+    
+    # Usage ledger settings (LLM_PRICES: "model=input:output[:cached],..." in USD per million tokens, "*" for any model)
+    usage_ledger_enabled: bool = os.getenv("USAGE_LEDGER_ENABLED", "True").lower() in ("true", "t", "yes", "y", "1")
+    usage_ledger_batch_size: int = int(os.getenv("USAGE_LEDGER_BATCH_SIZE", "100"))
+    usage_ledger_flush_interval: float = float(os.getenv("USAGE_LEDGER_FLUSH_INTERVAL", "5"))
+    usage_ledger_max_buffer: int = int(os.getenv("USAGE_LEDGER_MAX_BUFFER", "10000"))
+    llm_prices: str = os.getenv("LLM_PRICES", "")
+    
+    # Traffic capture settings (anonymized turns for scripts/replay_traffic.py)
+    traffic_capture_enabled: bool = os.getenv("TRAFFIC_CAPTURE_ENABLED", "False").lower() in ("true", "t", "yes", "y", "1")
+    traffic_capture_dir: str = os.getenv("TRAFFIC_CAPTURE_DIR", "traffic")
+    traffic_capture_sample_rate: float = float(os.getenv("TRAFFIC_CAPTURE_SAMPLE_RATE", "1.0"))
+    traffic_capture_salt: str = os.getenv("TRAFFIC_CAPTURE_SALT", "")
+    
+    # Admin settings (ADMIN_API_TOKEN unset disables the admin routes and per-request profiling)
+    admin_api_token: str = os.getenv("ADMIN_API_TOKEN", "")
+    profiler_max_seconds: float = float(os.getenv("PROFILER_MAX_SECONDS", "300"))
+    
+    # Logging settings (LOG_FORMAT: json | text; LOG_SAMPLING: logger=rate,... for records below WARNING)
+    log_level: str = os.getenv("LOG_LEVEL", "INFO")
+    log_format: str = os.getenv("LOG_FORMAT", "json")
+    log_sampling: str = os.getenv("LOG_SAMPLING", "")
+    log_queue_size: int = int(os.getenv("LOG_QUEUE_SIZE", "10000"))
+    
+    # Pricing settings
+    iva_rate: str = os.getenv("IVA_RATE", "19")
+    prices_include_iva: bool = os.getenv("PRICES_INCLUDE_IVA", "True").lower() in ("true", "t", "yes", "y", "1")
 
 settings = ServerSettings()
\ No newline at end of file
@@ -0,0 +1,69 @@
+"""Domain-specific exceptions."""
+
+from typing import Iterable
+
+
+class DomainError(Exception):
+    """Base class for business rule violations."""
+
+
+class ProductVariantNotFoundError(DomainError):
+    """Raised when an order references variants that do not exist or are inactive."""
+
+    def __init__(self, variant_ids: Iterable[int]):
+        self.variant_ids = sorted(variant_ids)
+        super().__init__(f"Variantes no disponibles: {', '.join(str(v) for v in self.variant_ids)}")
+
+
+class InsufficientStockError(DomainError):
+    """Raised when a variant does not have enough non-expired stock."""
+
+    def __init__(self, variant_id: int, requested: int, available: int):
+        self.variant_id = variant_id
+        self.requested = requested
+        self.available = available
+        super().__init__(
+            f"Inventario insuficiente para la variante {variant_id}: "
+            f"solicitadas {requested}, disponibles {available}"
+        )
+
+
+class OrderNotFoundError(DomainError):
+    """Raised when an order does not exist."""
+
+    def __init__(self, order_id: int):
+        self.order_id = order_id
+        super().__init__(f"Pedido {order_id} no encontrado")
+
+
+class BusinessNotFoundError(DomainError):
+    """Raised when a business does not exist or is inactive."""
+
+    def __init__(self, business_id: int):
+        self.business_id = business_id
+        super().__init__(f"Negocio {business_id} no encontrado")
+
+
+class CategoryNotFoundError(DomainError):
+    """Raised when a category does not exist in the business."""
+
+    def __init__(self, category_id: int):
+        self.category_id = category_id
+        super().__init__(f"Categoría {category_id} no encontrada")
+
+
+class InvalidCategoryParentError(DomainError):
+    """Raised when a category would be moved under itself or one of its descendants."""
+
+    def __init__(self, category_id: int, parent_id: int):
+        self.category_id = category_id
+        self.parent_id = parent_id
+        super().__init__(f"La categoría {parent_id} no puede ser padre de la categoría {category_id}")
+
+
+class TurnProcessingError(DomainError):
+    """Raised when the assistant could not answer a message (model, agent or database failure)."""
+
+    def __init__(self, reason: str):
+        self.reason = reason
+        super().__init__(f"No se pudo procesar el mensaje: {reason}")
@@ -0,0 +1,38 @@
+"""Business (tenant) domain models."""
+
+from dataclasses import dataclass
+from datetime import datetime
+from decimal import Decimal
+from typing import List, Optional
+
+# Business that owns the data created before multi-tenancy, and requests that name none
+DEFAULT_BUSINESS_ID = 1
+
+
+@dataclass
+class Business:
+    """Micro-business served by the assistant, with its public profile and pricing overrides."""
+
+    business_id: int
+    slug: str
+    name: str
+    assistant_name: str = "Sara"
+    hours: Optional[str] = None
+    address: Optional[str] = None
+    phone: Optional[str] = None
+    email: Optional[str] = None
+    iva_rate: Optional[Decimal] = None  # None uses IVA_RATE
+    prices_include_iva: Optional[bool] = None  # None uses PRICES_INCLUDE_IVA
+    active: bool = True
+    updated_at: Optional[datetime] = None
+
+    def profile_lines(self) -> List[str]:
+        """Public information of the business shown to customers, one line per known field."""
+        fields = [
+            ("Nombre", self.name),
+            ("Horario de Atención", self.hours),
+            ("Dirección", self.address),
+            ("Teléfono", self.phone),
+            ("Correo", self.email),
+        ]
+        return [f"- {label}: {value}" for label, value in fields if value]
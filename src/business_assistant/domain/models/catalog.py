@@ -0,0 +1,51 @@
+"""Catalog domain models."""
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, List
+
+
+@dataclass
+class CatalogImportReport:
+    """Outcome of a bulk catalog import."""
+
+    rows_received: int = 0
+    rows_rejected: int = 0
+    categories_created: int = 0
+    products_created: int = 0
+    products_updated: int = 0
+    variants_created: int = 0
+    variants_updated: int = 0
+    inventory_lots_created: int = 0
+    inventory_lots_updated: int = 0
+    elapsed_seconds: float = 0.0
+    rejects: List[Dict[str, Any]] = field(default_factory=list)
+
+    @property
+    def rows_imported(self) -> int:
+        """Number of rows that passed validation and were upserted."""
+        return self.rows_received - self.rows_rejected
+
+    @property
+    def rows_per_second(self) -> float:
+        """Import throughput over received rows."""
+        if self.elapsed_seconds <= 0:
+            return 0.0
+        return self.rows_received / self.elapsed_seconds
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert the report to dictionary format."""
+        return {
+            "rows_received": self.rows_received,
+            "rows_imported": self.rows_imported,
+            "rows_rejected": self.rows_rejected,
+            "categories_created": self.categories_created,
+            "products_created": self.products_created,
+            "products_updated": self.products_updated,
+            "variants_created": self.variants_created,
+            "variants_updated": self.variants_updated,
+            "inventory_lots_created": self.inventory_lots_created,
+            "inventory_lots_updated": self.inventory_lots_updated,
+            "elapsed_seconds": round(self.elapsed_seconds, 3),
+            "rows_per_second": round(self.rows_per_second, 1),
+            "rejects": self.rejects,
+        }
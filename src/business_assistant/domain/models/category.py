@@ -0,0 +1,17 @@
+"""Product category domain models."""
+
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+
+@dataclass
+class Category:
+    """Node of the category hierarchy of a business."""
+
+    category_id: int
+    name: str
+    parent_id: Optional[int] = None
+    description: Optional[str] = None
+    depth: int = 0
+    product_count: int = 0  # Products filed directly under this category
+    children: List[int] = field(default_factory=list)
@@ -0,0 +1,26 @@
+"""Inbound message domain models."""
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+
+# Inbound message statuses
+INBOUND_STATUS_QUEUED = "queued"
+INBOUND_STATUS_PROCESSING = "processing"
+INBOUND_STATUS_DONE = "done"
+INBOUND_STATUS_DEAD = "dead"
+
+
+@dataclass
+class InboundMessage:
+    """Customer message waiting in the durable queue."""
+
+    message_id: int
+    whatsapp_number: str
+    body: str
+    attempts: int = 0
+    business_id: Optional[int] = None
+    external_id: Optional[str] = None
+    response: Optional[str] = None
+    created_at: Optional[datetime] = None
+    queued_seconds: Optional[float] = None
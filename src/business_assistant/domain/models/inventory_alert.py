@@ -0,0 +1,54 @@
+"""Inventory alert domain models."""
+
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Optional
+
+# Alert kinds
+ALERT_LOW_STOCK = "low_stock"
+ALERT_EXPIRING = "expiring"
+
+
+@dataclass
+class InventoryAlert:
+    """Stock condition the business owner is told about."""
+
+    kind: str
+    business_id: int
+    ref_id: int  # variant_id of a low-stock alert, inventory_id of an expiring lot
+    product_name: str
+    variant_name: Optional[str] = None
+    sku: Optional[str] = None
+    quantity: int = 0
+    expiration_date: Optional[date] = None
+
+    @property
+    def key(self) -> tuple:
+        """Identity of the alert across runs."""
+        return self.kind, self.ref_id
+
+    def describe(self) -> str:
+        """One line of the notification sent to the owner."""
+        name = f"{self.product_name} ({self.variant_name})" if self.variant_name else self.product_name
+        sku = f" [{self.sku}]" if self.sku else ""
+        if self.kind == ALERT_EXPIRING:
+            return f"- {name}{sku}: {self.quantity} unidades vencen el {self.expiration_date:%d/%m/%Y}"
+        return f"- {name}{sku}: quedan {self.quantity} unidades"
+
+
+@dataclass
+class AlertRunReport:
+    """Work done by one run of the alert engine."""
+
+    started_at: datetime
+    full_scan: bool
+    low_stock_rows: int = 0
+    expiration_rows: int = 0
+    alerts_emitted: int = 0
+    alerts_resolved: int = 0
+    seconds: float = 0.0
+
+    @property
+    def rows_scanned(self) -> int:
+        """Candidate rows read by the run."""
+        return self.low_stock_rows + self.expiration_rows
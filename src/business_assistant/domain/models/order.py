@@ -0,0 +1,76 @@
+"""Order domain models."""
+
+from dataclasses import dataclass, field
+from datetime import datetime
+from decimal import Decimal
+from typing import Any, Dict, List, Optional
+
+# Order statuses
+ORDER_STATUS_RESERVED = "reserved"
+ORDER_STATUS_CANCELLED = "cancelled"
+
+
+@dataclass
+class OrderItem:
+    """Requested quantity of a product variant."""
+
+    variant_id: int
+    quantity: int
+
+    def __post_init__(self):
+        if self.quantity <= 0:
+            raise ValueError("La cantidad debe ser mayor que cero")
+
+
+@dataclass
+class OrderLine:
+    """Quantity of a variant reserved from one inventory lot."""
+
+    variant_id: int
+    variant_name: str
+    inventory_id: int
+    quantity: int
+    unit_price: Decimal
+
+    @property
+    def line_total(self) -> Decimal:
+        """Price of the line."""
+        return self.unit_price * self.quantity
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert order line to dictionary format."""
+        return {
+            "variant_id": self.variant_id,
+            "variant_name": self.variant_name,
+            "inventory_id": self.inventory_id,
+            "quantity": self.quantity,
+            "unit_price": str(self.unit_price),
+            "line_total": str(self.line_total),
+        }
+
+
+@dataclass
+class Order:
+    """Customer order with its reserved lines."""
+
+    order_id: int
+    whatsapp_number: str
+    status: str
+    lines: List[OrderLine] = field(default_factory=list)
+    created_at: Optional[datetime] = None
+
+    @property
+    def total(self) -> Decimal:
+        """Total price of the order."""
+        return sum((line.line_total for line in self.lines), Decimal("0"))
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert order to dictionary format."""
+        return {
+            "order_id": self.order_id,
+            "whatsapp_number": self.whatsapp_number,
+            "status": self.status,
+            "total": str(self.total),
+            "lines": [line.to_dict() for line in self.lines],
+            "created_at": self.created_at.isoformat() if self.created_at else None,
+        }
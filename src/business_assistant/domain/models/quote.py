@@ -0,0 +1,110 @@
+"""Order quote domain models."""
+
+from dataclasses import dataclass, field
+from decimal import Decimal, ROUND_HALF_UP
+from typing import Any, Dict, List, Optional
+
+# Colombian pesos are quoted in whole units
+COP_QUANTUM = Decimal("1")
+
+_HUNDRED = Decimal("100")
+
+
+def round_cop(value: Decimal) -> Decimal:
+    """Round an amount half up to whole pesos."""
+    return value.quantize(COP_QUANTUM, rounding=ROUND_HALF_UP)
+
+
+@dataclass
+class QuoteLine:
+    """Priced quantity of a product variant."""
+
+    variant_id: int
+    sku: str
+    variant_name: str
+    quantity: int
+    unit_price: Decimal
+    discount_percent: Decimal = Decimal("0")
+    available: Optional[int] = None
+
+    @property
+    def subtotal(self) -> Decimal:
+        """Price of the line before discounts."""
+        return self.unit_price * self.quantity
+
+    @property
+    def discount(self) -> Decimal:
+        """Discount amount of the line."""
+        return round_cop(self.subtotal * self.discount_percent / _HUNDRED)
+
+    @property
+    def total(self) -> Decimal:
+        """Price of the line after discounts."""
+        return round_cop(self.subtotal) - self.discount
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert quote line to dictionary format."""
+        return {
+            "variant_id": self.variant_id,
+            "sku": self.sku,
+            "variant_name": self.variant_name,
+            "quantity": self.quantity,
+            "unit_price": str(round_cop(self.unit_price)),
+            "subtotal": str(round_cop(self.subtotal)),
+            "discount_percent": str(self.discount_percent),
+            "discount": str(self.discount),
+            "total": str(self.total),
+            "available": self.available,
+            "enough_stock": self.available is None or self.available >= self.quantity,
+        }
+
+
+@dataclass
+class Quote:
+    """Price breakdown of a prospective order.
+
+    When ``prices_include_tax`` is set, catalog prices already contain IVA and
+    the tax is reported as the portion of the total it represents.
+    """
+
+    lines: List[QuoteLine]
+    tax_rate: Decimal
+    prices_include_tax: bool = True
+    not_found: List[str] = field(default_factory=list)
+
+    @property
+    def subtotal(self) -> Decimal:
+        """Sum of line prices before discounts."""
+        return sum((round_cop(line.subtotal) for line in self.lines), Decimal("0"))
+
+    @property
+    def discount(self) -> Decimal:
+        """Sum of line discounts."""
+        return sum((line.discount for line in self.lines), Decimal("0"))
+
+    @property
+    def tax(self) -> Decimal:
+        """IVA amount of the quote."""
+        net = self.subtotal - self.discount
+        if self.prices_include_tax:
+            return round_cop(net - net * _HUNDRED / (_HUNDRED + self.tax_rate))
+        return round_cop(net * self.tax_rate / _HUNDRED)
+
+    @property
+    def total(self) -> Decimal:
+        """Amount the customer pays."""
+        net = self.subtotal - self.discount
+        return net if self.prices_include_tax else net + self.tax
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert quote to dictionary format."""
+        return {
+            "lines": [line.to_dict() for line in self.lines],
+            "subtotal": str(self.subtotal),
+            "discount": str(self.discount),
+            "tax_rate": str(self.tax_rate),
+            "prices_include_tax": self.prices_include_tax,
+            "tax": str(self.tax),
+            "total": str(self.total),
+            "not_found": self.not_found,
+        }
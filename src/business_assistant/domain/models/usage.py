@@ -0,0 +1,30 @@
+"""Token usage and cost domain models."""
+
+from dataclasses import dataclass, field
+from datetime import datetime
+from decimal import Decimal
+from typing import Dict, Optional
+
+
+@dataclass
+class TurnUsage:
+    """LLM usage and cost of one conversation turn."""
+
+    thread_id: str
+    route: str
+    business_id: Optional[int] = None
+    whatsapp_number: Optional[str] = None
+    model: Optional[str] = None
+    llm_calls: int = 0
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    cached_tokens: int = 0
+    tool_calls: Dict[str, int] = field(default_factory=dict)
+    wall_ms: int = 0
+    cost: Decimal = Decimal("0")
+    created_at: Optional[datetime] = None
+
+    @property
+    def total_tool_calls(self) -> int:
+        """Number of tool calls requested in the turn."""
+        return sum(self.tool_calls.values())
@@ -0,0 +1,336 @@
+"""Shared HTTP client for LLM calls with retries, hedging, circuit breaking and model fallback."""
+import json
+import logging
+import random
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, TimeoutError as FutureTimeoutError, wait
+from typing import Callable, Dict, List, Optional
+
+import httpx
+
+from business_assistant.config.settings import settings
+from business_assistant.infrastructure.monitoring import metrics
+
+logger = logging.getLogger(__name__)
+
+# Responses worth retrying: rate limiting and transient upstream failures
+RETRYABLE_STATUS_CODES = frozenset({408, 429, 500, 502, 503, 504})
+
+# Circuit breaker states
+CIRCUIT_CLOSED = "closed"
+CIRCUIT_OPEN = "open"
+CIRCUIT_HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(httpx.TransportError):
+    """Raised when every candidate model has its circuit open."""
+
+
+class CircuitBreaker:
+    """Consecutive-failure circuit breaker.
+
+    After ``failure_threshold`` consecutive failures the circuit opens and
+    requests are rejected for ``reset_timeout`` seconds. Then a single trial
+    request is let through: success closes the circuit, failure opens it again.
+    """
+
+    def __init__(self, failure_threshold: int, reset_timeout: float):
+        """Initialize the breaker.
+
+        Args:
+            failure_threshold: Consecutive failures that open the circuit.
+            reset_timeout: Seconds the circuit stays open before a trial request.
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        """Current state of the circuit."""
+        with self._lock:
+            return self._state(time.monotonic())
+
+    def _state(self, now: float) -> str:
+        if self._opened_at is None:
+            return CIRCUIT_CLOSED
+        if now - self._opened_at >= self.reset_timeout:
+            return CIRCUIT_HALF_OPEN
+        return CIRCUIT_OPEN
+
+    def allow_request(self) -> bool:
+        """Check whether a request may be sent."""
+        with self._lock:
+            state = self._state(time.monotonic())
+            if state == CIRCUIT_CLOSED:
+                return True
+            if state == CIRCUIT_HALF_OPEN and not self._trial_in_flight:
+                self._trial_in_flight = True
+                return True
+            return False
+
+    def record_success(self) -> None:
+        """Close the circuit after a successful request."""
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        """Count a failed request, opening the circuit at the threshold."""
+        with self._lock:
+            self._failures += 1
+            self._trial_in_flight = False
+            if self._opened_at is not None or self._failures >= self.failure_threshold:
+                self._opened_at = time.monotonic()
+
+
+class ResilientTransport(httpx.BaseTransport):
+    """Transport adding retries, hedging, per-model circuit breakers and model fallback.
+
+    Retryable responses and transport errors are retried with exponential
+    backoff and full jitter, honouring ``Retry-After``. When a model keeps
+    failing, or its circuit is open, the request is re-sent with the next
+    model of the fallback list by rewriting the ``model`` field of the JSON
+    body, so the fallback is invisible to the OpenAI client above.
+    """
+
+    def __init__(
+        self,
+        transport: httpx.BaseTransport,
+        max_retries: int = 2,
+        backoff_base: float = 0.5,
+        backoff_max: float = 8.0,
+        hedge_delay: float = 0.0,
+        hedge_workers: int = 32,
+        fallback_models: Optional[List[str]] = None,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        """Initialize the transport.
+
+        Args:
+            transport: Transport that sends the requests.
+            max_retries: Retries per model after the first attempt.
+            backoff_base: Backoff of the first retry in seconds.
+            backoff_max: Maximum backoff in seconds.
+            hedge_delay: Seconds before a duplicate request is sent if the
+                first one has not answered. Zero disables hedging.
+            hedge_workers: Threads available for hedged requests.
+            fallback_models: Models tried in order when the requested one fails.
+            failure_threshold: Consecutive failures that open a model's circuit.
+            reset_timeout: Seconds a circuit stays open.
+            sleep: Function used to wait between retries.
+        """
+        self._transport = transport
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.hedge_delay = hedge_delay
+        self.fallback_models = list(fallback_models or [])
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._sleep = sleep
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._breakers_lock = threading.Lock()
+        self._hedge_pool = (
+            ThreadPoolExecutor(max_workers=hedge_workers, thread_name_prefix="llm-hedge") if hedge_delay > 0 else None
+        )
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        body = self._json_body(request)
+        requested_model = body.get("model") if body else None
+        models = [requested_model] + [m for m in self.fallback_models if m != requested_model] if requested_model else [None]
+
+        last_response: Optional[httpx.Response] = None
+        last_error: Optional[Exception] = None
+        for index, model in enumerate(models):
+            breaker = self._breaker(model or request.url.host)
+            if not breaker.allow_request():
+                metrics.increment("llm_circuit_rejections_total", model=str(model))
+                continue
+            attempt = request
+            if index > 0:
+                metrics.increment("llm_fallbacks_total", model=str(model))
+                logger.warning(f"Falling back to model {model}")
+                attempt = self._with_model(request, body, model)
+
+            try:
+                response = self._send_with_retries(attempt, str(model))
+            except httpx.TransportError as e:
+                breaker.record_failure()
+                last_error = e
+                continue
+
+            if response.status_code in RETRYABLE_STATUS_CODES:
+                breaker.record_failure()
+                if last_response is not None:
+                    last_response.close()
+                last_response = response
+                continue
+
+            breaker.record_success()
+            if last_response is not None:
+                last_response.close()
+            return response
+
+        if last_response is not None:
+            return last_response
+        if last_error is not None:
+            raise last_error
+        raise CircuitOpenError("El servicio del modelo no está disponible temporalmente")
+
+    def close(self) -> None:
+        if self._hedge_pool is not None:
+            self._hedge_pool.shutdown(wait=False)
+        self._transport.close()
+
+    def _breaker(self, key: str) -> CircuitBreaker:
+        with self._breakers_lock:
+            breaker = self._breakers.get(key)
+            if breaker is None:
+                breaker = CircuitBreaker(self.failure_threshold, self.reset_timeout)
+                self._breakers[key] = breaker
+            return breaker
+
+    def _send_with_retries(self, request: httpx.Request, model: str) -> httpx.Response:
+        for attempt in range(self.max_retries + 1):
+            last_attempt = attempt == self.max_retries
+            try:
+                response = self._send(request)
+            except httpx.TransportError as e:
+                if last_attempt:
+                    raise
+                reason = type(e).__name__
+                delay = self._backoff(attempt)
+            else:
+                if response.status_code not in RETRYABLE_STATUS_CODES or last_attempt:
+                    return response
+                reason = str(response.status_code)
+                delay = self._retry_after(response) or self._backoff(attempt)
+                response.close()
+            metrics.increment("llm_retries_total", model=model, reason=reason)
+            self._sleep(delay)
+        raise AssertionError("unreachable")
+
+    def _send(self, request: httpx.Request) -> httpx.Response:
+        """Send a request, duplicating it if it is slower than the hedge delay."""
+        if self._hedge_pool is None:
+            return self._transport.handle_request(request)
+
+        primary = self._hedge_pool.submit(self._transport.handle_request, request)
+        try:
+            return primary.result(timeout=self.hedge_delay)
+        except FutureTimeoutError:
+            pass
+        metrics.increment("llm_hedged_requests_total")
+        backup = self._hedge_pool.submit(self._transport.handle_request, request)
+        return self._first_success([primary, backup])
+
+    @staticmethod
+    def _first_success(futures: List[Future]) -> httpx.Response:
+        """Return the first good response and close the others when they arrive."""
+        pending = set(futures)
+        fallback: Optional[Future] = None
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is None and future.result().status_code not in RETRYABLE_STATUS_CODES:
+                    for other in pending:
+                        other.add_done_callback(_close_response)
+                    if fallback is not None:
+                        _close_response(fallback)
+                    return future.result()
+                if fallback is not None:
+                    _close_response(fallback)
+                fallback = future
+        return fallback.result()
+
+    def _backoff(self, attempt: int) -> float:
+        """Exponential backoff with full jitter."""
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** attempt))
+
+    def _retry_after(self, response: httpx.Response) -> Optional[float]:
+        """Seconds requested by the server, capped at the maximum backoff."""
+        try:
+            return min(self.backoff_max, max(0.0, float(response.headers.get("retry-after", ""))))
+        except ValueError:
+            return None
+
+    @staticmethod
+    def _json_body(request: httpx.Request) -> Optional[dict]:
+        if "json" not in request.headers.get("content-type", ""):
+            return None
+        try:
+            body = json.loads(request.content)
+        except (ValueError, httpx.RequestNotRead):
+            return None
+        return body if isinstance(body, dict) else None
+
+    @staticmethod
+    def _with_model(request: httpx.Request, body: dict, model: str) -> httpx.Request:
+        """Copy a request replacing the model of its JSON body."""
+        content = json.dumps({**body, "model": model}).encode("utf-8")
+        headers = [(k, v) for k, v in request.headers.raw if k.lower() != b"content-length"]
+        return httpx.Request(request.method, request.url, headers=headers, content=content, extensions=request.extensions)
+
+
+def _close_response(future: Future) -> None:
+    """Close the response of a finished request that lost the hedge."""
+    if future.exception() is None:
+        future.result().close()
+
+
+def _http2_available() -> bool:
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+# One pooled client per process, shared by every chat model
+_client: Optional[httpx.Client] = None
+_client_lock = threading.Lock()
+
+
+def get_llm_http_client() -> httpx.Client:
+    """Get the shared HTTP client used for LLM calls.
+
+    Returns:
+        The pooled client with the resilient transport.
+    """
+    global _client
+    with _client_lock:
+        if _client is None:
+            http2 = settings.llm_http2 and _http2_available()
+            if settings.llm_http2 and not http2:
+                logger.warning("LLM_HTTP2 is enabled but the h2 package is not installed, using HTTP/1.1")
+            transport = ResilientTransport(
+                httpx.HTTPTransport(
+                    http2=http2,
+                    limits=httpx.Limits(
+                        max_connections=settings.llm_max_connections,
+                        max_keepalive_connections=settings.llm_max_connections,
+                        keepalive_expiry=settings.llm_keepalive_expiry,
+                    ),
+                ),
+                max_retries=settings.llm_max_retries,
+                backoff_base=settings.llm_backoff_base_seconds,
+                backoff_max=settings.llm_backoff_max_seconds,
+                hedge_delay=settings.llm_hedge_delay_seconds,
+                hedge_workers=settings.llm_max_connections,
+                fallback_models=settings.openrouter_fallback_models,
+                failure_threshold=settings.llm_circuit_failure_threshold,
+                reset_timeout=settings.llm_circuit_reset_seconds,
+            )
+            _client = httpx.Client(
+                transport=transport,
+                timeout=httpx.Timeout(settings.llm_timeout_seconds, connect=settings.llm_connect_timeout_seconds),
+            )
+        return _client
@@ -0,0 +1,35 @@
+"""Chat model factory for OpenRouter models."""
+from typing import Optional
+
+from langchain_openai import ChatOpenAI
+
+from business_assistant.config.settings import settings
+from business_assistant.infrastructure.ai.http_client import get_llm_http_client
+
+
+def create_chat_model(model_name: Optional[str] = None, temperature: float = 0.6) -> ChatOpenAI:
+    """Create a chat model served through OpenRouter.
+    
+    Every model shares one pooled HTTP client, which also owns retries and
+    model fallback, so the OpenAI client's own retries are disabled.
+    
+    Args:
+        model_name: OpenRouter model identifier. Defaults to OPENROUTER_MODEL.
+        temperature: Sampling temperature.
+        
+    Returns:
+        The configured chat model.
+    """
+    return ChatOpenAI(
+        model_name = model_name or settings.openrouter_model,
+        base_url = settings.openrouter_base_url,
+        api_key = settings.openrouter_api_key,
+        default_headers = {
+            "HTTP-Referer": settings.site_url,
+            "X-Title": settings.site_name,
+        },
+        temperature = temperature,
+        http_client = get_llm_http_client(),
+        timeout = settings.llm_timeout_seconds,
+        max_retries = 0,
+    )
@@ -1,13 +1,20 @@
 """Conversation prompt templates for the business assistant."""
-from typing import Dict
+from typing import Dict, Optional
 from langchain_core.prompts import PromptTemplate
 
+from business_assistant.config.settings import settings
+from business_assistant.domain.models.business import Business
+from business_assistant.infrastructure.cache import LRUCache
+from business_assistant.infrastructure.services.business_registry import DEFAULT_BUSINESS
+
 # Core capabilities and areas of expertise
 CAPABILITIES = {
     "atencion_al_cliente": [
         "Ventas de los productos disponibles",
         "Creación de reservas para servicios",
         "Creación de domicilios y entregas",
+        "Cotización de pedidos con descuentos e IVA",
+        "Reserva de pedidos confirmados por el cliente",
         "Información de horarios y disponibilidad",
         "Información general del negocio"
     ],
@@ -21,16 +28,12 @@ CAPABILITIES = {
 
 # System message template with dynamic capabilities
 SYSTEM_TEMPLATE = """
-Eres un asistente de inteligencia artificial que atiendes clientes por Whatsapp a nombre de Liwaisi Tech. Tu nombre es Sara y estás en representación del área de atención al cliente en ventas y reservas.
+Eres un asistente de inteligencia artificial que atiendes clientes por Whatsapp a nombre de {business_name}. Tu nombre es {assistant_name} y estás en representación del área de atención al cliente en ventas y reservas.
 
 No invoques la tool de productos sin antes analizar la información de los mensajes con el usuario. Si ya le suministraste al usuario información de un producto; analiza si su pregunta sigue relacionada a la información previa suministrada o si por el contrario, es una consulta nueva.
 
 # Información del Negocio
-- Nombre: Liwaisi Tech
-- Horario de Atención: Lunes a Viernes de 8:00 AM a 6:00 PM (UTC-5)
-- Dirección: Calle Principal #123, Barrio Centro, Maní, Casanare, Colombia
-- Teléfono: +57 365 842 5187
-- Correo: info@liwaisi.tech
+{business_info}
 
 {capabilities}
 
@@ -50,12 +53,13 @@ No invoques la tool de productos sin antes analizar la información de los mensa
    - Mantén el contexto de la conversación en todo momento
    - Cuando un cliente menciona un producto específico, recuerda sus características
    - Si el cliente hace referencia a productos ya mencionados (por número, nombre o características), utiliza la información ya proporcionada
-   - Interpreta referencias como "opción 1", "opción 2", etc. como selecciones de los productos listados anteriormente
+   - Las referencias como "opción 1" o "la segunda" llegan resueltas en el Estado de la conversación; usa ese variant_id sin buscar de nuevo
 
 # Restricciones
 - Comunica SOLO en español
 - Mantén tu rol estrictamente en atención al cliente
-- Al momento de buscar un producto, siempre haz la búsqueda por palabra en singular
+{search_rules}
+- Si el cliente pregunta qué productos hay de un tipo o categoría, o qué categorías manejan, usa browse_categories
 - NO busques productos nuevamente si ya has proporcionado información sobre ellos
 - Cuando el cliente se refiera a productos ya mencionados, utiliza la información ya proporcionada
 - Para preguntas fuera de tu área, indica que no tienes esa información
@@ -64,9 +68,33 @@ No invoques la tool de productos sin antes analizar la información de los mensa
 
 # Procesamiento de Pedidos
 - Cuando un cliente indica cantidades (ej: "5 unidades de cada tipo", "3 de 500 gr"), interpreta esto como un pedido
-- Si el cliente menciona "opción 1", "opción 2", etc., relaciona esto con la lista numerada de productos que le proporcionaste
-- Confirma los pedidos repitiendo el producto, cantidad, precio unitario y total
-- Mantén un registro mental de los productos que el cliente ha solicitado durante la conversación
+- Cuando muestres productos, numéralos en el mismo orden en que los devolvió la búsqueda, incluyendo los agotados
+- Para calcular el total de un pedido usa la herramienta quote_order con el variant_id (o SKU) y la cantidad de cada producto; no uses la calculadora para esto
+- Confirma los pedidos repitiendo el producto, cantidad, precio unitario y total que devuelve quote_order
+- Cuando el cliente confirme el pedido, usa la herramienta reserve_order con el variant_id y la cantidad de cada producto, e infórmale el número de pedido
+- Si reserve_order indica inventario insuficiente, informa al cliente las unidades disponibles
+- El pedido en curso aparece en el Estado de la conversación; actualízalo con quote_order cuando el cliente lo cambie
+"""
+
+# Product search rules, depending on whether the in-memory catalog index is enabled
+SEARCH_RULES_INDEX = """- Para buscar productos usa search_catalog con las palabras del cliente; entiende plurales, tildes y errores de escritura, así que no repitas la búsqueda con otras formas de la palabra
+- Si el cliente pregunta por varios productos en el mismo mensaje, búscalos todos en una sola llamada a search_catalog"""
+
+SEARCH_RULES_SQL = """- Al momento de buscar un producto, siempre haz la búsqueda por palabra en singular
+- Si el cliente pregunta por varios productos en el mismo mensaje, búscalos todos en una sola llamada con search_available_variant_products_batch"""
+
+# Fixed replies for small talk turns, by intent
+CANNED_RESPONSES = {
+    "greeting": "¡Hola! Soy {assistant_name} de {business_name}. ¿En qué te puedo ayudar?",
+    "thanks": "Con gusto.",
+    "goodbye": "Gracias por escribirnos. Que tengas un buen día.",
+}
+
+# Instruction appended when the agent runs out of tool iterations or time for a turn
+BUDGET_EXHAUSTED_PROMPT = """
+Se agotó el tiempo disponible para consultar herramientas en este mensaje.
+Responde ahora al cliente usando SOLO la información que ya obtuviste en la conversación, sin llamar herramientas.
+Si te falta información para responder por completo, dilo con amabilidad e indica qué datos consultarás después.
 """
 
 def format_capabilities(caps: Dict[str, list]) -> str:
@@ -88,20 +116,56 @@ def format_capabilities(caps: Dict[str, list]) -> str:
     
     return "\n\n".join(formatted)
 
-def get_system_prompt() -> str:
-    """Get the formatted system prompt.
+# Rendered system prompts by business; the profile's updated_at is part of the key
+_system_prompts = LRUCache(settings.business_cache_size, name="system_prompts")
+
+def get_system_prompt(business: Optional[Business] = None) -> str:
+    """Get the formatted system prompt of a business.
     
+    The prompt is rendered once per business profile and then served from
+    memory, so hundreds of tenants cost one string each.
+    
+    Args:
+        business: The business the assistant answers for. Defaults to the default business.
+        
     Returns:
         Formatted system prompt string.
     """
+    business = business or DEFAULT_BUSINESS
+    key = (business.business_id, business.updated_at)
+    cached = _system_prompts.get(key)
+    if cached is not None:
+        return cached
+    
     # Create prompt template
     prompt = PromptTemplate(
         template=SYSTEM_TEMPLATE,
-        input_variables=["capabilities"]
+        input_variables=["business_name", "assistant_name", "business_info", "capabilities", "search_rules"]
     )
     
     # Format capabilities
     formatted_capabilities = format_capabilities(CAPABILITIES)
     
-    # Return formatted prompt
-    return prompt.format(capabilities=formatted_capabilities)
+    rendered = prompt.format(
+        business_name=business.name,
+        assistant_name=business.assistant_name,
+        business_info="\n".join(business.profile_lines()),
+        capabilities=formatted_capabilities,
+        search_rules=SEARCH_RULES_INDEX if settings.catalog_index_enabled else SEARCH_RULES_SQL,
+    )
+    _system_prompts.put(key, rendered)
+    return rendered
+
+def get_canned_response(intent: str, business: Optional[Business] = None) -> str:
+    """Get the fixed reply of a small talk intent for a business.
+    
+    Args:
+        intent: The small talk intent.
+        business: The business the assistant answers for. Defaults to the default business.
+        
+    Returns:
+        The reply, falling back to the greeting for unknown intents.
+    """
+    business = business or DEFAULT_BUSINESS
+    template = CANNED_RESPONSES.get(intent, CANNED_RESPONSES["greeting"])
+    return template.format(business_name=business.name, assistant_name=business.assistant_name)
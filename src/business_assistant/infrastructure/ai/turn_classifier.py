@@ -0,0 +1,111 @@
+"""Local rule-based classifier deciding how each conversation turn is served."""
+import re
+import unicodedata
+from dataclasses import dataclass
+from typing import FrozenSet
+
+# Routes a turn can take
+ROUTE_CANNED = "canned"  # Fixed reply, no model call
+ROUTE_SMALL_MODEL = "small_model"  # Small model without tools
+ROUTE_AGENT = "agent"  # Full React agent with tools
+
+# Intents recognized by the classifier
+INTENT_GREETING = "greeting"
+INTENT_THANKS = "thanks"
+INTENT_GOODBYE = "goodbye"
+INTENT_FAQ = "faq"
+INTENT_CATALOG = "catalog"
+INTENT_UNKNOWN = "unknown"
+
+# Longer messages are never answered with a canned reply
+MAX_CANNED_WORDS = 8
+
+# Small talk markers, checked in order of priority
+_SMALL_TALK_MARKERS = (
+    (INTENT_THANKS, frozenset({"gracias", "agradezco", "amable"})),
+    (INTENT_GOODBYE, frozenset({"chao", "chau", "adios", "bye", "hasta", "vemos"})),
+    (INTENT_GREETING, frozenset({"hola", "holi", "ola", "buenas", "buenos", "buen", "dias", "tardes", "noches", "saludos", "hey"})),
+)
+
+# Words that may accompany a marker without changing the meaning of the message
+_SMALL_TALK_WORDS = frozenset({
+    "muchas", "muchisimas", "mil", "muy", "luego", "pronto", "manana", "nos", "feliz", "dia", "que", "tal",
+    "como", "estas", "esta", "sara", "senor", "senora", "amigo", "amiga", "y", "a", "tu", "te", "usted", "por",
+    "todo", "la", "el", "de",
+}).union(*(markers for _, markers in _SMALL_TALK_MARKERS))
+
+# Acknowledgements are never small talk, even next to a marker: "listo,
+# gracias" or "dale gracias" may be confirming a quoted order, which only
+# the agent can reserve.
+_ACKNOWLEDGEMENT_WORDS = frozenset({
+    "ok", "okey", "vale", "listo", "perfecto", "genial", "excelente", "dale", "bueno", "entendido",
+})
+
+# Anything about products, prices or orders needs the agent and its tools
+_CATALOG_PATTERN = re.compile(
+    r"\b(precios?|cuantos?|cuantas|cuesta|cuestan|tienen|tienes|hay|disponibles?|productos?|comprar|compro"
+    r"|quiero|quisiera|necesito|pedidos?|pedir|ordenar|encargar|domicilios?|envios?|enviar|unidades?"
+    r"|opcion|total|cotiza\w*|reserv\w*|cancel\w*|stock|inventario|catalogo|descuentos?|promocion\w*)\b"
+    r"|\d"
+)
+
+# Questions answered from the business information in the system prompt
+_FAQ_PATTERN = re.compile(
+    r"\b(horarios?|abren|abiertos?|cierran|atienden|direccion|ubicacion|ubicados?|donde (estan|quedan|queda)"
+    r"|(medios?|metodos?|formas?) de pago|pagar|nequi|daviplata|transferencia|efectivo|contacto|telefono"
+    r"|correo|email|quienes son)\b"
+)
+
+_WORD_PATTERN = re.compile(r"[a-zñ]+")
+
+
+@dataclass(frozen=True)
+class TurnClassification:
+    """Route and intent chosen for a user message."""
+
+    route: str
+    intent: str
+
+
+def fold_text(text: str) -> str:
+    """Lowercase and strip accents, keeping the ñ."""
+    text = text.lower().replace("ñ", "\0")
+    text = "".join(c for c in unicodedata.normalize("NFKD", text) if not unicodedata.combining(c))
+    return text.replace("\0", "ñ")
+
+
+def _small_talk_intent(words: FrozenSet[str]) -> str:
+    """Return the intent of a message made only of small talk, or an empty string."""
+    if words & _ACKNOWLEDGEMENT_WORDS or not words <= _SMALL_TALK_WORDS:
+        return ""
+    for intent, markers in _SMALL_TALK_MARKERS:
+        if words & markers:
+            return intent
+    return ""
+
+
+def classify_turn(message: str) -> TurnClassification:
+    """Classify a user message without calling any model.
+
+    Catalog and order terms always win, so a greeting followed by a product
+    question goes to the agent. Messages that match nothing also go to the
+    agent, which is the safe default.
+
+    Args:
+        message: The user message.
+
+    Returns:
+        The route and intent of the turn.
+    """
+    text = fold_text(message)
+    if _CATALOG_PATTERN.search(text):
+        return TurnClassification(ROUTE_AGENT, INTENT_CATALOG)
+    if _FAQ_PATTERN.search(text):
+        return TurnClassification(ROUTE_SMALL_MODEL, INTENT_FAQ)
+
+    words = _WORD_PATTERN.findall(text)
+    if words and len(words) <= MAX_CANNED_WORDS:
+        intent = _small_talk_intent(frozenset(words))
+        if intent:
+            return TurnClassification(ROUTE_CANNED, intent)
+    return TurnClassification(ROUTE_AGENT, INTENT_UNKNOWN)
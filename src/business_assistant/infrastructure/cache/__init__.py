@@ -0,0 +1,5 @@
+"""In-memory caching utilities for the business assistant."""
+
+from business_assistant.infrastructure.cache.lru_cache import LRUCache
+
+__all__ = ["LRUCache"]
@@ -0,0 +1,201 @@
+"""Thread-safe least-recently-used cache with optional idle expiry."""
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, List, Optional, Tuple
+
+from business_assistant.infrastructure.monitoring import metrics
+
+# Eviction reasons reported to callbacks and metrics
+EVICTION_CAPACITY = "capacity"
+EVICTION_EXPIRED = "expired"
+EVICTION_MEMORY = "memory_pressure"
+
+EvictionCallback = Callable[[Hashable, Any, str], None]
+
+
+class LRUCache:
+    """Fixed-capacity cache that evicts the least recently used entry.
+
+    Every operation is O(1): entries live in an ``OrderedDict`` that is
+    reordered on access, so the oldest entry is always at the front. When a
+    ``ttl`` is set, entries idle for longer than ``ttl`` seconds expire. Since
+    access refreshes both the position and the idle clock, expired entries
+    always sit at the front and are dropped lazily without a full scan.
+    """
+
+    def __init__(
+        self,
+        capacity: int,
+        ttl: Optional[float] = None,
+        name: Optional[str] = None,
+        on_evict: Optional[EvictionCallback] = None,
+    ):
+        """Initialize the cache.
+
+        Args:
+            capacity: Maximum number of entries kept. A capacity of zero
+                disables the cache (every lookup is a miss).
+            ttl: Idle time in seconds after which an entry expires, or None
+                to keep entries until they are evicted by capacity.
+            name: Name used to label hit, miss and eviction metrics. Metrics
+                are not recorded for unnamed caches.
+            on_evict: Callback invoked with ``(key, value, reason)`` after an
+                entry is evicted.
+        """
+        if capacity < 0:
+            raise ValueError("La capacidad del caché no puede ser negativa")
+        self.capacity = capacity
+        self.ttl = ttl
+        self.name = name
+        self._on_evict = on_evict
+        # key -> (value, last_access)
+        self._data: "OrderedDict[Hashable, Tuple[Any, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Optional[Any] = None) -> Any:
+        """Get a value and mark it as recently used.
+
+        Args:
+            key: The cache key.
+            default: Value returned when the key is not cached or expired.
+
+        Returns:
+            The cached value or the default.
+        """
+        now = time.monotonic()
+        evicted = []
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None and self._is_expired(entry, now):
+                del self._data[key]
+                evicted.append((key, entry[0], EVICTION_EXPIRED))
+                entry = None
+            if entry is not None:
+                self._data[key] = (entry[0], now)
+                self._data.move_to_end(key)
+        self._record_lookup(entry is not None)
+        self._notify(evicted)
+        return entry[0] if entry is not None else default
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """Store a value, evicting expired and least recently used entries.
+
+        Args:
+            key: The cache key.
+            value: The value to store.
+        """
+        if self.capacity == 0:
+            return
+        now = time.monotonic()
+        with self._lock:
+            self._data[key] = (value, now)
+            self._data.move_to_end(key)
+            evicted = self._pop_expired(now)
+            while len(self._data) > self.capacity:
+                old_key, (old_value, _) = self._data.popitem(last=False)
+                evicted.append((old_key, old_value, EVICTION_CAPACITY))
+        self._notify(evicted)
+
+    def pop(self, key: Hashable, default: Optional[Any] = None) -> Any:
+        """Remove a key from the cache.
+
+        Args:
+            key: The cache key.
+            default: Value returned when the key is not cached.
+
+        Returns:
+            The removed value or the default.
+        """
+        with self._lock:
+            entry = self._data.pop(key, None)
+        return entry[0] if entry is not None else default
+
+    def purge_expired(self, max_idle: Optional[float] = None) -> int:
+        """Drop entries idle for longer than the TTL.
+
+        Only the expired prefix of the LRU order is visited.
+
+        Args:
+            max_idle: Idle time in seconds overriding the cache TTL.
+
+        Returns:
+            Number of entries removed.
+        """
+        with self._lock:
+            evicted = self._pop_expired(time.monotonic(), max_idle)
+        self._notify(evicted)
+        return len(evicted)
+
+    def shrink(self, count: int, reason: str = EVICTION_MEMORY) -> int:
+        """Evict the ``count`` least recently used entries.
+
+        Args:
+            count: Number of entries to evict.
+            reason: Eviction reason reported to the callback and metrics.
+
+        Returns:
+            Number of entries removed.
+        """
+        evicted = []
+        with self._lock:
+            while self._data and len(evicted) < count:
+                old_key, (old_value, _) = self._data.popitem(last=False)
+                evicted.append((old_key, old_value, reason))
+        self._notify(evicted)
+        return len(evicted)
+
+    def keys(self) -> List[Hashable]:
+        """Get the cached keys from least to most recently used.
+
+        Returns:
+            List of keys.
+        """
+        with self._lock:
+            return list(self._data.keys())
+
+    def clear(self) -> None:
+        """Remove every entry from the cache."""
+        with self._lock:
+            self._data.clear()
+
+    def _is_expired(self, entry: Tuple[Any, float], now: float, max_idle: Optional[float] = None) -> bool:
+        """Check whether an entry has been idle for too long."""
+        idle_limit = max_idle if max_idle is not None else self.ttl
+        return idle_limit is not None and now - entry[1] > idle_limit
+
+    def _pop_expired(self, now: float, max_idle: Optional[float] = None) -> List[Tuple[Hashable, Any, str]]:
+        """Pop expired entries from the front of the LRU order (lock held)."""
+        evicted = []
+        while self._data:
+            oldest_key = next(iter(self._data))
+            entry = self._data[oldest_key]
+            if not self._is_expired(entry, now, max_idle):
+                break
+            del self._data[oldest_key]
+            evicted.append((oldest_key, entry[0], EVICTION_EXPIRED))
+        return evicted
+
+    def _record_lookup(self, hit: bool) -> None:
+        """Record a hit or miss for named caches."""
+        if self.name:
+            metrics.increment("cache_hits_total" if hit else "cache_misses_total", cache=self.name)
+
+    def _notify(self, evicted: List[Tuple[Hashable, Any, str]]) -> None:
+        """Report evictions to metrics and the callback outside the lock."""
+        for key, value, reason in evicted:
+            if self.name:
+                metrics.increment("cache_evictions_total", cache=self.name, reason=reason)
+            if self._on_evict:
+                self._on_evict(key, value, reason)
+        if self.name:
+            metrics.set_gauge("cache_entries", len(self), cache=self.name)
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            entry = self._data.get(key)
+            return entry is not None and not self._is_expired(entry, time.monotonic())
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._data)
@@ -0,0 +1,183 @@
+"""Iteration and time budget for one run of the React agent."""
+import contextvars
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from typing import Any, Callable, Dict, List, Optional
+
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import AIMessage, BaseMessage, SystemMessage
+from langchain_core.runnables import Runnable, RunnableConfig
+from langgraph.errors import GraphRecursionError
+
+from business_assistant.infrastructure.ai.prompts.conversation_prompts import BUDGET_EXHAUSTED_PROMPT
+from business_assistant.infrastructure.monitoring import metrics
+
+logger = logging.getLogger(__name__)
+
+# Reasons a turn runs out of budget
+BUDGET_ITERATIONS = "iterations"
+BUDGET_DEADLINE = "deadline"
+BUDGET_RECURSION = "recursion"
+
+# Last-resort answer when the degraded answer cannot be generated either
+FALLBACK_ANSWER = (
+    "Lo siento, no pude completar tu consulta en este momento. "
+    "¿Podrías intentarlo de nuevo en unos minutos?"
+)
+
+# Returned by a finished agent stream
+_DONE = object()
+
+
+def _tool_rounds(messages: List[BaseMessage]) -> int:
+    """Count assistant messages that requested tools."""
+    return sum(1 for message in messages if isinstance(message, AIMessage) and message.tool_calls)
+
+
+def _called_tools(messages: List[BaseMessage]) -> List[str]:
+    """Names of the tools requested in the messages, without repetitions."""
+    names: List[str] = []
+    for message in messages:
+        if isinstance(message, AIMessage):
+            for call in message.tool_calls:
+                if call["name"] not in names:
+                    names.append(call["name"])
+    return names
+
+
+def run_agent_with_budget(
+    agent: Runnable,
+    llm: BaseChatModel,
+    inputs: Dict[str, Any],
+    config: RunnableConfig,
+    max_tool_iterations: int,
+    deadline_seconds: float,
+    degraded_answer_seconds: float = 10,
+) -> List[BaseMessage]:
+    """Run the agent until it answers or its budget for the turn runs out.
+
+    The agent is streamed step by step on a helper thread. A model step is
+    waited for only while the deadline has not passed, so a slow model call
+    or a slow final answer is cut off; tool steps are bounded by their own
+    tool timeouts. Before another round of tool calls starts, the number of
+    tool rounds and the elapsed time are checked. When either budget is
+    exhausted the pending tool calls are dropped and the model is asked,
+    without tools, to answer with the information it already has.
+
+    Args:
+        agent: The compiled React agent.
+        llm: The chat model used for the degraded answer.
+        inputs: Agent input with the conversation messages.
+        config: Runnable config for the agent.
+        max_tool_iterations: Maximum rounds of tool calls in the turn.
+        deadline_seconds: End-to-end time budget of the turn.
+        degraded_answer_seconds: Time the degraded answer may take once the
+            deadline has passed; 0 answers with the fallback without calling the model.
+
+    Returns:
+        The messages produced in this turn, ending with the answer to the user.
+    """
+    start = time.monotonic()
+    history_length = len(inputs["messages"])
+    # Each tool round is one model step plus one tools step; the extra steps
+    # leave room for the final answer before LangGraph's own limit applies
+    config = {**config, "recursion_limit": 2 * max_tool_iterations + 3}
+    messages: List[BaseMessage] = list(inputs["messages"])
+    exhausted: Optional[str] = None
+
+    # One thread per turn advances the stream, so a step that outlives the
+    # deadline is abandoned without blocking the turn; the callbacks and log
+    # context of the turn travel with it
+    executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="agent-turn")
+    context = contextvars.copy_context()
+    steps = agent.stream(inputs, stream_mode="values", config=config)
+    abandoned = False
+    try:
+        while True:
+            last = messages[-1] if len(messages) > history_length else None
+            running_tools = isinstance(last, AIMessage) and bool(last.tool_calls)
+            timeout = None if running_tools else max(0.0, deadline_seconds - (time.monotonic() - start))
+            future = executor.submit(context.run, next, steps, _DONE)
+            try:
+                state = future.result(timeout=timeout)
+            except FutureTimeoutError:
+                # The model call keeps running on the helper thread; the stream is closed when it returns
+                future.add_done_callback(lambda _: steps.close())
+                abandoned = True
+                exhausted = BUDGET_DEADLINE
+                break
+            if state is _DONE:
+                break
+            messages = state["messages"]
+            last = messages[-1]
+            if not (isinstance(last, AIMessage) and last.tool_calls):
+                continue
+            if _tool_rounds(messages[history_length:]) > max_tool_iterations:
+                exhausted = BUDGET_ITERATIONS
+                break
+            if time.monotonic() - start > deadline_seconds:
+                exhausted = BUDGET_DEADLINE
+                break
+    except GraphRecursionError:
+        exhausted = BUDGET_RECURSION
+    finally:
+        if not abandoned:
+            steps.close()
+        executor.shutdown(wait=False)
+
+    new_messages = messages[history_length:]
+    if exhausted is None:
+        return new_messages
+
+    # Reported per tool, including the calls the budget just cut off
+    tools = _called_tools(new_messages) or ["none"]
+
+    # Tool calls that will not run must not reach the history: the model API
+    # rejects assistant tool calls without their results
+    if new_messages and isinstance(new_messages[-1], AIMessage) and new_messages[-1].tool_calls:
+        new_messages = new_messages[:-1]
+
+    for tool in tools:
+        metrics.increment("agent_budget_exhausted_total", tool=tool, reason=exhausted)
+    logger.warning(
+        f"Agent budget exhausted ({exhausted}) after {time.monotonic() - start:.1f}s, tools used: {', '.join(tools)}"
+    )
+    # The degraded answer may use what is left of the deadline, or the grace period once it has passed
+    timeout = max(deadline_seconds - (time.monotonic() - start), degraded_answer_seconds)
+    return new_messages + [_degraded_answer(llm, list(inputs["messages"]) + new_messages, timeout)]
+
+
+def _call_with_timeout(function: Callable[[], Any], timeout: float) -> Any:
+    """Run a call on a helper thread and wait at most ``timeout`` seconds for it.
+
+    Raises:
+        concurrent.futures.TimeoutError: If the call does not finish in time; it keeps running in the background.
+    """
+    executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="agent-turn")
+    try:
+        return executor.submit(contextvars.copy_context().run, function).result(timeout=timeout)
+    finally:
+        executor.shutdown(wait=False)
+
+
+def _degraded_answer(llm: BaseChatModel, messages: List[BaseMessage], timeout: float) -> AIMessage:
+    """Ask the model for a final answer without tools, waiting at most ``timeout`` seconds."""
+    if timeout <= 0:
+        return AIMessage(content=FALLBACK_ANSWER)
+    try:
+        answer = _call_with_timeout(
+            lambda: llm.invoke(messages + [SystemMessage(content=BUDGET_EXHAUSTED_PROMPT)]), timeout
+        )
+        if answer.content:
+            # Usage is kept so the extra call is accounted to the turn
+            return AIMessage(
+                content=answer.content,
+                usage_metadata=answer.usage_metadata,
+                response_metadata=answer.response_metadata,
+            )
+    except FutureTimeoutError:
+        logger.error(f"Degraded answer not generated within {timeout:.1f}s")
+    except Exception as e:
+        logger.error(f"Error generating degraded answer: {str(e)}")
+    return AIMessage(content=FALLBACK_ANSWER)
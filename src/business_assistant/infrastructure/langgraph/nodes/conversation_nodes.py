@@ -1,68 +1,107 @@
 """Conversation nodes for langgraph implementation using React agent."""
-from typing import Annotated, Dict, List, Any
+from typing import Annotated, Dict, List, Any, Optional
 from typing_extensions import TypedDict
-from langchain_openai import ChatOpenAI
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import SystemMessage
+from langchain_core.runnables import RunnableConfig
+from langchain_core.tools import BaseTool
 from langgraph.graph.message import add_messages
 from langgraph.prebuilt import create_react_agent
-from langgraph.checkpoint.memory import MemorySaver
 from business_assistant.config.settings import settings
 from toolbox_langchain import ToolboxClient
+from business_assistant.infrastructure.ai.llm import create_chat_model
+from business_assistant.infrastructure.ai.prompts import get_system_prompt
+from business_assistant.infrastructure.langgraph.nodes.agent_budget import run_agent_with_budget
+from business_assistant.infrastructure.langgraph.nodes.conversation_state import (
+    render_context,
+    resolve_references,
+    trim_history,
+    update_context,
+)
+from business_assistant.infrastructure.langgraph.nodes.tool_executor import ParallelToolNode
 from business_assistant.infrastructure.tools.calculator_tool import get_calculator_tool
+from business_assistant.infrastructure.tools.catalog_search_tool import REPLACED_TOOLBOX_TOOLS, get_search_catalog_tool
+from business_assistant.infrastructure.tools.category_tool import get_browse_categories_tool
+from business_assistant.infrastructure.services.business_registry import get_business
+from business_assistant.infrastructure.tools.order_tool import get_quote_order_tool, get_reserve_order_tool
+from business_assistant.infrastructure.tools.tenant_tool import scope_to_tenant
 import logging
 
 logger = logging.getLogger(__name__)
 
 
+def _load_tools() -> List[BaseTool]:
+    """Load the Toolbox tools and add the tools implemented in this service."""
+    # Load tools from the Toolbox server. Their business_id parameter is bound
+    # to the business of the running turn, so the model never sees it and
+    # every query is filtered by tenant
+    client = ToolboxClient(settings.toolbox_base_url)
+    toolbox_tools = scope_to_tenant(client.load_toolset())
+    
+    # Product searches are served from the in-memory catalog index
+    if settings.catalog_index_enabled:
+        toolbox_tools = [tool for tool in toolbox_tools if tool.name not in REPLACED_TOOLBOX_TOOLS]
+        toolbox_tools.append(get_search_catalog_tool())
+    
+    # Add custom calculator tool
+    calculator_tool = get_calculator_tool()
+    
+    # Add order tools
+    quote_order_tool = get_quote_order_tool()
+    reserve_order_tool = get_reserve_order_tool()
+    
+    # Add the category browsing tool
+    browse_categories_tool = get_browse_categories_tool()
+    
+    # Combine all tools
+    return toolbox_tools + [calculator_tool, quote_order_tool, reserve_order_tool, browse_categories_tool]
+
+
 class State(TypedDict):
-    """State type for conversation graph."""
+    """State type for conversation graph.
+    
+    ``context`` holds the structured conversation state (listed products,
+    pending order and last order) maintained by ``update_context``.
+    """
     messages: Annotated[list, add_messages]
     context: Dict[str, Any] = {}
 
 
-def create_chatbot_node() -> callable:
+def create_chatbot_node(llm: Optional[BaseChatModel] = None, tools: Optional[List[BaseTool]] = None) -> callable:
     """Create a React agent chatbot node with the specified model and tools.
     
     Args:
-        model: The model to use for the chatbot.
+        llm: The model to use for the chatbot. Defaults to OPENROUTER_MODEL.
+        tools: The agent's tools. Defaults to the Toolbox tools plus the
+            calculator and order tools. Traffic replay passes doubles of both.
         
     Returns:
         A function that can be used as a node in the graph.
     """
     # Initialize the LLM
-    llm = ChatOpenAI(
-        model_name = settings.openrouter_model,
-        base_url = settings.openrouter_base_url,
-        api_key = settings.openrouter_api_key,
-        default_headers = {
-            "HTTP-Referer": settings.site_url,
-            "X-Title": settings.site_name,
-        },
-        temperature = 0.6
-    )
-    # Load tools from the Toolbox server
-    client = ToolboxClient(settings.toolbox_base_url)
-    toolbox_tools = client.load_toolset()
-    
-    # Add custom calculator tool
-    calculator_tool = get_calculator_tool()
-    
-    # Combine all tools
-    tools = toolbox_tools + [calculator_tool]
+    llm = llm or create_chat_model(settings.openrouter_model, temperature=0.6)
+    if tools is None:
+        tools = _load_tools()
     
-    # Create the React agent
-    agent = create_react_agent(llm, tools, checkpointer=MemorySaver())
+    # Create the React agent. It is stateless: the conversation graph passes the
+    # full history and owns checkpointing, so one agent can serve every user.
+    # Tool calls of the same step run concurrently with per-tool timeouts.
+    agent = create_react_agent(llm, ParallelToolNode(tools))
     
-    def chatbot(state: State) -> Dict:
+    def chatbot(state: State, config: RunnableConfig) -> Dict:
         """Process messages and generate a response using the React agent.
         
         Args:
             state: Current state containing messages.
+            config: Runnable config of the conversation graph.
             
         Returns:
             Dict containing the new messages to be added.
         """
-        # Get the thread_id from the state or use a default
-        thread_id = state.get("thread_id", "default-thread")
+        # Get the thread_id and user from the graph config or use a default
+        thread_id = config.get("configurable", {}).get("thread_id", "default-thread")
+        user_id = config.get("configurable", {}).get("user_id")
+        business_id = config.get("configurable", {}).get("business_id")
         
         # Initialize context if not present
         if "context" not in state:
@@ -71,67 +110,72 @@ def create_chatbot_node() -> callable:
         # Extract the last user message for analysis
         last_user_message = ""
         
-        # Add detailed logging for message types
-        if state["messages"]:
-            logger.debug(f"Message types in state: {[type(msg).__name__ for msg in state['messages']]}")
-            if hasattr(state["messages"][0], '__dict__'):
-                logger.debug(f"First message attributes: {dir(state['messages'][0])}")
-        
         for msg in reversed(state["messages"]):
-            # Log message type for debugging
-            logger.debug(f"Processing message of type: {type(msg).__name__}")
-            
             # Handle different message types
             if isinstance(msg, dict):
                 # Dict-like message
                 if msg.get("role") == "user":
                     last_user_message = msg.get("content", "")
-                    logger.debug(f"Found user message (dict): {last_user_message[:50]}...")
                     break
             elif hasattr(msg, 'type'):
-                # Log message type
-                logger.debug(f"Message has type attribute: {msg.type}")
                 if msg.type == 'human':
                     # LangChain HumanMessage
                     last_user_message = msg.content
-                    logger.debug(f"Found user message (LangChain): {last_user_message[:50]}...")
                     break
             elif hasattr(msg, 'role') and msg.role == 'user':
                 # Generic object with role attribute
                 if hasattr(msg, 'content'):
                     last_user_message = msg.content
-                    logger.debug(f"Found user message (role object): {last_user_message[:50]}...")
                     break
             else:
                 # Unknown message type
-                logger.warning(f"Unknown message type: {type(msg).__name__}")
+                logger.warning("Unknown message type: %s", type(msg).__name__)
                 
-        # Log the conversation state for debugging
-        logger.debug(f"Processing message with context: {state.get('context')}")
-        logger.debug(f"Last user message: {last_user_message}")
+        # Arguments are only rendered when debug logging is on
+        logger.debug("Processing message with context: %s", state.get("context"))
+        logger.debug("Last user message: %s", last_user_message)
+        
+        # The system prompt is rebuilt every turn with the current state instead
+        # of being stored in the history. Ordinal references ("la 2") are
+        # resolved here so the model does not have to search again
+        context = state.get("context") or {}
+        references = resolve_references(last_user_message, context)
+        system_prompt = get_system_prompt(get_business(business_id)) + render_context(context, references)
+        history = [msg for msg in state["messages"] if not isinstance(msg, SystemMessage)]
         
         # Prepare inputs for the agent
-        inputs = {"messages": state["messages"]}
+        inputs = {
+            "messages": [SystemMessage(content=system_prompt)] + trim_history(history, settings.agent_history_messages)
+        }
         
         # Configure the agent with the thread_id and context
-        config = {
+        agent_config = {
             "configurable": {
                 "thread_id": thread_id,
-                "context": state.get("context", {})
+                "user_id": user_id,
+                "business_id": business_id,
+                "context": context
             }
         }
         
-        # Invoke the agent
-        response = agent.invoke(inputs, stream_mode="values", config=config)
-        
-        # Update context with any product information from the response
-        # This helps maintain product context between interactions
-        assistant_response = response["messages"][-1].content
+        # Run the agent within the iteration and time budget of the turn.
+        # The tool calls and results of this turn are kept in the graph state
+        # so the checkpoint holds everything the next turn needs, whichever
+        # worker serves it
+        new_messages = run_agent_with_budget(
+            agent,
+            llm,
+            inputs,
+            agent_config,
+            max_tool_iterations=settings.agent_max_tool_iterations,
+            deadline_seconds=settings.agent_turn_deadline_seconds,
+            degraded_answer_seconds=settings.agent_degraded_answer_seconds,
+        )
          
-        # Return the agent's response and updated context
+        # Return the agent's messages and the state updated with their tool results
         return {
-            "messages": [response["messages"][-1]],
-            "context": state.get("context", {})
+            "messages": new_messages or [state["messages"][-1]],
+            "context": update_context(context, new_messages)
         }
 
     return chatbot
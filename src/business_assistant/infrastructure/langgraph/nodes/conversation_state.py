@@ -0,0 +1,303 @@
+"""Structured conversation state kept in the graph instead of the model's memory.
+
+The products last shown to the customer, the pending order and the last
+reserved order are extracted from the tool results of each turn and stored
+in ``State.context``, so they are checkpointed with the thread. Ordinal
+references such as "la 2" or "la segunda opción" are resolved against that
+state before the model runs, and the state is rendered as a compact block
+of the system prompt.
+"""
+import json
+import logging
+import re
+from typing import Any, Dict, Iterator, List, Optional
+
+from langchain_core.messages import AIMessage, BaseMessage, HumanMessage, ToolMessage
+
+from business_assistant.infrastructure.monitoring import metrics
+from business_assistant.infrastructure.services.catalog_index import fold_accents
+
+logger = logging.getLogger(__name__)
+
+# Keys of the conversation state in State.context
+LISTED_PRODUCTS_KEY = "listed_products"
+CART_KEY = "cart"
+LAST_ORDER_KEY = "last_order"
+
+# Products remembered from the last listing
+MAX_LISTED_PRODUCTS = 20
+
+# Tools whose results are the products shown to the customer
+SEARCH_TOOLS = frozenset({
+    "search_catalog",
+    "browse_categories",
+    "search_available_variant_products",
+    "search_available_variant_products_batch",
+})
+QUOTE_TOOL = "quote_order"
+RESERVE_TOOL = "reserve_order"
+
+# Fields of a listed product kept in the state
+_LISTED_FIELDS = ("variant_id", "product_name", "variant_name", "sku", "price", "quantity")
+
+# Fields of a cart line kept in the state
+_CART_FIELDS = ("variant_id", "sku", "variant_name", "quantity", "unit_price")
+
+_NUMBER_WORDS = {
+    "uno": 1, "dos": 2, "tres": 3, "cuatro": 4, "cinco": 5,
+    "seis": 6, "siete": 7, "ocho": 8, "nueve": 9, "diez": 10,
+}
+
+_ORDINAL_WORDS = {
+    "primer": 1, "primero": 1, "primera": 1,
+    "segundo": 2, "segunda": 2,
+    "tercer": 3, "tercero": 3, "tercera": 3,
+    "cuarto": 4, "cuarta": 4,
+    "quinto": 5, "quinta": 5,
+    "sexto": 6, "sexta": 6,
+    "septimo": 7, "septima": 7, "setimo": 7, "setima": 7,
+    "octavo": 8, "octava": 8,
+    "noveno": 9, "novena": 9,
+    "decimo": 10, "decima": 10,
+}
+
+# Position meaning the last listed product
+_LAST = -1
+_LAST_WORDS = {"ultimo": _LAST, "ultima": _LAST}
+
+_NUMBER = r"\d{1,2}|" + "|".join(_NUMBER_WORDS)
+_ORDINAL = "|".join(sorted({**_ORDINAL_WORDS, **_LAST_WORDS}, key=len, reverse=True))
+
+# "opción 2", "opciones 1 y 3", "número 4"
+_OPTION_PATTERN = re.compile(
+    rf"\b(?:opciones|opcion|numeros|numero|nro)\s+((?:{_NUMBER})\b(?:\s*(?:,|\by\b|\be\b|\bo\b)\s*\d{{1,2}}\b)*)"
+)
+# "la 2", "el 3", unless followed by a unit or "de" ("el 3 de mayo", "la 1 kg")
+_ARTICLE_NUMBER_PATTERN = re.compile(
+    r"\b(?:la|el)\s+(\d{1,2})\b(?!\s*(?:de\b|%|:|am\b|pm\b|kg\b|kilos?\b|gr?\b|gramos?\b|ml\b|l\b|litros?\b|lb\b|libras?\b|unidades\b))"
+)
+# "la segunda", "el último", "la primera opción", "segunda opción"
+_ORDINAL_PATTERN = re.compile(rf"\b(?:(?:la|el)\s+({_ORDINAL})\b|({_ORDINAL})\s+opcion\b)")
+_NUMBER_IN_LIST_PATTERN = re.compile(rf"{_NUMBER}")
+
+
+def _tool_names(messages: List[BaseMessage]) -> Dict[str, str]:
+    """Map the id of every tool call in the messages to the tool name."""
+    names = {}
+    for message in messages:
+        if isinstance(message, AIMessage):
+            for call in message.tool_calls:
+                names[call["id"]] = call["name"]
+    return names
+
+
+def _parse_result(message: ToolMessage) -> Any:
+    """Decode the JSON result of a tool, or None for errors and plain text."""
+    if not isinstance(message.content, str):
+        return None
+    try:
+        return json.loads(message.content)
+    except ValueError:
+        return None
+
+
+def _iter_variants(value: Any) -> Iterator[Dict[str, Any]]:
+    """Yield every object with a variant_id nested in a search result."""
+    if isinstance(value, dict):
+        if "variant_id" in value:
+            yield value
+            return
+        for item in value.values():
+            yield from _iter_variants(item)
+    elif isinstance(value, list):
+        for item in value:
+            yield from _iter_variants(item)
+
+
+def update_context(context: Dict[str, Any], new_messages: List[BaseMessage]) -> Dict[str, Any]:
+    """Update the conversation state with the tool results of a turn.
+
+    Searches replace the listed products, numbered in the order the tools
+    returned them. A quote becomes the pending order and a reservation
+    clears it and is kept as the last order.
+
+    Args:
+        context: The state before the turn. It is not modified.
+        new_messages: The messages produced in the turn.
+
+    Returns:
+        The state after the turn.
+    """
+    context = dict(context or {})
+    names = _tool_names(new_messages)
+    listing: Optional[List[Dict[str, Any]]] = None
+    for message in new_messages:
+        if not isinstance(message, ToolMessage):
+            continue
+        tool = names.get(message.tool_call_id) or message.name
+        result = _parse_result(message)
+        if result is None:
+            continue
+
+        if tool in SEARCH_TOOLS:
+            # Several searches in one turn make up a single listing
+            if listing is None:
+                listing = []
+            listing.extend(_iter_variants(result))
+        elif tool == QUOTE_TOOL and isinstance(result, dict) and result.get("lines"):
+            context[CART_KEY] = {
+                "lines": [{field: line.get(field) for field in _CART_FIELDS} for line in result["lines"]],
+                "total": result.get("total"),
+            }
+        elif tool == RESERVE_TOOL and isinstance(result, dict) and result.get("order_id"):
+            context[LAST_ORDER_KEY] = {"order_id": result["order_id"], "total": result.get("total")}
+            context.pop(CART_KEY, None)
+
+    if listing is not None:
+        products = []
+        seen = set()
+        for variant in listing:
+            if variant["variant_id"] in seen:
+                continue
+            seen.add(variant["variant_id"])
+            products.append({"position": len(products) + 1, **{field: variant.get(field) for field in _LISTED_FIELDS}})
+        context[LISTED_PRODUCTS_KEY] = products[:MAX_LISTED_PRODUCTS]
+    return context
+
+
+def _number(word: str) -> int:
+    return int(word) if word.isdigit() else _NUMBER_WORDS[word]
+
+
+def resolve_references(text: str, context: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Resolve ordinal references of a message to the listed products.
+
+    Recognizes "opción 2", "opciones 1 y 3", "la 2", "la segunda",
+    "el último" and "la primera opción", with or without accents. Positions
+    outside the listing are left out, since the words then refer to
+    something else, like an order number.
+
+    Args:
+        text: The customer's message.
+        context: The conversation state.
+
+    Returns:
+        One entry per referenced product, in order of appearance, with the
+        matched words, the position and the listed product.
+    """
+    products = (context or {}).get(LISTED_PRODUCTS_KEY) or []
+    if not products or not text:
+        return []
+
+    folded = fold_accents(text)
+    found = []
+    for match in _OPTION_PATTERN.finditer(folded):
+        for word in _NUMBER_IN_LIST_PATTERN.findall(match.group(1)):
+            found.append((match.start(), match.group(0).strip(), _number(word)))
+    for match in _ARTICLE_NUMBER_PATTERN.finditer(folded):
+        found.append((match.start(), match.group(0), int(match.group(1))))
+    for match in _ORDINAL_PATTERN.finditer(folded):
+        word = match.group(1) or match.group(2)
+        found.append((match.start(), match.group(0), _ORDINAL_WORDS.get(word, _LAST_WORDS.get(word))))
+
+    references = []
+    positions = set()
+    for _, words, position in sorted(found, key=lambda item: item[0]):
+        if position == _LAST:
+            position = len(products)
+        if position in positions:
+            continue
+        positions.add(position)
+        if 1 <= position <= len(products):
+            references.append({"reference": words, **products[position - 1]})
+            metrics.increment("ordinal_references_total", outcome="resolved")
+        else:
+            metrics.increment("ordinal_references_total", outcome="out_of_range")
+    return references
+
+
+def _product_label(product: Dict[str, Any]) -> str:
+    """Name of a listed product as shown in the state block."""
+    product_name = product.get("product_name")
+    variant_name = product.get("variant_name")
+    if product_name and variant_name and fold_accents(product_name) not in fold_accents(variant_name):
+        return f"{product_name} - {variant_name}"
+    return variant_name or product_name or f"variante {product.get('variant_id')}"
+
+
+def render_context(context: Dict[str, Any], references: Optional[List[Dict[str, Any]]] = None) -> str:
+    """Render the conversation state as a compact block for the system prompt.
+
+    Args:
+        context: The conversation state.
+        references: Ordinal references resolved from the current message.
+
+    Returns:
+        The block, or an empty string when there is no state.
+    """
+    context = context or {}
+    sections = []
+
+    products = context.get(LISTED_PRODUCTS_KEY)
+    if products:
+        lines = ["Productos mostrados al cliente (usa esta numeración):"]
+        for product in products:
+            lines.append(
+                f"{product['position']}. {_product_label(product)} (variant_id {product['variant_id']}, "
+                f"SKU {product.get('sku')}, precio {product.get('price')}, disponibles {product.get('quantity')})"
+            )
+        sections.append("\n".join(lines))
+
+    cart = context.get(CART_KEY)
+    if cart:
+        lines = ["Pedido en curso, cotizado y aún sin confirmar:"]
+        for line in cart["lines"]:
+            lines.append(
+                f"- {line['quantity']} x {line.get('variant_name')} (variant_id {line['variant_id']}) "
+                f"a {line.get('unit_price')} c/u"
+            )
+        lines.append(f"Total: {cart.get('total')}")
+        sections.append("\n".join(lines))
+
+    last_order = context.get(LAST_ORDER_KEY)
+    if last_order:
+        sections.append(f"Último pedido registrado: número {last_order['order_id']} por {last_order.get('total')}")
+
+    if references:
+        lines = ["Referencias del mensaje actual:"]
+        for reference in references:
+            lines.append(
+                f"- \"{reference['reference']}\" es el producto {reference['position']}: "
+                f"{_product_label(reference)} (variant_id {reference['variant_id']})"
+            )
+        sections.append("\n".join(lines))
+
+    if not sections:
+        return ""
+    return "\n\n# Estado de la conversación\n" + "\n\n".join(sections) + "\n"
+
+
+def trim_history(messages: List[BaseMessage], max_messages: int) -> List[BaseMessage]:
+    """Keep the most recent messages of the conversation.
+
+    The kept window always starts at a customer message, so tool results
+    are never separated from the assistant message that requested them.
+
+    Args:
+        messages: The conversation history.
+        max_messages: Messages to keep; 0 keeps the whole history.
+
+    Returns:
+        The recent history.
+    """
+    if max_messages <= 0 or len(messages) <= max_messages:
+        return list(messages)
+    start = len(messages) - max_messages
+    for index in range(start, len(messages)):
+        if isinstance(messages[index], HumanMessage):
+            return list(messages[index:])
+    # A single turn longer than the window is kept whole
+    for index in range(start - 1, -1, -1):
+        if isinstance(messages[index], HumanMessage):
+            return list(messages[index:])
+    return list(messages)
@@ -0,0 +1,138 @@
+"""Turn routing in front of the React agent and the lightweight routes it feeds."""
+import logging
+import time
+from typing import Callable, Dict, List, Optional
+
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import AIMessage, BaseMessage, HumanMessage, SystemMessage
+from langchain_core.runnables import RunnableConfig
+
+from business_assistant.config.settings import settings
+from business_assistant.infrastructure.ai.llm import create_chat_model
+from business_assistant.infrastructure.ai.prompts import get_system_prompt
+from business_assistant.infrastructure.ai.prompts.conversation_prompts import get_canned_response
+from business_assistant.infrastructure.ai.turn_classifier import ROUTE_AGENT, classify_turn
+from business_assistant.infrastructure.langgraph.nodes.conversation_nodes import State
+from business_assistant.infrastructure.monitoring import metrics
+from business_assistant.infrastructure.monitoring.usage_ledger import build_turn_usage, usage_ledger
+from business_assistant.infrastructure.services.business_registry import get_business
+
+logger = logging.getLogger(__name__)
+
+# Recent user and assistant messages sent to the small model
+SMALL_MODEL_HISTORY = 6
+
+
+def _last_user_message(messages: List[BaseMessage]) -> str:
+    """Get the text of the latest user message."""
+    for message in reversed(messages):
+        if isinstance(message, HumanMessage):
+            return message.content
+    return ""
+
+
+def route_turn(state: State) -> str:
+    """Choose the route of the current turn from its user message.
+
+    Args:
+        state: Current state containing messages.
+
+    Returns:
+        The route name.
+    """
+    if not settings.model_routing_enabled:
+        return ROUTE_AGENT
+    classification = classify_turn(_last_user_message(state["messages"]))
+    metrics.increment("turn_intent_total", intent=classification.intent)
+    logger.debug("Routing turn to %s (%s)", classification.route, classification.intent)
+    return classification.route
+
+
+def with_route_metrics(route: str, node: Callable) -> Callable:
+    """Wrap a node to record count, latency and token usage of its route.
+
+    The usage of the turn (tokens, tool calls, wall time and cost) is also
+    appended to the usage ledger, keyed by the conversation thread.
+
+    Args:
+        route: The route served by the node.
+        node: The graph node.
+
+    Returns:
+        A graph node recording metrics labelled with the route.
+    """
+    def timed_node(state: State, config: RunnableConfig) -> Dict:
+        start = time.perf_counter()
+        result = node(state, config)
+        elapsed = time.perf_counter() - start
+        metrics.increment("turn_route_total", route=route)
+        metrics.observe("turn_route_seconds", elapsed, route=route)
+        for message in result.get("messages", []):
+            usage = getattr(message, "usage_metadata", None)
+            if usage:
+                metrics.increment("llm_tokens_total", usage.get("input_tokens", 0), route=route, kind="input")
+                metrics.increment("llm_tokens_total", usage.get("output_tokens", 0), route=route, kind="output")
+        
+        configurable = config.get("configurable", {})
+        try:
+            usage_ledger.record(build_turn_usage(
+                result.get("messages", []),
+                route,
+                configurable.get("thread_id", "default-thread"),
+                elapsed,
+                business_id=configurable.get("business_id"),
+                whatsapp_number=configurable.get("user_id"),
+            ))
+        except Exception as e:
+            logger.error(f"Error recording turn usage: {str(e)}")
+        return result
+
+    return timed_node
+
+
+def create_canned_node() -> Callable:
+    """Create the node answering small talk with fixed replies.
+
+    Returns:
+        A function that can be used as a node in the graph.
+    """
+    def canned(state: State, config: RunnableConfig) -> Dict:
+        """Answer greetings, thanks and goodbyes without calling a model."""
+        intent = classify_turn(_last_user_message(state["messages"])).intent
+        business = get_business(config.get("configurable", {}).get("business_id"))
+        return {
+            "messages": [AIMessage(content=get_canned_response(intent, business))],
+            "context": state.get("context", {}),
+        }
+
+    return canned
+
+
+def create_small_model_node(llm: Optional[BaseChatModel] = None) -> Callable:
+    """Create the node answering business FAQs with the small model and no tools.
+
+    Args:
+        llm: The model to use. Defaults to OPENROUTER_SMALL_MODEL.
+
+    Returns:
+        A function that can be used as a node in the graph.
+    """
+    llm = llm or create_chat_model(settings.openrouter_small_model or settings.openrouter_model, temperature=0.3)
+
+    def small_model(state: State, config: RunnableConfig) -> Dict:
+        """Answer from the business information in the system prompt."""
+        # Tool traffic is left out: the small model has no tools and only
+        # needs the recent dialogue
+        dialogue = [
+            message for message in state["messages"]
+            if isinstance(message, HumanMessage) or (isinstance(message, AIMessage) and not message.tool_calls)
+        ]
+        business = get_business(config.get("configurable", {}).get("business_id"))
+        messages = [SystemMessage(content=get_system_prompt(business))] + dialogue[-SMALL_MODEL_HISTORY:]
+        response = llm.invoke(messages)
+        return {
+            "messages": [response],
+            "context": state.get("context", {}),
+        }
+
+    return small_model
@@ -0,0 +1,152 @@
+"""Tool executor node running the tool calls of one agent step concurrently."""
+import contextvars
+import logging
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from typing import Any, Dict, List, Optional, Sequence
+
+from langchain_core.messages import ToolMessage
+from langchain_core.runnables import RunnableConfig
+from langchain_core.runnables.config import get_config_list
+from langchain_core.tools import BaseTool
+from langgraph.prebuilt import ToolNode
+from langgraph.store.base import BaseStore
+from langgraph.types import Command
+
+from business_assistant.config.settings import settings
+from business_assistant.infrastructure.monitoring import metrics
+
+logger = logging.getLogger(__name__)
+
+# Tools with side effects that keep running after a timeout; answering them
+# with an error would make the agent retry and apply the effect twice
+NON_CANCELLABLE_TOOLS = frozenset({"reserve_order"})
+
+# Shared by every executor node so the process-wide number of tool threads stays bounded
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """Get or create the process-wide tool thread pool."""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=settings.tool_max_concurrency,
+                thread_name_prefix="tool-executor",
+            )
+        return _executor
+
+
+def parse_tool_timeouts(spec: str) -> Dict[str, float]:
+    """Parse per-tool timeouts written as ``name=seconds,name=seconds``.
+
+    Args:
+        spec: The timeout overrides.
+
+    Returns:
+        Dictionary of tool name to timeout in seconds.
+    """
+    timeouts = {}
+    for entry in spec.split(","):
+        if not entry.strip():
+            continue
+        name, _, seconds = entry.partition("=")
+        timeouts[name.strip()] = float(seconds)
+    return timeouts
+
+
+class ParallelToolNode(ToolNode):
+    """ToolNode that runs tool calls on a bounded pool with per-tool timeouts.
+
+    Every tool call of an assistant message is submitted at once, so a
+    multi-product question costs the latency of the slowest lookup instead of
+    their sum. Results are returned in the order of the tool calls. A call
+    that exceeds its timeout is answered with an error ToolMessage so the
+    agent can continue; its thread is released when the tool returns.
+    Non-cancellable tools are always waited for, since their work cannot be
+    stopped once started.
+    """
+
+    def __init__(
+        self,
+        tools: Sequence[BaseTool],
+        *,
+        default_timeout: Optional[float] = None,
+        timeouts: Optional[Dict[str, float]] = None,
+        executor: Optional[ThreadPoolExecutor] = None,
+        non_cancellable: Optional[frozenset] = None,
+        **kwargs: Any,
+    ):
+        """Initialize the node.
+
+        Args:
+            tools: Tools the agent can call.
+            default_timeout: Seconds a tool call may take. Defaults to TOOL_TIMEOUT_SECONDS.
+            timeouts: Per-tool timeouts overriding the default. Defaults to TOOL_TIMEOUTS.
+            executor: Thread pool to run tools on. Defaults to the shared pool.
+            non_cancellable: Tools waited for without a timeout. Defaults to
+                NON_CANCELLABLE_TOOLS.
+            **kwargs: Extra ToolNode arguments.
+        """
+        super().__init__(tools, **kwargs)
+        self.default_timeout = default_timeout if default_timeout is not None else settings.tool_timeout_seconds
+        self.timeouts = timeouts if timeouts is not None else parse_tool_timeouts(settings.tool_timeouts)
+        self._executor = executor
+        self.non_cancellable = non_cancellable if non_cancellable is not None else NON_CANCELLABLE_TOOLS
+
+    def _func(self, input: Any, config: RunnableConfig, *, store: Optional[BaseStore]) -> Any:
+        tool_calls, input_type = self._parse_input(input, store)
+        config_list = get_config_list(config, len(tool_calls))
+        executor = self._executor or _get_executor()
+
+        submitted = []
+        for call, call_config in zip(tool_calls, config_list):
+            context = contextvars.copy_context()
+            future = executor.submit(context.run, self._timed_run, call, input_type, call_config)
+            deadline = None
+            if call["name"] not in self.non_cancellable:
+                deadline = time.monotonic() + self.timeouts.get(call["name"], self.default_timeout)
+            submitted.append((call, future, deadline))
+
+        outputs = [self._collect(call, future, deadline) for call, future, deadline in submitted]
+
+        if not any(isinstance(output, Command) for output in outputs):
+            return outputs if input_type == "list" else {self.messages_key: outputs}
+
+        combined_outputs: List[Any] = []
+        for output in outputs:
+            if isinstance(output, Command):
+                combined_outputs.append(output)
+            else:
+                combined_outputs.append([output] if input_type == "list" else {self.messages_key: [output]})
+        return combined_outputs
+
+    def _timed_run(self, call: Dict[str, Any], input_type: str, config: RunnableConfig) -> Any:
+        """Run one tool call and record its latency and outcome."""
+        start = time.perf_counter()
+        output = self._run_one(call, input_type, config)
+        status = getattr(output, "status", "success")
+        metrics.observe("tool_call_seconds", time.perf_counter() - start, tool=call["name"])
+        metrics.increment("tool_calls_total", tool=call["name"], status=status)
+        return output
+
+    @staticmethod
+    def _collect(call: Dict[str, Any], future: Future, deadline: Optional[float]) -> Any:
+        """Wait for a tool call until its deadline, or until it finishes without one."""
+        if deadline is None:
+            return future.result()
+        try:
+            return future.result(timeout=max(0.0, deadline - time.monotonic()))
+        except FutureTimeoutError:
+            future.cancel()
+            logger.warning(f"Tool {call['name']} timed out")
+            metrics.increment("tool_calls_total", tool=call["name"], status="timeout")
+            return ToolMessage(
+                content=f"Error: la herramienta {call['name']} no respondió a tiempo. Intenta de nuevo.",
+                name=call["name"],
+                tool_call_id=call["id"],
+                status="error",
+            )
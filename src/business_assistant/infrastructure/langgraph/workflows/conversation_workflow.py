@@ -4,60 +4,166 @@ from langgraph.checkpoint.memory import MemorySaver
 from langgraph.checkpoint.postgres import PostgresSaver
 from psycopg_pool import ConnectionPool
 
-from business_assistant.infrastructure.ai.prompts import get_system_prompt
+from business_assistant.infrastructure.ai.turn_classifier import ROUTE_AGENT, ROUTE_CANNED, ROUTE_SMALL_MODEL
 from business_assistant.infrastructure.langgraph.nodes.conversation_nodes import State, create_chatbot_node
-from business_assistant.config.settings import settings
+from business_assistant.infrastructure.langgraph.nodes.routing_nodes import (
+    create_canned_node,
+    create_small_model_node,
+    route_turn,
+    with_route_metrics,
+)
+from business_assistant.config.settings import settings, DEPLOYMENT_MODE_SHARED
+from business_assistant.domain.exceptions import TurnProcessingError
+from business_assistant.infrastructure.cache import LRUCache
+from business_assistant.infrastructure.services.business_registry import get_business, tenant_user_key
 
 import logging
+import threading
+from typing import List, Optional
+
+from langchain_core.callbacks import BaseCallbackHandler
+from langchain_core.language_models import BaseChatModel
+from langchain_core.tools import BaseTool
+from langgraph.checkpoint.base import BaseCheckpointSaver
 
 logger = logging.getLogger(__name__)
 
+# Replies sent instead of an answer when a turn fails
+ERROR_RESPONSE = "Lo siento, se me presentó un error y no puedo responderte ahora."
+NO_RESPONSE = "Lo siento, no pude procesar tu mensaje."
+
+# Sentinel distinguishing a cache miss from a cached empty context
+_MISSING = object()
+
+# Context of recently active threads, shared by every workflow in the process
+_thread_state_cache = LRUCache(settings.thread_state_cache_size, name="thread_state")
+
+# One PostgreSQL checkpointer (and connection pool) per process
+_postgres_checkpointer = None
+_checkpointer_lock = threading.Lock()
+
+
 class ConversationWorkflow:
     """Manages the conversation workflow using langgraph with React agent."""
 
-    def __init__(self):
+    def __init__(
+        self,
+        llm: Optional[BaseChatModel] = None,
+        small_llm: Optional[BaseChatModel] = None,
+        tools: Optional[List[BaseTool]] = None,
+        checkpointer: Optional[BaseCheckpointSaver] = None,
+    ):
         """Initialize the conversation workflow with React agent.
         
         Args:
-            model: The model to use for the chatbot.
+            llm: The model of the agent. Defaults to OPENROUTER_MODEL.
+            small_llm: The model answering FAQs. Defaults to OPENROUTER_SMALL_MODEL.
+            tools: The agent's tools. Defaults to the Toolbox and service tools.
+            checkpointer: The checkpointer. Defaults to the shared PostgreSQL
+                checkpointer, or MemorySaver if PostgreSQL is unavailable.
         """
         self.graph_builder = StateGraph(State)
-        self._setup_graph()
+        self._setup_graph(llm, small_llm, tools)
+        
+        # In shared mode every worker reads session state from PostgreSQL only
+        self.shared_state = settings.deployment_mode == DEPLOYMENT_MODE_SHARED
         
+        # Whether the checkpointer was created for this workflow alone and is released with it
+        self._owns_checkpointer = False
+        
+        # A given checkpointer replaces the shared PostgreSQL one (used by traffic replay)
+        if checkpointer is not None:
+            self.checkpointer = checkpointer
+            self.using_postgres = isinstance(checkpointer, PostgresSaver)
+        else:
+            self._init_checkpointer()
+            
+        self.graph = self.graph_builder.compile(checkpointer=self.checkpointer)
+        # Store thread IDs for different users
+        self.user_threads = {}
+        # Store context for different users
+        self.user_contexts = {}
+
+    def _init_checkpointer(self) -> None:
+        """Use the PostgreSQL checkpointer, falling back to MemorySaver."""
         # Use PostgreSQL checkpointer if possible, fallback to MemorySaver
         try:
             self.checkpointer = self._init_postgres_checkpointer()
             logger.info("Using PostgreSQL checkpointer for conversation state persistence")
             self.using_postgres = True
         except Exception as e:
+            if self.shared_state:
+                # An in-memory fallback would give each worker a different view of the conversation
+                raise RuntimeError("Shared deployment mode requires the PostgreSQL checkpointer") from e
             logger.warning(f"Failed to initialize PostgreSQL checkpointer, falling back to MemorySaver: {str(e)}")
             self.checkpointer = MemorySaver()
+            self._owns_checkpointer = True
             self.using_postgres = False
-            
-        self.graph = self.graph_builder.compile(checkpointer=self.checkpointer)
-        # Store thread IDs for different users
-        self.user_threads = {}
-        # Store context for different users
-        self.user_contexts = {}
 
-    def _setup_graph(self) -> None:
+    def close(self) -> None:
+        """Release the resources this workflow owns.
+        
+        The PostgreSQL checkpointer and its connection pool are shared by
+        every workflow of the process and stay open, as does a checkpointer
+        passed in by the caller. An in-memory fallback checkpointer and the
+        per-user thread and context maps are dropped.
+        """
+        if self._owns_checkpointer:
+            self.checkpointer.storage.clear()
+        self.user_threads.clear()
+        self.user_contexts.clear()
+
+    def _setup_graph(
+        self,
+        llm: Optional[BaseChatModel] = None,
+        small_llm: Optional[BaseChatModel] = None,
+        tools: Optional[List[BaseTool]] = None,
+    ) -> None:
         """Set up the graph with nodes and edges."""
         # Add chatbot node with React agent
-        self.graph_builder.add_node("chatbot", create_chatbot_node())
-        
-        # Add edges
-        self.graph_builder.add_edge(START, "chatbot")
+        self.graph_builder.add_node("chatbot", with_route_metrics(ROUTE_AGENT, create_chatbot_node(llm, tools)))
         self.graph_builder.add_edge("chatbot", END)
         
+        if not settings.model_routing_enabled:
+            self.graph_builder.add_edge(START, "chatbot")
+            return
+        
+        # Small talk and FAQ turns skip the agent
+        self.graph_builder.add_node(ROUTE_CANNED, with_route_metrics(ROUTE_CANNED, create_canned_node()))
+        self.graph_builder.add_node(ROUTE_SMALL_MODEL, with_route_metrics(ROUTE_SMALL_MODEL, create_small_model_node(small_llm)))
+        self.graph_builder.add_conditional_edges(
+            START,
+            route_turn,
+            {ROUTE_AGENT: "chatbot", ROUTE_CANNED: ROUTE_CANNED, ROUTE_SMALL_MODEL: ROUTE_SMALL_MODEL},
+        )
+        self.graph_builder.add_edge(ROUTE_CANNED, END)
+        self.graph_builder.add_edge(ROUTE_SMALL_MODEL, END)
+        
     def _init_postgres_checkpointer(self):
         """Initialize the PostgreSQL checkpointer saver with a connection pool.
         
+        The checkpointer is created once per process and shared by every
+        workflow, so the number of connections does not grow with users.
+        
         Returns:
             PostgresSaver: The PostgreSQL checkpointer instance with connection pool.
             
         Raises:
             Exception: If the PostgreSQL connection pool initialization fails.
         """
+        global _postgres_checkpointer
+        with _checkpointer_lock:
+            if _postgres_checkpointer is None:
+                _postgres_checkpointer = self._create_postgres_checkpointer()
+            return _postgres_checkpointer
+    
+    @staticmethod
+    def _create_postgres_checkpointer():
+        """Create the PostgreSQL checkpointer and its tables.
+        
+        Returns:
+            PostgresSaver: The PostgreSQL checkpointer instance with connection pool.
+        """
         try:
             # Create connection string from settings
             connection_string = f"postgresql://{settings.db_user}:{settings.db_password}@{settings.db_host}:{settings.db_port}/{settings.db_name}"
@@ -90,11 +196,16 @@ class ConversationWorkflow:
     def _restore_thread_from_checkpointer(self, user_id: str):
         """Attempt to restore a thread and its context from the checkpointer.
         
+        Hot threads are served from the shared in-memory LRU; otherwise the
+        latest checkpoint for the thread is fetched with a single indexed
+        ``get_tuple`` lookup. In shared mode the LRU is bypassed because
+        another worker may have advanced the thread.
+        
         Args:
             user_id: The unique identifier for the user
             
         Returns:
-            tuple: (thread_id, context) - The thread ID and context if found, or (None, {}) if not
+            tuple: (thread_id, context) - The thread ID and context if found, or (thread_id, {}) if not
         """
         thread_id = f"thread-{user_id}"
         
@@ -102,110 +213,131 @@ class ConversationWorkflow:
         if not self.using_postgres:
             return thread_id, {}
             
-        # Early return if checkpointer doesn't support listing checkpoints
-        if not hasattr(self.checkpointer, 'list_checkpoints'):
-            return thread_id, {}
+        if not self.shared_state:
+            cached_context = _thread_state_cache.get(thread_id, _MISSING)
+            if cached_context is not _MISSING:
+                logger.debug("Thread state cache hit for %s", thread_id)
+                return thread_id, cached_context
             
         try:
-            # Direct check if thread exists in checkpoints
-            if thread_id not in self.checkpointer.list_checkpoints():
-                return thread_id, {}
-                
-            # Thread exists, get its state directly
-            state = self.checkpointer.get(thread_id)
+            # Latest checkpoint for the thread (ORDER BY checkpoint_id DESC LIMIT 1)
+            checkpoint_tuple = self.checkpointer.get_tuple(self._thread_config(thread_id))
+        except Exception as e:
+            logger.warning(f"Error restoring thread from checkpointer: {str(e)}")
+            return thread_id, {}
             
-            # Return context if available
-            if state and "context" in state:
+        context = {}
+        if checkpoint_tuple is not None:
+            channel_values = checkpoint_tuple.checkpoint.get("channel_values", {})
+            context = channel_values.get("context") or {}
+            if context:
                 logger.info(f"Restored context for user {user_id} from checkpoint")
-                return thread_id, state["context"]
                 
-        except Exception as e:
-            logger.warning(f"Error restoring thread from checkpointer: {str(e)}")
+        if not self.shared_state:
+            _thread_state_cache.put(thread_id, context)
+        return thread_id, context
+    
+    @staticmethod
+    def _thread_config(thread_id: str) -> dict:
+        """Build the runnable config addressing a conversation thread.
+        
+        Args:
+            thread_id: The thread identifier.
             
-        return thread_id, {}
+        Returns:
+            The config dict expected by the graph and the checkpointer.
+        """
+        return {"configurable": {"thread_id": thread_id}}
     
-    def process_message(self, user_id: str, message: str) -> str:
+    def process_message(
+        self,
+        user_id: str,
+        message: str,
+        business_id: Optional[int] = None,
+        callbacks: Optional[List[BaseCallbackHandler]] = None,
+        raise_errors: bool = False,
+    ) -> str:
         """Process a message through the conversation workflow using React agent.
         
         Args:
             user_id: The unique identifier for the user (e.g., WhatsApp number)
             message: The message to process.
+            business_id: The business the user writes to. Defaults to the default business.
+            callbacks: Callback handlers observing the model calls and tool runs of the turn.
+            raise_errors: Raise when the turn fails instead of answering with an
+                apology, so queued messages are retried.
             
         Returns:
             The assistant's response.
+            
+        Raises:
+            TurnProcessingError: If the turn failed and ``raise_errors`` is set.
         """
-        # Try to restore thread and context from checkpointer
-        thread_id, restored_context = self._restore_thread_from_checkpointer(user_id)
+        business = get_business(business_id)
         
-        # Update user_threads with the thread ID
-        self.user_threads[user_id] = thread_id
+        # Try to restore thread and context from checkpointer; a number writing
+        # to several businesses has one thread per business
+        thread_id, restored_context = self._restore_thread_from_checkpointer(tenant_user_key(user_id, business_id))
         
-        # Use restored context if available, otherwise use existing in-memory context or empty dict
-        if restored_context:
-            self.user_contexts[user_id] = restored_context
-            logger.info(f"Using restored context for user {user_id} from checkpoint")
-        
-        # Get existing context for this user if available
-        user_context = self.user_contexts.get(user_id, {})
-        logger.debug(f"Retrieved existing context for user {user_id}: {user_context}")
+        if self.shared_state:
+            # Nothing is kept per user in this process; the checkpoint is the source of truth
+            user_context = restored_context
+        else:
+            # Update user_threads with the thread ID
+            self.user_threads[user_id] = thread_id
+            
+            # Use restored context if available, otherwise use existing in-memory context or empty dict
+            if restored_context:
+                self.user_contexts[user_id] = restored_context
+                logger.info(f"Using restored context for user {user_id} from checkpoint")
+            
+            # Get existing context for this user if available
+            user_context = self.user_contexts.get(user_id, {})
+        logger.debug("Retrieved existing context for user %s: %s", user_id, user_context)
         
-        # Initialize state with system and user messages
+        # Initialize state with the user message; the nodes add the system prompt
         initial_state = {
             "messages": [
-                {
-                    "role": "system",
-                    "content": get_system_prompt()
-                },
                 {"role": "user", "content": message}
             ],
             "thread_id": thread_id,
             "context": user_context
         }
         
-        # Configure the graph with the thread_id
-        config = {"configurable": {"thread_id": thread_id}}
+        # Configure the graph with the thread_id and the user tools act on behalf of
+        config = self._thread_config(thread_id)
+        config["configurable"]["user_id"] = user_id
+        config["configurable"]["business_id"] = business.business_id
+        if callbacks:
+            config["callbacks"] = callbacks
         
         # Process through graph
         try:
             last_context = {}
             for event in self.graph.stream(initial_state, config=config):
-                logger.debug(f"Event: {event}")
+                logger.debug("Event: %s", event)
                 for key, value in event.items():
                     # Store context for future use
                     if "context" in value and value["context"]:
                         last_context = value["context"]
-                        logger.debug(f"Updated context: {last_context}")
+                        logger.debug("Updated context: %s", last_context)
                     
                     # Return the assistant's response
                     if "messages" in value and value["messages"]:
                         # Store the context in the user's thread data for future messages
-                        if last_context:
+                        if last_context and not self.shared_state:
                             # Create a simple dictionary to store user contexts if it doesn't exist
                             if not hasattr(self, 'user_contexts'):
                                 self.user_contexts = {}
                             
                             # Store the context for this user
                             self.user_contexts[user_id] = last_context
-                            logger.debug(f"Saved context for user {user_id}: {last_context}")
+                            logger.debug("Saved context for user %s: %s", user_id, last_context)
                             
-                            # Explicitly save the state to the checkpointer if using PostgreSQL
-                            if self.using_postgres:
-                                try:
-                                    # Ensure the thread ID is in the checkpointer
-                                    thread_id = self.user_threads.get(user_id, f"thread-{user_id}")
-                                    
-                                    # Create a state object with the context
-                                    state_to_save = {
-                                        "messages": value["messages"],
-                                        "context": last_context,
-                                        "thread_id": thread_id
-                                    }
-                                    
-                                    # Save to the checkpointer
-                                    self.checkpointer.put(thread_id, state_to_save)
-                                    logger.info(f"Explicitly saved state to PostgreSQL checkpointer for thread {thread_id}")
-                                except Exception as e:
-                                    logger.error(f"Failed to explicitly save state to checkpointer: {str(e)}")
+                        # The compiled graph already checkpointed this turn; keep the
+                        # hot copy in sync so the next restore skips the database
+                        if self.using_postgres and not self.shared_state:
+                            _thread_state_cache.put(thread_id, self.user_contexts.get(user_id, {}))
                         
                         # Handle both dict-like messages and LangChain message objects
                         last_message = value["messages"][-1]
@@ -221,6 +353,10 @@ class ConversationWorkflow:
                             return str(last_message)
         except Exception as e:
             logger.error(f"Error processing message: {str(e)}")
-            return "Lo siento, se me presentó un error y no puedo responderte ahora."
+            if raise_errors:
+                raise TurnProcessingError(f"{type(e).__name__}: {e}") from e
+            return ERROR_RESPONSE
 
-        return "Lo siento, no pude procesar tu mensaje."
+        if raise_errors:
+            raise TurnProcessingError("the graph produced no response")
+        return NO_RESPONSE
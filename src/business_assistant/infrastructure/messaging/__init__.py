@@ -0,0 +1,19 @@
+"""Inbound message queue processing and outbound reply delivery."""
+
+from business_assistant.infrastructure.messaging.outbound import (
+    HttpOutboundSender,
+    LoggingOutboundSender,
+    OutboundSender,
+    get_outbound_sender,
+)
+from business_assistant.infrastructure.messaging.inbound_worker import InboundWorkerPool
+from business_assistant.infrastructure.messaging.batch_processor import BatchProcessor
+
+__all__ = [
+    "BatchProcessor",
+    "HttpOutboundSender",
+    "InboundWorkerPool",
+    "LoggingOutboundSender",
+    "OutboundSender",
+    "get_outbound_sender",
+]
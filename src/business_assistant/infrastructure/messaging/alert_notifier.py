@@ -0,0 +1,107 @@
+"""Notifiers delivering inventory alerts to the business owner."""
+import logging
+import threading
+from typing import List, Protocol, Tuple
+
+from business_assistant.config.settings import settings
+from business_assistant.domain.models.business import Business
+from business_assistant.domain.models.inventory_alert import ALERT_EXPIRING, ALERT_LOW_STOCK, InventoryAlert
+from business_assistant.infrastructure.messaging.outbound import OutboundSender, get_outbound_sender
+
+logger = logging.getLogger(__name__)
+
+# Message id of alert notifications; they answer no inbound message
+ALERT_MESSAGE_ID = 0
+
+
+def format_alerts(business: Business, alerts: List[InventoryAlert]) -> str:
+    """Render the alerts of a business as one message for its owner.
+
+    Args:
+        business: The business.
+        alerts: Its new alerts.
+
+    Returns:
+        The message text.
+    """
+    sections = [f"Alertas de inventario de {business.name}"]
+    low_stock = [alert.describe() for alert in alerts if alert.kind == ALERT_LOW_STOCK]
+    expiring = [alert.describe() for alert in alerts if alert.kind == ALERT_EXPIRING]
+    if low_stock:
+        sections.append("Stock bajo:\n" + "\n".join(low_stock))
+    if expiring:
+        sections.append("Próximos a vencer:\n" + "\n".join(expiring))
+    return "\n\n".join(sections)
+
+
+class AlertNotifier(Protocol):
+    """Delivers the new alerts of a business to its owner.
+
+    Implementations raise an exception when the alerts were not delivered,
+    so the next run notifies them again.
+    """
+
+    def notify(self, business: Business, alerts: List[InventoryAlert]) -> None:
+        ...
+
+
+class LoggingAlertNotifier:
+    """Notifier that only logs and records alerts, for development and tests."""
+
+    def __init__(self):
+        self.sent: List[Tuple[int, str]] = []
+        self._lock = threading.Lock()
+
+    def notify(self, business: Business, alerts: List[InventoryAlert]) -> None:
+        """Record the alerts instead of delivering them.
+
+        Args:
+            business: The business.
+            alerts: Its new alerts.
+        """
+        text = format_alerts(business, alerts)
+        with self._lock:
+            self.sent.append((business.business_id, text))
+        logger.info(f"Inventory alerts for business {business.business_id}:\n{text}")
+
+
+class OutboundAlertNotifier:
+    """Notifier sending the alerts to the business phone through the outbound sender."""
+
+    def __init__(self, sender: OutboundSender):
+        """Initialize the notifier.
+
+        Args:
+            sender: Sender delivering WhatsApp messages.
+        """
+        self.sender = sender
+
+    def notify(self, business: Business, alerts: List[InventoryAlert]) -> None:
+        """Send the alerts to the business phone.
+
+        Args:
+            business: The business.
+            alerts: Its new alerts.
+
+        Raises:
+            ValueError: If the business has no phone.
+        """
+        if not business.phone:
+            raise ValueError(f"Business {business.business_id} has no phone to send inventory alerts to")
+        self.sender.send(business.phone, format_alerts(business, alerts), ALERT_MESSAGE_ID)
+
+
+def get_alert_notifier() -> AlertNotifier:
+    """Create the notifier selected by INVENTORY_ALERT_NOTIFIER.
+
+    Returns:
+        The configured alert notifier.
+
+    Raises:
+        ValueError: If the notifier is unknown.
+    """
+    if settings.inventory_alert_notifier == "log":
+        return LoggingAlertNotifier()
+    if settings.inventory_alert_notifier == "outbound":
+        return OutboundAlertNotifier(get_outbound_sender())
+    raise ValueError(f"Unknown INVENTORY_ALERT_NOTIFIER: {settings.inventory_alert_notifier}")
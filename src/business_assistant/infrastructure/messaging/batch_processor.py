@@ -0,0 +1,227 @@
+"""Bounded worker pool running batches of chat turns.
+
+A batch is split into lanes, one per customer, and each lane runs its
+messages in the order they were given. Lanes of all batches share one pool
+of threads, so a large broadcast cannot take more than ``workers`` agent
+runs at a time. A customer that appears in two batches at once still gets
+one turn at a time.
+
+Jobs are kept in the memory of the process that received them, so with
+several server workers a job can only be polled on the worker that
+created it.
+"""
+import logging
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from business_assistant.config.logging_config import log_context
+from business_assistant.config.settings import settings
+from business_assistant.infrastructure.cache import LRUCache
+from business_assistant.infrastructure.monitoring import metrics
+
+logger = logging.getLogger(__name__)
+
+# Job and item states
+STATUS_PENDING = "pending"
+STATUS_RUNNING = "running"
+STATUS_DONE = "done"
+STATUS_FAILED = "failed"
+
+
+@dataclass
+class BatchItem:
+    """One message of a batch and its outcome."""
+
+    index: int
+    whatsapp_number: str
+    message: str
+    business_id: Optional[int] = None
+    status: str = STATUS_PENDING
+    response: Optional[str] = None
+    error: Optional[str] = None
+    seconds: Optional[float] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """The outcome as returned to the client."""
+        return {
+            "index": self.index,
+            "whatsapp_number": self.whatsapp_number,
+            "status": self.status,
+            "response": self.response,
+            "error": self.error,
+            "seconds": self.seconds,
+        }
+
+
+@dataclass
+class BatchJob:
+    """A submitted batch and the outcomes of its finished items."""
+
+    job_id: str
+    items: List[BatchItem]
+    created_at: float = field(default_factory=time.time)
+    finished_at: Optional[float] = None
+    # Finished items in completion order; clients page through it by offset
+    results: List[BatchItem] = field(default_factory=list)
+    _changed: threading.Condition = field(default_factory=threading.Condition, repr=False)
+
+    @property
+    def total(self) -> int:
+        """Items in the batch."""
+        return len(self.items)
+
+    @property
+    def completed(self) -> int:
+        """Items answered."""
+        return sum(1 for item in self.results if item.status == STATUS_DONE)
+
+    @property
+    def failed(self) -> int:
+        """Items whose turn raised an error."""
+        return sum(1 for item in self.results if item.status == STATUS_FAILED)
+
+    @property
+    def status(self) -> str:
+        """pending until an item starts, running until all are finished, then done."""
+        if len(self.results) == self.total:
+            return STATUS_DONE
+        if self.results or any(item.status == STATUS_RUNNING for item in self.items):
+            return STATUS_RUNNING
+        return STATUS_PENDING
+
+    def finish(self, item: BatchItem) -> None:
+        """Record a finished item and wake up the readers of the job."""
+        with self._changed:
+            self.results.append(item)
+            if len(self.results) == self.total:
+                self.finished_at = time.time()
+            self._changed.notify_all()
+
+    def iter_results(self, offset: int = 0, timeout: Optional[float] = None) -> Iterator[BatchItem]:
+        """Yield finished items as they complete, until the job is done.
+
+        Args:
+            offset: Results already seen by the reader.
+            timeout: Seconds to wait for the next result before giving up.
+
+        Returns:
+            Iterator over the finished items in completion order.
+        """
+        position = offset
+        while position < self.total:
+            with self._changed:
+                if position >= len(self.results) and not self._changed.wait_for(
+                    lambda: position < len(self.results), timeout
+                ):
+                    return
+                pending = self.results[position:]
+            for item in pending:
+                yield item
+            position += len(pending)
+
+
+class BatchProcessor:
+    """Schedules batches of chat turns on a bounded thread pool."""
+
+    def __init__(
+        self,
+        handler: Callable[[str, str, Optional[int]], str],
+        workers: Optional[int] = None,
+        max_jobs: Optional[int] = None,
+        job_ttl: Optional[float] = None,
+    ):
+        """Initialize the processor.
+
+        Args:
+            handler: Function answering ``(whatsapp_number, message, business_id)`` with the reply.
+            workers: Turns run at the same time across all batches. Defaults to BATCH_WORKERS.
+            max_jobs: Jobs kept for polling. Defaults to BATCH_MAX_JOBS.
+            job_ttl: Seconds a job is kept after it was last read. Defaults to BATCH_JOB_TTL_SECONDS.
+        """
+        self.handler = handler
+        self.workers = workers if workers is not None else settings.batch_workers
+        self.jobs = LRUCache(
+            max_jobs if max_jobs is not None else settings.batch_max_jobs,
+            ttl=job_ttl if job_ttl is not None else settings.batch_job_ttl_seconds,
+            name="batch_jobs",
+        )
+        self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="batch-worker")
+        # Customer -> [lock, lanes holding it]; a customer's lock lives while one of its lanes does
+        self._customer_locks: Dict[Tuple[str, Optional[int]], list] = {}
+        self._locks_guard = threading.Lock()
+
+    def submit(self, items: List[Tuple[str, str, Optional[int]]]) -> BatchJob:
+        """Schedule a batch.
+
+        Args:
+            items: ``(whatsapp_number, message, business_id)`` tuples.
+
+        Returns:
+            The job, already queued.
+        """
+        job = BatchJob(
+            job_id=uuid.uuid4().hex,
+            items=[
+                BatchItem(index, number, message, business_id)
+                for index, (number, message, business_id) in enumerate(items)
+            ],
+        )
+        lanes: Dict[Tuple[str, Optional[int]], List[BatchItem]] = {}
+        for item in job.items:
+            lanes.setdefault((item.whatsapp_number, item.business_id), []).append(item)
+        self.jobs.put(job.job_id, job)
+        for key, lane in lanes.items():
+            self._executor.submit(self._run_lane, job, key, lane)
+        metrics.increment("batch_jobs_total")
+        logger.info(f"Queued batch {job.job_id} with {job.total} messages for {len(lanes)} customers")
+        return job
+
+    def get(self, job_id: str) -> Optional[BatchJob]:
+        """Get a job by id, or None if it is unknown or expired."""
+        return self.jobs.get(job_id)
+
+    def shutdown(self) -> None:
+        """Stop taking lanes; queued lanes are dropped and running turns finish."""
+        self._executor.shutdown(wait=True, cancel_futures=True)
+
+    def _run_lane(self, job: BatchJob, key: Tuple[str, Optional[int]], lane: List[BatchItem]) -> None:
+        lock = self._acquire_customer(key)
+        try:
+            with lock:
+                for item in lane:
+                    self._run_item(job, item)
+        finally:
+            self._release_customer(key)
+
+    def _run_item(self, job: BatchJob, item: BatchItem) -> None:
+        item.status = STATUS_RUNNING
+        start = time.perf_counter()
+        with log_context(request_id=f"batch-{job.job_id}-{item.index}"):
+            try:
+                item.response = self.handler(item.whatsapp_number, item.message, item.business_id)
+                item.status = STATUS_DONE
+            except Exception as e:
+                logger.error(f"Error processing batch item {item.index} of {job.job_id}: {str(e)}")
+                item.error = str(e)
+                item.status = STATUS_FAILED
+        item.seconds = round(time.perf_counter() - start, 3)
+        metrics.observe("batch_item_seconds", item.seconds, outcome=item.status)
+        metrics.increment("batch_items_total", outcome=item.status)
+        job.finish(item)
+
+    def _acquire_customer(self, key: Tuple[str, Optional[int]]) -> threading.Lock:
+        with self._locks_guard:
+            entry = self._customer_locks.setdefault(key, [threading.Lock(), 0])
+            entry[1] += 1
+            return entry[0]
+
+    def _release_customer(self, key: Tuple[str, Optional[int]]) -> None:
+        with self._locks_guard:
+            entry = self._customer_locks[key]
+            entry[1] -= 1
+            if entry[1] == 0:
+                del self._customer_locks[key]
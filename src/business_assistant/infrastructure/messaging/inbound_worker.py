@@ -0,0 +1,171 @@
+"""Worker pool draining the durable inbound message queue."""
+import logging
+import threading
+import time
+from typing import Callable, List, Optional
+
+from business_assistant.config.logging_config import log_context
+from business_assistant.config.settings import settings
+from business_assistant.domain.models.inbound_message import InboundMessage
+from business_assistant.infrastructure.messaging.outbound import OutboundSender
+from business_assistant.infrastructure.monitoring import metrics
+from business_assistant.infrastructure.persistence.repositories.inbound_queue_repository import (
+    PostgresInboundQueueRepository,
+)
+
+logger = logging.getLogger(__name__)
+
+# Seconds between stale-message recovery and queue depth refreshes
+MAINTENANCE_INTERVAL = 15.0
+
+# Longest delay between two attempts of the same message
+MAX_RETRY_DELAY = 600.0
+
+# Message outcomes
+OUTCOME_DONE = "done"
+OUTCOME_RETRY = "retry"
+OUTCOME_DEAD = "dead"
+
+
+class InboundWorkerPool:
+    """Threads that claim queued messages, run their turn and deliver the reply.
+
+    The reply is stored before it is sent, so a message whose delivery fails
+    is retried without running the turn again. Failed messages are requeued
+    with exponential backoff and dead-lettered after ``max_attempts``.
+    """
+
+    def __init__(
+        self,
+        handler: Callable[[str, str, Optional[int]], str],
+        sender: OutboundSender,
+        repository: Optional[PostgresInboundQueueRepository] = None,
+        workers: Optional[int] = None,
+        poll_interval: Optional[float] = None,
+        max_attempts: Optional[int] = None,
+        retry_backoff: Optional[float] = None,
+        visibility_timeout: Optional[float] = None,
+    ):
+        """Initialize the pool.
+
+        Args:
+            handler: Function answering ``(whatsapp_number, message, business_id)`` with the reply.
+            sender: Sender delivering the replies.
+            repository: Queue repository. Defaults to the PostgreSQL queue.
+            workers: Number of worker threads. Defaults to INBOUND_WORKERS.
+            poll_interval: Seconds an idle worker waits before polling again.
+            max_attempts: Attempts before a message is dead-lettered.
+            retry_backoff: Delay of the first retry in seconds, doubled on each attempt.
+            visibility_timeout: Seconds a message may stay in progress before
+                it is considered abandoned and requeued.
+        """
+        self.handler = handler
+        self.sender = sender
+        self.repository = repository or PostgresInboundQueueRepository()
+        self.workers = workers if workers is not None else settings.inbound_workers
+        self.poll_interval = poll_interval if poll_interval is not None else settings.inbound_poll_interval
+        self.max_attempts = max_attempts if max_attempts is not None else settings.inbound_max_attempts
+        self.retry_backoff = retry_backoff if retry_backoff is not None else settings.inbound_retry_backoff_seconds
+        self.visibility_timeout = (
+            visibility_timeout if visibility_timeout is not None else settings.inbound_visibility_timeout
+        )
+        self._stop = threading.Event()
+        self._threads: List[threading.Thread] = []
+
+    def start(self) -> None:
+        """Start the worker and maintenance threads."""
+        self._stop.clear()
+        for index in range(self.workers):
+            thread = threading.Thread(target=self._work, name=f"inbound-worker-{index}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+        maintenance = threading.Thread(target=self._maintain, name="inbound-maintenance", daemon=True)
+        maintenance.start()
+        self._threads.append(maintenance)
+        logger.info(f"Started {self.workers} inbound workers")
+
+    def stop(self, timeout: float = 30.0) -> None:
+        """Stop the threads, letting in-progress messages finish.
+
+        Args:
+            timeout: Seconds to wait for each thread.
+        """
+        self._stop.set()
+        for thread in self._threads:
+            thread.join(timeout)
+        self._threads = []
+        logger.info("Stopped inbound workers")
+
+    def run_once(self) -> bool:
+        """Claim and process one message.
+
+        Returns:
+            Whether a message was processed.
+        """
+        messages = self.repository.claim(1)
+        for message in messages:
+            self.process(message)
+        return bool(messages)
+
+    def process(self, message: InboundMessage) -> str:
+        """Run the turn of a claimed message and deliver its reply.
+
+        Args:
+            message: The claimed message.
+
+        Returns:
+            The outcome: done, retry or dead.
+        """
+        if message.queued_seconds is not None:
+            metrics.observe("inbound_queue_wait_seconds", message.queued_seconds)
+        start = time.perf_counter()
+        # The queued message plays the role of the request in the logs
+        with log_context(request_id=f"inbound-{message.message_id}"):
+            try:
+                response = message.response
+                if response is None:
+                    response = self.handler(message.whatsapp_number, message.body, message.business_id)
+                    self.repository.save_response(message.message_id, response)
+                self.sender.send(message.whatsapp_number, response, message.message_id)
+                self.repository.complete(message.message_id)
+                outcome = OUTCOME_DONE
+            except Exception as e:
+                outcome = self._fail(message, e)
+        metrics.observe("inbound_processing_seconds", time.perf_counter() - start, outcome=outcome)
+        metrics.increment("inbound_messages_total", outcome=outcome)
+        return outcome
+
+    def _fail(self, message: InboundMessage, error: Exception) -> str:
+        """Requeue or dead-letter a message whose processing failed."""
+        reason = f"{type(error).__name__}: {error}"
+        if message.attempts >= self.max_attempts:
+            logger.error(f"Dead-lettering inbound message {message.message_id} after {message.attempts} attempts: {reason}")
+            self.repository.dead_letter(message.message_id, reason)
+            return OUTCOME_DEAD
+        delay = min(MAX_RETRY_DELAY, self.retry_backoff * 2 ** (message.attempts - 1))
+        logger.warning(f"Retrying inbound message {message.message_id} in {delay:.0f}s: {reason}")
+        self.repository.retry(message.message_id, delay, reason)
+        return OUTCOME_RETRY
+
+    def _work(self) -> None:
+        while not self._stop.is_set():
+            try:
+                processed = self.run_once()
+            except Exception as e:
+                logger.error(f"Error claiming inbound messages: {str(e)}")
+                processed = False
+            if not processed:
+                self._stop.wait(self.poll_interval)
+
+    def _maintain(self) -> None:
+        while not self._stop.is_set():
+            try:
+                recovered = self.repository.recover_stale(self.visibility_timeout)
+                if recovered:
+                    logger.warning(f"Requeued {recovered} abandoned inbound messages")
+                    metrics.increment("inbound_messages_recovered_total", recovered)
+                for status, count in self.repository.depth().items():
+                    metrics.set_gauge("inbound_queue_depth", count, status=status)
+            except Exception as e:
+                logger.error(f"Error maintaining inbound queue: {str(e)}")
+            self._stop.wait(MAINTENANCE_INTERVAL)
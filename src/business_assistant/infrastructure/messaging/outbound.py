@@ -0,0 +1,93 @@
+"""Outbound senders delivering assistant replies to the messaging platform."""
+import logging
+import threading
+from typing import List, Optional, Protocol, Tuple
+
+import httpx
+
+from business_assistant.config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+
+class OutboundSender(Protocol):
+    """Delivers a reply to a WhatsApp number.
+
+    Implementations raise an exception when the reply was not delivered, so
+    the message is retried.
+    """
+
+    def send(self, whatsapp_number: str, text: str, message_id: int) -> None:
+        ...
+
+
+class LoggingOutboundSender:
+    """Sender that only logs and records replies, for development and tests."""
+
+    def __init__(self):
+        self.sent: List[Tuple[str, str, int]] = []
+        self._lock = threading.Lock()
+
+    def send(self, whatsapp_number: str, text: str, message_id: int) -> None:
+        """Record a reply instead of delivering it.
+
+        Args:
+            whatsapp_number: The recipient.
+            text: The reply text.
+            message_id: The inbound message being answered.
+        """
+        with self._lock:
+            self.sent.append((whatsapp_number, text, message_id))
+        logger.info(f"Reply to {whatsapp_number} for message {message_id}: {text[:80]}")
+
+
+class HttpOutboundSender:
+    """Sender posting replies as JSON to the gateway of the messaging platform."""
+
+    def __init__(self, url: str, timeout: float = 10.0, client: Optional[httpx.Client] = None):
+        """Initialize the sender.
+
+        Args:
+            url: Endpoint receiving ``{"whatsapp_number", "message", "message_id"}``.
+            timeout: Request timeout in seconds.
+            client: HTTP client to use. Defaults to a new pooled client.
+        """
+        self.url = url
+        self._client = client or httpx.Client(timeout=timeout)
+
+    def send(self, whatsapp_number: str, text: str, message_id: int) -> None:
+        """Deliver a reply.
+
+        Args:
+            whatsapp_number: The recipient.
+            text: The reply text.
+            message_id: The inbound message being answered, sent so the
+                gateway can drop duplicates after a retry.
+
+        Raises:
+            httpx.HTTPError: If the gateway is unreachable or rejects the reply.
+        """
+        response = self._client.post(self.url, json={
+            "whatsapp_number": whatsapp_number,
+            "message": text,
+            "message_id": message_id,
+        })
+        response.raise_for_status()
+
+
+def get_outbound_sender() -> OutboundSender:
+    """Create the sender selected by OUTBOUND_SENDER.
+
+    Returns:
+        The configured outbound sender.
+
+    Raises:
+        ValueError: If the sender is unknown or its URL is missing.
+    """
+    if settings.outbound_sender == "log":
+        return LoggingOutboundSender()
+    if settings.outbound_sender == "http":
+        if not settings.outbound_webhook_url:
+            raise ValueError("OUTBOUND_WEBHOOK_URL is required when OUTBOUND_SENDER=http")
+        return HttpOutboundSender(settings.outbound_webhook_url, timeout=settings.outbound_timeout_seconds)
+    raise ValueError(f"Unknown OUTBOUND_SENDER: {settings.outbound_sender}")
@@ -0,0 +1,5 @@
+"""Runtime monitoring utilities for the business assistant."""
+
+from business_assistant.infrastructure.monitoring.metrics import MetricsRegistry, metrics
+
+__all__ = ["MetricsRegistry", "metrics"]
@@ -0,0 +1,154 @@
+"""In-process metrics registry."""
+import random
+import threading
+from typing import Dict, List
+
+# Number of observations kept per summary to estimate percentiles
+_RESERVOIR_SIZE = 1024
+
+
+def _metric_key(name: str, labels: Dict[str, str]) -> str:
+    """Build the flat key for a metric and its labels.
+
+    Args:
+        name: The metric name.
+        labels: Label names and values.
+
+    Returns:
+        A key such as ``evictions_total{cache=workflows,reason=expired}``.
+    """
+    if not labels:
+        return name
+    label_str = ",".join(f"{key}={value}" for key, value in sorted(labels.items()))
+    return f"{name}{{{label_str}}}"
+
+
+class _Summary:
+    """Running summary of observed values with a sampled reservoir."""
+
+    __slots__ = ("count", "total", "minimum", "maximum", "reservoir")
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.minimum = float("inf")
+        self.maximum = float("-inf")
+        self.reservoir: List[float] = []
+
+    def observe(self, value: float) -> None:
+        self.count += 1
+        self.total += value
+        self.minimum = min(self.minimum, value)
+        self.maximum = max(self.maximum, value)
+        if len(self.reservoir) < _RESERVOIR_SIZE:
+            self.reservoir.append(value)
+        else:
+            # Reservoir sampling keeps a uniform sample of every observation
+            index = random.randrange(self.count)
+            if index < _RESERVOIR_SIZE:
+                self.reservoir[index] = value
+
+    def to_dict(self) -> Dict[str, float]:
+        ordered = sorted(self.reservoir)
+
+        def percentile(fraction: float) -> float:
+            if not ordered:
+                return 0.0
+            return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+        return {
+            "count": self.count,
+            "sum": self.total,
+            "min": self.minimum if self.count else 0.0,
+            "max": self.maximum if self.count else 0.0,
+            "p50": percentile(0.50),
+            "p95": percentile(0.95),
+            "p99": percentile(0.99),
+        }
+
+
+class MetricsRegistry:
+    """Thread-safe registry of counters, gauges and summaries."""
+
+    def __init__(self):
+        """Initialize an empty registry."""
+        self._lock = threading.Lock()
+        self._counters: Dict[str, float] = {}
+        self._gauges: Dict[str, float] = {}
+        self._summaries: Dict[str, _Summary] = {}
+
+    def increment(self, name: str, value: float = 1, **labels: str) -> None:
+        """Increase a counter.
+
+        Args:
+            name: The counter name.
+            value: Amount to add.
+            **labels: Label names and values.
+        """
+        key = _metric_key(name, labels)
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+
+    def set_gauge(self, name: str, value: float, **labels: str) -> None:
+        """Set a gauge to the current value.
+
+        Args:
+            name: The gauge name.
+            value: The current value.
+            **labels: Label names and values.
+        """
+        key = _metric_key(name, labels)
+        with self._lock:
+            self._gauges[key] = value
+
+    def observe(self, name: str, value: float, **labels: str) -> None:
+        """Record an observation in a summary (latencies, sizes, costs).
+
+        Args:
+            name: The summary name.
+            value: The observed value.
+            **labels: Label names and values.
+        """
+        key = _metric_key(name, labels)
+        with self._lock:
+            summary = self._summaries.get(key)
+            if summary is None:
+                summary = self._summaries[key] = _Summary()
+            summary.observe(value)
+
+    def get_counter(self, name: str, **labels: str) -> float:
+        """Get the current value of a counter.
+
+        Args:
+            name: The counter name.
+            **labels: Label names and values.
+
+        Returns:
+            The counter value, or 0 if it was never incremented.
+        """
+        with self._lock:
+            return self._counters.get(_metric_key(name, labels), 0)
+
+    def snapshot(self) -> Dict[str, Dict]:
+        """Get a point-in-time copy of every metric.
+
+        Returns:
+            Dictionary with ``counters``, ``gauges`` and ``summaries``.
+        """
+        with self._lock:
+            return {
+                "counters": dict(self._counters),
+                "gauges": dict(self._gauges),
+                "summaries": {key: summary.to_dict() for key, summary in self._summaries.items()},
+            }
+
+    def reset(self) -> None:
+        """Drop every recorded metric."""
+        with self._lock:
+            self._counters.clear()
+            self._gauges.clear()
+            self._summaries.clear()
+
+
+# Process-wide registry shared by every component
+metrics = MetricsRegistry()
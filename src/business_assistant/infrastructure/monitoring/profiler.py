@@ -0,0 +1,335 @@
+"""On-demand sampling CPU profiler and allocation tracking for a running process.
+
+The CPU profiler is a background thread reading the stack of every other
+thread with ``sys._current_frames`` at a fixed interval, so the profiled
+code runs unmodified and the cost is one stack walk per thread per sample.
+Stacks are aggregated in the collapsed format ("frame;frame;frame count")
+read by flamegraph.pl, speedscope and similar tools.
+
+Allocation tracking wraps ``tracemalloc``: snapshots are diffed against the
+previous one and the sizes are attributed to the components that hold most
+of the memory of a conversation worker.
+"""
+import fnmatch
+import logging
+import os
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+from business_assistant.infrastructure.cache import LRUCache
+from business_assistant.infrastructure.monitoring import metrics
+
+logger = logging.getLogger(__name__)
+
+# Frames kept per sampled stack, innermost last
+MAX_STACK_DEPTH = 64
+
+# Components memory is attributed to, by the source files in an allocation's traceback
+MEMORY_COMPONENTS = {
+    "conversation_manager": (
+        "*/business_assistant/infrastructure/services/conversation_manager.py",
+        "*/business_assistant/infrastructure/langgraph/*",
+        "*/langgraph/graph/*",
+        "*/langgraph/pregel/*",
+        "*/langgraph/prebuilt/*",
+    ),
+    "checkpointer": (
+        "*/langgraph/checkpoint/*",
+        "*/psycopg/*",
+        "*/psycopg_pool/*",
+    ),
+    "llm_client": (
+        "*/business_assistant/infrastructure/ai/*",
+        "*/langchain_openai/*",
+        "*/openai/*",
+        "*/httpx/*",
+        "*/httpcore/*",
+    ),
+}
+
+
+class ProfilerBusyError(RuntimeError):
+    """Raised when a profile is requested while another one is running."""
+
+
+def _frame_label(frame) -> str:
+    """Name of a stack frame as ``module.py:function``."""
+    return f"{os.path.basename(frame.f_code.co_filename)}:{frame.f_code.co_name}"
+
+
+def _collapse(frame, thread_name: str) -> str:
+    """Render the stack ending at a frame as one collapsed line, outermost first."""
+    labels = []
+    while frame is not None and len(labels) < MAX_STACK_DEPTH:
+        labels.append(_frame_label(frame))
+        frame = frame.f_back
+    labels.append(thread_name)
+    return ";".join(reversed(labels))
+
+
+@dataclass
+class CpuProfile:
+    """Aggregated stacks of a profiling run."""
+
+    interval: float
+    started_at: float
+    duration: float = 0.0
+    samples: int = 0
+    stacks: Counter = field(default_factory=Counter)
+
+    def collapsed(self) -> str:
+        """The stacks in collapsed format, the most frequent first."""
+        return "".join(f"{stack} {count}\n" for stack, count in self.stacks.most_common())
+
+    def top_frames(self, limit: int = 20) -> List[Dict[str, Any]]:
+        """Functions where the samples landed, the most frequent first.
+
+        Args:
+            limit: Functions returned.
+
+        Returns:
+            Rows with the frame, its samples and their share of the profile.
+        """
+        own = Counter()
+        for stack, count in self.stacks.items():
+            own[stack.rsplit(";", 1)[-1]] += count
+        return [
+            {"frame": frame, "samples": count, "ratio": round(count / self.samples, 4) if self.samples else 0.0}
+            for frame, count in own.most_common(limit)
+        ]
+
+
+class SamplingProfiler:
+    """Statistical CPU profiler sampling the stacks of running threads.
+
+    The sampler thread only exists while a profile runs. Idle threads are
+    sampled too, so time spent waiting on the database, the model or a
+    lock shows up in the stacks that wait for it.
+    """
+
+    def __init__(self, interval: float = 0.01, thread_ids: Optional[Set[int]] = None):
+        """Initialize the profiler.
+
+        Args:
+            interval: Seconds between samples.
+            thread_ids: Threads to sample. Defaults to every thread but the sampler.
+        """
+        self.interval = interval
+        self.thread_ids = thread_ids
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._profile: Optional[CpuProfile] = None
+        self.last_profile: Optional[CpuProfile] = None
+
+    @property
+    def running(self) -> bool:
+        """Whether a profile is being taken."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self, seconds: Optional[float] = None, interval: Optional[float] = None) -> None:
+        """Start sampling.
+
+        Args:
+            seconds: Stop automatically after this many seconds.
+            interval: Seconds between samples. Defaults to the profiler's interval.
+
+        Raises:
+            ProfilerBusyError: If a profile is already running.
+        """
+        with self._lock:
+            if self.running:
+                raise ProfilerBusyError("Ya hay un perfil de CPU en curso")
+            if interval:
+                self.interval = interval
+            self._stop.clear()
+            self._profile = CpuProfile(interval=self.interval, started_at=time.time())
+            self._thread = threading.Thread(target=self._run, args=(seconds,), name="cpu-profiler", daemon=True)
+            self._thread.start()
+
+    def stop(self) -> Optional[CpuProfile]:
+        """Stop sampling.
+
+        Returns:
+            The profile, or the last one if none was running.
+        """
+        with self._lock:
+            thread = self._thread
+        if thread is not None:
+            self._stop.set()
+            thread.join()
+        return self.last_profile
+
+    def _run(self, seconds: Optional[float]) -> None:
+        profile = self._profile
+        own_id = threading.get_ident()
+        start = time.perf_counter()
+        deadline = start + seconds if seconds else None
+        while not self._stop.is_set():
+            names = {thread.ident: thread.name for thread in threading.enumerate()}
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == own_id or (self.thread_ids is not None and thread_id not in self.thread_ids):
+                    continue
+                profile.stacks[_collapse(frame, names.get(thread_id, str(thread_id)))] += 1
+            profile.samples += 1
+            if deadline is not None and time.perf_counter() >= deadline:
+                break
+            self._stop.wait(self.interval)
+        profile.duration = time.perf_counter() - start
+        metrics.increment("profiler_samples_total", profile.samples)
+        self.last_profile = profile
+
+
+def profile_call(function, *args, interval: float = 0.005, **kwargs):
+    """Run a function while sampling only the calling thread.
+
+    Args:
+        function: The function to profile.
+        *args: Positional arguments of the function.
+        interval: Seconds between samples.
+        **kwargs: Keyword arguments of the function.
+
+    Returns:
+        Tuple of the function's result and its profile.
+    """
+    profiler = SamplingProfiler(interval=interval, thread_ids={threading.get_ident()})
+    profiler.start()
+    try:
+        result = function(*args, **kwargs)
+    finally:
+        profile = profiler.stop()
+    return result, profile
+
+
+def _component_filters(patterns: Iterable[str]) -> List[tracemalloc.Filter]:
+    return [tracemalloc.Filter(True, pattern, all_frames=True) for pattern in patterns]
+
+
+def _matches(filename: str, patterns: Iterable[str]) -> bool:
+    return any(fnmatch.fnmatch(filename, pattern) for pattern in patterns)
+
+
+class AllocationTracker:
+    """Diffs of ``tracemalloc`` snapshots, attributed to components.
+
+    An allocation counts for a component when any frame of its traceback is
+    in one of the component's files, so memory a component causes other
+    libraries to allocate is attributed to it too. An allocation can count
+    for more than one component.
+    """
+
+    def __init__(self, components: Optional[Dict[str, Iterable[str]]] = None):
+        """Initialize the tracker.
+
+        Args:
+            components: Source file patterns per component. Defaults to MEMORY_COMPONENTS.
+        """
+        self.components = components or MEMORY_COMPONENTS
+        self._lock = threading.Lock()
+        self._baseline: Optional[tracemalloc.Snapshot] = None
+        self._previous: Optional[tracemalloc.Snapshot] = None
+        self._started_here = False
+
+    @property
+    def running(self) -> bool:
+        """Whether allocations are being traced."""
+        return tracemalloc.is_tracing()
+
+    def start(self, frames: int = 25) -> None:
+        """Start tracing allocations and take the baseline snapshot.
+
+        Args:
+            frames: Frames stored per allocation; deeper tracebacks attribute
+                better but cost more memory.
+        """
+        with self._lock:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start(frames)
+                self._started_here = True
+            self._baseline = self._previous = self._take()
+
+    def stop(self) -> None:
+        """Stop tracing and drop the snapshots."""
+        with self._lock:
+            if self._started_here:
+                tracemalloc.stop()
+                self._started_here = False
+            self._baseline = self._previous = None
+
+    def snapshot(self, limit: int = 20) -> Dict[str, Any]:
+        """Take a snapshot and diff it with the previous one and the baseline.
+
+        Args:
+            limit: Source lines listed by growth.
+
+        Returns:
+            Traced memory, per-component sizes and growth, and the lines
+            whose allocations grew the most since the previous snapshot.
+
+        Raises:
+            RuntimeError: If tracing was not started.
+        """
+        with self._lock:
+            if self._previous is None:
+                raise RuntimeError("El rastreo de memoria no está activo")
+            snapshot = self._take()
+            previous, self._previous = self._previous, snapshot
+            baseline = self._baseline
+
+        components = {}
+        for name, patterns in self.components.items():
+            filters = _component_filters(patterns)
+            current = snapshot.filter_traces(filters)
+            size = sum(stat.size for stat in current.statistics("filename"))
+            components[name] = {
+                "size_kb": round(size / 1024, 1),
+                "diff_kb": round(self._diff(current, previous.filter_traces(filters)) / 1024, 1),
+                "since_start_kb": round(self._diff(current, baseline.filter_traces(filters)) / 1024, 1),
+            }
+
+        top_lines = []
+        for stat in snapshot.compare_to(previous, "lineno")[:limit]:
+            frame = stat.traceback[0]
+            top_lines.append({
+                "location": f"{frame.filename}:{frame.lineno}",
+                "component": next(
+                    (name for name, patterns in self.components.items() if _matches(frame.filename, patterns)),
+                    None,
+                ),
+                "size_kb": round(stat.size / 1024, 1),
+                "diff_kb": round(stat.size_diff / 1024, 1),
+                "count_diff": stat.count_diff,
+            })
+
+        current_kb, peak_kb = (value / 1024 for value in tracemalloc.get_traced_memory())
+        return {
+            "traced_kb": round(current_kb, 1),
+            "peak_kb": round(peak_kb, 1),
+            "components": components,
+            "top_lines": top_lines,
+        }
+
+    @staticmethod
+    def _diff(current: tracemalloc.Snapshot, previous: tracemalloc.Snapshot) -> int:
+        return sum(stat.size_diff for stat in current.compare_to(previous, "filename"))
+
+    @staticmethod
+    def _take() -> tracemalloc.Snapshot:
+        # The tracker's own allocations are not part of the answer
+        return tracemalloc.take_snapshot().filter_traces([
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, __file__),
+        ])
+
+
+# Process-wide profilers behind the admin routes
+cpu_profiler = SamplingProfiler()
+allocation_tracker = AllocationTracker()
+
+# Profiles of single requests, by the id returned in their X-Profile-Id header
+request_profiles = LRUCache(50, name="request_profiles")
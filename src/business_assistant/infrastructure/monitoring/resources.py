@@ -0,0 +1,24 @@
+"""Process resource usage helpers."""
+import os
+import resource
+import sys
+
+
+def current_rss_mb() -> float:
+    """Get the resident set size of the current process.
+
+    Reads ``/proc/self/statm`` where available (Linux) and falls back to the
+    peak RSS reported by ``getrusage`` elsewhere.
+
+    Returns:
+        Resident memory in megabytes.
+    """
+    try:
+        with open("/proc/self/statm") as statm:
+            resident_pages = int(statm.read().split()[1])
+        return resident_pages * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+    except (OSError, ValueError, IndexError):
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # macOS reports bytes, Linux reports kilobytes
+        divisor = 1024 * 1024 if sys.platform == "darwin" else 1024
+        return peak / divisor
@@ -0,0 +1,333 @@
+"""Opt-in capture of anonymized conversation turns for deterministic replay.
+
+Each captured turn is one JSON line holding the inbound text, every model
+response and tool result of the turn in the order they happened, and their
+timings. Lines are appended to a gzip file in batches, one gzip member per
+batch, so a file stays readable even if the process dies mid-run.
+"""
+import atexit
+import gzip
+import hashlib
+import hmac
+import json
+import logging
+import os
+import re
+import secrets
+import threading
+import time
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional
+from uuid import UUID
+
+from langchain_core.callbacks import BaseCallbackHandler
+from langchain_core.messages import AIMessage, ToolMessage
+from langchain_core.outputs import LLMResult
+
+from business_assistant.config.settings import settings
+from business_assistant.domain.models.business import DEFAULT_BUSINESS_ID
+from business_assistant.infrastructure.monitoring import metrics
+
+logger = logging.getLogger(__name__)
+
+# Version of the line format, bumped on incompatible changes
+FORMAT_VERSION = 1
+
+# Event types of a captured turn
+EVENT_LLM = "llm"
+EVENT_TOOL = "tool"
+
+_EMAIL_PATTERN = re.compile(r"[\w.+-]+@[\w-]+(?:\.[\w-]+)+")
+# Phone numbers, document ids and card numbers: 7 or more digits, optionally separated
+_LONG_NUMBER_PATTERN = re.compile(r"\+?\d(?:[\s.-]?\d){6,}")
+
+
+def scrub_text(text: str) -> str:
+    """Remove personal data from a text.
+
+    Emails and long digit sequences (phone numbers, document and card
+    numbers) are replaced with placeholders. Prices and quantities are kept.
+
+    Args:
+        text: The text to scrub.
+
+    Returns:
+        The anonymized text.
+    """
+    text = _EMAIL_PATTERN.sub("<email>", text)
+    return _LONG_NUMBER_PATTERN.sub("<numero>", text)
+
+
+def _scrub(value: Any) -> Any:
+    """Scrub every string nested in a JSON-like value."""
+    if isinstance(value, str):
+        return scrub_text(value)
+    if isinstance(value, dict):
+        return {key: _scrub(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_scrub(item) for item in value]
+    return value
+
+
+def anonymize_number(whatsapp_number: str, salt: str) -> str:
+    """Replace a WhatsApp number with a stable pseudonym.
+
+    Args:
+        whatsapp_number: The customer's number.
+        salt: Secret mixed into the hash, so pseudonyms cannot be reversed
+            by hashing every possible number.
+
+    Returns:
+        The pseudonym, the same for every turn of the customer.
+    """
+    digest = hmac.new(salt.encode(), whatsapp_number.encode(), hashlib.sha256).hexdigest()
+    return f"anon-{digest[:16]}"
+
+
+def _ai_message_to_dict(message: AIMessage) -> Dict[str, Any]:
+    """Compact form of a model response keeping what replay needs."""
+    return {
+        "content": scrub_text(message.content) if isinstance(message.content, str) else message.content,
+        "tool_calls": [
+            {"name": call["name"], "args": _scrub(call["args"]), "id": call["id"]} for call in message.tool_calls
+        ],
+        "usage": message.usage_metadata,
+        "model": message.response_metadata.get("model_name"),
+    }
+
+
+def ai_message_from_dict(data: Dict[str, Any]) -> AIMessage:
+    """Rebuild a model response captured by the recorder.
+
+    Args:
+        data: The captured response.
+
+    Returns:
+        The assistant message.
+    """
+    return AIMessage(
+        content=data.get("content") or "",
+        tool_calls=data.get("tool_calls") or [],
+        usage_metadata=data.get("usage"),
+        response_metadata={"model_name": data.get("model")},
+    )
+
+
+class TurnCapture(BaseCallbackHandler):
+    """Callback handler collecting the model calls and tool runs of one turn.
+
+    It is passed in the graph config, so it reaches the React agent, the
+    small model and every tool without changes to the nodes.
+    """
+
+    def __init__(self, user: str, business_id: Optional[int], text: str):
+        """Initialize the capture.
+
+        Args:
+            user: Pseudonym of the customer.
+            business_id: The business of the conversation.
+            text: The inbound message, already anonymized.
+        """
+        self.user = user
+        self.business_id = business_id
+        self.text = text
+        self.started_at = time.time()
+        self._start = time.perf_counter()
+        self._lock = threading.Lock()
+        self._running: Dict[UUID, tuple] = {}
+        self.events: List[Dict[str, Any]] = []
+
+    def on_chat_model_start(self, serialized, messages, *, run_id: UUID, **kwargs: Any) -> None:
+        self._running[run_id] = (time.perf_counter(), None, None)
+
+    def on_llm_end(self, response: LLMResult, *, run_id: UUID, **kwargs: Any) -> None:
+        started, _, _ = self._running.pop(run_id, (time.perf_counter(), None, None))
+        generation = response.generations[0][0] if response.generations and response.generations[0] else None
+        message = getattr(generation, "message", None)
+        if not isinstance(message, AIMessage):
+            return
+        self._append({
+            "type": EVENT_LLM,
+            "start": round(started - self._start, 4),
+            "seconds": round(time.perf_counter() - started, 4),
+            "message": _ai_message_to_dict(message),
+        })
+
+    def on_tool_start(self, serialized, input_str: str, *, run_id: UUID, inputs=None, **kwargs: Any) -> None:
+        name = (serialized or {}).get("name") or kwargs.get("name")
+        self._running[run_id] = (time.perf_counter(), name, inputs)
+
+    def on_tool_end(self, output: Any, *, run_id: UUID, **kwargs: Any) -> None:
+        started, name, inputs = self._running.pop(run_id, (time.perf_counter(), kwargs.get("name"), None))
+        content = output.content if isinstance(output, ToolMessage) else output
+        self._append({
+            "type": EVENT_TOOL,
+            "name": name,
+            "args": _scrub(inputs) if isinstance(inputs, dict) else None,
+            "start": round(started - self._start, 4),
+            "seconds": round(time.perf_counter() - started, 4),
+            "output": scrub_text(content if isinstance(content, str) else json.dumps(content, default=str)),
+        })
+
+    def _append(self, event: Dict[str, Any]) -> None:
+        with self._lock:
+            self.events.append(event)
+
+    def to_record(self, response: str) -> Dict[str, Any]:
+        """Build the log line of the finished turn.
+
+        Args:
+            response: The answer sent to the customer.
+
+        Returns:
+            The captured turn.
+        """
+        with self._lock:
+            events = sorted(self.events, key=lambda event: event["start"])
+        return {
+            "v": FORMAT_VERSION,
+            "ts": round(self.started_at, 3),
+            "user": self.user,
+            "business_id": self.business_id,
+            "text": self.text,
+            "seconds": round(time.perf_counter() - self._start, 4),
+            "response_chars": len(response or ""),
+            "events": events,
+        }
+
+
+class TrafficRecorder:
+    """Sampled recorder of conversation turns into compressed JSON lines.
+
+    Customers are sampled as a whole, so every turn of a sampled
+    conversation is captured and replay sees complete conversations.
+    """
+
+    def __init__(
+        self,
+        enabled: Optional[bool] = None,
+        directory: Optional[str] = None,
+        sample_rate: Optional[float] = None,
+        salt: Optional[str] = None,
+        batch_size: int = 50,
+    ):
+        """Initialize the recorder.
+
+        Args:
+            enabled: Whether turns are captured. Defaults to TRAFFIC_CAPTURE_ENABLED.
+            directory: Where the logs are written. Defaults to TRAFFIC_CAPTURE_DIR.
+            sample_rate: Fraction of customers captured. Defaults to TRAFFIC_CAPTURE_SAMPLE_RATE.
+            salt: Secret of the number pseudonyms. Defaults to TRAFFIC_CAPTURE_SALT,
+                or a random value per process when unset.
+            batch_size: Turns buffered before they are written.
+        """
+        self.enabled = enabled if enabled is not None else settings.traffic_capture_enabled
+        self.directory = directory or settings.traffic_capture_dir
+        self.sample_rate = sample_rate if sample_rate is not None else settings.traffic_capture_sample_rate
+        self.salt = salt or settings.traffic_capture_salt or secrets.token_hex(16)
+        self.batch_size = batch_size
+        self._buffer: List[Dict[str, Any]] = []
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._registered = False
+
+    @property
+    def path(self) -> str:
+        """File receiving the turns of this process today."""
+        return os.path.join(self.directory, f"traffic-{datetime.now():%Y%m%d}-{os.getpid()}.jsonl.gz")
+
+    def capture(self, whatsapp_number: str, message: str, business_id: Optional[int] = None) -> Optional[TurnCapture]:
+        """Start capturing a turn.
+
+        Args:
+            whatsapp_number: The customer's number.
+            message: The inbound message.
+            business_id: The business the customer writes to.
+
+        Returns:
+            The callback handler to pass in the graph config, or None if the
+            turn is not captured.
+        """
+        if not self.enabled:
+            return None
+        user = anonymize_number(whatsapp_number, self.salt)
+        # The pseudonym is uniformly distributed, so its prefix samples customers
+        if int(user[5:13], 16) / 0xFFFFFFFF >= self.sample_rate:
+            return None
+        # The graph resolves a missing business to the default one, and replay keys on what the graph sees
+        return TurnCapture(user, business_id if business_id is not None else DEFAULT_BUSINESS_ID, scrub_text(message))
+
+    def record(self, capture: Optional[TurnCapture], response: str) -> None:
+        """Queue a finished turn for writing.
+
+        Args:
+            capture: The capture returned by ``capture``, or None.
+            response: The answer sent to the customer.
+        """
+        if capture is None:
+            return
+        try:
+            line = json.dumps(capture.to_record(response), ensure_ascii=False, default=str, separators=(",", ":"))
+        except Exception as e:
+            logger.error(f"Error serializing captured turn: {str(e)}")
+            return
+        with self._lock:
+            self._buffer.append(line)
+            full = len(self._buffer) >= self.batch_size
+            if not self._registered:
+                atexit.register(self.flush)
+                self._registered = True
+        metrics.increment("traffic_captured_turns_total")
+        if full:
+            self.flush()
+
+    def flush(self) -> int:
+        """Write the buffered turns as one gzip member.
+
+        Returns:
+            Number of turns written.
+        """
+        with self._write_lock:
+            with self._lock:
+                lines, self._buffer = self._buffer, []
+            if not lines:
+                return 0
+            try:
+                os.makedirs(self.directory, exist_ok=True)
+                with gzip.open(self.path, "at", encoding="utf-8") as file:
+                    file.write("\n".join(lines) + "\n")
+            except Exception as e:
+                logger.error(f"Error writing {len(lines)} captured turns: {str(e)}")
+                metrics.increment("traffic_capture_errors_total")
+                return 0
+        return len(lines)
+
+
+def read_traffic(paths: List[str]) -> Iterator[Dict[str, Any]]:
+    """Read captured turns from log files or directories of logs.
+
+    Args:
+        paths: Log files, or directories whose ``traffic-*.jsonl.gz`` files are read.
+
+    Returns:
+        Iterator over the captured turns, file by file.
+    """
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            files.extend(
+                os.path.join(path, name) for name in sorted(os.listdir(path))
+                if name.startswith("traffic-") and name.endswith(".jsonl.gz")
+            )
+        else:
+            files.append(path)
+    for file_path in files:
+        opener = gzip.open if file_path.endswith(".gz") else open
+        with opener(file_path, "rt", encoding="utf-8") as file:
+            for line in file:
+                if line.strip():
+                    yield json.loads(line)
+
+
+# Process-wide recorder used by the chat service
+traffic_recorder = TrafficRecorder()
@@ -0,0 +1,271 @@
+"""Deterministic replay of captured traffic against the conversation graph.
+
+The model and the Toolbox are replaced by doubles that return the captured
+responses of each customer in order, after waiting the captured latency
+divided by the replay speed. Everything else (routing, graph state, the
+tool executor, budgets and checkpointing) runs as in production, so two
+builds can be compared on the same traffic.
+"""
+import logging
+import statistics
+import threading
+import time
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+from langchain_core.callbacks import CallbackManagerForLLMRun, CallbackManagerForToolRun
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import AIMessage, BaseMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+from langchain_core.runnables import RunnableConfig
+from langchain_core.tools import BaseTool
+from pydantic import BaseModel, ConfigDict
+
+from business_assistant.infrastructure.monitoring import metrics
+from business_assistant.infrastructure.monitoring.traffic_recorder import EVENT_LLM, EVENT_TOOL, ai_message_from_dict
+
+logger = logging.getLogger(__name__)
+
+# Answer of the model double when a customer has no captured response left
+MISSING_RESPONSE = "(sin respuesta grabada)"
+
+# Result of the tool double when a customer has no captured result left
+MISSING_TOOL_RESULT = "Error: no hay resultado grabado para esta herramienta"
+
+# Customer of a replayed turn: (pseudonym, business_id)
+ReplayKey = Tuple[str, Optional[int]]
+
+
+class TrafficRecording:
+    """Captured model responses and tool results, queued per customer."""
+
+    def __init__(self, turns: List[Dict[str, Any]], speed: float = 1.0):
+        """Queue the events of the captured turns.
+
+        Args:
+            turns: Captured turns, in the order they happened.
+            speed: Replay speed; 2 halves every captured latency and 0 skips the waits.
+        """
+        self.speed = speed
+        self.tool_names = sorted({
+            event["name"] for turn in turns for event in turn["events"]
+            if event["type"] == EVENT_TOOL and event.get("name")
+        })
+        self._responses: Dict[ReplayKey, Deque[Dict[str, Any]]] = defaultdict(deque)
+        self._results: Dict[Tuple[ReplayKey, str], Deque[Dict[str, Any]]] = defaultdict(deque)
+        self._lock = threading.Lock()
+        self.missing = 0
+        for turn in sorted(turns, key=lambda turn: turn["ts"]):
+            key = (turn["user"], turn.get("business_id"))
+            for event in turn["events"]:
+                if event["type"] == EVENT_LLM:
+                    self._responses[key].append(event)
+                elif event["type"] == EVENT_TOOL:
+                    self._results[(key, event["name"])].append(event)
+
+    @staticmethod
+    def key_from(values: Dict[str, Any]) -> ReplayKey:
+        """Customer key from the configurable values or metadata of a run."""
+        return values.get("user_id"), values.get("business_id")
+
+    def next_response(self, key: ReplayKey) -> Optional[Dict[str, Any]]:
+        """Pop the next captured model response of a customer."""
+        with self._lock:
+            queue = self._responses.get(key)
+            if queue:
+                return queue.popleft()
+            self.missing += 1
+        return None
+
+    def next_result(self, key: ReplayKey, tool: str) -> Optional[Dict[str, Any]]:
+        """Pop the next captured result of a tool for a customer."""
+        with self._lock:
+            queue = self._results.get((key, tool))
+            if queue:
+                return queue.popleft()
+            self.missing += 1
+        return None
+
+    def wait(self, seconds: float) -> None:
+        """Wait a captured latency at the replay speed."""
+        if self.speed > 0 and seconds > 0:
+            time.sleep(seconds / self.speed)
+
+
+class RecordedChatModel(BaseChatModel):
+    """Chat model double answering with the captured responses of each customer."""
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    recording: Any
+
+    @property
+    def _llm_type(self) -> str:
+        return "recorded"
+
+    def bind_tools(self, tools: Any, **kwargs: Any) -> "RecordedChatModel":
+        """Accept the agent's tools; the captured responses already carry the tool calls."""
+        return self
+
+    def _generate(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Optional[CallbackManagerForLLMRun] = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        # LangGraph copies the configurable values of the turn into the run metadata
+        key = TrafficRecording.key_from(run_manager.metadata if run_manager else {})
+        event = self.recording.next_response(key)
+        if event is None:
+            logger.warning(f"No captured model response left for {key[0]}")
+            message = AIMessage(content=MISSING_RESPONSE)
+        else:
+            self.recording.wait(event["seconds"])
+            message = ai_message_from_dict(event["message"])
+        return ChatResult(generations=[ChatGeneration(message=message)])
+
+
+class _AnyArgs(BaseModel):
+    """Arguments of a tool double, accepted as they come."""
+
+    model_config = ConfigDict(extra="allow")
+
+
+class RecordedTool(BaseTool):
+    """Tool double returning the captured results of each customer."""
+
+    description: str = "Herramienta que devuelve resultados grabados"
+    args_schema: type = _AnyArgs
+    recording: Any
+
+    def _run(self, config: RunnableConfig, run_manager: Optional[CallbackManagerForToolRun] = None, **kwargs) -> str:
+        key = TrafficRecording.key_from(config.get("configurable", {}))
+        event = self.recording.next_result(key, self.name)
+        if event is None:
+            logger.warning(f"No captured result of {self.name} left for {key[0]}")
+            return MISSING_TOOL_RESULT
+        self.recording.wait(event["seconds"])
+        return event["output"]
+
+
+def recorded_tools(recording: TrafficRecording) -> List[BaseTool]:
+    """Create one tool double per tool seen in the captured traffic.
+
+    Args:
+        recording: The captured traffic.
+
+    Returns:
+        The tool doubles.
+    """
+    return [RecordedTool(name=name, recording=recording) for name in recording.tool_names]
+
+
+@dataclass
+class ReplayReport:
+    """Throughput and latency of a replay next to those of the capture."""
+
+    turns: int = 0
+    errors: int = 0
+    missing_events: int = 0
+    wall_seconds: float = 0.0
+    latencies: List[float] = field(default_factory=list)
+    captured_latencies: List[float] = field(default_factory=list)
+
+    @property
+    def turns_per_second(self) -> float:
+        return self.turns / self.wall_seconds if self.wall_seconds else 0.0
+
+    @staticmethod
+    def percentile(values: List[float], fraction: float) -> float:
+        """Nearest-rank percentile of a list of values."""
+        if not values:
+            return 0.0
+        ordered = sorted(values)
+        return ordered[int(fraction * (len(ordered) - 1))]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert the report to dictionary format."""
+        return {
+            "turns": self.turns,
+            "errors": self.errors,
+            "missing_events": self.missing_events,
+            "wall_seconds": round(self.wall_seconds, 3),
+            "turns_per_second": round(self.turns_per_second, 2),
+            "latency_ms": {
+                "p50": round(statistics.median(self.latencies) * 1000, 1) if self.latencies else 0.0,
+                "p95": round(self.percentile(self.latencies, 0.95) * 1000, 1),
+                "p99": round(self.percentile(self.latencies, 0.99) * 1000, 1),
+            },
+            "captured_latency_ms": {
+                "p50": round(statistics.median(self.captured_latencies) * 1000, 1) if self.captured_latencies else 0.0,
+                "p95": round(self.percentile(self.captured_latencies, 0.95) * 1000, 1),
+                "p99": round(self.percentile(self.captured_latencies, 0.99) * 1000, 1),
+            },
+        }
+
+
+def replay_turns(
+    turns: List[Dict[str, Any]],
+    process_message,
+    recording: TrafficRecording,
+    max_workers: int = 32,
+) -> ReplayReport:
+    """Send the captured turns again, keeping their pacing and per-customer order.
+
+    Each customer's turns are sent one after the other from their own worker,
+    at the captured offset from the first turn divided by the replay speed.
+    With speed 0 turns are sent as fast as the application answers.
+
+    Args:
+        turns: Captured turns.
+        process_message: Function ``(whatsapp_number, message, business_id) -> str``
+            serving a turn, normally ``ChatService().process_message``.
+        recording: The doubles' view of the same turns, holding the replay speed.
+        max_workers: Customers replayed at the same time.
+
+    Returns:
+        The replay report.
+    """
+    report = ReplayReport()
+    if not turns:
+        return report
+    turns = sorted(turns, key=lambda turn: turn["ts"])
+    first_ts = turns[0]["ts"]
+    conversations: Dict[ReplayKey, List[Dict[str, Any]]] = defaultdict(list)
+    for turn in turns:
+        conversations[(turn["user"], turn.get("business_id"))].append(turn)
+    lock = threading.Lock()
+    started = time.perf_counter()
+
+    def run_conversation(key: ReplayKey, conversation: List[Dict[str, Any]]) -> None:
+        for turn in conversation:
+            if recording.speed > 0:
+                delay = (turn["ts"] - first_ts) / recording.speed - (time.perf_counter() - started)
+                if delay > 0:
+                    time.sleep(delay)
+            turn_start = time.perf_counter()
+            failed = False
+            try:
+                process_message(key[0], turn["text"], key[1])
+            except Exception as e:
+                logger.error(f"Error replaying turn of {key[0]}: {str(e)}")
+                failed = True
+            elapsed = time.perf_counter() - turn_start
+            metrics.observe("traffic_replay_turn_seconds", elapsed)
+            with lock:
+                report.turns += 1
+                report.errors += failed
+                report.latencies.append(elapsed)
+                report.captured_latencies.append(turn["seconds"])
+
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="replay") as executor:
+        futures = [executor.submit(run_conversation, key, conversation) for key, conversation in conversations.items()]
+        for future in futures:
+            future.result()
+
+    report.wall_seconds = time.perf_counter() - started
+    report.missing_events = recording.missing
+    return report
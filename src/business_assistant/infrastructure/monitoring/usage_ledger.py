@@ -0,0 +1,254 @@
+"""Per-turn LLM usage and cost ledger, written to PostgreSQL in batches."""
+import atexit
+import logging
+import threading
+from collections import deque
+from dataclasses import dataclass
+from datetime import datetime
+from decimal import Decimal
+from typing import Deque, Dict, List, Optional
+
+from langchain_core.messages import AIMessage, BaseMessage
+
+from business_assistant.config.settings import settings
+from business_assistant.domain.models.usage import TurnUsage
+from business_assistant.infrastructure.monitoring import metrics
+from business_assistant.infrastructure.persistence.repositories.usage_repository import PostgresUsageRepository
+
+logger = logging.getLogger(__name__)
+
+# Price entry applied to models missing from LLM_PRICES
+DEFAULT_PRICE_KEY = "*"
+
+_MILLION = Decimal(1_000_000)
+
+
+@dataclass(frozen=True)
+class ModelPrice:
+    """Price of a model in USD per million tokens."""
+
+    input: Decimal
+    output: Decimal
+    cached: Decimal
+
+
+def parse_llm_prices(spec: str) -> Dict[str, ModelPrice]:
+    """Parse model prices written as ``model=input:output[:cached],...``.
+
+    Prices are in USD per million tokens. Cached input tokens cost the input
+    price unless a cached price is given. ``*`` sets the price of unlisted models.
+
+    Args:
+        spec: The price list.
+
+    Returns:
+        Dictionary of model name to price.
+    """
+    prices = {}
+    for entry in spec.split(","):
+        if not entry.strip():
+            continue
+        # Model names may contain "/" and ":", but not "="
+        name, _, values = entry.rpartition("=")
+        parts = [Decimal(value.strip()) for value in values.split(":")]
+        input_price, output_price = parts[0], parts[1]
+        prices[name.strip()] = ModelPrice(input_price, output_price, parts[2] if len(parts) > 2 else input_price)
+    return prices
+
+
+def _message_cost(usage: Dict, model: Optional[str], prices: Dict[str, ModelPrice]) -> Decimal:
+    """Cost of one model call from its token usage."""
+    price = prices.get(model or "") or prices.get(DEFAULT_PRICE_KEY)
+    if price is None:
+        return Decimal("0")
+    cached = (usage.get("input_token_details") or {}).get("cache_read") or 0
+    uncached = max(0, usage.get("input_tokens", 0) - cached)
+    return (
+        uncached * price.input + cached * price.cached + usage.get("output_tokens", 0) * price.output
+    ) / _MILLION
+
+
+def build_turn_usage(
+    messages: List[BaseMessage],
+    route: str,
+    thread_id: str,
+    wall_seconds: float,
+    business_id: Optional[int] = None,
+    whatsapp_number: Optional[str] = None,
+    prices: Optional[Dict[str, ModelPrice]] = None,
+) -> TurnUsage:
+    """Summarize the model calls and tool calls of a turn.
+
+    Every assistant message carrying ``usage_metadata`` is one model call.
+    Each call is priced with the model that actually answered it, so turns
+    served by a fallback model are charged at that model's price.
+
+    Args:
+        messages: The messages produced in the turn.
+        route: The route that served the turn.
+        thread_id: The conversation thread.
+        wall_seconds: Duration of the turn.
+        business_id: The business of the conversation.
+        whatsapp_number: The customer's number.
+        prices: Model prices. Defaults to LLM_PRICES.
+
+    Returns:
+        The usage of the turn.
+    """
+    prices = prices if prices is not None else _default_prices
+    usage = TurnUsage(
+        thread_id=thread_id,
+        route=route,
+        business_id=business_id,
+        whatsapp_number=whatsapp_number,
+        wall_ms=int(wall_seconds * 1000),
+    )
+    for message in messages:
+        if not isinstance(message, AIMessage):
+            continue
+        for call in message.tool_calls:
+            usage.tool_calls[call["name"]] = usage.tool_calls.get(call["name"], 0) + 1
+        if not message.usage_metadata:
+            continue
+        model = message.response_metadata.get("model_name")
+        usage.llm_calls += 1
+        usage.model = model or usage.model
+        usage.prompt_tokens += message.usage_metadata.get("input_tokens", 0)
+        usage.completion_tokens += message.usage_metadata.get("output_tokens", 0)
+        usage.cached_tokens += (message.usage_metadata.get("input_token_details") or {}).get("cache_read") or 0
+        usage.cost += _message_cost(message.usage_metadata, model, prices)
+    return usage
+
+
+class UsageLedger:
+    """Buffer of turn usages flushed to the ledger table by a background thread.
+
+    Turns are appended to a bounded in-memory buffer and written with one
+    multi-row insert every ``flush_interval`` seconds, or as soon as
+    ``batch_size`` turns are waiting. If the database is unavailable the rows
+    stay buffered; when the buffer is full the oldest rows are dropped, so
+    accounting never slows down or fails a turn.
+    """
+
+    def __init__(
+        self,
+        repository: Optional[PostgresUsageRepository] = None,
+        enabled: Optional[bool] = None,
+        batch_size: Optional[int] = None,
+        flush_interval: Optional[float] = None,
+        max_buffer: Optional[int] = None,
+    ):
+        """Initialize the ledger.
+
+        Args:
+            repository: Ledger repository. Defaults to the PostgreSQL ledger.
+            enabled: Whether turns are recorded. Defaults to USAGE_LEDGER_ENABLED.
+            batch_size: Rows per insert. Defaults to USAGE_LEDGER_BATCH_SIZE.
+            flush_interval: Seconds between flushes. Defaults to USAGE_LEDGER_FLUSH_INTERVAL.
+            max_buffer: Rows kept while the database is unavailable. Defaults to USAGE_LEDGER_MAX_BUFFER.
+        """
+        self.repository = repository or PostgresUsageRepository()
+        self.enabled = enabled if enabled is not None else settings.usage_ledger_enabled
+        self.batch_size = batch_size if batch_size is not None else settings.usage_ledger_batch_size
+        self.flush_interval = flush_interval if flush_interval is not None else settings.usage_ledger_flush_interval
+        max_buffer = max_buffer if max_buffer is not None else settings.usage_ledger_max_buffer
+        self._buffer: Deque[TurnUsage] = deque(maxlen=max_buffer)
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def pending(self) -> int:
+        """Rows waiting to be written."""
+        return len(self._buffer)
+
+    def record(self, usage: TurnUsage) -> None:
+        """Queue the usage of a turn for the next flush.
+
+        Args:
+            usage: The usage of the turn.
+        """
+        if not self.enabled:
+            return
+        if usage.created_at is None:
+            usage.created_at = datetime.now()
+        with self._lock:
+            if len(self._buffer) == self._buffer.maxlen:
+                metrics.increment("usage_ledger_dropped_total")
+            self._buffer.append(usage)
+            full = len(self._buffer) >= self.batch_size
+        metrics.increment("llm_cost_usd_total", float(usage.cost), route=usage.route)
+        self._ensure_started()
+        if full:
+            self._wake.set()
+
+    def flush(self) -> int:
+        """Write every buffered row.
+
+        Returns:
+            Number of rows written.
+        """
+        written = 0
+        with self._flush_lock:
+            while True:
+                with self._lock:
+                    batch = [self._buffer.popleft() for _ in range(min(self.batch_size, len(self._buffer)))]
+                if not batch:
+                    break
+                try:
+                    self.repository.insert_many(batch)
+                except Exception as e:
+                    # Put the rows back in order for the next flush
+                    with self._lock:
+                        space = self._buffer.maxlen - len(self._buffer)
+                        self._buffer.extendleft(reversed(batch[len(batch) - space:] if space > 0 else []))
+                    metrics.increment("usage_ledger_flush_errors_total")
+                    logger.warning(f"Error writing {len(batch)} usage rows, will retry: {str(e)}")
+                    break
+                written += len(batch)
+                metrics.increment("usage_ledger_rows_total", len(batch))
+        metrics.set_gauge("usage_ledger_pending", len(self._buffer))
+        return written
+
+    def start(self) -> None:
+        """Start the flushing thread."""
+        with self._lock:
+            if self._thread is not None:
+                return
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="usage-ledger", daemon=True)
+            self._thread.start()
+        atexit.register(self.stop)
+
+    def stop(self, timeout: float = 10.0) -> None:
+        """Stop the flushing thread and write the remaining rows.
+
+        Args:
+            timeout: Seconds to wait for the thread.
+        """
+        with self._lock:
+            thread, self._thread = self._thread, None
+        if thread is not None:
+            self._stop.set()
+            self._wake.set()
+            thread.join(timeout)
+        self.flush()
+
+    def _ensure_started(self) -> None:
+        if self._thread is None:
+            self.start()
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            self.flush()
+
+
+# Prices used when none are given
+_default_prices = parse_llm_prices(settings.llm_prices)
+
+# Process-wide ledger fed by the conversation graph
+usage_ledger = UsageLedger()
@@ -2,10 +2,11 @@
 
 import os
 import logging
+import threading
 from typing import Dict, Any
 from contextlib import contextmanager
 import psycopg2
-from psycopg2.pool import SimpleConnectionPool
+from psycopg2.pool import PoolError, ThreadedConnectionPool
 from psycopg2.extras import RealDictCursor
 
 from business_assistant.config.settings import settings
@@ -14,30 +15,79 @@ logger = logging.getLogger(__name__)
 
 # Connection pool for PostgreSQL
 _pool = None
+_pool_lock = threading.Lock()
+
+
+class BlockingConnectionPool(ThreadedConnectionPool):
+    """Thread-safe connection pool whose getconn waits for a free connection.
+
+    psycopg2's pools raise PoolError as soon as ``maxconn`` connections are
+    in use. Turns, tool calls and background workers share this pool from
+    many threads, so a burst waits up to ``timeout`` seconds for a
+    connection instead of failing.
+    """
+
+    def __init__(self, minconn: int, maxconn: int, timeout: float, *args, **kwargs):
+        """Initialize the pool.
+
+        Args:
+            minconn: Connections kept open.
+            maxconn: Connections open at most.
+            timeout: Seconds getconn waits for a free connection.
+            *args: Connection arguments passed to psycopg2.connect.
+            **kwargs: Connection keyword arguments passed to psycopg2.connect.
+        """
+        super().__init__(minconn, maxconn, *args, **kwargs)
+        self.timeout = timeout
+        self._slots = threading.BoundedSemaphore(maxconn)
+
+    def getconn(self, key=None):
+        """Get a free connection, waiting for one to be returned if needed.
+
+        Raises:
+            PoolError: If no connection was returned within the timeout.
+        """
+        if not self._slots.acquire(timeout=self.timeout):
+            raise PoolError(f"No database connection available after {self.timeout:g}s")
+        try:
+            return super().getconn(key)
+        except Exception:
+            self._slots.release()
+            raise
+
+    def putconn(self, conn=None, key=None, close=False):
+        """Return a connection to the pool and wake up a waiting thread."""
+        try:
+            super().putconn(conn, key, close)
+        finally:
+            self._slots.release()
 
 
 def get_connection_pool():
     """Get or create the database connection pool.
 
     Returns:
-        SimpleConnectionPool: The connection pool instance.
+        BlockingConnectionPool: The connection pool instance.
     """
     global _pool
     if _pool is None:
-        try:
-            _pool = SimpleConnectionPool(
-                minconn=1,
-                maxconn=10,
-                host=settings.db_host,
-                port=settings.db_port,
-                dbname=settings.db_name,
-                user=settings.db_user,
-                password=settings.db_password,
-            )
-            logger.info("Database connection pool created successfully")
-        except Exception as e:
-            logger.error(f"Error creating database connection pool: {str(e)}")
-            raise
+        with _pool_lock:
+            if _pool is None:
+                try:
+                    _pool = BlockingConnectionPool(
+                        minconn=settings.db_pool_min_size,
+                        maxconn=settings.db_pool_max_size,
+                        timeout=settings.db_pool_timeout_seconds,
+                        host=settings.db_host,
+                        port=settings.db_port,
+                        dbname=settings.db_name,
+                        user=settings.db_user,
+                        password=settings.db_password,
+                    )
+                    logger.info("Database connection pool created successfully")
+                except Exception as e:
+                    logger.error(f"Error creating database connection pool: {str(e)}")
+                    raise
     return _pool
 
 
@@ -18,6 +18,31 @@ from business_assistant.infrastructure.persistence.queries.products_queries impo
     CREATE_INVENTORY_TABLE,
     CREATE_PRODUCT_INDEXES,
 )
+from business_assistant.infrastructure.persistence.queries.orders_queries import (
+    CREATE_ORDERS_TABLE,
+    CREATE_ORDER_LINES_TABLE,
+    CREATE_ORDER_INDEXES,
+)
+from business_assistant.infrastructure.persistence.queries.inbound_queries import (
+    CREATE_INBOUND_MESSAGES_TABLE,
+    CREATE_INBOUND_MESSAGE_INDEXES,
+)
+from business_assistant.infrastructure.persistence.queries.business_queries import (
+    CREATE_BUSINESSES_TABLE,
+    SEED_DEFAULT_BUSINESS,
+    ADD_TENANT_COLUMNS,
+    CREATE_TENANT_INDEXES,
+)
+from business_assistant.infrastructure.persistence.queries.catalog_index_queries import CREATE_CATALOG_INDEX_INDEXES
+from business_assistant.infrastructure.persistence.queries.inventory_alert_queries import (
+    CREATE_INVENTORY_ALERTS_TABLE,
+    CREATE_INVENTORY_ALERT_RUNS_TABLE,
+    CREATE_INVENTORY_ALERT_INDEXES,
+)
+from business_assistant.infrastructure.persistence.queries.usage_queries import (
+    CREATE_TURN_USAGE_TABLE,
+    CREATE_TURN_USAGE_INDEXES,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -116,6 +141,33 @@ class DatabaseMigration:
             ("Create product variants table", CREATE_PRODUCT_VARIANTS_TABLE),
             ("Create inventory table", CREATE_INVENTORY_TABLE),
             ("Create product indexes", CREATE_PRODUCT_INDEXES),
+            
+            # Order tables
+            ("Create orders table", CREATE_ORDERS_TABLE),
+            ("Create order lines table", CREATE_ORDER_LINES_TABLE),
+            ("Create order indexes", CREATE_ORDER_INDEXES),
+            
+            # Inbound message queue
+            ("Create inbound messages table", CREATE_INBOUND_MESSAGES_TABLE),
+            ("Create inbound message indexes", CREATE_INBOUND_MESSAGE_INDEXES),
+            
+            # Tenants: existing rows belong to the default business
+            ("Create businesses table", CREATE_BUSINESSES_TABLE),
+            ("Seed default business", SEED_DEFAULT_BUSINESS),
+            ("Add tenant columns", ADD_TENANT_COLUMNS),
+            ("Create tenant indexes", CREATE_TENANT_INDEXES),
+            
+            # Usage ledger
+            ("Create turn usage table", CREATE_TURN_USAGE_TABLE),
+            ("Create turn usage indexes", CREATE_TURN_USAGE_INDEXES),
+            
+            # Incremental refresh of the in-memory catalog index
+            ("Create catalog index refresh indexes", CREATE_CATALOG_INDEX_INDEXES),
+            
+            # Low-stock and expiration alerts
+            ("Create inventory alerts table", CREATE_INVENTORY_ALERTS_TABLE),
+            ("Create inventory alert runs table", CREATE_INVENTORY_ALERT_RUNS_TABLE),
+            ("Create inventory alert indexes", CREATE_INVENTORY_ALERT_INDEXES),
         ]
 
 
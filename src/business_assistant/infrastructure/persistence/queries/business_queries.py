@@ -0,0 +1,77 @@
+"""SQL query templates for businesses (tenants) and tenant scoping."""
+
+# Businesses table queries
+CREATE_BUSINESSES_TABLE = """
+CREATE TABLE IF NOT EXISTS businesses (
+    business_id SERIAL PRIMARY KEY,
+    slug VARCHAR(50) NOT NULL UNIQUE,
+    name VARCHAR(100) NOT NULL,
+    assistant_name VARCHAR(50) NOT NULL DEFAULT 'Sara',
+    hours TEXT,
+    address TEXT,
+    phone VARCHAR(30),
+    email VARCHAR(100),
+    iva_rate DECIMAL(5, 2), -- NULL uses IVA_RATE
+    prices_include_iva BOOLEAN, -- NULL uses PRICES_INCLUDE_IVA
+    active BOOLEAN NOT NULL DEFAULT TRUE,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+"""
+
+# The first business owns every row created before multi-tenancy
+SEED_DEFAULT_BUSINESS = """
+INSERT INTO businesses (business_id, slug, name, hours, address, phone, email)
+VALUES (
+    1,
+    'liwaisi-tech',
+    'Liwaisi Tech',
+    'Lunes a Viernes de 8:00 AM a 6:00 PM (UTC-5)',
+    'Calle Principal #123, Barrio Centro, Maní, Casanare, Colombia',
+    '+57 365 842 5187',
+    'info@liwaisi.tech'
+)
+ON CONFLICT (business_id) DO NOTHING;
+SELECT setval(pg_get_serial_sequence('businesses', 'business_id'), GREATEST((SELECT MAX(business_id) FROM businesses), 1));
+"""
+
+# Tenant column on the tables that are queried by business; variants,
+# inventory and order lines are reached through their product or order
+ADD_TENANT_COLUMNS = """
+ALTER TABLE categories ADD COLUMN IF NOT EXISTS business_id INTEGER NOT NULL DEFAULT 1 REFERENCES businesses(business_id);
+ALTER TABLE products ADD COLUMN IF NOT EXISTS business_id INTEGER NOT NULL DEFAULT 1 REFERENCES businesses(business_id);
+ALTER TABLE orders ADD COLUMN IF NOT EXISTS business_id INTEGER NOT NULL DEFAULT 1 REFERENCES businesses(business_id);
+ALTER TABLE inbound_messages ADD COLUMN IF NOT EXISTS business_id INTEGER NOT NULL DEFAULT 1 REFERENCES businesses(business_id);
+"""
+
+CREATE_TENANT_INDEXES = """
+CREATE INDEX IF NOT EXISTS idx_categories_business_name ON categories(business_id, LOWER(name));
+CREATE INDEX IF NOT EXISTS idx_products_business_category ON products(business_id, category_id);
+CREATE INDEX IF NOT EXISTS idx_orders_business_number ON orders(business_id, whatsapp_number);
+"""
+
+# Business queries
+GET_ACTIVE_BUSINESS_BY_ID = """
+SELECT business_id, slug, name, assistant_name, hours, address, phone, email,
+       iva_rate, prices_include_iva, active, updated_at
+FROM businesses
+WHERE business_id = %(business_id)s AND active = TRUE;
+"""
+
+LIST_BUSINESSES = """
+SELECT business_id, slug, name, assistant_name, hours, address, phone, email,
+       iva_rate, prices_include_iva, active, updated_at
+FROM businesses
+ORDER BY business_id
+LIMIT %(limit)s OFFSET %(offset)s;
+"""
+
+CREATE_BUSINESS = """
+INSERT INTO businesses (slug, name, assistant_name, hours, address, phone, email, iva_rate, prices_include_iva)
+VALUES (
+    %(slug)s, %(name)s, %(assistant_name)s, %(hours)s, %(address)s, %(phone)s, %(email)s,
+    %(iva_rate)s, %(prices_include_iva)s
+)
+RETURNING business_id, slug, name, assistant_name, hours, address, phone, email,
+          iva_rate, prices_include_iva, active, updated_at;
+"""
@@ -0,0 +1,287 @@
+"""SQL query templates for bulk catalog import and export.
+
+The import loads a flat file (one row per inventory lot) into a temporary
+staging table with COPY, validates it with set-based statements and upserts
+categories, products, variants (by SKU) and inventory lots in a single
+transaction.
+"""
+
+# Columns of the flat catalog file, in export order
+CATALOG_COLUMNS = (
+    "category",
+    "product",
+    "product_description",
+    "is_physical",
+    "variant",
+    "sku",
+    "price",
+    "active",
+    "quantity",
+    "expiration_date",
+)
+
+# Staging table; every column is TEXT so malformed values are reported instead of aborting COPY
+CREATE_CATALOG_STAGING_TABLE = """
+CREATE TEMP TABLE catalog_staging (
+    line_no BIGSERIAL,
+    category TEXT,
+    product TEXT,
+    product_description TEXT,
+    is_physical TEXT,
+    variant TEXT,
+    sku TEXT,
+    price TEXT,
+    active TEXT,
+    quantity TEXT,
+    expiration_date TEXT
+) ON COMMIT DROP;
+
+CREATE TEMP TABLE catalog_rejects (
+    line_no BIGINT,
+    sku TEXT,
+    reason TEXT
+) ON COMMIT DROP;
+"""
+
+COPY_CATALOG_STAGING = """
+COPY catalog_staging ({columns}) FROM STDIN WITH (FORMAT csv)
+"""
+
+# Row-level validation in one pass over the staging table
+REJECT_INVALID_STAGING_ROWS = """
+INSERT INTO catalog_rejects (line_no, sku, reason)
+SELECT line_no, sku, reason
+FROM (
+    SELECT
+        line_no,
+        sku,
+        CASE
+            WHEN NULLIF(TRIM(sku), '') IS NULL THEN 'SKU requerido'
+            WHEN NULLIF(TRIM(category), '') IS NULL THEN 'Categoría requerida'
+            WHEN NULLIF(TRIM(product), '') IS NULL THEN 'Producto requerido'
+            WHEN NULLIF(TRIM(variant), '') IS NULL THEN 'Variante requerida'
+            WHEN TRIM(COALESCE(price, '')) !~ '^[0-9]+(\\.[0-9]{1,2})?$' THEN 'Precio inválido'
+            WHEN NULLIF(TRIM(quantity), '') IS NOT NULL AND TRIM(quantity) !~ '^[0-9]+$' THEN 'Cantidad inválida'
+            WHEN NULLIF(TRIM(expiration_date), '') IS NOT NULL
+                 AND TRIM(expiration_date) !~ '^[0-9]{4}-[0-9]{2}-[0-9]{2}$' THEN 'Fecha de vencimiento inválida'
+            WHEN NULLIF(LOWER(TRIM(is_physical)), '') IS NOT NULL
+                 AND LOWER(TRIM(is_physical)) NOT IN ('true', 'false', 't', 'f', '1', '0', 'yes', 'no') THEN 'is_physical inválido'
+            WHEN NULLIF(LOWER(TRIM(active)), '') IS NOT NULL
+                 AND LOWER(TRIM(active)) NOT IN ('true', 'false', 't', 'f', '1', '0', 'yes', 'no') THEN 'active inválido'
+            WHEN ROW_NUMBER() OVER (
+                PARTITION BY TRIM(sku), TRIM(COALESCE(expiration_date, '')) ORDER BY line_no DESC
+            ) > 1 THEN 'Lote duplicado en el archivo (SKU y vencimiento)'
+        END AS reason
+    FROM catalog_staging
+) checked
+WHERE reason IS NOT NULL;
+"""
+
+# Typed copy of the rows that passed validation
+CREATE_CATALOG_VALID_TABLE = """
+CREATE TEMP TABLE catalog_valid ON COMMIT DROP AS
+SELECT
+    s.line_no,
+    TRIM(s.category) AS category,
+    TRIM(s.product) AS product,
+    NULLIF(s.product_description, '') AS product_description,
+    COALESCE(NULLIF(TRIM(s.is_physical), '')::BOOLEAN, TRUE) AS is_physical,
+    TRIM(s.variant) AS variant,
+    TRIM(s.sku) AS sku,
+    TRIM(s.price)::DECIMAL(10, 2) AS price,
+    COALESCE(NULLIF(TRIM(s.active), '')::BOOLEAN, TRUE) AS active,
+    NULLIF(TRIM(s.quantity), '')::INTEGER AS quantity,
+    NULLIF(TRIM(s.expiration_date), '')::DATE AS expiration_date,
+    NULL::INTEGER AS category_id,
+    NULL::INTEGER AS product_id
+FROM catalog_staging s
+WHERE NOT EXISTS (SELECT 1 FROM catalog_rejects r WHERE r.line_no = s.line_no);
+"""
+
+CREATE_MISSING_CATEGORIES = """
+WITH created AS (
+    INSERT INTO categories (business_id, name)
+    SELECT DISTINCT %(business_id)s, v.category
+    FROM catalog_valid v
+    WHERE NOT EXISTS (
+        SELECT 1 FROM categories c
+        WHERE c.business_id = %(business_id)s AND LOWER(c.name) = LOWER(v.category)
+    )
+    RETURNING 1
+)
+SELECT COUNT(*) AS created FROM created;
+"""
+
+RESOLVE_CATEGORY_IDS = """
+UPDATE catalog_valid v
+SET category_id = c.category_id
+FROM (
+    SELECT DISTINCT ON (LOWER(name)) category_id, LOWER(name) AS name_key
+    FROM categories
+    WHERE business_id = %(business_id)s
+    ORDER BY LOWER(name), category_id
+) c
+WHERE c.name_key = LOWER(v.category);
+"""
+
+# Foreign key validation: rows whose category does not exist are rejected as a set
+REJECT_UNKNOWN_CATEGORIES = """
+WITH unknown AS (
+    DELETE FROM catalog_valid
+    WHERE category_id IS NULL
+    RETURNING line_no, sku, category
+)
+INSERT INTO catalog_rejects (line_no, sku, reason)
+SELECT line_no, sku, 'Categoría no existe: ' || category FROM unknown;
+"""
+
+UPDATE_EXISTING_PRODUCTS = """
+WITH source AS (
+    SELECT DISTINCT ON (category_id, LOWER(product))
+        category_id, product, product_description, is_physical
+    FROM catalog_valid
+    ORDER BY category_id, LOWER(product), line_no DESC
+), updated AS (
+    UPDATE products p
+    SET
+        description = COALESCE(s.product_description, p.description),
+        is_physical = s.is_physical,
+        updated_at = CURRENT_TIMESTAMP
+    FROM source s
+    WHERE p.category_id = s.category_id
+      AND LOWER(p.name) = LOWER(s.product)
+      AND (p.description IS DISTINCT FROM COALESCE(s.product_description, p.description)
+           OR p.is_physical IS DISTINCT FROM s.is_physical)
+    RETURNING 1
+)
+SELECT COUNT(*) AS updated FROM updated;
+"""
+
+CREATE_MISSING_PRODUCTS = """
+WITH source AS (
+    SELECT DISTINCT ON (category_id, LOWER(product))
+        category_id, product, product_description, is_physical
+    FROM catalog_valid
+    ORDER BY category_id, LOWER(product), line_no DESC
+), created AS (
+    INSERT INTO products (business_id, category_id, name, description, is_physical)
+    SELECT %(business_id)s, s.category_id, s.product, s.product_description, s.is_physical
+    FROM source s
+    WHERE NOT EXISTS (
+        SELECT 1 FROM products p
+        WHERE p.category_id = s.category_id AND LOWER(p.name) = LOWER(s.product)
+    )
+    RETURNING 1
+)
+SELECT COUNT(*) AS created FROM created;
+"""
+
+RESOLVE_PRODUCT_IDS = """
+UPDATE catalog_valid v
+SET product_id = p.product_id
+FROM (
+    SELECT DISTINCT ON (category_id, LOWER(name)) product_id, category_id, LOWER(name) AS name_key
+    FROM products
+    ORDER BY category_id, LOWER(name), product_id
+) p
+WHERE p.category_id = v.category_id AND p.name_key = LOWER(v.product);
+"""
+
+# SKUs are unique across the deployment; a row may not move another business's variant
+REJECT_FOREIGN_SKUS = """
+WITH foreign_skus AS (
+    DELETE FROM catalog_valid v
+    USING product_variants pv
+    JOIN products p ON p.product_id = pv.product_id
+    WHERE pv.sku = v.sku AND p.business_id <> %(business_id)s
+    RETURNING v.line_no, v.sku
+)
+INSERT INTO catalog_rejects (line_no, sku, reason)
+SELECT line_no, sku, 'SKU pertenece a otro negocio' FROM foreign_skus;
+"""
+
+UPSERT_VARIANTS_BY_SKU = """
+WITH upserted AS (
+    INSERT INTO product_variants (product_id, name, sku, price, active)
+    SELECT DISTINCT ON (sku) product_id, variant, sku, price, active
+    FROM catalog_valid
+    ORDER BY sku, line_no DESC
+    ON CONFLICT (sku) DO UPDATE
+    SET
+        product_id = EXCLUDED.product_id,
+        name = EXCLUDED.name,
+        price = EXCLUDED.price,
+        active = EXCLUDED.active,
+        updated_at = CURRENT_TIMESTAMP
+    RETURNING (xmax = 0) AS inserted
+)
+SELECT
+    COUNT(*) FILTER (WHERE inserted) AS created,
+    COUNT(*) FILTER (WHERE NOT inserted) AS updated
+FROM upserted;
+"""
+
+# Inventory lots are identified by (variant, expiration date); the file sets their quantity
+UPDATE_EXISTING_INVENTORY_LOTS = """
+WITH updated AS (
+    UPDATE inventory i
+    SET quantity = v.quantity, updated_at = CURRENT_TIMESTAMP
+    FROM catalog_valid v
+    JOIN product_variants pv ON pv.sku = v.sku
+    WHERE v.quantity IS NOT NULL
+      AND i.variant_id = pv.variant_id
+      AND i.expiration_date IS NOT DISTINCT FROM v.expiration_date
+    RETURNING 1
+)
+SELECT COUNT(*) AS updated FROM updated;
+"""
+
+CREATE_MISSING_INVENTORY_LOTS = """
+WITH created AS (
+    INSERT INTO inventory (variant_id, quantity, expiration_date)
+    SELECT pv.variant_id, v.quantity, v.expiration_date
+    FROM catalog_valid v
+    JOIN product_variants pv ON pv.sku = v.sku
+    WHERE v.quantity IS NOT NULL
+      AND NOT EXISTS (
+          SELECT 1 FROM inventory i
+          WHERE i.variant_id = pv.variant_id
+            AND i.expiration_date IS NOT DISTINCT FROM v.expiration_date
+      )
+    RETURNING 1
+)
+SELECT COUNT(*) AS created FROM created;
+"""
+
+GET_CATALOG_IMPORT_REJECTS = """
+SELECT line_no, sku, reason FROM catalog_rejects ORDER BY line_no LIMIT %(limit)s;
+"""
+
+COUNT_CATALOG_IMPORT_ROWS = """
+SELECT
+    (SELECT COUNT(*) FROM catalog_staging) AS received,
+    (SELECT COUNT(*) FROM catalog_rejects) AS rejected;
+"""
+
+# Flat export in the same layout accepted by the import (one row per inventory lot)
+COPY_CATALOG_EXPORT = """
+COPY (
+    SELECT
+        c.name AS category,
+        p.name AS product,
+        p.description AS product_description,
+        p.is_physical,
+        v.name AS variant,
+        v.sku,
+        v.price,
+        v.active,
+        i.quantity,
+        i.expiration_date
+    FROM product_variants v
+    JOIN products p ON p.product_id = v.product_id
+    JOIN categories c ON c.category_id = p.category_id
+    LEFT JOIN inventory i ON i.variant_id = v.variant_id
+    WHERE p.business_id = %(business_id)s
+    ORDER BY c.name, p.name, v.sku, i.expiration_date NULLS LAST
+) TO STDOUT WITH (FORMAT csv, HEADER true)
+"""
@@ -0,0 +1,39 @@
+"""SQL query templates feeding the in-memory catalog search index."""
+
+# updated_at indexes keep incremental refreshes proportional to the changes
+CREATE_CATALOG_INDEX_INDEXES = """
+CREATE INDEX IF NOT EXISTS idx_products_updated ON products(updated_at);
+CREATE INDEX IF NOT EXISTS idx_variants_updated ON product_variants(updated_at);
+CREATE INDEX IF NOT EXISTS idx_inventory_updated ON inventory(updated_at);
+"""
+
+# One row per variant of a business with its non-expired stock. With a
+# changed_since timestamp only variants whose product, variant or inventory
+# rows changed afterwards are returned.
+GET_CATALOG_INDEX_ROWS = """
+SELECT
+    v.variant_id,
+    v.name AS variant_name,
+    v.sku,
+    v.price,
+    v.active,
+    p.product_id,
+    p.name AS product_name,
+    p.description AS product_description,
+    c.name AS category_name,
+    COALESCE(SUM(i.quantity) FILTER (WHERE i.expiration_date IS NULL OR i.expiration_date >= CURRENT_DATE), 0) AS quantity,
+    MIN(i.expiration_date) FILTER (WHERE i.quantity > 0 AND i.expiration_date >= CURRENT_DATE) AS next_expiration_date,
+    GREATEST(MAX(p.updated_at), MAX(v.updated_at), MAX(i.updated_at)) AS updated_at
+FROM product_variants v
+JOIN products p ON p.product_id = v.product_id
+JOIN categories c ON c.category_id = p.category_id
+LEFT JOIN inventory i ON i.variant_id = v.variant_id
+WHERE p.business_id = %(business_id)s
+  AND (
+      %(changed_since)s::timestamp IS NULL
+      OR p.updated_at > %(changed_since)s::timestamp
+      OR v.updated_at > %(changed_since)s::timestamp
+      OR v.variant_id IN (SELECT variant_id FROM inventory WHERE updated_at > %(changed_since)s::timestamp)
+  )
+GROUP BY v.variant_id, p.product_id, c.name;
+"""
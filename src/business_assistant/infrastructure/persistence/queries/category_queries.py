@@ -0,0 +1,75 @@
+"""SQL query templates for the category hierarchy of a business."""
+
+# Every category of a business reachable from a root, parents before their
+# children, with its depth and the number of products filed directly under
+# it. The visited path stops the recursion on a parent_id cycle, and
+# categories caught in one are never reached from a root.
+GET_CATEGORY_TREE = """
+WITH RECURSIVE tree AS (
+    SELECT c.category_id, c.parent_id, c.name, c.description, 0 AS depth, ARRAY[c.category_id] AS path
+    FROM categories c
+    WHERE c.business_id = %(business_id)s AND c.parent_id IS NULL
+    UNION ALL
+    SELECT c.category_id, c.parent_id, c.name, c.description, t.depth + 1, t.path || c.category_id
+    FROM categories c
+    JOIN tree t ON c.parent_id = t.category_id
+    WHERE c.business_id = %(business_id)s AND NOT c.category_id = ANY(t.path)
+)
+SELECT t.category_id, t.parent_id, t.name, t.description, t.depth, COUNT(p.product_id) AS product_count
+FROM tree t
+LEFT JOIN products p ON p.business_id = %(business_id)s AND p.category_id = t.category_id
+GROUP BY t.category_id, t.parent_id, t.name, t.description, t.depth, t.path
+ORDER BY t.path;
+"""
+
+# Active variants of the products filed under any of the given categories,
+# one row per variant with its non-expired stock. The category ids are the
+# subtree resolved from the cached tree, so a single lookup on
+# idx_products_business_category serves any depth.
+GET_SUBTREE_PRODUCTS = """
+SELECT
+    p.category_id,
+    p.product_id,
+    p.name AS product_name,
+    v.variant_id,
+    v.name AS variant_name,
+    v.sku,
+    v.price,
+    COALESCE(SUM(i.quantity) FILTER (WHERE i.expiration_date IS NULL OR i.expiration_date >= CURRENT_DATE), 0) AS quantity
+FROM products p
+JOIN product_variants v ON v.product_id = p.product_id AND v.active = TRUE
+LEFT JOIN inventory i ON i.variant_id = v.variant_id
+WHERE p.business_id = %(business_id)s
+  AND p.category_id = ANY(%(category_ids)s::int[])
+GROUP BY p.product_id, v.variant_id
+ORDER BY p.name, v.name, v.variant_id
+LIMIT %(limit)s OFFSET %(offset)s;
+"""
+
+# Category edits scoped to the business; the parent must belong to it too
+CREATE_BUSINESS_CATEGORY = """
+INSERT INTO categories (business_id, name, description, parent_id)
+SELECT %(business_id)s, %(name)s, %(description)s, %(parent_id)s
+WHERE %(parent_id)s::int IS NULL OR EXISTS (
+    SELECT 1 FROM categories WHERE category_id = %(parent_id)s AND business_id = %(business_id)s
+)
+RETURNING category_id, parent_id, name, description;
+"""
+
+UPDATE_BUSINESS_CATEGORY = """
+UPDATE categories
+SET
+    name = %(name)s,
+    description = %(description)s,
+    parent_id = %(parent_id)s,
+    updated_at = CURRENT_TIMESTAMP
+WHERE category_id = %(category_id)s AND business_id = %(business_id)s
+  AND (%(parent_id)s::int IS NULL OR EXISTS (
+      SELECT 1 FROM categories WHERE category_id = %(parent_id)s AND business_id = %(business_id)s
+  ))
+RETURNING category_id, parent_id, name, description;
+"""
+
+DELETE_BUSINESS_CATEGORY = """
+DELETE FROM categories WHERE category_id = %(category_id)s AND business_id = %(business_id)s;
+"""
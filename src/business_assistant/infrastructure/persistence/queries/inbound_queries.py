@@ -0,0 +1,117 @@
+"""SQL query templates for the durable inbound message queue."""
+
+# Inbound messages received through the webhook, processed by the worker pool
+CREATE_INBOUND_MESSAGES_TABLE = """
+CREATE TABLE IF NOT EXISTS inbound_messages (
+    message_id BIGSERIAL PRIMARY KEY,
+    external_id VARCHAR(255) UNIQUE,
+    whatsapp_number VARCHAR(20) NOT NULL,
+    body TEXT NOT NULL,
+    status VARCHAR(20) NOT NULL DEFAULT 'queued' CHECK (status IN ('queued', 'processing', 'done', 'dead')),
+    attempts INTEGER NOT NULL DEFAULT 0,
+    available_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    locked_at TIMESTAMP,
+    response TEXT,
+    last_error TEXT,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+"""
+
+# Partial indexes keep claiming and stale recovery proportional to the pending work
+CREATE_INBOUND_MESSAGE_INDEXES = """
+CREATE INDEX IF NOT EXISTS idx_inbound_messages_queued ON inbound_messages(available_at, message_id) WHERE status = 'queued';
+CREATE INDEX IF NOT EXISTS idx_inbound_messages_processing ON inbound_messages(whatsapp_number, locked_at) WHERE status = 'processing';
+CREATE INDEX IF NOT EXISTS idx_inbound_messages_number_queued ON inbound_messages(whatsapp_number, message_id) WHERE status = 'queued';
+"""
+
+# Duplicate webhook deliveries (same external_id) are acknowledged without a new row.
+# The no-op update locks the existing row, so a delivery racing the first one
+# waits for its insert and still gets the message id back; xmax is 0 only for
+# a freshly inserted row.
+ENQUEUE_INBOUND_MESSAGE = """
+INSERT INTO inbound_messages (business_id, external_id, whatsapp_number, body)
+VALUES (%(business_id)s, %(external_id)s, %(whatsapp_number)s, %(body)s)
+ON CONFLICT (external_id) DO UPDATE SET external_id = EXCLUDED.external_id
+RETURNING message_id, (xmax = 0) AS created;
+"""
+
+# Claim the oldest due message of conversations (business and number) with no
+# message in progress. Only the earliest queued message of a conversation
+# qualifies, so its turns are processed one at a time and in order; SKIP LOCKED
+# lets workers claim in parallel.
+CLAIM_INBOUND_MESSAGES = """
+UPDATE inbound_messages m
+SET
+    status = 'processing',
+    attempts = m.attempts + 1,
+    locked_at = CURRENT_TIMESTAMP,
+    updated_at = CURRENT_TIMESTAMP
+WHERE m.message_id IN (
+    SELECT q.message_id
+    FROM inbound_messages q
+    WHERE q.status = 'queued'
+      AND q.available_at <= CURRENT_TIMESTAMP
+      AND NOT EXISTS (
+          SELECT 1 FROM inbound_messages p
+          WHERE p.whatsapp_number = q.whatsapp_number AND p.business_id = q.business_id AND p.status = 'processing'
+      )
+      AND NOT EXISTS (
+          SELECT 1 FROM inbound_messages e
+          WHERE e.whatsapp_number = q.whatsapp_number AND e.business_id = q.business_id
+            AND e.status = 'queued' AND e.message_id < q.message_id
+      )
+    ORDER BY q.available_at, q.message_id
+    LIMIT %(batch_size)s
+    FOR UPDATE SKIP LOCKED
+)
+RETURNING
+    m.message_id, m.business_id, m.external_id, m.whatsapp_number, m.body, m.attempts, m.response, m.created_at,
+    EXTRACT(EPOCH FROM CURRENT_TIMESTAMP - m.created_at)::float AS queued_seconds;
+"""
+
+# The reply is stored before delivery so a failed send is retried without re-running the turn
+SAVE_INBOUND_RESPONSE = """
+UPDATE inbound_messages
+SET response = %(response)s, updated_at = CURRENT_TIMESTAMP
+WHERE message_id = %(message_id)s;
+"""
+
+COMPLETE_INBOUND_MESSAGE = """
+UPDATE inbound_messages
+SET status = 'done', locked_at = NULL, last_error = NULL, updated_at = CURRENT_TIMESTAMP
+WHERE message_id = %(message_id)s;
+"""
+
+RETRY_INBOUND_MESSAGE = """
+UPDATE inbound_messages
+SET
+    status = 'queued',
+    locked_at = NULL,
+    available_at = CURRENT_TIMESTAMP + make_interval(secs => %(delay_seconds)s),
+    last_error = %(error)s,
+    updated_at = CURRENT_TIMESTAMP
+WHERE message_id = %(message_id)s;
+"""
+
+DEAD_LETTER_INBOUND_MESSAGE = """
+UPDATE inbound_messages
+SET status = 'dead', locked_at = NULL, last_error = %(error)s, updated_at = CURRENT_TIMESTAMP
+WHERE message_id = %(message_id)s;
+"""
+
+# Messages left in progress by a crashed worker become claimable again
+RECOVER_STALE_INBOUND_MESSAGES = """
+UPDATE inbound_messages
+SET status = 'queued', locked_at = NULL, last_error = 'Procesamiento interrumpido', updated_at = CURRENT_TIMESTAMP
+WHERE status = 'processing'
+  AND locked_at < CURRENT_TIMESTAMP - make_interval(secs => %(visibility_timeout)s)
+RETURNING message_id;
+"""
+
+COUNT_INBOUND_MESSAGES_BY_STATUS = """
+SELECT status, COUNT(*) AS count
+FROM inbound_messages
+WHERE status IN ('queued', 'processing', 'dead')
+GROUP BY status;
+"""
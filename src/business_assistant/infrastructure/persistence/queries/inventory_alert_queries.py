@@ -0,0 +1,174 @@
+"""SQL query templates for the low-stock and expiration alert engine."""
+
+# Open alerts, so a condition is notified once until it clears; ref_id is
+# the variant of a low-stock alert and the inventory lot of an expiring one.
+# notified_at stays NULL until the owner was notified.
+CREATE_INVENTORY_ALERTS_TABLE = """
+CREATE TABLE IF NOT EXISTS inventory_alerts (
+    kind VARCHAR(20) NOT NULL,
+    ref_id INTEGER NOT NULL,
+    business_id INTEGER NOT NULL REFERENCES businesses(business_id),
+    product_name VARCHAR(255) NOT NULL,
+    variant_name VARCHAR(255),
+    sku VARCHAR(100),
+    quantity INTEGER NOT NULL,
+    expiration_date DATE,
+    created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    notified_at TIMESTAMP,
+    PRIMARY KEY (kind, ref_id)
+);
+"""
+
+# One row per run; the last one holds the watermarks of the next run
+CREATE_INVENTORY_ALERT_RUNS_TABLE = """
+CREATE TABLE IF NOT EXISTS inventory_alert_runs (
+    run_id SERIAL PRIMARY KEY,
+    started_at TIMESTAMP NOT NULL,
+    run_date DATE NOT NULL,
+    horizon DATE NOT NULL,
+    full_scan BOOLEAN NOT NULL,
+    low_stock_rows INTEGER NOT NULL,
+    expiration_rows INTEGER NOT NULL,
+    alerts_emitted INTEGER NOT NULL,
+    alerts_resolved INTEGER NOT NULL,
+    seconds NUMERIC(10, 3) NOT NULL
+);
+"""
+
+# Partial indexes over stocked perishable lots, the only rows expiration
+# alerts look at: by date for lots entering the window, by update time for
+# lots changed inside it. Pending alerts are the few not yet delivered.
+CREATE_INVENTORY_ALERT_INDEXES = """
+CREATE INDEX IF NOT EXISTS idx_inventory_stocked_expiration ON inventory(expiration_date)
+    WHERE quantity > 0 AND expiration_date IS NOT NULL;
+CREATE INDEX IF NOT EXISTS idx_inventory_stocked_updated ON inventory(updated_at)
+    WHERE quantity > 0 AND expiration_date IS NOT NULL;
+CREATE INDEX IF NOT EXISTS idx_inventory_alerts_pending ON inventory_alerts(business_id)
+    WHERE notified_at IS NULL;
+"""
+
+# Transaction-scoped lock serializing the runs of every replica; it is
+# released when the transaction holding it ends, even if the process dies
+TRY_LOCK_INVENTORY_ALERT_RUN = """
+SELECT pg_try_advisory_xact_lock(hashtext('inventory_alert_run')) AS acquired;
+"""
+
+GET_LAST_ALERT_RUN = """
+SELECT CURRENT_TIMESTAMP::timestamp AS now, CURRENT_DATE AS today, r.started_at, r.run_date, r.horizon
+FROM (SELECT 1) AS clock
+LEFT JOIN (
+    SELECT started_at, run_date, horizon FROM inventory_alert_runs ORDER BY run_id DESC LIMIT 1
+) AS r ON TRUE;
+"""
+
+# Sellable stock of the active variants of physical products whose lots
+# changed since the last run, or whose lots expired since then (an expired
+# lot stops counting without its row changing). With changed_since NULL
+# every variant is returned.
+GET_CHANGED_VARIANT_STOCK = """
+SELECT
+    p.business_id,
+    p.product_id,
+    p.name AS product_name,
+    v.variant_id,
+    v.name AS variant_name,
+    v.sku,
+    COALESCE(SUM(i.quantity) FILTER (WHERE i.expiration_date IS NULL OR i.expiration_date >= CURRENT_DATE), 0) AS quantity
+FROM product_variants v
+JOIN products p ON p.product_id = v.product_id
+LEFT JOIN inventory i ON i.variant_id = v.variant_id
+WHERE p.is_physical = TRUE
+  AND v.active = TRUE
+  AND (
+      %(changed_since)s::timestamp IS NULL
+      OR v.variant_id IN (SELECT variant_id FROM inventory WHERE updated_at > %(changed_since)s::timestamp)
+      OR v.variant_id IN (
+          SELECT variant_id FROM inventory
+          WHERE quantity > 0 AND expiration_date IS NOT NULL
+            AND expiration_date >= %(expired_since)s::date AND expiration_date < CURRENT_DATE
+      )
+  )
+GROUP BY p.business_id, p.product_id, v.variant_id;
+"""
+
+# Stocked lots expiring within the horizon that the last run did not see:
+# lots the moving window reached since the previous horizon, and lots
+# changed since the last run. Both branches use the partial indexes.
+GET_EXPIRING_LOTS = """
+SELECT
+    p.business_id,
+    p.product_id,
+    p.name AS product_name,
+    v.variant_id,
+    v.name AS variant_name,
+    v.sku,
+    i.inventory_id,
+    i.quantity,
+    i.expiration_date
+FROM inventory i
+JOIN product_variants v ON v.variant_id = i.variant_id
+JOIN products p ON p.product_id = v.product_id
+WHERE i.quantity > 0 AND i.expiration_date IS NOT NULL
+  AND i.expiration_date >= CURRENT_DATE AND i.expiration_date <= %(horizon)s
+  AND (%(previous_horizon)s::date IS NULL OR i.expiration_date > %(previous_horizon)s::date)
+UNION
+SELECT
+    p.business_id,
+    p.product_id,
+    p.name AS product_name,
+    v.variant_id,
+    v.name AS variant_name,
+    v.sku,
+    i.inventory_id,
+    i.quantity,
+    i.expiration_date
+FROM inventory i
+JOIN product_variants v ON v.variant_id = i.variant_id
+JOIN products p ON p.product_id = v.product_id
+WHERE i.quantity > 0 AND i.expiration_date IS NOT NULL
+  AND i.expiration_date >= CURRENT_DATE AND i.expiration_date <= %(horizon)s
+  AND i.updated_at > %(changed_since)s::timestamp;
+"""
+
+# Multi-row upsert used with psycopg2.extras.execute_values; an open alert
+# is left alone unless its lot got a new expiration date, which is notified again
+OPEN_INVENTORY_ALERTS = """
+INSERT INTO inventory_alerts (kind, ref_id, business_id, product_name, variant_name, sku, quantity, expiration_date)
+VALUES %s
+ON CONFLICT (kind, ref_id) DO UPDATE
+SET quantity = EXCLUDED.quantity,
+    expiration_date = EXCLUDED.expiration_date,
+    notified_at = NULL
+WHERE inventory_alerts.expiration_date IS DISTINCT FROM EXCLUDED.expiration_date;
+"""
+
+# Alerts whose condition cleared: restocked variants, and lots past their date
+RESOLVE_INVENTORY_ALERTS = """
+DELETE FROM inventory_alerts
+WHERE (kind = 'low_stock' AND ref_id = ANY(%(restocked_variant_ids)s::int[]))
+   OR (kind = 'expiring' AND expiration_date < CURRENT_DATE);
+"""
+
+# Alerts not yet delivered, including those whose notification failed before
+GET_PENDING_INVENTORY_ALERTS = """
+SELECT kind, ref_id, business_id, product_name, variant_name, sku, quantity, expiration_date
+FROM inventory_alerts
+WHERE notified_at IS NULL
+ORDER BY business_id, kind, product_name;
+"""
+
+MARK_INVENTORY_ALERTS_NOTIFIED = """
+UPDATE inventory_alerts
+SET notified_at = CURRENT_TIMESTAMP
+WHERE (kind, ref_id) IN (SELECT * FROM UNNEST(%(kinds)s::text[], %(ref_ids)s::int[]));
+"""
+
+INSERT_INVENTORY_ALERT_RUN = """
+INSERT INTO inventory_alert_runs (
+    started_at, run_date, horizon, full_scan, low_stock_rows, expiration_rows,
+    alerts_emitted, alerts_resolved, seconds
+) VALUES (
+    %(started_at)s, %(run_date)s, %(horizon)s, %(full_scan)s, %(low_stock_rows)s, %(expiration_rows)s,
+    %(alerts_emitted)s, %(alerts_resolved)s, %(seconds)s
+);
+"""
@@ -0,0 +1,146 @@
+"""SQL query templates for order and inventory reservation operations."""
+
+# Orders table queries
+CREATE_ORDERS_TABLE = """
+CREATE TABLE IF NOT EXISTS orders (
+    order_id SERIAL PRIMARY KEY,
+    whatsapp_number VARCHAR(20) NOT NULL,
+    status VARCHAR(20) NOT NULL DEFAULT 'reserved' CHECK (status IN ('reserved', 'cancelled')),
+    total DECIMAL(12, 2) NOT NULL DEFAULT 0,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+"""
+
+# Order lines table queries (one line per inventory lot the quantity was taken from)
+CREATE_ORDER_LINES_TABLE = """
+CREATE TABLE IF NOT EXISTS order_lines (
+    order_line_id SERIAL PRIMARY KEY,
+    order_id INTEGER NOT NULL REFERENCES orders(order_id) ON DELETE CASCADE,
+    variant_id INTEGER NOT NULL REFERENCES product_variants(variant_id),
+    inventory_id INTEGER NOT NULL REFERENCES inventory(inventory_id),
+    quantity INTEGER NOT NULL CHECK (quantity > 0),
+    unit_price DECIMAL(10, 2) NOT NULL,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+"""
+
+# Index creation queries
+CREATE_ORDER_INDEXES = """
+CREATE INDEX IF NOT EXISTS idx_orders_whatsapp_number ON orders(whatsapp_number);
+CREATE INDEX IF NOT EXISTS idx_order_lines_order ON order_lines(order_id);
+CREATE INDEX IF NOT EXISTS idx_inventory_variant_fifo ON inventory(variant_id, expiration_date) WHERE quantity > 0;
+"""
+
+# Reservation queries
+GET_ACTIVE_VARIANTS_BY_IDS = """
+SELECT v.variant_id, v.name, v.price
+FROM product_variants v
+JOIN products p ON p.product_id = v.product_id
+WHERE v.variant_id = ANY(%(variant_ids)s) AND v.active = TRUE AND p.business_id = %(business_id)s;
+"""
+
+# Quote query: prices and non-expired stock of a business's variants referenced by id or SKU
+GET_VARIANT_PRICES = """
+SELECT
+    v.variant_id,
+    v.sku,
+    v.name,
+    v.price,
+    COALESCE(SUM(i.quantity) FILTER (
+        WHERE i.expiration_date IS NULL OR i.expiration_date >= CURRENT_DATE
+    ), 0) AS available
+FROM product_variants v
+JOIN products p ON p.product_id = v.product_id
+LEFT JOIN inventory i ON i.variant_id = v.variant_id
+WHERE (v.variant_id = ANY(%(variant_ids)s) OR v.sku = ANY(%(skus)s))
+  AND v.active = TRUE
+  AND p.business_id = %(business_id)s
+GROUP BY v.variant_id;
+"""
+
+# Fast path: take the whole quantity from the oldest non-expired lot that can
+# cover it. SKIP LOCKED lets concurrent buyers move on to other lots instead of
+# queuing; the outer condition keeps the decrement from going negative.
+RESERVE_FROM_SINGLE_LOT = """
+UPDATE inventory
+SET
+    quantity = quantity - %(quantity)s,
+    updated_at = CURRENT_TIMESTAMP
+WHERE inventory_id = (
+    SELECT inventory_id
+    FROM inventory
+    WHERE variant_id = %(variant_id)s
+      AND quantity >= %(quantity)s
+      AND (expiration_date IS NULL OR expiration_date >= CURRENT_DATE)
+    ORDER BY expiration_date ASC NULLS LAST, inventory_id
+    LIMIT 1
+    FOR UPDATE SKIP LOCKED
+)
+AND quantity >= %(quantity)s
+RETURNING inventory_id;
+"""
+
+# Slow path: lock every available lot of the variant in FIFO order (waiting for
+# concurrent reservations) so the quantity can be split across lots
+LOCK_AVAILABLE_LOTS = """
+SELECT inventory_id, quantity
+FROM inventory
+WHERE variant_id = %(variant_id)s
+  AND quantity > 0
+  AND (expiration_date IS NULL OR expiration_date >= CURRENT_DATE)
+ORDER BY expiration_date ASC NULLS LAST, inventory_id
+FOR UPDATE;
+"""
+
+DECREMENT_LOT = """
+UPDATE inventory
+SET
+    quantity = quantity - %(quantity)s,
+    updated_at = CURRENT_TIMESTAMP
+WHERE inventory_id = %(inventory_id)s AND quantity >= %(quantity)s
+RETURNING inventory_id;
+"""
+
+CREATE_ORDER = """
+INSERT INTO orders (business_id, whatsapp_number, status, total)
+VALUES (%(business_id)s, %(whatsapp_number)s, 'reserved', %(total)s)
+RETURNING order_id, whatsapp_number, status, created_at;
+"""
+
+CREATE_ORDER_LINE = """
+INSERT INTO order_lines (order_id, variant_id, inventory_id, quantity, unit_price)
+VALUES (%(order_id)s, %(variant_id)s, %(inventory_id)s, %(quantity)s, %(unit_price)s);
+"""
+
+GET_ORDER_BY_ID = """
+SELECT order_id, whatsapp_number, status, created_at FROM orders WHERE order_id = %(order_id)s;
+"""
+
+GET_ORDER_LINES = """
+SELECT ol.variant_id, v.name AS variant_name, ol.inventory_id, ol.quantity, ol.unit_price
+FROM order_lines ol
+JOIN product_variants v ON v.variant_id = ol.variant_id
+WHERE ol.order_id = %(order_id)s
+ORDER BY ol.order_line_id;
+"""
+
+# Cancelling returns every reserved unit to the lot it was taken from
+CANCEL_ORDER = """
+UPDATE orders
+SET status = 'cancelled', updated_at = CURRENT_TIMESTAMP
+WHERE order_id = %(order_id)s AND status = 'reserved'
+RETURNING order_id;
+"""
+
+RESTOCK_ORDER_LINES = """
+UPDATE inventory i
+SET quantity = i.quantity + l.quantity, updated_at = CURRENT_TIMESTAMP
+FROM (
+    SELECT inventory_id, SUM(quantity) AS quantity
+    FROM order_lines
+    WHERE order_id = %(order_id)s
+    GROUP BY inventory_id
+) l
+WHERE i.inventory_id = l.inventory_id;
+"""
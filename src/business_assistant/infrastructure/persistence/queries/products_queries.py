@@ -184,17 +184,20 @@ UPDATE inventory
 SET 
     quantity = %(quantity)s,
     expiration_date = %(expiration_date)s,
-    last_updated = CURRENT_TIMESTAMP
+    updated_at = CURRENT_TIMESTAMP
 WHERE inventory_id = %(inventory_id)s
 RETURNING *;
 """
 
+# Adjusts a single lot; the guard leaves the row untouched (no rows returned)
+# when the change would make the quantity negative
 UPDATE_INVENTORY_QUANTITY = """
 UPDATE inventory
 SET 
     quantity = quantity + %(quantity_change)s,
-    last_updated = CURRENT_TIMESTAMP
-WHERE variant_id = %(variant_id)s
+    updated_at = CURRENT_TIMESTAMP
+WHERE inventory_id = %(inventory_id)s
+  AND quantity + %(quantity_change)s >= 0
 RETURNING *;
 """
 
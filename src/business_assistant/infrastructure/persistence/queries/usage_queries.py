@@ -0,0 +1,98 @@
+"""SQL query templates for the per-turn usage ledger."""
+
+# Append-only ledger: one row per conversation turn, never updated
+CREATE_TURN_USAGE_TABLE = """
+CREATE TABLE IF NOT EXISTS turn_usage (
+    usage_id BIGSERIAL PRIMARY KEY,
+    thread_id VARCHAR(255) NOT NULL,
+    business_id INTEGER NOT NULL DEFAULT 1 REFERENCES businesses(business_id),
+    whatsapp_number VARCHAR(20),
+    route VARCHAR(20) NOT NULL,
+    model VARCHAR(255),
+    llm_calls INTEGER NOT NULL DEFAULT 0,
+    prompt_tokens INTEGER NOT NULL DEFAULT 0,
+    completion_tokens INTEGER NOT NULL DEFAULT 0,
+    cached_tokens INTEGER NOT NULL DEFAULT 0,
+    tool_calls JSONB NOT NULL DEFAULT '{}'::jsonb,
+    wall_ms INTEGER NOT NULL DEFAULT 0,
+    cost NUMERIC(14, 8) NOT NULL DEFAULT 0,
+    created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+"""
+
+CREATE_TURN_USAGE_INDEXES = """
+CREATE INDEX IF NOT EXISTS idx_turn_usage_thread ON turn_usage(thread_id, created_at);
+CREATE INDEX IF NOT EXISTS idx_turn_usage_business_created ON turn_usage(business_id, created_at);
+"""
+
+# Multi-row insert used with psycopg2.extras.execute_values
+INSERT_TURN_USAGE = """
+INSERT INTO turn_usage (
+    thread_id, business_id, whatsapp_number, route, model, llm_calls,
+    prompt_tokens, completion_tokens, cached_tokens, tool_calls, wall_ms, cost, created_at
+) VALUES %s;
+"""
+
+INSERT_TURN_USAGE_TEMPLATE = (
+    "(%(thread_id)s, %(business_id)s, %(whatsapp_number)s, %(route)s, %(model)s, %(llm_calls)s, "
+    "%(prompt_tokens)s, %(completion_tokens)s, %(cached_tokens)s, %(tool_calls)s, %(wall_ms)s, %(cost)s, %(created_at)s)"
+)
+
+# Rollups over a time window, optionally restricted to one business
+COST_BY_CONVERSATION = """
+SELECT
+    thread_id,
+    MAX(whatsapp_number) AS whatsapp_number,
+    COUNT(*) AS turns,
+    SUM(llm_calls) AS llm_calls,
+    SUM(prompt_tokens) AS prompt_tokens,
+    SUM(completion_tokens) AS completion_tokens,
+    SUM(cached_tokens) AS cached_tokens,
+    SUM(cost) AS cost,
+    MIN(created_at) AS first_turn_at,
+    MAX(created_at) AS last_turn_at
+FROM turn_usage
+WHERE created_at >= %(since)s
+  AND (%(business_id)s::int IS NULL OR business_id = %(business_id)s::int)
+GROUP BY thread_id
+ORDER BY cost DESC
+LIMIT %(limit)s;
+"""
+
+COST_BY_DAY = """
+SELECT
+    created_at::date AS day,
+    COUNT(*) AS turns,
+    COUNT(DISTINCT thread_id) AS conversations,
+    SUM(llm_calls) AS llm_calls,
+    SUM(prompt_tokens) AS prompt_tokens,
+    SUM(completion_tokens) AS completion_tokens,
+    SUM(cached_tokens) AS cached_tokens,
+    SUM(cost) AS cost
+FROM turn_usage
+WHERE created_at >= %(since)s
+  AND (%(business_id)s::int IS NULL OR business_id = %(business_id)s::int)
+GROUP BY day
+ORDER BY day DESC;
+"""
+
+# The cost of a turn is split among its tools in proportion to their calls
+COST_BY_TOOL = """
+SELECT
+    t.tool,
+    COUNT(*) AS turns,
+    SUM(t.calls) AS calls,
+    SUM(u.cost) AS turn_cost,
+    SUM(u.cost * t.calls / tc.total_calls) AS attributed_cost
+FROM turn_usage u
+CROSS JOIN LATERAL (
+    SELECT key AS tool, value::int AS calls FROM jsonb_each_text(u.tool_calls)
+) t
+CROSS JOIN LATERAL (
+    SELECT SUM(value::int) AS total_calls FROM jsonb_each_text(u.tool_calls)
+) tc
+WHERE u.created_at >= %(since)s
+  AND (%(business_id)s::int IS NULL OR u.business_id = %(business_id)s::int)
+GROUP BY t.tool
+ORDER BY attributed_cost DESC;
+"""
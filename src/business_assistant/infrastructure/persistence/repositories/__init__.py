@@ -0,0 +1 @@
+"""Repository implementations using native SQL."""
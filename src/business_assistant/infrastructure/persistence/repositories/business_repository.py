@@ -0,0 +1,77 @@
+"""PostgreSQL repository for businesses (tenants)."""
+
+import logging
+from typing import List
+
+from business_assistant.domain.exceptions import BusinessNotFoundError
+from business_assistant.domain.models.business import Business
+from business_assistant.infrastructure.persistence.connection import get_db_cursor
+from business_assistant.infrastructure.persistence.queries.business_queries import (
+    GET_ACTIVE_BUSINESS_BY_ID,
+    LIST_BUSINESSES,
+    CREATE_BUSINESS,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class PostgresBusinessRepository:
+    """Reads and registers the businesses served by the deployment."""
+
+    def get_business(self, business_id: int) -> Business:
+        """Get an active business.
+
+        Args:
+            business_id: The business identifier.
+
+        Returns:
+            The business.
+
+        Raises:
+            BusinessNotFoundError: If the business does not exist or is inactive.
+        """
+        with get_db_cursor() as cursor:
+            cursor.execute(GET_ACTIVE_BUSINESS_BY_ID, {"business_id": business_id})
+            row = cursor.fetchone()
+        if row is None:
+            raise BusinessNotFoundError(business_id)
+        return Business(**row)
+
+    def list_businesses(self, limit: int = 100, offset: int = 0) -> List[Business]:
+        """List businesses ordered by identifier.
+
+        Args:
+            limit: Maximum number of businesses returned.
+            offset: Number of businesses skipped.
+
+        Returns:
+            The businesses, active or not.
+        """
+        with get_db_cursor() as cursor:
+            cursor.execute(LIST_BUSINESSES, {"limit": limit, "offset": offset})
+            return [Business(**row) for row in cursor.fetchall()]
+
+    def create_business(self, business: Business) -> Business:
+        """Register a new business.
+
+        Args:
+            business: The business to create; its identifier is ignored.
+
+        Returns:
+            The created business with its assigned identifier.
+        """
+        with get_db_cursor(commit=True) as cursor:
+            cursor.execute(CREATE_BUSINESS, {
+                "slug": business.slug,
+                "name": business.name,
+                "assistant_name": business.assistant_name,
+                "hours": business.hours,
+                "address": business.address,
+                "phone": business.phone,
+                "email": business.email,
+                "iva_rate": business.iva_rate,
+                "prices_include_iva": business.prices_include_iva,
+            })
+            row = cursor.fetchone()
+        logger.info(f"Created business {row['business_id']} ({row['slug']})")
+        return Business(**row)
@@ -0,0 +1,152 @@
+"""PostgreSQL repository for bulk catalog operations."""
+
+import logging
+from datetime import datetime
+from typing import Any, Dict, IO, List, Optional, Sequence
+
+from business_assistant.domain.models.business import DEFAULT_BUSINESS_ID
+from business_assistant.infrastructure.persistence.connection import get_db_cursor
+from business_assistant.infrastructure.persistence.queries.catalog_bulk_queries import (
+    CATALOG_COLUMNS,
+    CREATE_CATALOG_STAGING_TABLE,
+    COPY_CATALOG_STAGING,
+    REJECT_INVALID_STAGING_ROWS,
+    CREATE_CATALOG_VALID_TABLE,
+    CREATE_MISSING_CATEGORIES,
+    RESOLVE_CATEGORY_IDS,
+    REJECT_UNKNOWN_CATEGORIES,
+    REJECT_FOREIGN_SKUS,
+    UPDATE_EXISTING_PRODUCTS,
+    CREATE_MISSING_PRODUCTS,
+    RESOLVE_PRODUCT_IDS,
+    UPSERT_VARIANTS_BY_SKU,
+    UPDATE_EXISTING_INVENTORY_LOTS,
+    CREATE_MISSING_INVENTORY_LOTS,
+    GET_CATALOG_IMPORT_REJECTS,
+    COUNT_CATALOG_IMPORT_ROWS,
+    COPY_CATALOG_EXPORT,
+)
+from business_assistant.infrastructure.persistence.queries.catalog_index_queries import GET_CATALOG_INDEX_ROWS
+
+logger = logging.getLogger(__name__)
+
+# Buffer size used by COPY when reading from or writing to a stream
+COPY_BUFFER_SIZE = 64 * 1024
+
+
+class PostgresCatalogRepository:
+    """Bulk import and export of the product catalog using COPY."""
+
+    def get_index_rows(self, business_id: int, changed_since: Optional[datetime] = None) -> List[Dict[str, Any]]:
+        """Load the variants of a business for the in-memory search index.
+
+        Args:
+            business_id: The business whose catalog is loaded.
+            changed_since: Only return variants changed after this time.
+                Defaults to the whole catalog.
+
+        Returns:
+            One row per variant with its product, category and non-expired stock.
+        """
+        with get_db_cursor() as cursor:
+            cursor.execute(GET_CATALOG_INDEX_ROWS, {"business_id": business_id, "changed_since": changed_since})
+            return [dict(row) for row in cursor.fetchall()]
+
+    def bulk_import(
+        self,
+        csv_stream: IO[str],
+        columns: Sequence[str],
+        create_missing_categories: bool = False,
+        reject_limit: int = 100,
+        business_id: int = DEFAULT_BUSINESS_ID,
+    ) -> Dict[str, Any]:
+        """Load catalog rows from a CSV stream and upsert them in one transaction.
+
+        Args:
+            csv_stream: Readable text stream of CSV rows without a header.
+            columns: Catalog columns present in the stream, in order.
+            create_missing_categories: Create categories that do not exist
+                instead of rejecting their rows.
+            reject_limit: Maximum number of rejected rows returned.
+            business_id: The business whose catalog is loaded. Rows whose
+                SKU belongs to another business are rejected.
+
+        Returns:
+            Dictionary with row counts per stage and the rejected rows.
+
+        Raises:
+            ValueError: If a column is not part of the catalog layout.
+        """
+        unknown_columns = [column for column in columns if column not in CATALOG_COLUMNS]
+        if unknown_columns:
+            raise ValueError(f"Columnas desconocidas: {', '.join(unknown_columns)}")
+
+        with get_db_cursor(commit=True) as cursor:
+            cursor.execute(CREATE_CATALOG_STAGING_TABLE)
+            cursor.copy_expert(
+                COPY_CATALOG_STAGING.format(columns=", ".join(columns)),
+                csv_stream,
+                size=COPY_BUFFER_SIZE,
+            )
+
+            cursor.execute(REJECT_INVALID_STAGING_ROWS)
+            cursor.execute(CREATE_CATALOG_VALID_TABLE)
+
+            tenant = {"business_id": business_id}
+            categories_created = 0
+            if create_missing_categories:
+                categories_created = self._fetch_count(cursor, CREATE_MISSING_CATEGORIES, "created", tenant)
+            cursor.execute(RESOLVE_CATEGORY_IDS, tenant)
+            cursor.execute(REJECT_UNKNOWN_CATEGORIES)
+            cursor.execute(REJECT_FOREIGN_SKUS, tenant)
+
+            # Categories are per business, so products resolved through them are too
+            products_updated = self._fetch_count(cursor, UPDATE_EXISTING_PRODUCTS, "updated")
+            products_created = self._fetch_count(cursor, CREATE_MISSING_PRODUCTS, "created", tenant)
+            cursor.execute(RESOLVE_PRODUCT_IDS)
+
+            cursor.execute(UPSERT_VARIANTS_BY_SKU)
+            variants = cursor.fetchone()
+
+            lots_updated = self._fetch_count(cursor, UPDATE_EXISTING_INVENTORY_LOTS, "updated")
+            lots_created = self._fetch_count(cursor, CREATE_MISSING_INVENTORY_LOTS, "created")
+
+            cursor.execute(COUNT_CATALOG_IMPORT_ROWS)
+            totals = cursor.fetchone()
+            cursor.execute(GET_CATALOG_IMPORT_REJECTS, {"limit": reject_limit})
+            rejects = [dict(row) for row in cursor.fetchall()]
+
+        logger.info(
+            f"Catalog import: {totals['received']} rows received, {totals['rejected']} rejected, "
+            f"{variants['created']} variants created, {variants['updated']} updated"
+        )
+        return {
+            "rows_received": totals["received"],
+            "rows_rejected": totals["rejected"],
+            "categories_created": categories_created,
+            "products_created": products_created,
+            "products_updated": products_updated,
+            "variants_created": variants["created"],
+            "variants_updated": variants["updated"],
+            "inventory_lots_created": lots_created,
+            "inventory_lots_updated": lots_updated,
+            "rejects": rejects,
+        }
+
+    def export(self, output: IO[str], business_id: int = DEFAULT_BUSINESS_ID) -> None:
+        """Write the catalog of a business as CSV (with header) to a stream.
+
+        Args:
+            output: Writable text stream.
+            business_id: The business whose catalog is exported.
+        """
+        with get_db_cursor() as cursor:
+            # COPY does not take bind parameters, so the value is quoted client-side
+            query = cursor.mogrify(COPY_CATALOG_EXPORT, {"business_id": business_id}).decode()
+            cursor.copy_expert(query, output, size=COPY_BUFFER_SIZE)
+
+    @staticmethod
+    def _fetch_count(cursor, query: str, column: str, params: Optional[Dict[str, Any]] = None) -> int:
+        """Execute a counting statement and return one column of its row."""
+        cursor.execute(query, params)
+        return cursor.fetchone()[column]
@@ -0,0 +1,120 @@
+"""PostgreSQL repository for the category hierarchy."""
+
+from typing import Any, Dict, List, Optional, Sequence
+
+from business_assistant.infrastructure.persistence.connection import get_db_cursor
+from business_assistant.infrastructure.persistence.queries.category_queries import (
+    CREATE_BUSINESS_CATEGORY,
+    DELETE_BUSINESS_CATEGORY,
+    GET_CATEGORY_TREE,
+    GET_SUBTREE_PRODUCTS,
+    UPDATE_BUSINESS_CATEGORY,
+)
+
+
+class PostgresCategoryRepository:
+    """Categories of a business and the products filed under them."""
+
+    def get_tree_rows(self, business_id: int) -> List[Dict[str, Any]]:
+        """Load the whole category tree of a business in one query.
+
+        Args:
+            business_id: The business.
+
+        Returns:
+            One row per category reachable from a root, parents first.
+        """
+        with get_db_cursor() as cursor:
+            cursor.execute(GET_CATEGORY_TREE, {"business_id": business_id})
+            return [dict(row) for row in cursor.fetchall()]
+
+    def get_products(
+        self, business_id: int, category_ids: Sequence[int], limit: int, offset: int = 0
+    ) -> List[Dict[str, Any]]:
+        """Get the active variants of the products filed under any of the categories.
+
+        Args:
+            business_id: The business.
+            category_ids: The categories, usually a whole subtree.
+            limit: Maximum number of variants.
+            offset: Variants to skip.
+
+        Returns:
+            One row per variant with its product and non-expired stock.
+        """
+        with get_db_cursor() as cursor:
+            cursor.execute(GET_SUBTREE_PRODUCTS, {
+                "business_id": business_id,
+                "category_ids": list(category_ids),
+                "limit": limit,
+                "offset": offset,
+            })
+            return [dict(row) for row in cursor.fetchall()]
+
+    def create_category(
+        self, business_id: int, name: str, description: Optional[str], parent_id: Optional[int]
+    ) -> Optional[Dict[str, Any]]:
+        """Create a category.
+
+        Args:
+            business_id: The business.
+            name: Category name.
+            description: Category description.
+            parent_id: Parent category, None for a root category.
+
+        Returns:
+            The created category, or None if the parent is not a category of the business.
+        """
+        with get_db_cursor(commit=True) as cursor:
+            cursor.execute(CREATE_BUSINESS_CATEGORY, {
+                "business_id": business_id,
+                "name": name,
+                "description": description,
+                "parent_id": parent_id,
+            })
+            row = cursor.fetchone()
+            return dict(row) if row else None
+
+    def update_category(
+        self, business_id: int, category_id: int, name: str, description: Optional[str], parent_id: Optional[int]
+    ) -> Optional[Dict[str, Any]]:
+        """Rename, describe or move a category.
+
+        Args:
+            business_id: The business.
+            category_id: The category.
+            name: New name.
+            description: New description.
+            parent_id: New parent, None to make it a root category.
+
+        Returns:
+            The updated category, or None if the category or the parent is
+            not a category of the business.
+        """
+        with get_db_cursor(commit=True) as cursor:
+            cursor.execute(UPDATE_BUSINESS_CATEGORY, {
+                "business_id": business_id,
+                "category_id": category_id,
+                "name": name,
+                "description": description,
+                "parent_id": parent_id,
+            })
+            row = cursor.fetchone()
+            return dict(row) if row else None
+
+    def delete_category(self, business_id: int, category_id: int) -> bool:
+        """Delete a category without subcategories or products.
+
+        Args:
+            business_id: The business.
+            category_id: The category.
+
+        Returns:
+            Whether the category existed.
+
+        Raises:
+            psycopg2.errors.ForeignKeyViolation: If subcategories or products reference it.
+        """
+        with get_db_cursor(commit=True) as cursor:
+            cursor.execute(DELETE_BUSINESS_CATEGORY, {"business_id": business_id, "category_id": category_id})
+            return cursor.rowcount > 0
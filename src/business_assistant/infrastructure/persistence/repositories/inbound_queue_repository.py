@@ -0,0 +1,111 @@
+"""PostgreSQL repository for the durable inbound message queue."""
+
+import logging
+from typing import Dict, List, Optional, Tuple
+
+from business_assistant.domain.models.business import DEFAULT_BUSINESS_ID
+from business_assistant.domain.models.inbound_message import InboundMessage
+from business_assistant.infrastructure.persistence.connection import get_db_cursor
+from business_assistant.infrastructure.persistence.queries.inbound_queries import (
+    ENQUEUE_INBOUND_MESSAGE,
+    CLAIM_INBOUND_MESSAGES,
+    SAVE_INBOUND_RESPONSE,
+    COMPLETE_INBOUND_MESSAGE,
+    RETRY_INBOUND_MESSAGE,
+    DEAD_LETTER_INBOUND_MESSAGE,
+    RECOVER_STALE_INBOUND_MESSAGES,
+    COUNT_INBOUND_MESSAGES_BY_STATUS,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class PostgresInboundQueueRepository:
+    """Queue of inbound messages stored in PostgreSQL."""
+
+    def enqueue(
+        self,
+        whatsapp_number: str,
+        body: str,
+        external_id: Optional[str] = None,
+        business_id: int = DEFAULT_BUSINESS_ID,
+    ) -> Tuple[int, bool]:
+        """Persist an inbound message.
+
+        Args:
+            whatsapp_number: The WhatsApp number of the sender.
+            body: The message text.
+            external_id: Identifier assigned by the messaging platform, used
+                to ignore duplicate deliveries.
+            business_id: The business the message is addressed to.
+
+        Returns:
+            The message identifier and whether it was newly queued.
+        """
+        with get_db_cursor(commit=True) as cursor:
+            cursor.execute(ENQUEUE_INBOUND_MESSAGE, {
+                "business_id": business_id,
+                "external_id": external_id,
+                "whatsapp_number": whatsapp_number,
+                "body": body,
+            })
+            row = cursor.fetchone()
+        return row["message_id"], row["created"]
+
+    def claim(self, batch_size: int = 1) -> List[InboundMessage]:
+        """Claim due messages for processing.
+
+        Args:
+            batch_size: Maximum number of messages to claim.
+
+        Returns:
+            The claimed messages, at most one per business and WhatsApp number.
+        """
+        with get_db_cursor(commit=True) as cursor:
+            cursor.execute(CLAIM_INBOUND_MESSAGES, {"batch_size": batch_size})
+            return [InboundMessage(**row) for row in cursor.fetchall()]
+
+    def save_response(self, message_id: int, response: str) -> None:
+        """Store the reply generated for a message."""
+        with get_db_cursor(commit=True) as cursor:
+            cursor.execute(SAVE_INBOUND_RESPONSE, {"message_id": message_id, "response": response})
+
+    def complete(self, message_id: int) -> None:
+        """Mark a message as delivered."""
+        with get_db_cursor(commit=True) as cursor:
+            cursor.execute(COMPLETE_INBOUND_MESSAGE, {"message_id": message_id})
+
+    def retry(self, message_id: int, delay_seconds: float, error: str) -> None:
+        """Return a message to the queue after a delay."""
+        with get_db_cursor(commit=True) as cursor:
+            cursor.execute(RETRY_INBOUND_MESSAGE, {
+                "message_id": message_id,
+                "delay_seconds": delay_seconds,
+                "error": error,
+            })
+
+    def dead_letter(self, message_id: int, error: str) -> None:
+        """Park a message that exhausted its attempts."""
+        with get_db_cursor(commit=True) as cursor:
+            cursor.execute(DEAD_LETTER_INBOUND_MESSAGE, {"message_id": message_id, "error": error})
+
+    def recover_stale(self, visibility_timeout: float) -> int:
+        """Requeue messages left in progress longer than the visibility timeout.
+
+        Returns:
+            Number of messages requeued.
+        """
+        with get_db_cursor(commit=True) as cursor:
+            cursor.execute(RECOVER_STALE_INBOUND_MESSAGES, {"visibility_timeout": visibility_timeout})
+            return len(cursor.fetchall())
+
+    def depth(self) -> Dict[str, int]:
+        """Count pending, in-progress and dead-lettered messages.
+
+        Returns:
+            Dictionary of status to message count.
+        """
+        with get_db_cursor() as cursor:
+            cursor.execute(COUNT_INBOUND_MESSAGES_BY_STATUS)
+            counts = {row["status"]: row["count"] for row in cursor.fetchall()}
+        return {status: counts.get(status, 0) for status in ("queued", "processing", "dead")}
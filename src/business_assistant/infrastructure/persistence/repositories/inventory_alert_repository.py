@@ -0,0 +1,150 @@
+"""PostgreSQL repository for the low-stock and expiration alert engine."""
+
+from contextlib import contextmanager
+from dataclasses import asdict
+from datetime import date, datetime
+from typing import Any, Dict, Iterator, List, Optional
+
+from psycopg2.extras import execute_values
+
+from business_assistant.domain.models.inventory_alert import AlertRunReport, InventoryAlert
+from business_assistant.infrastructure.persistence.connection import get_db_cursor
+from business_assistant.infrastructure.persistence.queries.inventory_alert_queries import (
+    GET_CHANGED_VARIANT_STOCK,
+    GET_EXPIRING_LOTS,
+    GET_LAST_ALERT_RUN,
+    GET_PENDING_INVENTORY_ALERTS,
+    INSERT_INVENTORY_ALERT_RUN,
+    MARK_INVENTORY_ALERTS_NOTIFIED,
+    OPEN_INVENTORY_ALERTS,
+    RESOLVE_INVENTORY_ALERTS,
+    TRY_LOCK_INVENTORY_ALERT_RUN,
+)
+
+
+class PostgresInventoryAlertRepository:
+    """Candidate rows, open alerts and run history of the alert engine."""
+
+    @contextmanager
+    def run_lock(self) -> Iterator[bool]:
+        """Hold the lock that lets a single replica run the engine at a time.
+
+        The lock is taken without waiting in a transaction kept open for
+        the block and released when the block exits.
+
+        Yields:
+            Whether the lock was acquired; False while another run holds it.
+        """
+        with get_db_cursor(commit=True) as cursor:
+            cursor.execute(TRY_LOCK_INVENTORY_ALERT_RUN)
+            yield cursor.fetchone()["acquired"]
+
+    def get_last_run(self) -> Dict[str, Any]:
+        """Get the database clock and the watermarks left by the last run.
+
+        Returns:
+            ``now`` and ``today`` from the database, and the ``started_at``,
+            ``run_date`` and ``horizon`` of the last run (None before the first).
+        """
+        with get_db_cursor() as cursor:
+            cursor.execute(GET_LAST_ALERT_RUN)
+            return dict(cursor.fetchone())
+
+    def changed_variant_stock(
+        self, changed_since: Optional[datetime], expired_since: Optional[date]
+    ) -> List[Dict[str, Any]]:
+        """Sellable stock of the variants whose lots changed or expired since the last run.
+
+        Args:
+            changed_since: Lots updated after this time. None returns every variant.
+            expired_since: Lots that expired on or after this date.
+
+        Returns:
+            One row per variant.
+        """
+        return self._fetch(GET_CHANGED_VARIANT_STOCK, {"changed_since": changed_since, "expired_since": expired_since})
+
+    def expiring_lots(
+        self, horizon: date, previous_horizon: Optional[date], changed_since: Optional[datetime]
+    ) -> List[Dict[str, Any]]:
+        """Stocked lots expiring by the horizon that the last run did not see.
+
+        Args:
+            horizon: Last expiration date alerted on.
+            previous_horizon: Horizon of the last run. None returns every lot in the window.
+            changed_since: Lots updated after this time are returned again.
+
+        Returns:
+            One row per lot.
+        """
+        return self._fetch(
+            GET_EXPIRING_LOTS,
+            {"horizon": horizon, "previous_horizon": previous_horizon, "changed_since": changed_since},
+        )
+
+    def open_alerts(self, alerts: List[InventoryAlert]) -> None:
+        """Record alerts whose condition holds; alerts already open are left as they are.
+
+        Args:
+            alerts: The alerts.
+        """
+        if not alerts:
+            return
+        rows = [
+            (a.kind, a.ref_id, a.business_id, a.product_name, a.variant_name, a.sku, a.quantity, a.expiration_date)
+            for a in alerts
+        ]
+        with get_db_cursor(commit=True) as cursor:
+            execute_values(cursor, OPEN_INVENTORY_ALERTS, rows, page_size=len(rows))
+
+    def resolve_alerts(self, restocked_variant_ids: List[int]) -> int:
+        """Close low-stock alerts of restocked variants and expiring alerts of past lots.
+
+        Args:
+            restocked_variant_ids: Variants whose stock is above the threshold again.
+
+        Returns:
+            Number of alerts closed.
+        """
+        with get_db_cursor(commit=True) as cursor:
+            cursor.execute(RESOLVE_INVENTORY_ALERTS, {"restocked_variant_ids": restocked_variant_ids})
+            return cursor.rowcount
+
+    def pending_alerts(self) -> List[InventoryAlert]:
+        """Get the open alerts the owners were not notified of yet.
+
+        Returns:
+            The alerts, grouped by business.
+        """
+        return [InventoryAlert(**row) for row in self._fetch(GET_PENDING_INVENTORY_ALERTS, {})]
+
+    def mark_notified(self, keys: List[tuple]) -> None:
+        """Record that alerts were delivered.
+
+        Args:
+            keys: ``(kind, ref_id)`` of the alerts.
+        """
+        if not keys:
+            return
+        with get_db_cursor(commit=True) as cursor:
+            cursor.execute(MARK_INVENTORY_ALERTS_NOTIFIED, {
+                "kinds": [kind for kind, _ in keys],
+                "ref_ids": [ref_id for _, ref_id in keys],
+            })
+
+    def save_run(self, report: AlertRunReport, run_date: date, horizon: date) -> None:
+        """Record a finished run; its start time and horizon are the next run's watermarks.
+
+        Args:
+            report: The run.
+            run_date: Database date the run evaluated.
+            horizon: Last expiration date the run alerted on.
+        """
+        with get_db_cursor(commit=True) as cursor:
+            cursor.execute(INSERT_INVENTORY_ALERT_RUN, {**asdict(report), "run_date": run_date, "horizon": horizon})
+
+    @staticmethod
+    def _fetch(query: str, params: Dict[str, Any]) -> List[Dict[str, Any]]:
+        with get_db_cursor() as cursor:
+            cursor.execute(query, params)
+            return [dict(row) for row in cursor.fetchall()]
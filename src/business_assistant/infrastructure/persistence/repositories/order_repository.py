@@ -0,0 +1,208 @@
+"""PostgreSQL repository for orders and inventory reservations."""
+
+import logging
+from typing import Any, Dict, List
+
+from business_assistant.domain.exceptions import (
+    InsufficientStockError,
+    OrderNotFoundError,
+    ProductVariantNotFoundError,
+)
+from business_assistant.domain.models.business import DEFAULT_BUSINESS_ID
+from business_assistant.domain.models.order import Order, OrderItem, OrderLine
+from business_assistant.infrastructure.persistence.connection import get_db_cursor
+from business_assistant.infrastructure.persistence.queries.orders_queries import (
+    GET_ACTIVE_VARIANTS_BY_IDS,
+    GET_VARIANT_PRICES,
+    RESERVE_FROM_SINGLE_LOT,
+    LOCK_AVAILABLE_LOTS,
+    DECREMENT_LOT,
+    CREATE_ORDER,
+    CREATE_ORDER_LINE,
+    GET_ORDER_BY_ID,
+    GET_ORDER_LINES,
+    CANCEL_ORDER,
+    RESTOCK_ORDER_LINES,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class PostgresOrderRepository:
+    """Creates orders and reserves their inventory atomically."""
+
+    def reserve_order(
+        self,
+        whatsapp_number: str,
+        items: List[OrderItem],
+        business_id: int = DEFAULT_BUSINESS_ID,
+    ) -> Order:
+        """Reserve stock for every item and record the order in one transaction.
+
+        Each item is first taken from the oldest non-expired lot that can cover
+        it with a single conditional UPDATE. Only when no single lot is enough
+        are the variant's lots locked in FIFO order and the quantity split.
+        Any shortage rolls back the whole order.
+
+        Args:
+            whatsapp_number: The WhatsApp number of the customer.
+            items: Variants and quantities to reserve.
+            business_id: The business selling the variants.
+
+        Returns:
+            The reserved order with one line per inventory lot used.
+
+        Raises:
+            ProductVariantNotFoundError: If a variant does not exist, is inactive
+                or belongs to another business.
+            InsufficientStockError: If a variant does not have enough stock.
+        """
+        quantities = self._merge_items(items)
+
+        with get_db_cursor(commit=True) as cursor:
+            cursor.execute(GET_ACTIVE_VARIANTS_BY_IDS, {
+                "variant_ids": list(quantities),
+                "business_id": business_id,
+            })
+            variants = {row["variant_id"]: row for row in cursor.fetchall()}
+            missing = set(quantities) - set(variants)
+            if missing:
+                raise ProductVariantNotFoundError(missing)
+
+            lines: List[OrderLine] = []
+            # A fixed lock order keeps concurrent multi-item orders from deadlocking
+            for variant_id in sorted(quantities):
+                variant = variants[variant_id]
+                for inventory_id, quantity in self._reserve_variant(cursor, variant_id, quantities[variant_id]):
+                    lines.append(OrderLine(
+                        variant_id=variant_id,
+                        variant_name=variant["name"],
+                        inventory_id=inventory_id,
+                        quantity=quantity,
+                        unit_price=variant["price"],
+                    ))
+
+            order = Order(order_id=0, whatsapp_number=whatsapp_number, status="", lines=lines)
+            cursor.execute(CREATE_ORDER, {
+                "business_id": business_id,
+                "whatsapp_number": whatsapp_number,
+                "total": order.total,
+            })
+            row = cursor.fetchone()
+            order.order_id = row["order_id"]
+            order.status = row["status"]
+            order.created_at = row["created_at"]
+            cursor.executemany(CREATE_ORDER_LINE, [
+                {
+                    "order_id": order.order_id,
+                    "variant_id": line.variant_id,
+                    "inventory_id": line.inventory_id,
+                    "quantity": line.quantity,
+                    "unit_price": line.unit_price,
+                }
+                for line in lines
+            ])
+
+        logger.info(f"Reserved order {order.order_id} with {len(lines)} lines for {whatsapp_number}")
+        return order
+
+    def get_variant_prices(
+        self,
+        variant_ids: List[int],
+        skus: List[str],
+        business_id: int = DEFAULT_BUSINESS_ID,
+    ) -> List[Dict[str, Any]]:
+        """Get price and available stock of active variants in a single query.
+
+        Args:
+            variant_ids: Variant identifiers to look up.
+            skus: Variant SKUs to look up.
+            business_id: The business whose variants are looked up.
+
+        Returns:
+            List of variants with variant_id, sku, name, price and available units.
+        """
+        with get_db_cursor() as cursor:
+            cursor.execute(GET_VARIANT_PRICES, {
+                "variant_ids": variant_ids,
+                "skus": skus,
+                "business_id": business_id,
+            })
+            return cursor.fetchall()
+
+    def get_order(self, order_id: int) -> Order:
+        """Get an order with its lines.
+
+        Args:
+            order_id: The order identifier.
+
+        Returns:
+            The order.
+
+        Raises:
+            OrderNotFoundError: If the order does not exist.
+        """
+        with get_db_cursor() as cursor:
+            cursor.execute(GET_ORDER_BY_ID, {"order_id": order_id})
+            row = cursor.fetchone()
+            if row is None:
+                raise OrderNotFoundError(order_id)
+            cursor.execute(GET_ORDER_LINES, {"order_id": order_id})
+            lines = [OrderLine(**line) for line in cursor.fetchall()]
+        return Order(lines=lines, **row)
+
+    def cancel_order(self, order_id: int) -> bool:
+        """Cancel a reserved order and return its units to inventory.
+
+        Args:
+            order_id: The order identifier.
+
+        Returns:
+            True if the order was cancelled, False if it was not reserved.
+        """
+        with get_db_cursor(commit=True) as cursor:
+            cursor.execute(CANCEL_ORDER, {"order_id": order_id})
+            if cursor.fetchone() is None:
+                return False
+            cursor.execute(RESTOCK_ORDER_LINES, {"order_id": order_id})
+        return True
+
+    @staticmethod
+    def _merge_items(items: List[OrderItem]) -> Dict[int, int]:
+        """Sum quantities of repeated variants."""
+        quantities: Dict[int, int] = {}
+        for item in items:
+            quantities[item.variant_id] = quantities.get(item.variant_id, 0) + item.quantity
+        if not quantities:
+            raise ValueError("El pedido no tiene productos")
+        return quantities
+
+    @staticmethod
+    def _reserve_variant(cursor, variant_id: int, quantity: int) -> List[tuple]:
+        """Decrement stock of one variant.
+
+        Returns:
+            List of (inventory_id, quantity) taken from each lot.
+        """
+        cursor.execute(RESERVE_FROM_SINGLE_LOT, {"variant_id": variant_id, "quantity": quantity})
+        row = cursor.fetchone()
+        if row is not None:
+            return [(row["inventory_id"], quantity)]
+
+        cursor.execute(LOCK_AVAILABLE_LOTS, {"variant_id": variant_id})
+        lots = cursor.fetchall()
+        available = sum(lot["quantity"] for lot in lots)
+        if available < quantity:
+            raise InsufficientStockError(variant_id, quantity, available)
+
+        allocations = []
+        remaining = quantity
+        for lot in lots:
+            if remaining == 0:
+                break
+            take = min(remaining, lot["quantity"])
+            # Rows are locked, so the guarded decrement cannot fail here
+            cursor.execute(DECREMENT_LOT, {"inventory_id": lot["inventory_id"], "quantity": take})
+            allocations.append((lot["inventory_id"], take))
+            remaining -= take
+        return allocations
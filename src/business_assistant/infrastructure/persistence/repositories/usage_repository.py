@@ -0,0 +1,86 @@
+"""PostgreSQL repository for the per-turn usage ledger."""
+
+import logging
+from dataclasses import asdict
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from psycopg2.extras import Json, execute_values
+
+from business_assistant.domain.models.business import DEFAULT_BUSINESS_ID
+from business_assistant.domain.models.usage import TurnUsage
+from business_assistant.infrastructure.persistence.connection import get_db_cursor
+from business_assistant.infrastructure.persistence.queries.usage_queries import (
+    INSERT_TURN_USAGE,
+    INSERT_TURN_USAGE_TEMPLATE,
+    COST_BY_CONVERSATION,
+    COST_BY_DAY,
+    COST_BY_TOOL,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class PostgresUsageRepository:
+    """Append-only ledger of LLM usage and cost per turn."""
+
+    def insert_many(self, usages: List[TurnUsage]) -> None:
+        """Append turns to the ledger with one multi-row insert.
+
+        Args:
+            usages: The turns to record.
+        """
+        rows = []
+        for usage in usages:
+            row = asdict(usage)
+            row["business_id"] = usage.business_id or DEFAULT_BUSINESS_ID
+            row["tool_calls"] = Json(usage.tool_calls)
+            row["created_at"] = usage.created_at or datetime.now()
+            rows.append(row)
+        with get_db_cursor(commit=True) as cursor:
+            execute_values(cursor, INSERT_TURN_USAGE, rows, template=INSERT_TURN_USAGE_TEMPLATE, page_size=len(rows))
+
+    def cost_by_conversation(
+        self, since: datetime, business_id: Optional[int] = None, limit: int = 50
+    ) -> List[Dict[str, Any]]:
+        """Most expensive conversations since a point in time.
+
+        Args:
+            since: Start of the window.
+            business_id: Restrict to one business. Defaults to every business.
+            limit: Maximum number of conversations returned.
+
+        Returns:
+            One row per conversation thread, most expensive first.
+        """
+        return self._fetch(COST_BY_CONVERSATION, {"since": since, "business_id": business_id, "limit": limit})
+
+    def cost_by_day(self, since: datetime, business_id: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Daily usage and cost since a point in time.
+
+        Args:
+            since: Start of the window.
+            business_id: Restrict to one business. Defaults to every business.
+
+        Returns:
+            One row per day, newest first.
+        """
+        return self._fetch(COST_BY_DAY, {"since": since, "business_id": business_id})
+
+    def cost_by_tool(self, since: datetime, business_id: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Usage and attributed cost of each tool since a point in time.
+
+        Args:
+            since: Start of the window.
+            business_id: Restrict to one business. Defaults to every business.
+
+        Returns:
+            One row per tool, highest attributed cost first.
+        """
+        return self._fetch(COST_BY_TOOL, {"since": since, "business_id": business_id})
+
+    @staticmethod
+    def _fetch(query: str, params: Dict[str, Any]) -> List[Dict[str, Any]]:
+        with get_db_cursor() as cursor:
+            cursor.execute(query, params)
+            return [dict(row) for row in cursor.fetchall()]
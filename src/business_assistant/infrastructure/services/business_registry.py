@@ -0,0 +1,101 @@
+"""Process-wide registry of the businesses (tenants) served by this deployment.
+
+Every tenant shares the same process, workflows, tools and connection pool.
+The business of the current turn travels in the graph config as
+``configurable.business_id``, next to the customer's ``user_id``.
+"""
+import logging
+import time
+from typing import Optional
+
+from business_assistant.config.settings import settings
+from business_assistant.domain.exceptions import BusinessNotFoundError
+from business_assistant.domain.models.business import DEFAULT_BUSINESS_ID, Business
+from business_assistant.infrastructure.cache import LRUCache
+from business_assistant.infrastructure.persistence.repositories.business_repository import (
+    PostgresBusinessRepository,
+)
+
+logger = logging.getLogger(__name__)
+
+# Profile used for the default business until the businesses table exists
+DEFAULT_BUSINESS = Business(
+    business_id=DEFAULT_BUSINESS_ID,
+    slug="liwaisi-tech",
+    name="Liwaisi Tech",
+    hours="Lunes a Viernes de 8:00 AM a 6:00 PM (UTC-5)",
+    address="Calle Principal #123, Barrio Centro, Maní, Casanare, Colombia",
+    phone="+57 365 842 5187",
+    email="info@liwaisi.tech",
+)
+
+# business_id -> (business, loaded at); entries are reloaded after BUSINESS_CACHE_TTL
+_businesses = LRUCache(settings.business_cache_size, name="businesses")
+
+
+def get_business(business_id: Optional[int] = None) -> Business:
+    """Get a business, loading it from the database at most once per TTL.
+
+    Args:
+        business_id: The business identifier. Defaults to the default business.
+
+    Returns:
+        The business.
+
+    Raises:
+        BusinessNotFoundError: If the business does not exist or is inactive.
+    """
+    if business_id is None:
+        business_id = DEFAULT_BUSINESS_ID
+
+    cached = _businesses.get(business_id)
+    if cached is not None and time.monotonic() - cached[1] < settings.business_cache_ttl:
+        return cached[0]
+
+    try:
+        business = PostgresBusinessRepository().get_business(business_id)
+    except BusinessNotFoundError:
+        _businesses.pop(business_id)
+        if business_id != DEFAULT_BUSINESS_ID:
+            raise
+        business = DEFAULT_BUSINESS
+    except Exception as e:
+        # A stale profile is better than failing the turn
+        if cached is not None:
+            logger.warning(f"Error reloading business {business_id}, using cached profile: {str(e)}")
+            return cached[0]
+        if business_id != DEFAULT_BUSINESS_ID:
+            raise
+        logger.warning(f"Error loading the default business, using the built-in profile: {str(e)}")
+        return DEFAULT_BUSINESS
+
+    _businesses.put(business_id, (business, time.monotonic()))
+    return business
+
+
+def invalidate_business(business_id: int) -> None:
+    """Drop a business from the cache so its next use reloads it.
+
+    Args:
+        business_id: The business identifier.
+    """
+    _businesses.pop(business_id)
+
+
+def tenant_user_key(user_id: str, business_id: Optional[int] = None) -> str:
+    """Key of a customer within a business.
+
+    The same WhatsApp number may write to several businesses, so sessions
+    are keyed by both. Customers of the default business keep the bare number
+    so their existing conversation threads are still found.
+
+    Args:
+        user_id: The customer's WhatsApp number.
+        business_id: The business the customer writes to.
+
+    Returns:
+        The tenant-qualified user key.
+    """
+    if business_id is None or business_id == DEFAULT_BUSINESS_ID:
+        return user_id
+    return f"{business_id}:{user_id}"
@@ -0,0 +1,478 @@
+"""In-memory catalog search index with Spanish normalization and fuzzy matching.
+
+Each business gets an inverted index from normalized terms to its active
+variants, loaded from PostgreSQL and refreshed incrementally from the
+``updated_at`` columns of products, variants and inventory. Searches never
+touch the database while the index is fresh.
+"""
+import bisect
+import heapq
+import logging
+import re
+import threading
+import time
+import unicodedata
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from business_assistant.config.settings import settings
+from business_assistant.domain.models.business import DEFAULT_BUSINESS_ID
+from business_assistant.infrastructure.cache import LRUCache
+from business_assistant.infrastructure.monitoring import metrics
+from business_assistant.infrastructure.persistence.repositories.catalog_repository import PostgresCatalogRepository
+
+logger = logging.getLogger(__name__)
+
+# Words that never identify a product
+STOPWORDS = frozenset({
+    "a", "al", "con", "de", "del", "el", "en", "la", "las", "lo", "los", "o",
+    "para", "por", "sin", "su", "un", "una", "unos", "unas", "y",
+})
+
+# Weight of a match by the field it was found in
+FIELD_WEIGHTS = {
+    "product_name": 1.0,
+    "variant_name": 1.0,
+    "sku": 1.0,
+    "category_name": 0.6,
+    "product_description": 0.3,
+}
+
+# Weight of a match by how the query term matched the indexed term
+MATCH_EXACT = 1.0
+MATCH_PREFIX = 0.7
+MATCH_FUZZY = 0.6
+MATCH_FUZZY_FAR = 0.4
+
+# Shortest terms eligible for prefix and fuzzy matching, and for two edits
+MIN_PREFIX_LENGTH = 3
+MIN_FUZZY_LENGTH = 4
+MIN_FAR_FUZZY_LENGTH = 8
+
+# Prefix matches considered per query term
+MAX_PREFIX_TERMS = 50
+
+# Results of recent searches kept per business until the catalog changes
+SEARCH_CACHE_SIZE = 256
+
+# Changes committed late with an earlier updated_at are picked up by re-reading this window
+REFRESH_OVERLAP = timedelta(seconds=60)
+
+_TOKEN_PATTERN = re.compile(r"[a-z0-9ñ]+")
+
+
+def fold_accents(text: str) -> str:
+    """Lowercase text and remove accents and diaeresis (ñ is kept).
+
+    Args:
+        text: The text to fold.
+
+    Returns:
+        The folded text, e.g. "Café Pequeño" becomes "cafe pequeño".
+    """
+    text = text.lower().replace("ñ", "\0")
+    text = "".join(char for char in unicodedata.normalize("NFD", text) if not unicodedata.combining(char))
+    return text.replace("\0", "ñ")
+
+
+def stem(word: str) -> str:
+    """Reduce a folded Spanish word to a stem shared by its singular and plural.
+
+    Only number is handled: "mieles" and "miel", "nueces" and "nuez",
+    "postres" and "postre" or "cafés" and "café" get the same stem. The stem
+    is not always a word; it only has to match between query and catalog.
+
+    Args:
+        word: A lowercase word without accents.
+
+    Returns:
+        The stem.
+    """
+    if len(word) <= 3 or word.isdigit():
+        return word
+    if len(word) > 4 and word.endswith("ces"):
+        word = word[:-3] + "z"
+    elif word.endswith("es"):
+        word = word[:-2]
+    elif word.endswith("s"):
+        word = word[:-1]
+    # A final "e" may be part of the singular ("postre") or of the plural
+    # ending ("mieles"); dropping it makes both forms meet
+    if len(word) > 3 and word.endswith("e"):
+        word = word[:-1]
+    return word
+
+
+def tokenize(text: Optional[str]) -> List[str]:
+    """Split text into stemmed search terms, without stopwords.
+
+    Args:
+        text: The text to tokenize.
+
+    Returns:
+        The terms in order of appearance.
+    """
+    if not text:
+        return []
+    return [
+        stem(token) for token in _TOKEN_PATTERN.findall(fold_accents(text))
+        if token not in STOPWORDS and (len(token) > 1 or token.isdigit())
+    ]
+
+
+def edit_distance(a: str, b: str, limit: int) -> int:
+    """Optimal string alignment distance between two words, bounded by a limit.
+
+    Insertions, deletions, substitutions and transpositions of adjacent
+    characters count as one edit.
+
+    Args:
+        a: First word.
+        b: Second word.
+        limit: Largest distance of interest.
+
+    Returns:
+        The distance, or ``limit + 1`` if it exceeds the limit.
+    """
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    previous_previous: List[int] = []
+    previous = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        current = [i] + [0] * len(b)
+        for j in range(1, len(b) + 1):
+            cost = 0 if a[i - 1] == b[j - 1] else 1
+            current[j] = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                current[j] = min(current[j], previous_previous[j - 2] + 1)
+        if min(current) > limit:
+            return limit + 1
+        previous_previous, previous = previous, current
+    return previous[-1] if previous[-1] <= limit else limit + 1
+
+
+def _deletions(term: str, edits: int = 1) -> Set[str]:
+    """Strings obtained by deleting up to ``edits`` characters of a term."""
+    deletions = {term[:i] + term[i + 1:] for i in range(len(term))}
+    if edits > 1:
+        for deletion in list(deletions):
+            deletions |= _deletions(deletion, edits - 1)
+    return deletions
+
+
+class CatalogIndex:
+    """Inverted index of the active variants of one business.
+
+    Query terms match indexed terms exactly, by prefix, or within one edit
+    (two for long words). Fuzzy candidates come from a precomputed deletion
+    neighborhood, so a lookup costs a few dictionary reads instead of a scan
+    of the vocabulary.
+    """
+
+    def __init__(self, business_id: int, loader: Callable[[int, Optional[datetime]], List[Dict[str, Any]]]):
+        """Initialize an empty index.
+
+        Args:
+            business_id: The business whose catalog is indexed.
+            loader: Function returning the variant rows of a business,
+                optionally only those changed after a timestamp.
+        """
+        self.business_id = business_id
+        self._loader = loader
+        self._variants: Dict[int, Dict[str, Any]] = {}
+        self._postings: Dict[str, Dict[int, float]] = {}
+        self._variant_terms: Dict[int, Set[str]] = {}
+        self._deletes: Dict[str, Set[str]] = {}
+        self._sorted_terms: List[str] = []
+        self._vocabulary_changed = False
+        self._results = LRUCache(SEARCH_CACHE_SIZE, name="catalog_search")
+        self._lock = threading.RLock()
+        self._refresh_lock = threading.Lock()
+        self._watermark: Optional[datetime] = None
+        self._built_on: Optional[date] = None
+        self.refreshed_at = 0.0
+
+    @property
+    def size(self) -> int:
+        """Number of indexed variants."""
+        return len(self._variants)
+
+    @property
+    def loaded(self) -> bool:
+        """Whether the catalog was loaded at least once."""
+        return self._built_on is not None
+
+    def is_stale(self, max_age: float) -> bool:
+        """Check whether the index should be refreshed before serving a search.
+
+        Args:
+            max_age: Seconds a refresh stays valid.
+
+        Returns:
+            Whether the last refresh is older than ``max_age`` or from another day.
+        """
+        return time.monotonic() - self.refreshed_at > max_age or self._built_on != date.today()
+
+    def mark_stale(self) -> None:
+        """Force a refresh before the next search."""
+        self.refreshed_at = 0.0
+
+    def refresh(self) -> int:
+        """Load the changes since the last refresh.
+
+        The whole catalog is reloaded on the first refresh of each day,
+        because expired lots leave the available stock without any row
+        changing. Deleted variants are dropped at that reload.
+
+        Returns:
+            Number of variants loaded.
+        """
+        with self._refresh_lock:
+            return self._refresh()
+
+    def refresh_if_stale(self, max_age: float) -> bool:
+        """Refresh the index unless another thread just did.
+
+        Args:
+            max_age: Seconds a refresh stays valid.
+
+        Returns:
+            Whether this call refreshed the index.
+        """
+        if not self.is_stale(max_age):
+            return False
+        with self._refresh_lock:
+            if not self.is_stale(max_age):
+                return False
+            self._refresh()
+            return True
+
+    def _refresh(self) -> int:
+        full = self._built_on != date.today()
+        changed_since = None if full or self._watermark is None else self._watermark - REFRESH_OVERLAP
+        start = time.perf_counter()
+        rows = self._loader(self.business_id, changed_since)
+        with self._lock:
+            if full:
+                self._clear()
+            if rows or full:
+                self._results.clear()
+            for row in rows:
+                self._index_variant(row)
+                if row.get("updated_at") and (self._watermark is None or row["updated_at"] > self._watermark):
+                    self._watermark = row["updated_at"]
+            self._built_on = date.today()
+            self.refreshed_at = time.monotonic()
+        metrics.observe(
+            "catalog_index_refresh_seconds", time.perf_counter() - start, kind="full" if full else "incremental"
+        )
+        logger.debug(f"Catalog index of business {self.business_id} loaded {len(rows)} variants (full={full})")
+        return len(rows)
+
+    def search(self, query: str, limit: int = 5) -> List[Dict[str, Any]]:
+        """Find the variants best matching a query.
+
+        Variants matching the most query terms win; ties are ranked by match
+        quality and then by available stock. Repeated searches are answered
+        from a cache that is cleared whenever the catalog changes.
+
+        Args:
+            query: The customer's words, e.g. "mieles" or "cafe molido".
+            limit: Maximum number of variants returned.
+
+        Returns:
+            The matching variants, best first.
+        """
+        terms = list(dict.fromkeys(tokenize(query)))
+        if not terms:
+            return []
+        key = (tuple(terms), limit)
+        with self._lock:
+            cached = self._results.get(key)
+            if cached is not None:
+                return cached
+            results = self._rank(terms, limit)
+            self._results.put(key, results)
+            return results
+
+    def _rank(self, terms: List[str], limit: int) -> List[Dict[str, Any]]:
+        """Score the variants matching the query terms and return the best ones."""
+        self._update_vocabulary()
+        coverage: Dict[int, int] = {}
+        scores: Dict[int, float] = {}
+        for term in terms:
+            best: Dict[int, float] = {}
+            for indexed_term, match_weight in self._expand(term):
+                for variant_id, field_weight in self._postings.get(indexed_term, {}).items():
+                    best[variant_id] = max(best.get(variant_id, 0.0), match_weight * field_weight)
+            for variant_id, score in best.items():
+                coverage[variant_id] = coverage.get(variant_id, 0) + 1
+                scores[variant_id] = scores.get(variant_id, 0.0) + score
+        if not scores:
+            return []
+        top_coverage = max(coverage.values())
+        ranked = heapq.nsmallest(
+            limit,
+            (variant_id for variant_id in scores if coverage[variant_id] == top_coverage),
+            key=lambda variant_id: (
+                -round(scores[variant_id], 6),
+                self._variants[variant_id]["quantity"] <= 0,
+                -self._variants[variant_id]["quantity"],
+                self._variants[variant_id]["price"],
+            ),
+        )
+        return [self._to_result(self._variants[variant_id]) for variant_id in ranked]
+
+    def _expand(self, term: str) -> Iterable[Tuple[str, float]]:
+        """Indexed terms matching a query term, with the weight of each match."""
+        matches: Dict[str, float] = {}
+        if term in self._postings:
+            matches[term] = MATCH_EXACT
+        if len(term) >= MIN_PREFIX_LENGTH:
+            position = bisect.bisect_left(self._sorted_terms, term)
+            for candidate in self._sorted_terms[position:position + MAX_PREFIX_TERMS]:
+                if not candidate.startswith(term):
+                    break
+                matches.setdefault(candidate, MATCH_PREFIX)
+        if len(term) >= MIN_FUZZY_LENGTH and term not in self._postings:
+            # Two edits only for long words that are one edit away from nothing
+            edits = 2 if len(term) >= MIN_FAR_FUZZY_LENGTH else 1
+            candidates = set(self._deletes.get(term, ()))
+            for deletion in _deletions(term, edits):
+                candidates.update(self._deletes.get(deletion, ()))
+            far: Dict[str, float] = {}
+            for candidate in candidates:
+                if candidate in matches:
+                    continue
+                distance = edit_distance(term, candidate, edits)
+                if distance <= 1:
+                    matches[candidate] = MATCH_FUZZY
+                elif distance <= edits:
+                    far[candidate] = MATCH_FUZZY_FAR
+            if not matches:
+                matches.update(far)
+        return matches.items()
+
+    def _index_variant(self, row: Dict[str, Any]) -> None:
+        """Replace the postings of a variant with those of its current row."""
+        variant_id = row["variant_id"]
+        self._remove_variant(variant_id)
+        if not row.get("active", True):
+            return
+        weights: Dict[str, float] = {}
+        for field_name, field_weight in FIELD_WEIGHTS.items():
+            for term in tokenize(row.get(field_name)):
+                weights[term] = max(weights.get(term, 0.0), field_weight)
+        for term, weight in weights.items():
+            if term not in self._postings:
+                self._postings[term] = {}
+                self._vocabulary_changed = True
+            self._postings[term][variant_id] = weight
+        self._variants[variant_id] = row
+        self._variant_terms[variant_id] = set(weights)
+
+    def _remove_variant(self, variant_id: int) -> None:
+        self._variants.pop(variant_id, None)
+        for term in self._variant_terms.pop(variant_id, ()):
+            postings = self._postings.get(term)
+            if postings is None:
+                continue
+            postings.pop(variant_id, None)
+            if not postings:
+                del self._postings[term]
+                self._vocabulary_changed = True
+
+    def _update_vocabulary(self) -> None:
+        """Rebuild the prefix and fuzzy lookups after terms were added or removed."""
+        if not self._vocabulary_changed:
+            return
+        self._sorted_terms = sorted(self._postings)
+        self._deletes = {}
+        for term in self._sorted_terms:
+            if len(term) < MIN_FUZZY_LENGTH - 1:
+                continue
+            # Terms two edits away from a long query are at least two characters shorter
+            edits = 2 if len(term) >= MIN_FAR_FUZZY_LENGTH - 2 else 1
+            self._deletes.setdefault(term, set()).add(term)
+            for deletion in _deletions(term, edits):
+                self._deletes.setdefault(deletion, set()).add(term)
+        self._vocabulary_changed = False
+
+    def _clear(self) -> None:
+        self._variants = {}
+        self._postings = {}
+        self._variant_terms = {}
+        self._watermark = None
+        self._vocabulary_changed = True
+
+    @staticmethod
+    def _to_result(row: Dict[str, Any]) -> Dict[str, Any]:
+        """Render an indexed variant as the search tool returns it."""
+        expiration = row.get("next_expiration_date")
+        return {
+            "product_id": row["product_id"],
+            "product_name": row["product_name"],
+            "category_name": row.get("category_name"),
+            "variant_id": row["variant_id"],
+            "variant_name": row["variant_name"],
+            "sku": row.get("sku"),
+            "price": str(row["price"]) if isinstance(row["price"], Decimal) else row["price"],
+            "quantity": row["quantity"],
+            "next_expiration_date": expiration.isoformat() if expiration else None,
+        }
+
+
+# Indexes by business, least recently searched evicted first
+_indexes = LRUCache(settings.catalog_index_max_businesses, name="catalog_index")
+_indexes_lock = threading.Lock()
+
+
+def _load_rows(business_id: int, changed_since: Optional[datetime]) -> List[Dict[str, Any]]:
+    return PostgresCatalogRepository().get_index_rows(business_id, changed_since)
+
+
+def get_catalog_index(business_id: Optional[int] = None) -> CatalogIndex:
+    """Get the search index of a business, refreshing it when stale.
+
+    Args:
+        business_id: The business. Defaults to the default business.
+
+    Returns:
+        An index no older than CATALOG_INDEX_REFRESH_SECONDS, or the last
+        loaded one while the database is unavailable.
+
+    Raises:
+        Exception: If the catalog cannot be loaded and nothing was loaded before.
+    """
+    business_id = business_id or DEFAULT_BUSINESS_ID
+    with _indexes_lock:
+        index = _indexes.get(business_id)
+        if index is None:
+            index = CatalogIndex(business_id, _load_rows)
+            _indexes.put(business_id, index)
+    try:
+        index.refresh_if_stale(settings.catalog_index_refresh_seconds)
+    except Exception as e:
+        if not index.loaded:
+            raise
+        logger.warning(f"Error refreshing catalog index of business {business_id}, serving last load: {str(e)}")
+    return index
+
+
+def invalidate_catalog_index(business_id: Optional[int] = None, reload: bool = False) -> None:
+    """Make the next search of a business pick up recent catalog changes.
+
+    Args:
+        business_id: The business whose catalog changed. Defaults to the default business.
+        reload: Drop the index so the whole catalog is loaded again, for
+            changes no variant's updated_at reflects (e.g. a renamed category).
+    """
+    business_id = business_id or DEFAULT_BUSINESS_ID
+    if reload:
+        with _indexes_lock:
+            _indexes.pop(business_id)
+        return
+    index = _indexes.get(business_id)
+    if index is not None:
+        index.mark_stale()
@@ -0,0 +1,219 @@
+"""In-memory category hierarchy of each business.
+
+The tree is loaded with one recursive query and kept per business, so
+browsing a category, its breadcrumbs or the ids of its whole subtree never
+touches the database. Category edits made through the service invalidate
+the tree of their business; edits made elsewhere are picked up after
+CATEGORY_TREE_REFRESH_SECONDS.
+"""
+import logging
+import time
+from typing import Any, Dict, Iterable, List, Optional
+
+from business_assistant.config.settings import settings
+from business_assistant.domain.exceptions import CategoryNotFoundError
+from business_assistant.domain.models.business import DEFAULT_BUSINESS_ID
+from business_assistant.domain.models.category import Category
+from business_assistant.infrastructure.cache import LRUCache
+from business_assistant.infrastructure.monitoring import metrics
+from business_assistant.infrastructure.persistence.repositories.category_repository import PostgresCategoryRepository
+from business_assistant.infrastructure.services.catalog_index import tokenize
+
+logger = logging.getLogger(__name__)
+
+
+class CategoryTree:
+    """Category hierarchy of one business."""
+
+    def __init__(self, business_id: int, rows: Iterable[Dict[str, Any]]):
+        """Build the tree.
+
+        Args:
+            business_id: The business.
+            rows: Categories with ``category_id``, ``parent_id``, ``name``,
+                ``description``, ``depth`` and ``product_count``, parents
+                before their children.
+        """
+        self.business_id = business_id
+        self.loaded_at = time.monotonic()
+        self._nodes: Dict[int, Category] = {}
+        self.roots: List[int] = []
+        for row in rows:
+            node = Category(
+                category_id=row["category_id"],
+                name=row["name"],
+                parent_id=row["parent_id"],
+                description=row.get("description"),
+                depth=row.get("depth", 0),
+                product_count=int(row.get("product_count", 0)),
+            )
+            self._nodes[node.category_id] = node
+            parent = self._nodes.get(node.parent_id) if node.parent_id is not None else None
+            if parent is not None:
+                parent.children.append(node.category_id)
+            else:
+                self.roots.append(node.category_id)
+        for children in [self.roots] + [node.children for node in self._nodes.values()]:
+            children.sort(key=lambda category_id: self._nodes[category_id].name.lower())
+        self._terms = {category_id: tokenize(node.name) for category_id, node in self._nodes.items()}
+
+    @property
+    def size(self) -> int:
+        """Number of categories in the tree."""
+        return len(self._nodes)
+
+    def get(self, category_id: int) -> Category:
+        """Get a category.
+
+        Args:
+            category_id: The category.
+
+        Returns:
+            The category.
+
+        Raises:
+            CategoryNotFoundError: If the category is not in the tree.
+        """
+        node = self._nodes.get(category_id)
+        if node is None:
+            raise CategoryNotFoundError(category_id)
+        return node
+
+    def children(self, category_id: Optional[int] = None) -> List[Category]:
+        """Get the direct subcategories of a category, sorted by name.
+
+        Args:
+            category_id: The category. None returns the root categories.
+
+        Returns:
+            The subcategories.
+        """
+        ids = self.roots if category_id is None else self.get(category_id).children
+        return [self._nodes[child_id] for child_id in ids]
+
+    def path(self, category_id: int) -> List[Category]:
+        """Get the breadcrumbs of a category, from its root down to itself.
+
+        Args:
+            category_id: The category.
+
+        Returns:
+            The categories on the path.
+        """
+        path = [self.get(category_id)]
+        while path[-1].parent_id is not None and path[-1].parent_id in self._nodes:
+            path.append(self._nodes[path[-1].parent_id])
+        return path[::-1]
+
+    def subtree_ids(self, category_id: int) -> List[int]:
+        """Get a category and all its descendants.
+
+        Args:
+            category_id: The category.
+
+        Returns:
+            The category ids, the category first.
+        """
+        ids = [self.get(category_id).category_id]
+        position = 0
+        while position < len(ids):
+            ids.extend(self._nodes[ids[position]].children)
+            position += 1
+        return ids
+
+    def subtree_product_count(self, category_id: int) -> int:
+        """Count the products filed under a category or any of its descendants."""
+        return sum(self._nodes[node_id].product_count for node_id in self.subtree_ids(category_id))
+
+    def is_descendant(self, category_id: int, ancestor_id: int) -> bool:
+        """Check whether a category is an ancestor's descendant or the ancestor itself."""
+        return any(node.category_id == ancestor_id for node in self.path(category_id))
+
+    def find(self, name: str) -> Optional[Category]:
+        """Find a category by name, ignoring case, accents and number.
+
+        An exact match wins over a category whose name contains every word
+        of the query; among equal matches the one closest to the root wins.
+
+        Args:
+            name: Name as the customer wrote it, e.g. "alimento".
+
+        Returns:
+            The category, or None if no category matches.
+        """
+        terms = tokenize(name)
+        if not terms:
+            return None
+        exact = [self._nodes[i] for i, category_terms in self._terms.items() if category_terms == terms]
+        partial = [self._nodes[i] for i, category_terms in self._terms.items() if set(terms) <= set(category_terms)]
+        matches = exact or partial
+        if not matches:
+            return None
+        return min(matches, key=lambda node: (node.depth, node.name.lower()))
+
+    def to_dict(self, category_id: int, depth: int = 1) -> Dict[str, Any]:
+        """Represent a category and its subcategories down to a depth.
+
+        Args:
+            category_id: The category.
+            depth: Levels of subcategories included; deeper ones are left out.
+
+        Returns:
+            The category with ``product_count`` counting its whole subtree.
+        """
+        node = self.get(category_id)
+        result = {
+            "category_id": node.category_id,
+            "name": node.name,
+            "description": node.description,
+            "product_count": self.subtree_product_count(category_id),
+        }
+        if depth > 0:
+            result["subcategories"] = [self.to_dict(child_id, depth - 1) for child_id in node.children]
+        return result
+
+
+# business_id -> tree; trees are reloaded after CATEGORY_TREE_REFRESH_SECONDS
+_trees = LRUCache(settings.category_tree_max_businesses, name="category_trees")
+
+
+def get_category_tree(business_id: Optional[int] = None) -> CategoryTree:
+    """Get the category tree of a business, loading it when stale.
+
+    Args:
+        business_id: The business. Defaults to the default business.
+
+    Returns:
+        A tree no older than CATEGORY_TREE_REFRESH_SECONDS, or the last
+        loaded one while the database is unavailable.
+
+    Raises:
+        Exception: If the tree cannot be loaded and nothing was loaded before.
+    """
+    business_id = business_id or DEFAULT_BUSINESS_ID
+    cached = _trees.get(business_id)
+    if cached is not None and time.monotonic() - cached.loaded_at < settings.category_tree_refresh_seconds:
+        return cached
+
+    start = time.perf_counter()
+    try:
+        tree = CategoryTree(business_id, PostgresCategoryRepository().get_tree_rows(business_id))
+    except Exception as e:
+        if cached is None:
+            raise
+        logger.warning(f"Error reloading category tree of business {business_id}, serving last load: {str(e)}")
+        return cached
+
+    metrics.observe("category_tree_load_seconds", time.perf_counter() - start)
+    logger.debug("Loaded %d categories of business %d", tree.size, business_id)
+    _trees.put(business_id, tree)
+    return tree
+
+
+def invalidate_category_tree(business_id: Optional[int] = None) -> None:
+    """Drop the tree of a business so its next use reloads it.
+
+    Args:
+        business_id: The business whose categories changed. Defaults to the default business.
+    """
+    _trees.pop(business_id or DEFAULT_BUSINESS_ID)
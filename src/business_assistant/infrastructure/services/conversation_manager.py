@@ -1,17 +1,45 @@
 """Conversation manager service to maintain conversation workflows by user."""
 
 import logging
-import time
-from typing import Dict, Optional
+import threading
+from typing import Any, Callable, Dict, Optional
+from business_assistant.config.settings import settings, DEPLOYMENT_MODE_SHARED
+from business_assistant.infrastructure.cache import LRUCache
 from business_assistant.infrastructure.langgraph.workflows.conversation_workflow import ConversationWorkflow
+from business_assistant.infrastructure.monitoring import metrics
+from business_assistant.infrastructure.monitoring.resources import current_rss_mb
+from business_assistant.infrastructure.services.business_registry import tenant_user_key
 
 logger = logging.getLogger(__name__)
 
+# Fraction of the registry evicted each time the memory limit is exceeded
+MEMORY_PRESSURE_EVICTION_RATIO = 0.1
+
+
+def _close_evicted_workflow(user_id: str, workflow: ConversationWorkflow, reason: str) -> None:
+    """Release the resources of a workflow leaving the registry.
+
+    The workflow's state is already persisted by its checkpointer, so the
+    next message from the user simply rebuilds it.
+    """
+    logger.info(f"Evicted workflow for user {user_id} ({reason})")
+    try:
+        workflow.close()
+    except Exception as e:
+        logger.warning(f"Error closing evicted workflow for user {user_id}: {str(e)}")
+
+
 class ConversationManager:
     """Singleton service that manages conversation workflows by user ID.
     
     This ensures that conversation context is maintained across multiple API requests
-    for the same user (identified by WhatsApp number).
+    for the same user (identified by WhatsApp number). Workflows are kept in a
+    capacity-bounded LRU with an idle TTL, so memory stays bounded under traffic
+    spikes without waiting for a periodic sweep.
+    
+    In shared deployment mode a single stateless workflow serves every user and
+    all session state is read from PostgreSQL, so any worker or node can serve
+    any user.
     """
     
     _instance = None
@@ -21,8 +49,6 @@ class ConversationManager:
         if cls._instance is None:
             logger.info("Creating new ConversationManager instance")
             cls._instance = super(ConversationManager, cls).__new__(cls)
-            cls._instance._workflows = {}
-            cls._instance._last_accessed = {}
             cls._instance._initialized = False
         return cls._instance
         
@@ -30,54 +56,98 @@ class ConversationManager:
         """Initialize the ConversationManager if not already initialized."""
         if not getattr(self, '_initialized', False):
             logger.info("Initializing ConversationManager")
-            self._workflows = {}
-            self._last_accessed = {}
+            self._workflows = LRUCache(
+                capacity=settings.workflow_registry_size,
+                ttl=settings.workflow_idle_ttl,
+                name="workflows",
+                on_evict=_close_evicted_workflow,
+            )
+            self.max_rss_mb = settings.workflow_registry_max_rss_mb
+            self.shared_state = settings.deployment_mode == DEPLOYMENT_MODE_SHARED
+            self._shared_workflow: Optional[ConversationWorkflow] = None
+            self._shared_lock = threading.Lock()
+            # Makes the lookup, build and insert of a user's workflow atomic, so
+            # concurrent first turns share one workflow instead of evicting each other's
+            self._registry_lock = threading.Lock()
+            # Builds new workflows; traffic replay swaps in workflows with model and tool doubles
+            self.workflow_factory: Callable[[], ConversationWorkflow] = ConversationWorkflow
             self._initialized = True
     
-    def get_workflow(self, user_id: str) -> ConversationWorkflow:
+    def get_workflow(self, user_id: str, business_id: Optional[int] = None) -> ConversationWorkflow:
         """Get or create a conversation workflow for a specific user.
         
         Args:
             user_id: The unique identifier for the user (e.g., WhatsApp number)
+            business_id: The business the user writes to. Defaults to the default business.
             
         Returns:
             A ConversationWorkflow instance for the user
         """
-        # Update last accessed time for this user
-        self._last_accessed[user_id] = time.time()
+        if self.shared_state:
+            return self._get_shared_workflow()
         
-        if user_id not in self._workflows:
-            logger.info(f"Creating new ConversationWorkflow for user {user_id}")
-            workflow = ConversationWorkflow()
-            
-            # The workflow will automatically attempt to restore state from PostgreSQL
-            # during its first process_message call
-            self._workflows[user_id] = workflow
+        user_id = tenant_user_key(user_id, business_id)
+        workflow = self._workflows.get(user_id)
+        if workflow is not None:
+            return workflow
+        
+        with self._registry_lock:
+            workflow = self._workflows.get(user_id)
+            if workflow is None:
+                logger.info(f"Creating new ConversationWorkflow for user {user_id}")
+                self.relieve_memory_pressure()
+                workflow = self.workflow_factory()
+                
+                # The workflow will automatically attempt to restore state from PostgreSQL
+                # during its first process_message call
+                self._workflows.put(user_id, workflow)
             
-        return self._workflows[user_id]
+        return workflow
+        
+    def _get_shared_workflow(self) -> ConversationWorkflow:
+        """Get the process-wide workflow used in shared deployment mode.
         
-    def cleanup_inactive_workflows(self, max_idle_time: int = 3600) -> None:
+        Returns:
+            The ConversationWorkflow shared by every user
+        """
+        with self._shared_lock:
+            if self._shared_workflow is None:
+                logger.info("Creating shared ConversationWorkflow")
+                self._shared_workflow = self.workflow_factory()
+            return self._shared_workflow
+            
+    def cleanup_inactive_workflows(self, max_idle_time: Optional[int] = None) -> int:
         """Remove workflows that haven't been accessed for a specified time.
         
-        This helps manage memory usage for long-running servers.
+        Idle workflows are also dropped on access, so this only trims the
+        expired prefix of the LRU order instead of visiting every entry.
         
         Args:
-            max_idle_time: Maximum idle time in seconds before a workflow is removed
+            max_idle_time: Maximum idle time in seconds before a workflow is removed.
+                Defaults to the registry TTL.
+                
+        Returns:
+            Number of workflows removed
         """
-        current_time = time.time()
-        users_to_remove = []
+        removed = self._workflows.purge_expired(max_idle_time)
+        self.relieve_memory_pressure()
+        return removed
         
-        for user_id, last_time in self._last_accessed.items():
-            if current_time - last_time > max_idle_time:
-                users_to_remove.append(user_id)
-                
-        for user_id in users_to_remove:
-            if user_id in self._workflows:
-                logger.info(f"Removing inactive workflow for user {user_id}")
-                # The workflow's state should already be persisted in PostgreSQL
-                # if that feature is enabled
-                del self._workflows[user_id]
-                del self._last_accessed[user_id]
+    def relieve_memory_pressure(self) -> int:
+        """Evict least recently used workflows while the process is over its memory limit.
+        
+        Returns:
+            Number of workflows evicted
+        """
+        if not self.max_rss_mb or not len(self._workflows):
+            return 0
+        rss_mb = current_rss_mb()
+        metrics.set_gauge("process_rss_mb", rss_mb)
+        if rss_mb <= self.max_rss_mb:
+            return 0
+        count = max(1, int(len(self._workflows) * MEMORY_PRESSURE_EVICTION_RATIO))
+        logger.warning(f"Process RSS {rss_mb:.0f} MB over limit {self.max_rss_mb} MB, evicting {count} workflows")
+        return self._workflows.shrink(count)
     
     def get_all_user_ids(self) -> list:
         """Get a list of all user IDs with active workflows.
@@ -85,4 +155,19 @@ class ConversationManager:
         Returns:
             List of user IDs
         """
-        return list(self._workflows.keys())
+        return self._workflows.keys()
+
+    def get_registry_stats(self) -> Dict[str, Any]:
+        """Get the size and limits of the workflow registry.
+        
+        Returns:
+            Dictionary with registry size, capacity, TTL and memory limit
+        """
+        return {
+            "deployment_mode": settings.deployment_mode,
+            "size": len(self._workflows),
+            "capacity": self._workflows.capacity,
+            "idle_ttl_seconds": self._workflows.ttl,
+            "max_rss_mb": self.max_rss_mb,
+        }
+        
\ No newline at end of file
@@ -0,0 +1,160 @@
+"""Incremental low-stock and expiration alert engine.
+
+Each run reads only what may have changed since the previous one: variants
+whose inventory rows were updated or expired since then, and stocked lots
+that entered the expiration window or changed inside it. Open alerts are
+kept in the database, so a condition is notified once until it clears,
+even when the same row is read again, and an alert whose notification
+failed is sent again by the next run. Runs are serialized across replicas
+by a database advisory lock; a replica finding it taken skips its turn.
+"""
+import logging
+import time
+from datetime import timedelta
+from typing import Dict, List, Optional
+
+from business_assistant.config.settings import settings
+from business_assistant.domain.exceptions import BusinessNotFoundError
+from business_assistant.domain.models.inventory_alert import (
+    ALERT_EXPIRING,
+    ALERT_LOW_STOCK,
+    AlertRunReport,
+    InventoryAlert,
+)
+from business_assistant.infrastructure.messaging.alert_notifier import AlertNotifier, get_alert_notifier
+from business_assistant.infrastructure.monitoring import metrics
+from business_assistant.infrastructure.persistence.repositories.inventory_alert_repository import (
+    PostgresInventoryAlertRepository,
+)
+from business_assistant.infrastructure.services.business_registry import get_business
+
+logger = logging.getLogger(__name__)
+
+# Rows updated by transactions still open when the last run started carry
+# an earlier timestamp; re-reading this margin catches them
+WATERMARK_OVERLAP = timedelta(seconds=60)
+
+
+def _alert(kind: str, ref_id: int, row: Dict) -> InventoryAlert:
+    return InventoryAlert(
+        kind=kind,
+        business_id=row["business_id"],
+        ref_id=ref_id,
+        product_name=row["product_name"],
+        variant_name=row.get("variant_name"),
+        sku=row.get("sku"),
+        quantity=int(row["quantity"]),
+        expiration_date=row.get("expiration_date"),
+    )
+
+
+class InventoryAlertEngine:
+    """Evaluates stock thresholds and expirations and notifies business owners."""
+
+    def __init__(
+        self,
+        repository: Optional[PostgresInventoryAlertRepository] = None,
+        notifier: Optional[AlertNotifier] = None,
+        low_stock_threshold: Optional[int] = None,
+        expiration_days: Optional[int] = None,
+    ):
+        """Initialize the engine.
+
+        Args:
+            repository: Alert repository. Defaults to the PostgreSQL repository.
+            notifier: Notifier of the owners. Defaults to INVENTORY_ALERT_NOTIFIER.
+            low_stock_threshold: Sellable units at or below which a variant is
+                low on stock. Defaults to INVENTORY_LOW_STOCK_THRESHOLD.
+            expiration_days: Days ahead a lot's expiration is alerted.
+                Defaults to INVENTORY_EXPIRATION_DAYS.
+        """
+        self.repository = repository or PostgresInventoryAlertRepository()
+        self.notifier = notifier or get_alert_notifier()
+        self.low_stock_threshold = (
+            low_stock_threshold if low_stock_threshold is not None else settings.inventory_low_stock_threshold
+        )
+        self.expiration_days = expiration_days if expiration_days is not None else settings.inventory_expiration_days
+
+    def run(self) -> Optional[AlertRunReport]:
+        """Evaluate the rows changed since the last run and notify the new alerts.
+
+        Returns:
+            The report of the run, also recorded in the run history, or None
+            if another replica was running the engine.
+        """
+        with self.repository.run_lock() as acquired:
+            if not acquired:
+                logger.info("Skipping inventory alert run: another replica is running it")
+                metrics.increment("inventory_alert_runs_skipped_total")
+                return None
+            return self._run()
+
+    def _run(self) -> AlertRunReport:
+        """Run the engine while holding the run lock."""
+        start = time.perf_counter()
+        last = self.repository.get_last_run()
+        full_scan = last["started_at"] is None
+        changed_since = None if full_scan else last["started_at"] - WATERMARK_OVERLAP
+        horizon = last["today"] + timedelta(days=self.expiration_days)
+        report = AlertRunReport(started_at=last["now"], full_scan=full_scan)
+
+        candidates: List[InventoryAlert] = []
+        restocked: List[int] = []
+        stock_rows = self.repository.changed_variant_stock(changed_since, last["run_date"])
+        report.low_stock_rows = len(stock_rows)
+        for row in stock_rows:
+            if row["quantity"] <= self.low_stock_threshold:
+                candidates.append(_alert(ALERT_LOW_STOCK, row["variant_id"], row))
+            else:
+                restocked.append(row["variant_id"])
+
+        lot_rows = self.repository.expiring_lots(horizon, last["horizon"], changed_since)
+        report.expiration_rows = len(lot_rows)
+        candidates.extend(_alert(ALERT_EXPIRING, row["inventory_id"], row) for row in lot_rows)
+
+        self.repository.open_alerts(candidates)
+        report.alerts_resolved = self.repository.resolve_alerts(restocked)
+        report.alerts_emitted = self._notify(self.repository.pending_alerts())
+
+        report.seconds = round(time.perf_counter() - start, 3)
+        self.repository.save_run(report, last["today"], horizon)
+        metrics.increment("inventory_alert_runs_total", scan="full" if full_scan else "incremental")
+        metrics.increment("inventory_alert_rows_scanned_total", report.low_stock_rows, query=ALERT_LOW_STOCK)
+        metrics.increment("inventory_alert_rows_scanned_total", report.expiration_rows, query=ALERT_EXPIRING)
+        metrics.increment("inventory_alerts_emitted_total", report.alerts_emitted)
+        metrics.set_gauge("inventory_alert_last_run_rows_scanned", report.rows_scanned)
+        logger.info(
+            f"Inventory alert run ({'full' if full_scan else 'incremental'}): scanned {report.low_stock_rows} "
+            f"variant and {report.expiration_rows} lot rows, {report.alerts_emitted} alerts emitted, "
+            f"{report.alerts_resolved} resolved in {report.seconds:.3f}s"
+        )
+        return report
+
+    def _notify(self, alerts: List[InventoryAlert]) -> int:
+        """Notify pending alerts, one message per business.
+
+        Alerts of a business whose notification fails stay pending for the
+        next run.
+
+        Returns:
+            Number of alerts delivered.
+        """
+        by_business: Dict[int, List[InventoryAlert]] = {}
+        for alert in alerts:
+            by_business.setdefault(alert.business_id, []).append(alert)
+
+        delivered = 0
+        for business_id, business_alerts in by_business.items():
+            try:
+                self.notifier.notify(get_business(business_id), business_alerts)
+            except BusinessNotFoundError:
+                # Inactive businesses are not notified; their alerts stay pending
+                logger.info(f"Skipping inventory alerts of inactive business {business_id}")
+                continue
+            except Exception as e:
+                logger.error(f"Error notifying inventory alerts of business {business_id}: {str(e)}")
+                metrics.increment("inventory_alert_notify_errors_total")
+                continue
+            self.repository.mark_notified([alert.key for alert in business_alerts])
+            delivered += len(business_alerts)
+        return delivered
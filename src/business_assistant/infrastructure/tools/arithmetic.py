@@ -0,0 +1,235 @@
+"""Safe decimal arithmetic engine for price calculations.
+
+Expressions are parsed once with Python's ``ast`` module, checked against a
+small whitelist (numbers, ``+ - * / %``, bounded ``**``, parentheses and a few
+named helpers) and compiled into a tree of closures that evaluate in
+``Decimal``. Compiled expressions are memoized, so repeated calculations skip
+parsing entirely.
+"""
+import ast
+import decimal
+import operator
+from decimal import Decimal, ROUND_HALF_UP
+from typing import Callable, Dict, List
+
+from business_assistant.infrastructure.cache import LRUCache
+
+# Limits protecting the worker from pathological expressions
+MAX_EXPRESSION_LENGTH = 500
+MAX_OPERATIONS = 64
+MAX_EXPONENT = 10
+MAX_MAGNITUDE = Decimal("1e15")
+
+# Colombian pesos are quoted in whole units
+COP_QUANTUM = Decimal("1")
+
+# Default IVA rate in Colombia, in percent
+DEFAULT_IVA_RATE = Decimal("19")
+
+EXPRESSION_CACHE_SIZE = 256
+
+_HUNDRED = Decimal("100")
+
+_DECIMAL_CONTEXT = decimal.Context(
+    prec=28,
+    rounding=ROUND_HALF_UP,
+    traps=[decimal.InvalidOperation, decimal.DivisionByZero, decimal.Overflow],
+)
+
+Program = Callable[[], Decimal]
+
+
+class ExpressionError(ValueError):
+    """Raised when an expression is not allowed or cannot be evaluated."""
+
+
+def _descuento(precio: Decimal, porcentaje: Decimal) -> Decimal:
+    """Price after a percentage discount."""
+    return precio * (_HUNDRED - porcentaje) / _HUNDRED
+
+
+def _porcentaje(valor: Decimal, porcentaje: Decimal) -> Decimal:
+    """Percentage of a value."""
+    return valor * porcentaje / _HUNDRED
+
+
+def _iva(precio: Decimal, tasa: Decimal = DEFAULT_IVA_RATE) -> Decimal:
+    """IVA tax amount of a price."""
+    return precio * tasa / _HUNDRED
+
+
+def _con_iva(precio: Decimal, tasa: Decimal = DEFAULT_IVA_RATE) -> Decimal:
+    """Price including IVA."""
+    return precio * (_HUNDRED + tasa) / _HUNDRED
+
+
+def _total_linea(precio: Decimal, cantidad: Decimal, descuento: Decimal = Decimal("0")) -> Decimal:
+    """Total of an order line with an optional percentage discount."""
+    return _descuento(precio * cantidad, descuento)
+
+
+# Named helpers available in expressions: name -> (function, min args, max args)
+HELPERS: Dict[str, tuple] = {
+    "descuento": (_descuento, 2, 2),
+    "porcentaje": (_porcentaje, 2, 2),
+    "iva": (_iva, 1, 2),
+    "con_iva": (_con_iva, 1, 2),
+    "total_linea": (_total_linea, 2, 3),
+}
+
+_BINARY_OPERATORS = {
+    ast.Add: operator.add,
+    ast.Sub: operator.sub,
+    ast.Mult: operator.mul,
+    ast.Div: operator.truediv,
+    ast.Mod: operator.mod,
+}
+
+_UNARY_OPERATORS = {
+    ast.UAdd: operator.pos,
+    ast.USub: operator.neg,
+}
+
+
+def _checked(value: Decimal) -> Decimal:
+    """Reject intermediate results outside the allowed magnitude."""
+    if abs(value) > MAX_MAGNITUDE:
+        raise ExpressionError("El resultado excede el valor máximo permitido")
+    return value
+
+
+class _Compiler:
+    """Compiles a whitelisted AST into nested closures."""
+
+    def __init__(self):
+        self.operations = 0
+
+    def compile(self, node: ast.AST) -> Program:
+        """Compile one node.
+
+        Raises:
+            ExpressionError: If the node is not allowed.
+        """
+        if isinstance(node, ast.Expression):
+            return self.compile(node.body)
+        if isinstance(node, ast.Constant):
+            return self._constant(node)
+        self.operations += 1
+        if self.operations > MAX_OPERATIONS:
+            raise ExpressionError(f"La expresión supera el máximo de {MAX_OPERATIONS} operaciones")
+        if isinstance(node, ast.BinOp):
+            return self._binary(node)
+        if isinstance(node, ast.UnaryOp) and type(node.op) in _UNARY_OPERATORS:
+            operand = self.compile(node.operand)
+            op = _UNARY_OPERATORS[type(node.op)]
+            return lambda: op(operand())
+        if isinstance(node, ast.Call):
+            return self._call(node)
+        raise ExpressionError(f"Elemento no permitido en la expresión: {type(node).__name__}")
+
+    @staticmethod
+    def _constant(node: ast.Constant) -> Program:
+        value = node.value
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            raise ExpressionError("Solo se permiten números en la expresión")
+        # repr() keeps the literal as written (0.1 stays 0.1, not its binary approximation)
+        number = Decimal(repr(value)) if isinstance(value, float) else Decimal(value)
+        if not number.is_finite() or abs(number) > MAX_MAGNITUDE:
+            raise ExpressionError("Número fuera del rango permitido")
+        return lambda: number
+
+    def _binary(self, node: ast.BinOp) -> Program:
+        left = self.compile(node.left)
+        if isinstance(node.op, ast.Pow):
+            exponent = node.right
+            if not (isinstance(exponent, ast.Constant) and type(exponent.value) is int
+                    and 0 <= exponent.value <= MAX_EXPONENT):
+                raise ExpressionError(f"El exponente debe ser un entero entre 0 y {MAX_EXPONENT}")
+            power = exponent.value
+            return lambda: _checked(left() ** power)
+        op = _BINARY_OPERATORS.get(type(node.op))
+        if op is None:
+            raise ExpressionError(f"Operador no permitido: {type(node.op).__name__}")
+        right = self.compile(node.right)
+        return lambda: _checked(op(left(), right()))
+
+    def _call(self, node: ast.Call) -> Program:
+        if not isinstance(node.func, ast.Name) or node.func.id not in HELPERS:
+            raise ExpressionError(f"Funciones disponibles: {', '.join(sorted(HELPERS))}")
+        function, min_args, max_args = HELPERS[node.func.id]
+        if node.keywords or not min_args <= len(node.args) <= max_args:
+            raise ExpressionError(f"Número de argumentos inválido para {node.func.id}")
+        args: List[Program] = [self.compile(arg) for arg in node.args]
+        return lambda: _checked(function(*(arg() for arg in args)))
+
+
+class ArithmeticEngine:
+    """Evaluates price expressions in Decimal with COP rounding."""
+
+    def __init__(self, cache_size: int = EXPRESSION_CACHE_SIZE):
+        """Initialize the engine.
+
+        Args:
+            cache_size: Number of compiled expressions kept in memory.
+        """
+        self._programs = LRUCache(cache_size, name="calculator_expressions")
+
+    def compile(self, expression: str) -> Program:
+        """Parse and compile an expression, reusing recent compilations.
+
+        Args:
+            expression: The arithmetic expression.
+
+        Returns:
+            A callable returning the unrounded Decimal result.
+
+        Raises:
+            ExpressionError: If the expression is invalid or exceeds the limits.
+        """
+        expression = self.normalize(expression)
+        program = self._programs.get(expression)
+        if program is None:
+            try:
+                tree = ast.parse(expression, mode="eval")
+            except SyntaxError:
+                raise ExpressionError("La expresión no es válida")
+            program = _Compiler().compile(tree)
+            self._programs.put(expression, program)
+        return program
+
+    def evaluate(self, expression: str) -> Decimal:
+        """Evaluate an expression and round it to whole pesos.
+
+        Args:
+            expression: The arithmetic expression.
+
+        Returns:
+            The result rounded half up to COP units.
+
+        Raises:
+            ExpressionError: If the expression is invalid, exceeds the limits
+                or divides by zero.
+        """
+        program = self.compile(expression)
+        with decimal.localcontext(_DECIMAL_CONTEXT):
+            try:
+                result = program()
+            except decimal.DivisionByZero:
+                raise ExpressionError("División por cero")
+            except (decimal.InvalidOperation, decimal.Overflow):
+                raise ExpressionError("Operación no válida")
+            return result.quantize(COP_QUANTUM)
+
+    @staticmethod
+    def normalize(expression: str) -> str:
+        """Strip currency markers and surrounding whitespace.
+
+        Raises:
+            ExpressionError: If the expression is empty or too long.
+        """
+        normalized = expression.replace("$", "").replace("COP", "").strip()
+        if not normalized:
+            raise ExpressionError("La expresión no contiene operaciones matemáticas válidas")
+        if len(normalized) > MAX_EXPRESSION_LENGTH:
+            raise ExpressionError(f"La expresión supera los {MAX_EXPRESSION_LENGTH} caracteres")
+        return normalized
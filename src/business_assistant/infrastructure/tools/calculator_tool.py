@@ -1,11 +1,14 @@
 """Calculator tool for basic product price calculations."""
-import re
-from typing import Dict, Any, List, Optional, Union
 from langchain.tools import BaseTool
 import logging
 
+from business_assistant.infrastructure.tools.arithmetic import ArithmeticEngine, ExpressionError
+
 logger = logging.getLogger(__name__)
 
+# Shared so every conversation benefits from the compiled expression cache
+_engine = ArithmeticEngine()
+
 class CalculatorTool(BaseTool):
     """Tool for performing basic calculations related to product pricing.
     
@@ -14,6 +17,8 @@ class CalculatorTool(BaseTool):
     - Apply discounts
     - Calculate tax
     - Convert between currencies (using fixed rates)
+
+    Expressions are evaluated by a whitelisted Decimal engine instead of eval().
     """
     
     name: str = "calculator"
@@ -26,7 +31,17 @@ class CalculatorTool(BaseTool):
     - Para calcular impuestos sobre precios
     - Para convertir precios entre monedas
     
-    La herramienta acepta expresiones matemáticas y devuelve el resultado del cálculo.
+    La herramienta acepta expresiones con números, + - * / %, potencias pequeñas (**) y paréntesis,
+    y devuelve el resultado redondeado a pesos colombianos.
+    
+    Funciones disponibles:
+    - descuento(precio, porcentaje): precio después de aplicar el descuento
+    - porcentaje(valor, porcentaje): porcentaje de un valor
+    - iva(precio, tasa=19): valor del IVA de un precio
+    - con_iva(precio, tasa=19): precio con IVA incluido
+    - total_linea(precio, cantidad, descuento=0): total de una línea de pedido
+    
+    Ejemplo: total_linea(12000, 3, 10) + con_iva(5000)
     """
     
     def _run(self, query: str) -> str:
@@ -39,41 +54,13 @@ class CalculatorTool(BaseTool):
             The result of the calculation as a string.
         """
         try:
-            # Clean the input to ensure it's safe to evaluate
-            sanitized_query = self._sanitize_input(query)
-            
-            # Evaluate the expression
-            result = eval(sanitized_query)
-            
-            # Format the result
-            if isinstance(result, (int, float)):
-                # Round to 2 decimal places for currency values
-                formatted_result = f"{result:.2f}"
-                return formatted_result
-            else:
-                return str(result)
-                
+            return str(_engine.evaluate(query))
+        except ExpressionError as e:
+            logger.warning(f"Rejected calculator expression: {str(e)}")
+            return f"Error al realizar el cálculo: {str(e)}"
         except Exception as e:
             logger.error(f"Error in calculator tool: {str(e)}")
             return f"Error al realizar el cálculo: {str(e)}"
-    
-    def _sanitize_input(self, query: str) -> str:
-        """Sanitize the input to ensure it's safe to evaluate.
-        
-        Args:
-            query: The raw calculation expression.
-            
-        Returns:
-            A sanitized version of the expression safe to evaluate.
-        """
-        # Remove all characters except digits, basic operators, parentheses, and decimal points
-        sanitized = re.sub(r'[^0-9+\-*/().%\s]', '', query)
-        
-        # Check if the sanitized string is empty or contains only invalid characters
-        if not sanitized or all(c in ' ' for c in sanitized):
-            raise ValueError("La expresión no contiene operaciones matemáticas válidas")
-            
-        return sanitized
 
 def get_calculator_tool() -> CalculatorTool:
     """Create and return a calculator tool instance.
@@ -0,0 +1,90 @@
+"""Catalog search tool backed by the in-memory catalog index."""
+import json
+import logging
+import time
+from typing import List, Type
+
+from langchain.tools import BaseTool
+from langchain_core.runnables import RunnableConfig
+from pydantic import BaseModel, Field
+
+from business_assistant.domain.models.business import DEFAULT_BUSINESS_ID
+from business_assistant.infrastructure.monitoring import metrics
+from business_assistant.infrastructure.services.catalog_index import get_catalog_index
+
+logger = logging.getLogger(__name__)
+
+# Toolbox SQL searches superseded by this tool when the index is enabled
+REPLACED_TOOLBOX_TOOLS = frozenset({"search_available_variant_products", "search_available_variant_products_batch"})
+
+# Variants returned per search term
+RESULTS_PER_TERM = 5
+
+
+class SearchCatalogInput(BaseModel):
+    """Input of the search_catalog tool."""
+
+    search_terms: List[str] = Field(
+        ...,
+        min_length=1,
+        max_length=10,
+        description="Productos a buscar, uno por elemento, con las palabras del cliente (ej. [\"mieles\", \"café molido\"])",
+    )
+
+
+class SearchCatalogTool(BaseTool):
+    """Tool that searches the catalog of the business in memory.
+
+    Plurals, accents and small spelling mistakes are resolved by the index,
+    so the agent does not need to normalize the customer's words or retry
+    a search that found nothing.
+    """
+
+    name: str = "search_catalog"
+    description: str = """
+    Utiliza esta herramienta para buscar productos del negocio cuando el cliente pregunte por uno o varios productos.
+    
+    Recibe una lista de términos de búsqueda, uno por producto, y los resuelve todos en una sola llamada.
+    Busca por nombre del producto, nombre de la variante, SKU, categoría y descripción. Entiende singular y plural,
+    palabras con o sin tilde y errores de escritura menores, así que usa las mismas palabras del cliente.
+    
+    Devuelve para cada término hasta 5 variantes con variant_id, SKU, precio, unidades disponibles (sin contar lotes vencidos)
+    y la próxima fecha de vencimiento. Una variante con quantity 0 está agotada.
+    Si un término no tiene resultados su lista de variantes está vacía.
+    """
+    args_schema: Type[BaseModel] = SearchCatalogInput
+
+    def _run(self, search_terms: List[str], config: RunnableConfig) -> str:
+        """Run the search.
+        
+        Args:
+            search_terms: One search per product.
+            config: Runnable config carrying the business_id of the turn.
+            
+        Returns:
+            The variants found per term as JSON, or an error message.
+        """
+        business_id = config.get("configurable", {}).get("business_id") or DEFAULT_BUSINESS_ID
+        start = time.perf_counter()
+        try:
+            index = get_catalog_index(business_id)
+        except Exception as e:
+            logger.error(f"Error loading catalog index: {str(e)}")
+            return "Error al buscar productos. Intenta de nuevo más tarde."
+
+        results = []
+        for term in search_terms:
+            variants = index.search(term, RESULTS_PER_TERM)
+            metrics.increment("catalog_searches_total", outcome="found" if variants else "empty")
+            results.append({"search_term": term, "variants": variants})
+        metrics.observe("catalog_search_seconds", time.perf_counter() - start)
+        return json.dumps(results, ensure_ascii=False)
+
+
+def get_search_catalog_tool() -> SearchCatalogTool:
+    """Create and return a catalog search tool instance.
+    
+    Returns:
+        An instance of the SearchCatalogTool.
+    """
+    return SearchCatalogTool()
@@ -0,0 +1,105 @@
+"""Category browsing tool backed by the in-memory category tree."""
+import json
+import logging
+from decimal import Decimal
+from typing import Any, Dict, Optional, Type
+
+from langchain.tools import BaseTool
+from langchain_core.runnables import RunnableConfig
+from pydantic import BaseModel, Field
+
+from business_assistant.config.settings import settings
+from business_assistant.domain.models.business import DEFAULT_BUSINESS_ID
+from business_assistant.infrastructure.monitoring import metrics
+from business_assistant.infrastructure.persistence.repositories.category_repository import PostgresCategoryRepository
+from business_assistant.infrastructure.services.category_tree import get_category_tree
+
+logger = logging.getLogger(__name__)
+
+
+class BrowseCategoriesInput(BaseModel):
+    """Input of the browse_categories tool."""
+
+    category: Optional[str] = Field(
+        None,
+        description="Nombre de la categoría con las palabras del cliente (ej. \"alimentos\"); omítelo para ver las categorías principales",
+    )
+
+
+class BrowseCategoriesTool(BaseTool):
+    """Tool that shows a category, its subcategories and the products under it.
+
+    The category is resolved in the cached tree and the products of its
+    whole subtree are fetched with a single query, however deep it is.
+    """
+
+    name: str = "browse_categories"
+    description: str = """
+    Utiliza esta herramienta cuando el cliente pregunte qué productos hay de un tipo o categoría (ej. "¿qué alimentos tienen?")
+    o quiera conocer las categorías del negocio.
+
+    Sin categoría devuelve las categorías principales con sus subcategorías.
+    Con una categoría devuelve su ruta, sus subcategorías y los productos de la categoría y de todas sus subcategorías,
+    con variant_id, SKU, precio y unidades disponibles (sin contar lotes vencidos). Una variante con quantity 0 está agotada.
+    Si la categoría no existe, "category" es null y se devuelven las categorías principales.
+    """
+    args_schema: Type[BaseModel] = BrowseCategoriesInput
+
+    def _run(self, config: RunnableConfig, category: Optional[str] = None) -> str:
+        """Run the browse.
+
+        Args:
+            config: Runnable config carrying the business_id of the turn.
+            category: Category name. None lists the root categories.
+
+        Returns:
+            The category, its subcategories and products as JSON, or an error message.
+        """
+        business_id = config.get("configurable", {}).get("business_id") or DEFAULT_BUSINESS_ID
+        try:
+            tree = get_category_tree(business_id)
+            node = tree.find(category) if category else None
+            if node is None:
+                metrics.increment("category_browses_total", outcome="root" if not category else "not_found")
+                return json.dumps({
+                    "category": None,
+                    "subcategories": [tree.to_dict(root.category_id, depth=1) for root in tree.children()],
+                }, ensure_ascii=False)
+
+            subtree = tree.subtree_ids(node.category_id)
+            rows = PostgresCategoryRepository().get_products(business_id, subtree, settings.category_products_limit)
+        except Exception as e:
+            logger.error(f"Error browsing categories: {str(e)}")
+            return "Error al consultar las categorías. Intenta de nuevo más tarde."
+
+        metrics.increment("category_browses_total", outcome="found")
+        names = {category_id: tree.get(category_id).name for category_id in subtree}
+        return json.dumps({
+            "category": node.name,
+            "path": [c.name for c in tree.path(node.category_id)],
+            "subcategories": [child.name for child in tree.children(node.category_id)],
+            "products": [self._to_result(row, names) for row in rows],
+        }, ensure_ascii=False)
+
+    @staticmethod
+    def _to_result(row: Dict[str, Any], names: Dict[int, str]) -> Dict[str, Any]:
+        """Render a variant as the tool returns it."""
+        return {
+            "product_id": row["product_id"],
+            "product_name": row["product_name"],
+            "category_name": names.get(row["category_id"]),
+            "variant_id": row["variant_id"],
+            "variant_name": row["variant_name"],
+            "sku": row.get("sku"),
+            "price": str(row["price"]) if isinstance(row["price"], Decimal) else row["price"],
+            "quantity": row["quantity"],
+        }
+
+
+def get_browse_categories_tool() -> BrowseCategoriesTool:
+    """Create and return a category browsing tool instance.
+
+    Returns:
+        An instance of the BrowseCategoriesTool.
+    """
+    return BrowseCategoriesTool()
@@ -0,0 +1,227 @@
+"""Order tools for quoting and reserving customer orders."""
+import json
+import logging
+import time
+from decimal import Decimal
+from typing import List, Optional, Type
+
+from langchain.tools import BaseTool
+from langchain_core.runnables import RunnableConfig
+from pydantic import BaseModel, Field, model_validator
+
+from business_assistant.config.settings import settings
+from business_assistant.domain.exceptions import DomainError
+from business_assistant.domain.models.business import DEFAULT_BUSINESS_ID, Business
+from business_assistant.domain.models.order import OrderItem
+from business_assistant.domain.models.quote import Quote, QuoteLine
+from business_assistant.infrastructure.monitoring import metrics
+from business_assistant.infrastructure.persistence.repositories.order_repository import PostgresOrderRepository
+from business_assistant.infrastructure.services.business_registry import get_business
+from business_assistant.infrastructure.services.catalog_index import invalidate_catalog_index
+
+logger = logging.getLogger(__name__)
+
+
+class ReserveOrderItemInput(BaseModel):
+    """One line of the order to reserve."""
+
+    variant_id: int = Field(..., description="variant_id de la variante del producto")
+    quantity: int = Field(..., gt=0, description="Cantidad de unidades")
+
+
+class ReserveOrderInput(BaseModel):
+    """Input of the reserve_order tool."""
+
+    items: List[ReserveOrderItemInput] = Field(..., description="Productos y cantidades confirmados por el cliente")
+
+
+class QuoteOrderItemInput(BaseModel):
+    """One line of the order to quote."""
+
+    variant_id: Optional[int] = Field(None, description="variant_id de la variante del producto")
+    sku: Optional[str] = Field(None, description="SKU de la variante, si no se conoce el variant_id")
+    quantity: int = Field(..., gt=0, description="Cantidad de unidades")
+    discount_percent: Decimal = Field(Decimal("0"), ge=0, le=100, description="Porcentaje de descuento de la línea")
+
+    @model_validator(mode="after")
+    def check_reference(self) -> "QuoteOrderItemInput":
+        """Require a variant_id or a SKU."""
+        if self.variant_id is None and not self.sku:
+            raise ValueError("Cada producto necesita variant_id o sku")
+        return self
+
+
+class QuoteOrderInput(BaseModel):
+    """Input of the quote_order tool."""
+
+    items: List[QuoteOrderItemInput] = Field(..., description="Productos y cantidades a cotizar")
+
+
+class QuoteOrderTool(BaseTool):
+    """Tool that prices an order in a single call.
+
+    Prices of every item are fetched with one batched query and line totals,
+    discounts and IVA are computed in Decimal, so the agent does not need
+    separate search and calculator steps to quote an order.
+    """
+
+    name: str = "quote_order"
+    description: str = """
+    Utiliza esta herramienta para calcular el precio total de un pedido antes de confirmarlo.
+    
+    Recibe la lista de productos con su variant_id o SKU, la cantidad y opcionalmente un porcentaje de descuento por línea.
+    Devuelve en una sola respuesta el precio unitario, subtotal, descuento y total de cada línea,
+    el IVA, el total del pedido y si hay inventario suficiente.
+    Los productos que no se encuentran aparecen en "not_found".
+    """
+    args_schema: Type[BaseModel] = QuoteOrderInput
+
+    def _run(self, items: List[QuoteOrderItemInput], config: RunnableConfig) -> str:
+        """Run the quote.
+        
+        Args:
+            items: Variants, quantities and discounts to price.
+            config: Runnable config carrying the business_id of the turn.
+            
+        Returns:
+            The quote as JSON, or an error message.
+        """
+        business_id = config.get("configurable", {}).get("business_id") or DEFAULT_BUSINESS_ID
+        start = time.perf_counter()
+        try:
+            business = get_business(business_id)
+            variants = PostgresOrderRepository().get_variant_prices(
+                sorted({item.variant_id for item in items if item.variant_id is not None}),
+                sorted({item.sku for item in items if item.variant_id is None}),
+                business_id=business_id,
+            )
+        except Exception as e:
+            logger.error(f"Error in quote_order tool: {str(e)}")
+            return "Error al cotizar el pedido. Intenta de nuevo más tarde."
+        finally:
+            metrics.observe("order_quote_seconds", time.perf_counter() - start)
+
+        quote = build_quote(items, variants, business)
+        metrics.increment("order_quotes_total")
+        return json.dumps(quote.to_dict(), ensure_ascii=False)
+
+
+def build_quote(
+    items: List[QuoteOrderItemInput],
+    variants: List[dict],
+    business: Optional[Business] = None,
+) -> Quote:
+    """Price the requested items with the fetched variants.
+    
+    Args:
+        items: Requested variants, quantities and discounts.
+        variants: Rows with variant_id, sku, name, price and available units.
+        business: The business quoting, whose IVA settings override the defaults.
+        
+    Returns:
+        The quote, listing references that did not match an active variant.
+    """
+    by_id = {variant["variant_id"]: variant for variant in variants}
+    by_sku = {variant["sku"]: variant for variant in variants}
+    lines = []
+    not_found = []
+    for item in items:
+        variant = by_id.get(item.variant_id) if item.variant_id is not None else by_sku.get(item.sku)
+        if variant is None:
+            not_found.append(str(item.variant_id if item.variant_id is not None else item.sku))
+            continue
+        lines.append(QuoteLine(
+            variant_id=variant["variant_id"],
+            sku=variant["sku"],
+            variant_name=variant["name"],
+            quantity=item.quantity,
+            unit_price=Decimal(variant["price"]),
+            discount_percent=item.discount_percent,
+            available=variant["available"],
+        ))
+    tax_rate = Decimal(settings.iva_rate)
+    prices_include_tax = settings.prices_include_iva
+    if business is not None and business.iva_rate is not None:
+        tax_rate = Decimal(business.iva_rate)
+    if business is not None and business.prices_include_iva is not None:
+        prices_include_tax = business.prices_include_iva
+    return Quote(
+        lines=lines,
+        tax_rate=tax_rate,
+        prices_include_tax=prices_include_tax,
+        not_found=not_found,
+    )
+
+
+class ReserveOrderTool(BaseTool):
+    """Tool that reserves inventory and records a confirmed order.
+
+    Stock is decremented atomically, so two customers can never be promised
+    the same unit.
+    """
+
+    name: str = "reserve_order"
+    description: str = """
+    Utiliza esta herramienta SOLO cuando el cliente haya confirmado explícitamente su pedido.
+    Reserva el inventario y registra el pedido.
+    
+    Recibe la lista de productos con su variant_id (obtenido de la búsqueda de productos) y la cantidad.
+    Devuelve el número de pedido, las líneas reservadas con su precio unitario y el total.
+    Si no hay inventario suficiente devuelve un error indicando las unidades disponibles.
+    """
+    args_schema: Type[BaseModel] = ReserveOrderInput
+
+    def _run(self, items: List[ReserveOrderItemInput], config: RunnableConfig) -> str:
+        """Run the reservation.
+        
+        Args:
+            items: Variants and quantities to reserve.
+            config: Runnable config carrying the customer's user_id and business_id.
+            
+        Returns:
+            The reserved order as JSON, or an error message.
+        """
+        whatsapp_number = config.get("configurable", {}).get("user_id")
+        business_id = config.get("configurable", {}).get("business_id") or DEFAULT_BUSINESS_ID
+        if not whatsapp_number:
+            return "Error: no se pudo identificar al cliente para registrar el pedido"
+
+        start = time.perf_counter()
+        try:
+            order = PostgresOrderRepository().reserve_order(
+                whatsapp_number,
+                [OrderItem(variant_id=item.variant_id, quantity=item.quantity) for item in items],
+                business_id=business_id,
+            )
+        except (DomainError, ValueError) as e:
+            metrics.increment("order_reservations_total", outcome="rejected")
+            return f"Error al reservar el pedido: {str(e)}"
+        except Exception as e:
+            logger.error(f"Error in reserve_order tool: {str(e)}")
+            metrics.increment("order_reservations_total", outcome="error")
+            return "Error al reservar el pedido. Intenta de nuevo más tarde."
+        finally:
+            metrics.observe("order_reservation_seconds", time.perf_counter() - start)
+
+        metrics.increment("order_reservations_total", outcome="reserved")
+        # Searches must not keep offering the reserved units
+        invalidate_catalog_index(business_id)
+        return json.dumps(order.to_dict(), ensure_ascii=False)
+
+
+def get_reserve_order_tool() -> ReserveOrderTool:
+    """Create and return an order reservation tool instance.
+    
+    Returns:
+        An instance of the ReserveOrderTool.
+    """
+    return ReserveOrderTool()
+
+
+def get_quote_order_tool() -> QuoteOrderTool:
+    """Create and return an order quote tool instance.
+    
+    Returns:
+        An instance of the QuoteOrderTool.
+    """
+    return QuoteOrderTool()
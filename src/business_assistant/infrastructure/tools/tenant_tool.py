@@ -0,0 +1,87 @@
+"""Tenant scoping of Toolbox tools."""
+import logging
+from typing import Any, List, Sequence
+
+from langchain.tools import BaseTool
+from langchain_core.runnables import RunnableConfig
+from pydantic import PrivateAttr
+
+from business_assistant.config.settings import settings
+from business_assistant.domain.models.business import DEFAULT_BUSINESS_ID
+from business_assistant.infrastructure.cache import LRUCache
+
+logger = logging.getLogger(__name__)
+
+# Parameter every tenant-aware Toolbox query declares
+TENANT_PARAM = "business_id"
+
+
+class TenantScopedTool(BaseTool):
+    """Toolbox tool whose ``business_id`` parameter is bound to the business of the turn.
+
+    The model sees the tool without ``business_id``. Each call reads the
+    business from the runnable config, like the customer's ``user_id``, and
+    runs through a copy of the tool bound to that business. Bound copies are
+    created without contacting the Toolbox server and kept per business.
+    """
+
+    tool: BaseTool
+    _bound: LRUCache = PrivateAttr()
+
+    def __init__(self, tool: BaseTool, **kwargs: Any):
+        """Initialize the wrapper.
+
+        Args:
+            tool: Toolbox tool declaring a ``business_id`` parameter.
+            **kwargs: Extra BaseTool arguments.
+        """
+        default = tool.bind_param(TENANT_PARAM, DEFAULT_BUSINESS_ID)
+        super().__init__(
+            tool=tool,
+            name=tool.name,
+            description=tool.description,
+            args_schema=default.args_schema,
+            **kwargs,
+        )
+        self._bound = LRUCache(settings.business_cache_size, name=f"tenant_tool_{tool.name}")
+        self._bound.put(DEFAULT_BUSINESS_ID, default)
+
+    def _run(self, config: RunnableConfig, **kwargs: Any) -> Any:
+        """Run the tool for the business in the config.
+
+        Args:
+            config: Runnable config carrying the business_id of the turn.
+            **kwargs: Tool arguments chosen by the model.
+
+        Returns:
+            The output of the Toolbox tool.
+        """
+        business_id = config.get("configurable", {}).get("business_id") or DEFAULT_BUSINESS_ID
+        return self._for_business(business_id).invoke(kwargs)
+
+    def _for_business(self, business_id: int) -> BaseTool:
+        """Get the copy of the tool bound to a business."""
+        bound = self._bound.get(business_id)
+        if bound is None:
+            bound = self.tool.bind_param(TENANT_PARAM, business_id)
+            self._bound.put(business_id, bound)
+        return bound
+
+
+def scope_to_tenant(tools: Sequence[BaseTool]) -> List[BaseTool]:
+    """Bind the ``business_id`` parameter of Toolbox tools to the business of each turn.
+
+    Args:
+        tools: Tools loaded from the Toolbox server.
+
+    Returns:
+        The tools, wrapped when they declare ``business_id``.
+    """
+    scoped = []
+    for tool in tools:
+        if TENANT_PARAM in (tool.args or {}):
+            scoped.append(TenantScopedTool(tool))
+        else:
+            logger.warning(f"Tool {tool.name} has no {TENANT_PARAM} parameter and is not filtered by business")
+            scoped.append(tool)
+    return scoped
@@ -0,0 +1,41 @@
+"""Authentication of the operator-only admin routes."""
+import hmac
+from typing import Optional
+
+from fastapi import Header, HTTPException
+
+from business_assistant.config.settings import settings
+
+# Header carrying the admin token
+ADMIN_TOKEN_HEADER = "X-Admin-Token"
+
+
+def is_admin_token(token: Optional[str]) -> bool:
+    """Check a token against ADMIN_API_TOKEN in constant time.
+
+    Args:
+        token: The token sent by the client.
+
+    Returns:
+        Whether the token is valid. Always False while ADMIN_API_TOKEN is unset.
+    """
+    if not settings.admin_api_token or not token:
+        return False
+    return hmac.compare_digest(token.encode(), settings.admin_api_token.encode())
+
+
+async def require_admin(x_admin_token: Optional[str] = Header(None)) -> None:
+    """Dependency rejecting requests without a valid admin token.
+
+    The admin routes are disabled (404) while ADMIN_API_TOKEN is unset.
+
+    Args:
+        x_admin_token: Value of the X-Admin-Token header.
+
+    Raises:
+        HTTPException: 404 if admin routes are disabled, 401 if the token is invalid.
+    """
+    if not settings.admin_api_token:
+        raise HTTPException(status_code=404, detail="Not Found")
+    if not is_admin_token(x_admin_token):
+        raise HTTPException(status_code=401, detail="Invalid admin token")
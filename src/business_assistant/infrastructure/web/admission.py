@@ -0,0 +1,178 @@
+"""Admission control for the chat endpoint: per-number rate limits and a bounded work queue.
+
+State is kept in the memory of each worker process. With several workers
+the per-number limit applies per process, so enable STICKY_ROUTING_HEADER
+when the exact limit matters.
+"""
+import asyncio
+import math
+import threading
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Callable, Tuple
+
+from business_assistant.config.settings import settings
+from business_assistant.infrastructure.cache import LRUCache
+from business_assistant.infrastructure.monitoring import metrics
+
+# Rejection reasons
+REJECTED_RATE_LIMITED = "rate_limited"
+REJECTED_QUEUE_FULL = "queue_full"
+REJECTED_QUEUE_TIMEOUT = "queue_timeout"
+
+# Numbers tracked by the rate limiter; idle buckets are refilled anyway, so dropping them is harmless
+RATE_LIMIT_MAX_KEYS = 100_000
+
+# Weight of the newest sample in the service time average
+SERVICE_TIME_SMOOTHING = 0.2
+
+
+class AdmissionRejected(Exception):
+    """Raised when a request is shed instead of queued."""
+
+    def __init__(self, reason: str, retry_after: float):
+        self.reason = reason
+        self.retry_after = retry_after
+        super().__init__(f"Request rejected ({reason}), retry after {retry_after:.1f}s")
+
+    @property
+    def retry_after_header(self) -> str:
+        """Retry-After header value in whole seconds."""
+        return str(max(1, math.ceil(self.retry_after)))
+
+
+class TokenBucketLimiter:
+    """Token bucket per key.
+
+    Each key may send ``burst`` requests at once and then ``rate`` requests
+    per second on average.
+    """
+
+    def __init__(self, rate: float, burst: int, clock: Callable[[], float] = time.monotonic):
+        """Initialize the limiter.
+
+        Args:
+            rate: Tokens added per second. Zero disables the limit.
+            burst: Bucket capacity.
+            clock: Monotonic clock, replaceable in tests.
+        """
+        self.rate = rate
+        self.burst = burst
+        self._clock = clock
+        # key -> [tokens, last refill]; a bucket idle for burst / rate seconds is full again
+        self._buckets = LRUCache(RATE_LIMIT_MAX_KEYS if rate > 0 else 0, ttl=burst / rate if rate > 0 else None)
+        self._lock = threading.Lock()
+
+    def acquire(self, key: str) -> Tuple[bool, float]:
+        """Take one token for a key.
+
+        Args:
+            key: The rate-limited identity, e.g. the WhatsApp number.
+
+        Returns:
+            Whether the request is allowed and, if not, seconds until a token is available.
+        """
+        if self.rate <= 0:
+            return True, 0.0
+        now = self._clock()
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                bucket = [float(self.burst), now]
+                self._buckets.put(key, bucket)
+            tokens = min(float(self.burst), bucket[0] + (now - bucket[1]) * self.rate)
+            bucket[1] = now
+            if tokens >= 1:
+                bucket[0] = tokens - 1
+                return True, 0.0
+            bucket[0] = tokens
+            return False, (1 - tokens) / self.rate
+
+
+class AdmissionController:
+    """Concurrency limit with a bounded FIFO wait queue and load shedding.
+
+    At most ``max_concurrent`` requests run at once. Up to ``max_queue``
+    more wait for a slot for at most ``queue_timeout`` seconds; anything
+    beyond that is rejected immediately with an estimated retry delay.
+    """
+
+    def __init__(self, max_concurrent: int, max_queue: int, queue_timeout: float):
+        """Initialize the controller.
+
+        Args:
+            max_concurrent: Requests served at the same time.
+            max_queue: Requests allowed to wait for a slot.
+            queue_timeout: Seconds a request may wait before it is shed.
+        """
+        self.max_concurrent = max_concurrent
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self._semaphore = asyncio.Semaphore(max_concurrent)
+        self._waiting = 0
+        self._in_flight = 0
+        self._service_time = 1.0
+
+    @property
+    def waiting(self) -> int:
+        """Requests currently queued."""
+        return self._waiting
+
+    @property
+    def in_flight(self) -> int:
+        """Requests currently being served."""
+        return self._in_flight
+
+    def estimated_wait(self) -> float:
+        """Seconds until a request arriving now would likely get a slot."""
+        return self._service_time * (self._waiting + 1) / self.max_concurrent
+
+    @asynccontextmanager
+    async def admit(self) -> AsyncIterator[None]:
+        """Hold a slot for the duration of the block.
+
+        Raises:
+            AdmissionRejected: If the queue is full or the wait times out.
+        """
+        if self._semaphore.locked() and self._waiting >= self.max_queue:
+            self._reject(REJECTED_QUEUE_FULL)
+
+        self._waiting += 1
+        metrics.set_gauge("admission_queue_depth", self._waiting)
+        queued_at = time.perf_counter()
+        try:
+            await asyncio.wait_for(self._semaphore.acquire(), timeout=self.queue_timeout)
+        except asyncio.TimeoutError:
+            self._reject(REJECTED_QUEUE_TIMEOUT)
+        finally:
+            self._waiting -= 1
+            metrics.set_gauge("admission_queue_depth", self._waiting)
+            metrics.observe("admission_queue_wait_seconds", time.perf_counter() - queued_at)
+
+        self._in_flight += 1
+        metrics.set_gauge("admission_in_flight", self._in_flight)
+        started_at = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - started_at
+            self._service_time += SERVICE_TIME_SMOOTHING * (elapsed - self._service_time)
+            self._in_flight -= 1
+            metrics.set_gauge("admission_in_flight", self._in_flight)
+            self._semaphore.release()
+
+    def _reject(self, reason: str) -> None:
+        metrics.increment("admission_rejections_total", reason=reason)
+        raise AdmissionRejected(reason, self.estimated_wait())
+
+
+# Process-wide instances used by the chat endpoint
+chat_rate_limiter = TokenBucketLimiter(
+    rate=settings.chat_rate_limit_per_minute / 60,
+    burst=settings.chat_rate_limit_burst,
+)
+chat_admission = AdmissionController(
+    max_concurrent=settings.chat_max_concurrency,
+    max_queue=settings.chat_max_queue,
+    queue_timeout=settings.chat_queue_timeout_seconds,
+)
@@ -1,27 +1,52 @@
 """Web application configuration."""
 import asyncio
 import logging
+from typing import Optional
 from fastapi import FastAPI
 from contextlib import asynccontextmanager
 
+from business_assistant.application.services.chat_service import ChatService
 from business_assistant.interface.api.v1.routes import init_routes
+from business_assistant.infrastructure.messaging import BatchProcessor, InboundWorkerPool, get_outbound_sender
+from business_assistant.infrastructure.monitoring.traffic_recorder import traffic_recorder
+from business_assistant.infrastructure.monitoring.usage_ledger import usage_ledger
 from business_assistant.infrastructure.services.conversation_manager import ConversationManager
+from business_assistant.infrastructure.services.inventory_alerts import InventoryAlertEngine
+from business_assistant.infrastructure.web.request_id import RequestIdMiddleware
+from business_assistant.config.settings import settings
 
 logger = logging.getLogger(__name__)
 
 # Background task for cleaning up inactive workflows
 async def cleanup_inactive_workflows():
-    """Periodically clean up inactive conversation workflows."""
+    """Periodically clean up inactive conversation workflows.
+    
+    Expired workflows are already dropped on access; this sweep only trims the
+    expired prefix of the registry and re-checks memory pressure.
+    """
     manager = ConversationManager()
     while True:
         try:
-            # Clean up workflows that have been inactive for more than 1 hour
-            manager.cleanup_inactive_workflows(max_idle_time=3600)
-            logger.debug("Cleaned up inactive workflows")
+            removed = manager.cleanup_inactive_workflows()
+            logger.debug("Cleaned up %d inactive workflows", removed)
         except Exception as e:
             logger.error(f"Error cleaning up workflows: {str(e)}")
-        # Run every 30 minutes
-        await asyncio.sleep(1800)
+        await asyncio.sleep(settings.workflow_sweep_interval)
+
+# Background task evaluating low-stock and expiration alerts
+async def run_inventory_alerts():
+    """Periodically run the incremental inventory alert engine."""
+    engine = InventoryAlertEngine()
+    while True:
+        try:
+            await asyncio.to_thread(engine.run)
+        except Exception as e:
+            logger.error(f"Error running inventory alerts: {str(e)}")
+        await asyncio.sleep(settings.inventory_alert_interval_seconds)
+
+def process_inbound_message(whatsapp_number: str, message: str, business_id: Optional[int]) -> str:
+    """Run the turn of a queued or batched message; failed turns raise so the worker retries or reports them."""
+    return ChatService().process_message(whatsapp_number, message, business_id, raise_errors=True)
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -30,8 +55,43 @@ async def lifespan(app: FastAPI):
     cleanup_task = asyncio.create_task(cleanup_inactive_workflows())
     logger.info("Started background task for cleaning up inactive workflows")
     
+    # Start the workers draining the inbound message queue (opt-in with INBOUND_WORKERS)
+    inbound_workers = None
+    if settings.inbound_workers > 0:
+        inbound_workers = InboundWorkerPool(process_inbound_message, get_outbound_sender())
+        inbound_workers.start()
+    else:
+        logger.info("Inbound workers disabled (INBOUND_WORKERS=0); queued webhook messages are not processed here")
+    
+    # Worker pool of the batch chat endpoint; threads start with the first batch
+    app.state.batch_processor = BatchProcessor(process_inbound_message)
+    
+    # Start the inventory alert scheduler
+    alerts_task = None
+    if settings.inventory_alerts_enabled:
+        alerts_task = asyncio.create_task(run_inventory_alerts())
+    
+    # Start the thread writing turn usage to the ledger
+    if settings.usage_ledger_enabled:
+        usage_ledger.start()
+    
     yield
     
+    if inbound_workers is not None:
+        await asyncio.to_thread(inbound_workers.stop)
+    
+    # Drop the queued batch lanes and let the running turns finish
+    await asyncio.to_thread(app.state.batch_processor.shutdown)
+    
+    # Write the usage still buffered
+    await asyncio.to_thread(usage_ledger.stop)
+    
+    # Write the captured turns still buffered
+    await asyncio.to_thread(traffic_recorder.flush)
+    
+    if alerts_task is not None:
+        alerts_task.cancel()
+    
     # Cancel the background task when shutting down
     cleanup_task.cancel()
     try:
@@ -48,6 +108,9 @@ def create_app() -> FastAPI:
         lifespan=lifespan
     )
     
+    # Tag the logs of each request with its id
+    app.add_middleware(RequestIdMiddleware)
+    
     # Initialize routes
     init_routes(app)
     
@@ -0,0 +1,45 @@
+"""Request correlation ids for the logs of each HTTP request."""
+import re
+import uuid
+
+from business_assistant.config.logging_config import log_context
+
+# Header carrying the request id, taken from the client or the proxy when present
+REQUEST_ID_HEADER = "X-Request-ID"
+
+# Accepted client ids; anything else is replaced so it cannot forge log lines
+_VALID_REQUEST_ID = re.compile(r"^[\w.:-]{1,64}$")
+
+
+class RequestIdMiddleware:
+    """ASGI middleware tagging the logs of a request with its id.
+
+    The id is echoed in the response's X-Request-ID header. The context
+    variable is set before the route runs, so the id follows the request
+    into the threadpool and the graph.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_id = None
+        for name, value in scope["headers"]:
+            if name == b"x-request-id":
+                request_id = value.decode("latin-1")
+                break
+        if not request_id or not _VALID_REQUEST_ID.match(request_id):
+            request_id = uuid.uuid4().hex
+
+        async def send_with_id(message):
+            if message["type"] == "http.response.start":
+                message.setdefault("headers", [])
+                message["headers"] = list(message["headers"]) + [(b"x-request-id", request_id.encode())]
+            await send(message)
+
+        with log_context(request_id=request_id):
+            await self.app(scope, receive, send_with_id)
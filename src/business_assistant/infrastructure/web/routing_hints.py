@@ -0,0 +1,18 @@
+"""Sticky-routing hints for load balancers in front of several workers."""
+import hashlib
+
+
+def session_affinity_key(whatsapp_number: str) -> str:
+    """Get a stable, non-reversible routing key for a user.
+
+    Load balancers can hash on this value (e.g. nginx ``hash`` or Envoy ring
+    hash on a header) to keep a user on the same worker and its warm caches,
+    without exposing the phone number.
+
+    Args:
+        whatsapp_number: The WhatsApp number of the user.
+
+    Returns:
+        A 16-character hexadecimal key.
+    """
+    return hashlib.sha256(whatsapp_number.encode("utf-8")).hexdigest()[:16]
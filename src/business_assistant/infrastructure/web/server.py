@@ -15,13 +15,16 @@ def run_server() -> None:
     """Run the Uvicorn server with the FastAPI application."""
     settings = ServerSettings()
     
-    if settings.reload:
-        # When reload is enabled, we need to use import string
+    if settings.reload or settings.workers > 1:
+        # When reload or several workers are enabled, we need to use import string
         uvicorn.run(
             "src.main:app",
             host=settings.host,
             port=settings.port,
-            reload=settings.reload
+            reload=settings.reload,
+            workers=settings.workers,
+            # Uvicorn's records go through the application's logging pipeline
+            log_config=None
         )
     else:
         # When reload is disabled, we can pass the app instance directly
@@ -30,5 +33,6 @@ def run_server() -> None:
             app,
             host=settings.host,
             port=settings.port,
-            reload=settings.reload
+            reload=settings.reload,
+            log_config=None
         )
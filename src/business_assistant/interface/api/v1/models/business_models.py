@@ -0,0 +1,26 @@
+"""Business API models."""
+from decimal import Decimal
+from typing import Optional
+
+from pydantic import BaseModel, Field
+
+
+class BusinessCreateRequest(BaseModel):
+    """Business registration request."""
+
+    slug: str = Field(..., pattern=r"^[a-z0-9-]{2,50}$", description="Unique short name (lowercase, digits and dashes)")
+    name: str = Field(..., description="Name the assistant uses for the business")
+    assistant_name: str = Field("Sara", description="Name of the assistant")
+    hours: Optional[str] = Field(None, description="Opening hours shown to customers")
+    address: Optional[str] = None
+    phone: Optional[str] = None
+    email: Optional[str] = None
+    iva_rate: Optional[Decimal] = Field(None, ge=0, le=100, description="IVA percentage; defaults to IVA_RATE")
+    prices_include_iva: Optional[bool] = Field(None, description="Whether prices include IVA; defaults to PRICES_INCLUDE_IVA")
+
+
+class BusinessResponse(BusinessCreateRequest):
+    """Registered business."""
+
+    business_id: int
+    active: bool
@@ -0,0 +1,30 @@
+"""Catalog API models."""
+from typing import List, Optional
+
+from pydantic import BaseModel, Field
+
+
+class CatalogImportReject(BaseModel):
+    """A row rejected during a catalog import."""
+
+    line_no: int = Field(..., description="Position of the record in the file (1-based, header excluded)")
+    sku: Optional[str] = Field(None, description="SKU of the rejected record")
+    reason: str = Field(..., description="Why the record was rejected")
+
+
+class CatalogImportResponse(BaseModel):
+    """Catalog import report."""
+
+    rows_received: int
+    rows_imported: int
+    rows_rejected: int
+    categories_created: int
+    products_created: int
+    products_updated: int
+    variants_created: int
+    variants_updated: int
+    inventory_lots_created: int
+    inventory_lots_updated: int
+    elapsed_seconds: float
+    rows_per_second: float
+    rejects: List[CatalogImportReject] = Field(default_factory=list, description="First rejected rows")
@@ -0,0 +1,66 @@
+"""Category API models."""
+from decimal import Decimal
+from typing import List, Optional
+
+from pydantic import BaseModel, Field
+
+
+class CategoryRequest(BaseModel):
+    """Category creation or update request."""
+
+    name: str = Field(..., min_length=1, max_length=100, description="Category name")
+    description: Optional[str] = None
+    parent_id: Optional[int] = Field(None, description="Parent category; null for a root category")
+
+
+class CategoryResponse(CategoryRequest):
+    """Stored category."""
+
+    category_id: int
+
+
+class CategoryNode(BaseModel):
+    """Category with its subcategories down to the requested depth."""
+
+    category_id: int
+    name: str
+    description: Optional[str] = None
+    product_count: int = Field(..., description="Products filed under the category or any of its descendants")
+    subcategories: List["CategoryNode"] = Field(default_factory=list)
+
+
+class CategoryPathItem(BaseModel):
+    """One step of the breadcrumbs of a category."""
+
+    category_id: int
+    name: str
+
+
+class CategoryBrowseResponse(BaseModel):
+    """A category, its breadcrumbs and its subcategories."""
+
+    category: Optional[CategoryNode] = Field(None, description="The browsed category; null at the root")
+    path: List[CategoryPathItem] = Field(default_factory=list, description="Categories from the root down to this one")
+    subcategories: List[CategoryNode] = Field(default_factory=list)
+
+
+class CategoryProduct(BaseModel):
+    """Active variant of a product filed under a category subtree."""
+
+    category_id: int
+    product_id: int
+    product_name: str
+    variant_id: int
+    variant_name: str
+    sku: Optional[str] = None
+    price: Decimal
+    quantity: int = Field(..., description="Units available, without expired lots")
+
+
+class CategoryProductsResponse(BaseModel):
+    """Page of the products of a category and its subcategories."""
+
+    category_id: int
+    limit: int
+    offset: int
+    products: List[CategoryProduct]
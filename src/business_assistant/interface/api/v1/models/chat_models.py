@@ -1,5 +1,7 @@
 """Chat API models."""
 
+from typing import List, Optional
+
 from pydantic import BaseModel, Field
 
 
@@ -8,9 +10,40 @@ class ChatRequest(BaseModel):
 
     message: str = Field(..., description="Message from the user")
     whatsapp_number: str = Field(..., description="WhatsApp number of the user")
+    business_id: Optional[int] = Field(None, description="Business the user writes to; defaults to the default business")
 
 
 class ChatResponse(BaseModel):
     """Chat response model."""
 
     response: str = Field(..., description="AI assistant's response")
+
+
+class BatchChatRequest(BaseModel):
+    """Batch of messages answered on the batch worker pool."""
+
+    items: List[ChatRequest] = Field(..., min_length=1, description="Messages; those of one number run in the given order")
+    stream: bool = Field(True, description="Stream the results as NDJSON; otherwise return the job id to poll")
+
+
+class BatchItemResult(BaseModel):
+    """Outcome of one message of a batch."""
+
+    index: int = Field(..., description="Position of the message in the batch")
+    whatsapp_number: str
+    status: str = Field(..., description="done or failed")
+    response: Optional[str] = None
+    error: Optional[str] = None
+    seconds: Optional[float] = Field(None, description="Duration of the turn")
+
+
+class BatchJobResponse(BaseModel):
+    """State of a batch job and a page of its results in completion order."""
+
+    job_id: str
+    status: str = Field(..., description="pending, running or done")
+    total: int
+    completed: int
+    failed: int
+    results: List[BatchItemResult] = Field(default_factory=list)
+    next_offset: int = Field(..., description="Offset to poll for the following results")
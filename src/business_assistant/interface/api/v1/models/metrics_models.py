@@ -0,0 +1,13 @@
+"""Metrics API models."""
+from typing import Any, Dict
+
+from pydantic import BaseModel, Field
+
+
+class MetricsResponse(BaseModel):
+    """Snapshot of the in-process metrics."""
+
+    counters: Dict[str, float] = Field(default_factory=dict, description="Monotonic counters")
+    gauges: Dict[str, float] = Field(default_factory=dict, description="Current values")
+    summaries: Dict[str, Dict[str, float]] = Field(default_factory=dict, description="Observation summaries with percentiles")
+    workflow_registry: Dict[str, Any] = Field(default_factory=dict, description="Workflow registry size and limits")
@@ -0,0 +1,56 @@
+"""Profiler API models."""
+from typing import Dict, List, Optional
+
+from pydantic import BaseModel, Field
+
+
+class ProfilerStatusResponse(BaseModel):
+    """State of the CPU profiler and the allocation tracker."""
+
+    cpu_profiling: bool = Field(..., description="Whether a CPU profile is running")
+    memory_tracing: bool = Field(..., description="Whether allocations are being traced")
+
+
+class FrameSamples(BaseModel):
+    """Samples that landed in one function."""
+
+    frame: str = Field(..., description="Function as module.py:function")
+    samples: int
+    ratio: float = Field(..., description="Samples of the function per sampling tick")
+
+
+class CpuProfileResponse(BaseModel):
+    """Summary of a CPU profile; the full stacks are served in collapsed format."""
+
+    started_at: float = Field(..., description="Start time as a Unix timestamp")
+    duration_seconds: float
+    interval_ms: float
+    samples: int = Field(..., description="Sampling ticks")
+    top_frames: List[FrameSamples]
+
+
+class ComponentMemory(BaseModel):
+    """Traced memory attributed to a component."""
+
+    size_kb: float = Field(..., description="Memory currently allocated")
+    diff_kb: float = Field(..., description="Growth since the previous snapshot")
+    since_start_kb: float = Field(..., description="Growth since tracing started")
+
+
+class LineMemory(BaseModel):
+    """Allocations of one source line."""
+
+    location: str
+    component: Optional[str] = None
+    size_kb: float
+    diff_kb: float
+    count_diff: int
+
+
+class MemorySnapshotResponse(BaseModel):
+    """Diff of an allocation snapshot with the previous one."""
+
+    traced_kb: float
+    peak_kb: float
+    components: Dict[str, ComponentMemory]
+    top_lines: List[LineMemory]
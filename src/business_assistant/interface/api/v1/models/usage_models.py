@@ -0,0 +1,44 @@
+"""Usage and cost API models."""
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Optional
+
+from pydantic import BaseModel, Field
+
+
+class TokenTotals(BaseModel):
+    """Token counts and cost of a group of turns."""
+
+    llm_calls: int = Field(..., description="Model calls")
+    prompt_tokens: int = Field(..., description="Input tokens, cached ones included")
+    completion_tokens: int = Field(..., description="Output tokens")
+    cached_tokens: int = Field(..., description="Input tokens served from the provider cache")
+    cost: Decimal = Field(..., description="Cost in USD according to LLM_PRICES")
+
+
+class ConversationCostResponse(TokenTotals):
+    """Usage of one conversation thread."""
+
+    thread_id: str
+    whatsapp_number: Optional[str] = None
+    turns: int
+    first_turn_at: datetime
+    last_turn_at: datetime
+
+
+class DailyCostResponse(TokenTotals):
+    """Usage of one day."""
+
+    day: date
+    turns: int
+    conversations: int
+
+
+class ToolCostResponse(BaseModel):
+    """Usage attributed to one tool."""
+
+    tool: str
+    turns: int = Field(..., description="Turns that called the tool")
+    calls: int = Field(..., description="Calls of the tool")
+    turn_cost: Decimal = Field(..., description="Total cost of the turns that called the tool")
+    attributed_cost: Decimal = Field(..., description="Share of those turns' cost, split by tool calls")
@@ -0,0 +1,21 @@
+"""Webhook API models."""
+
+from typing import Optional
+
+from pydantic import BaseModel, Field
+
+
+class InboundMessageRequest(BaseModel):
+    """Inbound message delivered by the messaging platform."""
+
+    message: str = Field(..., description="Message from the user")
+    whatsapp_number: str = Field(..., description="WhatsApp number of the user")
+    business_id: Optional[int] = Field(None, description="Business the user writes to; defaults to the default business")
+    external_id: Optional[str] = Field(None, description="Message id assigned by the platform, used to drop duplicate deliveries")
+
+
+class InboundMessageAck(BaseModel):
+    """Acknowledgement of a queued inbound message."""
+
+    message_id: int = Field(..., description="Identifier of the queued message")
+    status: str = Field(..., description="queued, or duplicate if the message was already received")
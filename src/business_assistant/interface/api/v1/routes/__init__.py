@@ -3,6 +3,13 @@ from fastapi import APIRouter
 
 from business_assistant.interface.api.v1.routes.health_routes import router as health_router
 from business_assistant.interface.api.v1.routes.chat_routes import router as chat_router
+from business_assistant.interface.api.v1.routes.metrics_routes import router as metrics_router
+from business_assistant.interface.api.v1.routes.catalog_routes import router as catalog_router
+from business_assistant.interface.api.v1.routes.category_routes import router as category_router
+from business_assistant.interface.api.v1.routes.webhook_routes import router as webhook_router
+from business_assistant.interface.api.v1.routes.business_routes import router as business_router
+from business_assistant.interface.api.v1.routes.usage_routes import router as usage_router
+from business_assistant.interface.api.v1.routes.profiler_routes import router as profiler_router
 from business_assistant.config.settings import settings
 
 def init_routes(app) -> None:
@@ -12,6 +19,13 @@ def init_routes(app) -> None:
     # Include all route modules here
     api_router.include_router(health_router)
     api_router.include_router(chat_router)
+    api_router.include_router(metrics_router)
+    api_router.include_router(catalog_router)
+    api_router.include_router(category_router)
+    api_router.include_router(webhook_router)
+    api_router.include_router(business_router)
+    api_router.include_router(usage_router)
+    api_router.include_router(profiler_router)
     
     # Include the main API router in the app
     app.include_router(api_router)
@@ -0,0 +1,82 @@
+"""Business (tenant) routes.
+
+Registering a tenant provisions its prompts, caches and tool scopes, and
+listing exposes every business's profile, so the routes are reserved to
+operators holding the admin token.
+"""
+from dataclasses import asdict
+from typing import List
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.concurrency import run_in_threadpool
+from psycopg2.errors import UniqueViolation
+
+from business_assistant.domain.exceptions import BusinessNotFoundError
+from business_assistant.domain.models.business import Business
+from business_assistant.infrastructure.persistence.repositories.business_repository import PostgresBusinessRepository
+from business_assistant.infrastructure.services.business_registry import get_business
+from business_assistant.infrastructure.web.admin_auth import require_admin
+from business_assistant.interface.api.v1.models.business_models import BusinessCreateRequest, BusinessResponse
+
+router = APIRouter(
+    prefix="/businesses",
+    tags=["businesses"],
+    dependencies=[Depends(require_admin)],
+    responses={
+        401: {"description": "Unauthorized - Missing or invalid X-Admin-Token"},
+        404: {"description": "Not found - Unknown business"},
+        409: {"description": "Conflict - Slug already registered"},
+    },
+)
+
+
+def _to_response(business: Business) -> BusinessResponse:
+    """Convert a business to its API representation."""
+    fields = asdict(business)
+    fields.pop("updated_at")
+    return BusinessResponse(**fields)
+
+
+@router.post("", response_model=BusinessResponse, status_code=201)
+async def create_business(request: BusinessCreateRequest) -> BusinessResponse:
+    """Register a business served by this deployment.
+
+    Args:
+        request: The business profile.
+
+    Returns:
+        BusinessResponse with the assigned business_id.
+    """
+    business = Business(business_id=0, **request.model_dump())
+    try:
+        created = await run_in_threadpool(PostgresBusinessRepository().create_business, business)
+    except UniqueViolation:
+        raise HTTPException(status_code=409, detail=f"Business slug already exists: {request.slug}")
+    return _to_response(created)
+
+
+@router.get("", response_model=List[BusinessResponse])
+async def list_businesses(
+    limit: int = Query(100, ge=1, le=1000),
+    offset: int = Query(0, ge=0),
+) -> List[BusinessResponse]:
+    """List the registered businesses."""
+    businesses = await run_in_threadpool(PostgresBusinessRepository().list_businesses, limit, offset)
+    return [_to_response(business) for business in businesses]
+
+
+@router.get("/{business_id}", response_model=BusinessResponse)
+async def get_business_profile(business_id: int) -> BusinessResponse:
+    """Get an active business as the assistant sees it.
+
+    Args:
+        business_id: The business identifier.
+
+    Returns:
+        BusinessResponse with the cached profile.
+    """
+    try:
+        business = await run_in_threadpool(get_business, business_id)
+    except BusinessNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    return _to_response(business)
@@ -0,0 +1,75 @@
+"""Catalog bulk import and export routes.
+
+Imports overwrite products, prices and stock and exports dump the whole
+catalog, so the routes are reserved to operators holding the admin token.
+"""
+import tempfile
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
+
+from business_assistant.application.services.catalog_service import CatalogService, CATALOG_FORMATS
+from business_assistant.domain.models.business import DEFAULT_BUSINESS_ID
+from business_assistant.infrastructure.web.admin_auth import require_admin
+from business_assistant.interface.api.v1.models.catalog_models import CatalogImportResponse
+
+router = APIRouter(
+    prefix="/catalog",
+    tags=["catalog"],
+    dependencies=[Depends(require_admin)],
+    responses={
+        400: {"description": "Bad request - Invalid catalog file"},
+        401: {"description": "Unauthorized - Missing or invalid X-Admin-Token"},
+    },
+)
+
+# Uploads larger than this are spooled to disk before COPY reads them
+UPLOAD_SPOOL_MAX_MEMORY = 8 * 1024 * 1024
+
+
+@router.post("/import", response_model=CatalogImportResponse)
+async def import_catalog(
+    request: Request,
+    format: str = Query("csv", description="File format: csv or json"),
+    create_missing_categories: bool = Query(False, description="Create unknown categories instead of rejecting rows"),
+    business_id: int = Query(DEFAULT_BUSINESS_ID, description="Business whose catalog is loaded"),
+) -> CatalogImportResponse:
+    """Bulk import a catalog file sent as the raw request body.
+
+    Args:
+        request: The request whose body is the CSV or JSON file.
+        format: File format.
+        create_missing_categories: Whether unknown categories are created.
+        business_id: The business whose catalog is loaded.
+
+    Returns:
+        CatalogImportResponse with row counts and throughput.
+    """
+    if format not in CATALOG_FORMATS:
+        raise HTTPException(status_code=400, detail=f"Unsupported format. Use one of: {', '.join(CATALOG_FORMATS)}")
+
+    with tempfile.SpooledTemporaryFile(max_size=UPLOAD_SPOOL_MAX_MEMORY, mode="w+b") as upload:
+        async for chunk in request.stream():
+            upload.write(chunk)
+        upload.seek(0)
+        try:
+            report = await run_in_threadpool(
+                CatalogService().import_catalog, upload, format, create_missing_categories, business_id
+            )
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
+    return CatalogImportResponse(**report.to_dict())
+
+
+@router.get("/export")
+async def export_catalog(
+    business_id: int = Query(DEFAULT_BUSINESS_ID, description="Business whose catalog is exported"),
+) -> StreamingResponse:
+    """Stream the catalog of a business as CSV in the import layout."""
+    return StreamingResponse(
+        CatalogService().stream_export(business_id),
+        media_type="text/csv",
+        headers={"Content-Disposition": "attachment; filename=catalog.csv"},
+    )
@@ -0,0 +1,134 @@
+"""Category hierarchy routes.
+
+Browsing is public; creating, editing and deleting categories requires
+the admin token.
+"""
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.concurrency import run_in_threadpool
+from psycopg2.errors import ForeignKeyViolation
+
+from business_assistant.application.services.category_service import CategoryService
+from business_assistant.domain.exceptions import CategoryNotFoundError, InvalidCategoryParentError
+from business_assistant.domain.models.business import DEFAULT_BUSINESS_ID
+from business_assistant.infrastructure.web.admin_auth import require_admin
+from business_assistant.interface.api.v1.models.category_models import (
+    CategoryBrowseResponse,
+    CategoryProductsResponse,
+    CategoryRequest,
+    CategoryResponse,
+)
+
+router = APIRouter(
+    prefix="/categories",
+    tags=["categories"],
+    responses={
+        401: {"description": "Unauthorized - Category edits require a valid X-Admin-Token"},
+        404: {"description": "Not found - Unknown category"},
+        409: {"description": "Conflict - Category in use or invalid parent"},
+    },
+)
+
+
+@router.get("", response_model=CategoryBrowseResponse)
+async def browse_root(
+    business_id: int = Query(DEFAULT_BUSINESS_ID, description="Business whose categories are browsed"),
+    depth: int = Query(1, ge=1, le=10, description="Levels of subcategories included"),
+) -> CategoryBrowseResponse:
+    """Browse the root categories of a business."""
+    result = await run_in_threadpool(CategoryService(business_id).browse, None, depth)
+    return CategoryBrowseResponse(**result)
+
+
+@router.get("/{category_id}", response_model=CategoryBrowseResponse)
+async def browse_category(
+    category_id: int,
+    business_id: int = Query(DEFAULT_BUSINESS_ID, description="Business whose categories are browsed"),
+    depth: int = Query(1, ge=0, le=10, description="Levels of subcategories included"),
+) -> CategoryBrowseResponse:
+    """Browse a category with its breadcrumbs and subcategories.
+
+    Args:
+        category_id: The category.
+        business_id: The business.
+        depth: Levels of subcategories included.
+
+    Returns:
+        CategoryBrowseResponse with product counts over each whole subtree.
+    """
+    try:
+        result = await run_in_threadpool(CategoryService(business_id).browse, category_id, depth)
+    except CategoryNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    return CategoryBrowseResponse(**result)
+
+
+@router.get("/{category_id}/products", response_model=CategoryProductsResponse)
+async def list_category_products(
+    category_id: int,
+    business_id: int = Query(DEFAULT_BUSINESS_ID, description="Business whose products are listed"),
+    limit: int = Query(100, ge=1, le=1000),
+    offset: int = Query(0, ge=0),
+) -> CategoryProductsResponse:
+    """List the products of a category and all its subcategories.
+
+    Args:
+        category_id: The category.
+        business_id: The business.
+        limit: Maximum number of variants.
+        offset: Variants to skip.
+
+    Returns:
+        CategoryProductsResponse with one entry per active variant.
+    """
+    try:
+        products = await run_in_threadpool(CategoryService(business_id).list_products, category_id, limit, offset)
+    except CategoryNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    return CategoryProductsResponse(category_id=category_id, limit=limit, offset=offset, products=products)
+
+
+@router.post("", response_model=CategoryResponse, status_code=201, dependencies=[Depends(require_admin)])
+async def create_category(
+    request: CategoryRequest,
+    business_id: int = Query(DEFAULT_BUSINESS_ID, description="Business the category belongs to"),
+) -> CategoryResponse:
+    """Create a category."""
+    service = CategoryService(business_id)
+    try:
+        row = await run_in_threadpool(service.create_category, request.name, request.description, request.parent_id)
+    except CategoryNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    return CategoryResponse(**row)
+
+
+@router.put("/{category_id}", response_model=CategoryResponse, dependencies=[Depends(require_admin)])
+async def update_category(
+    category_id: int,
+    request: CategoryRequest,
+    business_id: int = Query(DEFAULT_BUSINESS_ID, description="Business the category belongs to"),
+) -> CategoryResponse:
+    """Rename, describe or move a category with its whole subtree."""
+    service = CategoryService(business_id)
+    try:
+        row = await run_in_threadpool(
+            service.update_category, category_id, request.name, request.description, request.parent_id
+        )
+    except CategoryNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except InvalidCategoryParentError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    return CategoryResponse(**row)
+
+
+@router.delete("/{category_id}", status_code=204, dependencies=[Depends(require_admin)])
+async def delete_category(
+    category_id: int,
+    business_id: int = Query(DEFAULT_BUSINESS_ID, description="Business the category belongs to"),
+) -> None:
+    """Delete a category that has no subcategories or products."""
+    try:
+        await run_in_threadpool(CategoryService(business_id).delete_category, category_id)
+    except CategoryNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except ForeignKeyViolation:
+        raise HTTPException(status_code=409, detail=f"Category {category_id} has subcategories or products")
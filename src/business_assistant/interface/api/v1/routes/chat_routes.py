@@ -1,9 +1,31 @@
 """Chat routes implementation."""
 
-from typing import Dict
-from fastapi import APIRouter, Depends, HTTPException
+import json
+import uuid
+from typing import Dict, Iterator, Optional
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request, Response
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
 from business_assistant.application.services.chat_service import ChatService
+from business_assistant.config.settings import settings
+from business_assistant.domain.exceptions import BusinessNotFoundError
+from business_assistant.infrastructure.messaging import BatchProcessor
+from business_assistant.infrastructure.messaging.batch_processor import BatchJob
+from business_assistant.infrastructure.monitoring import metrics
+from business_assistant.infrastructure.monitoring.profiler import profile_call, request_profiles
+from business_assistant.infrastructure.web.admin_auth import is_admin_token, require_admin
+from business_assistant.infrastructure.services.business_registry import get_business
+from business_assistant.infrastructure.web.admission import (
+    REJECTED_RATE_LIMITED,
+    AdmissionRejected,
+    chat_admission,
+    chat_rate_limiter,
+)
+from business_assistant.infrastructure.web.routing_hints import session_affinity_key
 from business_assistant.interface.api.v1.models.chat_models import (
+    BatchChatRequest,
+    BatchItemResult,
+    BatchJobResponse,
     ChatRequest,
     ChatResponse,
 )
@@ -12,8 +34,11 @@ router = APIRouter(
     prefix="/chat",
     tags=["chat"],
     responses={
-        404: {"description": "Not found"},
+        404: {"description": "Not found - Unknown business"},
         400: {"description": "Bad request - Invalid WhatsApp number"},
+        401: {"description": "Unauthorized - Batch routes require a valid X-Admin-Token"},
+        413: {"description": "Payload too large - More batch items than BATCH_MAX_ITEMS"},
+        429: {"description": "Too many requests - Retry after the seconds in the Retry-After header"},
     },
 )
 
@@ -29,26 +54,200 @@ def get_chat_service():
 
 @router.post("/message", response_model=ChatResponse)
 async def process_message(
-    request: ChatRequest, chat_service: ChatService = Depends(get_chat_service, use_cache=False)
+    request: ChatRequest,
+    response: Response,
+    chat_service: ChatService = Depends(get_chat_service, use_cache=False),
+    x_profile: Optional[str] = Header(None),
+    x_admin_token: Optional[str] = Header(None),
 ) -> ChatResponse:
     """Process a chat message.
 
+    Operators can profile a single turn by sending ``X-Profile: 1`` with a
+    valid ``X-Admin-Token``; the response then carries an ``X-Profile-Id``
+    to fetch the profile from the admin profiler routes.
+
     Args:
         request: The chat request containing the message.
+        response: The outgoing response, used to attach routing hints.
         chat_service: The chat service instance for the user.
+        x_profile: Value of the X-Profile header.
+        x_admin_token: Value of the X-Admin-Token header.
 
     Returns:
         ChatResponse containing the assistant's response.
     """
-    print('initiating endpoint call')
-    
     # Validate WhatsApp number format
-    if not request.whatsapp_number.startswith("+") or not request.whatsapp_number[1:].isdigit():
+    if not _valid_number(request.whatsapp_number):
         raise HTTPException(
             status_code=400,
             detail="Invalid WhatsApp number format. Must start with + followed by digits.",
         )
         
-    response = chat_service.process_message(request.whatsapp_number, request.message)
+    try:
+        await run_in_threadpool(get_business, request.business_id)
+    except BusinessNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+        
+    if settings.sticky_routing_header:
+        response.headers[settings.sticky_routing_header] = session_affinity_key(request.whatsapp_number)
+
+    allowed, retry_after = chat_rate_limiter.acquire(request.whatsapp_number)
+    if not allowed:
+        metrics.increment("admission_rejections_total", reason=REJECTED_RATE_LIMITED)
+        _reject(AdmissionRejected(REJECTED_RATE_LIMITED, retry_after))
+
+    try:
+        async with chat_admission.admit():
+            # The agent run is blocking; keep the event loop free for other requests
+            if x_profile and is_admin_token(x_admin_token):
+                assistant_response, profile = await run_in_threadpool(
+                    profile_call,
+                    chat_service.process_message, request.whatsapp_number, request.message, request.business_id,
+                )
+                profile_id = uuid.uuid4().hex
+                request_profiles.put(profile_id, profile)
+                response.headers["X-Profile-Id"] = profile_id
+                response.headers["Server-Timing"] = f"turn;dur={profile.duration * 1000:.1f}"
+            else:
+                assistant_response = await run_in_threadpool(
+                    chat_service.process_message, request.whatsapp_number, request.message, request.business_id
+                )
+    except AdmissionRejected as e:
+        _reject(e)
+
+    return ChatResponse(response=assistant_response)
+
+
+def _reject(rejection: AdmissionRejected) -> None:
+    """Shed a request with 429 and the time the client should wait.
+
+    Args:
+        rejection: The admission decision.
+
+    Raises:
+        HTTPException: Always, with status 429 and a Retry-After header.
+    """
+    raise HTTPException(
+        status_code=429,
+        detail=f"Too many requests ({rejection.reason}). Retry later.",
+        headers={"Retry-After": rejection.retry_after_header},
+    )
+
+
+@router.post("/batch", response_model=BatchJobResponse, status_code=202, dependencies=[Depends(require_admin)])
+async def process_batch(request: BatchChatRequest, http_request: Request):
+    """Answer many messages on the bounded batch worker pool.
+
+    Batches bypass the per-number rate limit and the admission queue of
+    ``/chat/message`` (a broadcast writes to many numbers at once and has
+    its own bounded pool), so the batch routes are reserved to operators
+    holding the admin token.
+
+    Messages of the same number run one at a time in the given order;
+    different numbers run in parallel up to BATCH_WORKERS turns. With
+    ``stream`` the response is NDJSON: a ``job`` line, one ``result`` line
+    per message as it completes and a closing ``summary`` line. Otherwise
+    the job id is returned at once to poll ``GET /chat/batch/{job_id}``.
+
+    Args:
+        request: The messages of the batch.
+        http_request: The HTTP request, used to reach the batch processor.
+
+    Returns:
+        The NDJSON stream, or BatchJobResponse with the queued job.
+    """
+    if len(request.items) > settings.batch_max_items:
+        raise HTTPException(
+            status_code=413, detail=f"A batch may have at most {settings.batch_max_items} items."
+        )
+    invalid = [index for index, item in enumerate(request.items) if not _valid_number(item.whatsapp_number)]
+    if invalid:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Invalid WhatsApp number format in items {invalid[:20]}. Must start with + followed by digits.",
+        )
+    try:
+        for business_id in {item.business_id for item in request.items}:
+            await run_in_threadpool(get_business, business_id)
+    except BusinessNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+
+    job = _batch_processor(http_request).submit(
+        [(item.whatsapp_number, item.message, item.business_id) for item in request.items]
+    )
+    if request.stream:
+        return StreamingResponse(
+            _stream_job(job), media_type="application/x-ndjson", headers={"X-Batch-Job-Id": job.job_id}
+        )
+    return _job_response(job, offset=0, limit=0)
+
+
+@router.get("/batch/{job_id}", response_model=BatchJobResponse, dependencies=[Depends(require_admin)])
+async def get_batch(
+    job_id: str,
+    http_request: Request,
+    offset: int = Query(0, ge=0, description="Results already read"),
+    limit: int = Query(100, ge=0, le=1000, description="Results returned"),
+) -> BatchJobResponse:
+    """Poll a batch job for its state and the results finished since ``offset``."""
+    return _job_response(_get_job(http_request, job_id), offset, limit)
+
+
+@router.get("/batch/{job_id}/stream", dependencies=[Depends(require_admin)])
+async def stream_batch(
+    job_id: str,
+    http_request: Request,
+    offset: int = Query(0, ge=0, description="Results already read"),
+) -> StreamingResponse:
+    """Stream the results of a batch job as NDJSON, starting at ``offset``."""
+    job = _get_job(http_request, job_id)
+    return StreamingResponse(
+        _stream_job(job, offset), media_type="application/x-ndjson", headers={"X-Batch-Job-Id": job.job_id}
+    )
+
+
+def _valid_number(whatsapp_number: str) -> bool:
+    """Check the +digits format of a WhatsApp number."""
+    return whatsapp_number.startswith("+") and whatsapp_number[1:].isdigit()
+
+
+def _batch_processor(http_request: Request) -> BatchProcessor:
+    """The batch processor started with the application."""
+    processor = getattr(http_request.app.state, "batch_processor", None)
+    if processor is None:
+        raise HTTPException(status_code=503, detail="Batch processing is not available.")
+    return processor
+
+
+def _get_job(http_request: Request, job_id: str) -> BatchJob:
+    job = _batch_processor(http_request).get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Batch job not found: {job_id}")
+    return job
+
+
+def _job_response(job: BatchJob, offset: int, limit: int) -> BatchJobResponse:
+    results = job.results[offset:offset + limit]
+    return BatchJobResponse(
+        job_id=job.job_id,
+        status=job.status,
+        total=job.total,
+        completed=job.completed,
+        failed=job.failed,
+        results=[BatchItemResult(**item.to_dict()) for item in results],
+        next_offset=offset + len(results),
+    )
+
 
-    return ChatResponse(response=response)
+def _stream_job(job: BatchJob, offset: int = 0) -> Iterator[str]:
+    """NDJSON lines of a job; Starlette iterates it in the threadpool, so waiting does not block the loop."""
+    yield json.dumps({"type": "job", "job_id": job.job_id, "total": job.total}) + "\n"
+    for item in job.iter_results(offset):
+        yield json.dumps({"type": "result", **item.to_dict()}, ensure_ascii=False) + "\n"
+    yield json.dumps({
+        "type": "summary",
+        "job_id": job.job_id,
+        "status": job.status,
+        "completed": job.completed,
+        "failed": job.failed,
+    }) + "\n"
@@ -0,0 +1,17 @@
+"""Metrics routes."""
+from fastapi import APIRouter
+
+from business_assistant.infrastructure.monitoring import metrics
+from business_assistant.infrastructure.services.conversation_manager import ConversationManager
+from business_assistant.interface.api.v1.models.metrics_models import MetricsResponse
+
+router = APIRouter(tags=["Metrics"])
+
+
+@router.get("/metrics", response_model=MetricsResponse)
+async def get_metrics() -> MetricsResponse:
+    """Get a snapshot of the in-process metrics."""
+    return MetricsResponse(
+        **metrics.snapshot(),
+        workflow_registry=ConversationManager().get_registry_stats(),
+    )
@@ -0,0 +1,130 @@
+"""Operator routes for on-demand CPU profiling and allocation tracking."""
+from typing import Union
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import PlainTextResponse
+
+from business_assistant.config.settings import settings
+from business_assistant.infrastructure.monitoring.profiler import (
+    CpuProfile,
+    ProfilerBusyError,
+    allocation_tracker,
+    cpu_profiler,
+    request_profiles,
+)
+from business_assistant.infrastructure.web.admin_auth import require_admin
+from business_assistant.interface.api.v1.models.profiler_models import (
+    CpuProfileResponse,
+    MemorySnapshotResponse,
+    ProfilerStatusResponse,
+)
+
+router = APIRouter(
+    prefix="/admin/profiler",
+    tags=["admin"],
+    dependencies=[Depends(require_admin)],
+    responses={
+        401: {"description": "Unauthorized - Missing or invalid X-Admin-Token"},
+        409: {"description": "Conflict - The profiler is not in the required state"},
+    },
+)
+
+# Output formats of a CPU profile
+FORMAT_QUERY = Query(
+    "json", alias="format", pattern="^(json|collapsed)$", description="json summary or collapsed stacks"
+)
+
+
+def _status() -> ProfilerStatusResponse:
+    return ProfilerStatusResponse(cpu_profiling=cpu_profiler.running, memory_tracing=allocation_tracker.running)
+
+
+def _render(profile: CpuProfile, output_format: str) -> Union[CpuProfileResponse, PlainTextResponse]:
+    """Render a CPU profile as a JSON summary or as collapsed stacks for flame graphs."""
+    if output_format == "collapsed":
+        return PlainTextResponse(profile.collapsed())
+    return CpuProfileResponse(
+        started_at=profile.started_at,
+        duration_seconds=round(profile.duration, 3),
+        interval_ms=profile.interval * 1000,
+        samples=profile.samples,
+        top_frames=profile.top_frames(),
+    )
+
+
+@router.get("", response_model=ProfilerStatusResponse)
+async def get_status() -> ProfilerStatusResponse:
+    """Get the state of the profilers."""
+    return _status()
+
+
+@router.post("/cpu/start", response_model=ProfilerStatusResponse, status_code=202)
+async def start_cpu_profile(
+    seconds: float = Query(30, gt=0, description="Seconds before the profile stops by itself"),
+    interval_ms: float = Query(10, ge=1, le=1000, description="Milliseconds between samples"),
+) -> ProfilerStatusResponse:
+    """Start sampling the stacks of every thread of this process."""
+    if seconds > settings.profiler_max_seconds:
+        raise HTTPException(status_code=400, detail=f"seconds must be at most {settings.profiler_max_seconds}")
+    try:
+        cpu_profiler.start(seconds, interval_ms / 1000)
+    except ProfilerBusyError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    return _status()
+
+
+@router.post("/cpu/stop", response_model=CpuProfileResponse)
+async def stop_cpu_profile(output_format: str = FORMAT_QUERY):
+    """Stop the CPU profile and return it."""
+    profile = await run_in_threadpool(cpu_profiler.stop)
+    if profile is None:
+        raise HTTPException(status_code=409, detail="No CPU profile has been taken")
+    return _render(profile, output_format)
+
+
+@router.get("/cpu", response_model=CpuProfileResponse)
+async def get_cpu_profile(output_format: str = FORMAT_QUERY):
+    """Get the last finished CPU profile."""
+    if cpu_profiler.running:
+        raise HTTPException(status_code=409, detail="The CPU profile is still running")
+    if cpu_profiler.last_profile is None:
+        raise HTTPException(status_code=409, detail="No CPU profile has been taken")
+    return _render(cpu_profiler.last_profile, output_format)
+
+
+@router.get("/requests/{profile_id}", response_model=CpuProfileResponse)
+async def get_request_profile(profile_id: str, output_format: str = FORMAT_QUERY):
+    """Get the profile of a request sent with the X-Profile header."""
+    profile = request_profiles.get(profile_id)
+    if profile is None:
+        raise HTTPException(status_code=404, detail=f"Profile not found: {profile_id}")
+    return _render(profile, output_format)
+
+
+@router.post("/memory/start", response_model=ProfilerStatusResponse)
+async def start_memory_tracing(
+    frames: int = Query(25, ge=1, le=100, description="Frames stored per allocation"),
+) -> ProfilerStatusResponse:
+    """Start tracing allocations and take the baseline snapshot."""
+    await run_in_threadpool(allocation_tracker.start, frames)
+    return _status()
+
+
+@router.post("/memory/snapshot", response_model=MemorySnapshotResponse)
+async def take_memory_snapshot(
+    limit: int = Query(20, ge=1, le=200, description="Source lines listed by growth"),
+) -> MemorySnapshotResponse:
+    """Take an allocation snapshot and diff it with the previous one."""
+    try:
+        snapshot = await run_in_threadpool(allocation_tracker.snapshot, limit)
+    except RuntimeError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    return MemorySnapshotResponse(**snapshot)
+
+
+@router.post("/memory/stop", response_model=ProfilerStatusResponse)
+async def stop_memory_tracing() -> ProfilerStatusResponse:
+    """Stop tracing allocations."""
+    await run_in_threadpool(allocation_tracker.stop)
+    return _status()
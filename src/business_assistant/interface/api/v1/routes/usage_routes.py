@@ -0,0 +1,65 @@
+"""Usage and cost routes backed by the per-turn usage ledger.
+
+The rollups list customers' WhatsApp numbers, so the routes are reserved
+to operators holding the admin token.
+"""
+from datetime import datetime, timedelta
+from typing import List, Optional
+
+from fastapi import APIRouter, Depends, Query
+from fastapi.concurrency import run_in_threadpool
+
+from business_assistant.infrastructure.persistence.repositories.usage_repository import PostgresUsageRepository
+from business_assistant.infrastructure.web.admin_auth import require_admin
+from business_assistant.interface.api.v1.models.usage_models import (
+    ConversationCostResponse,
+    DailyCostResponse,
+    ToolCostResponse,
+)
+
+router = APIRouter(
+    prefix="/usage",
+    tags=["usage"],
+    dependencies=[Depends(require_admin)],
+    responses={401: {"description": "Unauthorized - Missing or invalid X-Admin-Token"}},
+)
+
+# Query parameters shared by every rollup
+DAYS_QUERY = Query(7, ge=1, le=366, description="Days back from now")
+BUSINESS_QUERY = Query(None, description="Restrict to one business")
+
+
+def _since(days: int) -> datetime:
+    """Start of a window of the last ``days`` days."""
+    return datetime.now() - timedelta(days=days)
+
+
+@router.get("/conversations", response_model=List[ConversationCostResponse])
+async def cost_by_conversation(
+    days: int = DAYS_QUERY,
+    business_id: Optional[int] = BUSINESS_QUERY,
+    limit: int = Query(50, ge=1, le=1000),
+) -> List[ConversationCostResponse]:
+    """List the most expensive conversations of the window."""
+    rows = await run_in_threadpool(PostgresUsageRepository().cost_by_conversation, _since(days), business_id, limit)
+    return [ConversationCostResponse(**row) for row in rows]
+
+
+@router.get("/daily", response_model=List[DailyCostResponse])
+async def cost_by_day(
+    days: int = DAYS_QUERY,
+    business_id: Optional[int] = BUSINESS_QUERY,
+) -> List[DailyCostResponse]:
+    """Get usage and cost per day, newest first."""
+    rows = await run_in_threadpool(PostgresUsageRepository().cost_by_day, _since(days), business_id)
+    return [DailyCostResponse(**row) for row in rows]
+
+
+@router.get("/tools", response_model=List[ToolCostResponse])
+async def cost_by_tool(
+    days: int = DAYS_QUERY,
+    business_id: Optional[int] = BUSINESS_QUERY,
+) -> List[ToolCostResponse]:
+    """Get calls and attributed cost per tool, most expensive first."""
+    rows = await run_in_threadpool(PostgresUsageRepository().cost_by_tool, _since(days), business_id)
+    return [ToolCostResponse(**row) for row in rows]
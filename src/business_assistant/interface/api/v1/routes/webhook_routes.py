@@ -0,0 +1,59 @@
+"""Webhook routes receiving messages for asynchronous processing."""
+
+from fastapi import APIRouter, HTTPException
+from fastapi.concurrency import run_in_threadpool
+
+from business_assistant.domain.exceptions import BusinessNotFoundError
+from business_assistant.infrastructure.monitoring import metrics
+from business_assistant.infrastructure.services.business_registry import get_business
+from business_assistant.infrastructure.persistence.repositories.inbound_queue_repository import (
+    PostgresInboundQueueRepository,
+)
+from business_assistant.interface.api.v1.models.webhook_models import (
+    InboundMessageAck,
+    InboundMessageRequest,
+)
+
+router = APIRouter(
+    prefix="/webhook",
+    tags=["webhook"],
+    responses={
+        400: {"description": "Bad request - Invalid WhatsApp number"},
+        404: {"description": "Not found - Unknown business"},
+    },
+)
+
+
+@router.post("/messages", response_model=InboundMessageAck, status_code=202)
+async def receive_message(request: InboundMessageRequest) -> InboundMessageAck:
+    """Queue an inbound message and acknowledge it immediately.
+
+    The turn runs on the inbound workers and the reply is delivered through
+    the outbound sender, so the platform's webhook never waits on the agent.
+
+    Args:
+        request: The inbound message.
+
+    Returns:
+        InboundMessageAck with the queue identifier of the message.
+    """
+    if not request.whatsapp_number.startswith("+") or not request.whatsapp_number[1:].isdigit():
+        raise HTTPException(
+            status_code=400,
+            detail="Invalid WhatsApp number format. Must start with + followed by digits.",
+        )
+
+    try:
+        business = await run_in_threadpool(get_business, request.business_id)
+    except BusinessNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+
+    message_id, created = await run_in_threadpool(
+        PostgresInboundQueueRepository().enqueue,
+        request.whatsapp_number,
+        request.message,
+        request.external_id,
+        business.business_id,
+    )
+    metrics.increment("inbound_messages_received_total", status="queued" if created else "duplicate")
+    return InboundMessageAck(message_id=message_id, status="queued" if created else "duplicate")
@@ -0,0 +1,84 @@
+"""CLI for bulk catalog import and export."""
+import argparse
+import os
+import sys
+
+from business_assistant.application.services.catalog_service import CatalogService, CATALOG_FORMATS
+
+
+def detect_format(path: str, requested: str = None) -> str:
+    """Get the file format from the flag or the file extension.
+
+    Args:
+        path: Path of the catalog file.
+        requested: Format given on the command line, if any.
+
+    Returns:
+        The catalog format.
+    """
+    if requested:
+        return requested
+    extension = os.path.splitext(path)[1].lower().lstrip(".")
+    return "json" if extension in ("json", "ndjson", "jsonl") else "csv"
+
+
+def import_command(args: argparse.Namespace) -> int:
+    """Import a catalog file and print the report."""
+    file_format = detect_format(args.file, args.format)
+    with open(args.file, "rb") as catalog_file:
+        report = CatalogService().import_catalog(
+            catalog_file,
+            file_format=file_format,
+            create_missing_categories=args.create_categories,
+        )
+
+    print(f"Filas recibidas:   {report.rows_received}")
+    print(f"Filas importadas:  {report.rows_imported}")
+    print(f"Filas rechazadas:  {report.rows_rejected}")
+    print(f"Categorías nuevas: {report.categories_created}")
+    print(f"Productos:         {report.products_created} nuevos, {report.products_updated} actualizados")
+    print(f"Variantes:         {report.variants_created} nuevas, {report.variants_updated} actualizadas")
+    print(f"Lotes inventario:  {report.inventory_lots_created} nuevos, {report.inventory_lots_updated} actualizados")
+    print(f"Tiempo:            {report.elapsed_seconds:.2f} s ({report.rows_per_second:.0f} filas/s)")
+    for reject in report.rejects:
+        print(f"  Registro {reject['line_no']} (SKU {reject['sku']}): {reject['reason']}")
+    return 0 if report.rows_rejected == 0 else 2
+
+
+def export_command(args: argparse.Namespace) -> int:
+    """Export the catalog as CSV to a file or stdout."""
+    output = open(args.output, "w", newline="", encoding="utf-8") if args.output else sys.stdout
+    try:
+        for chunk in CatalogService().stream_export():
+            output.write(chunk)
+    finally:
+        if args.output:
+            output.close()
+    return 0
+
+
+def main():
+    """Main entry point for the catalog CLI."""
+    parser = argparse.ArgumentParser(description="Importación y exportación masiva del catálogo")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    import_parser = subparsers.add_parser("import", help="Importar catálogo desde CSV o JSON")
+    import_parser.add_argument("file", help="Archivo CSV (con encabezado) o JSON")
+    import_parser.add_argument("--format", choices=CATALOG_FORMATS, help="Formato del archivo (por defecto según la extensión)")
+    import_parser.add_argument("--create-categories", action="store_true", help="Crear categorías inexistentes")
+    import_parser.set_defaults(handler=import_command)
+
+    export_parser = subparsers.add_parser("export", help="Exportar catálogo a CSV")
+    export_parser.add_argument("-o", "--output", help="Archivo de salida (por defecto stdout)")
+    export_parser.set_defaults(handler=export_command)
+
+    args = parser.parse_args()
+    try:
+        sys.exit(args.handler(args))
+    except Exception as e:
+        print(f"\n❌ Error: {str(e)}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,7 @@
 """CLI interface for the business assistant chat."""
+import argparse
+import asyncio
+import json
 import os
 import sys
 import re
@@ -6,13 +9,28 @@ import requests
 from typing import Optional
 import readline  # Enable arrow key navigation and command history
 
+from business_assistant.config.settings import settings
+from business_assistant.interface.cli.chat_load import LoadRunner, load_script
+
+
+def default_api_url() -> str:
+    """Chat endpoint of a server running locally with the current settings."""
+    return f"http://localhost:{settings.port}{settings.api_prefix}/chat/message"
+
+
 class ChatCLI:
     """CLI chat interface for the business assistant."""
     
-    def __init__(self):
-        """Initialize the chat CLI."""
-        self.api_url = "http://localhost:8080/ai-business-assistant/api/v1/chat/message"
+    def __init__(self, api_url: Optional[str] = None):
+        """Initialize the chat CLI.
+        
+        Args:
+            api_url: Chat endpoint. Defaults to the local server on SERVER_PORT.
+        """
+        self.api_url = api_url or default_api_url()
         self.whatsapp_number: Optional[str] = None
+        # One keep-alive connection for the whole chat
+        self.session = requests.Session()
         
     def validate_whatsapp_number(self, number: str) -> bool:
         """Validate WhatsApp number format.
@@ -48,7 +66,7 @@ class ChatCLI:
             headers = {
                 "Content-Type": "application/json",
             }
-            response = requests.post(
+            response = self.session.post(
                 self.api_url,
                 headers=headers,
                 json={"message": message, "whatsapp_number": self.whatsapp_number}
@@ -97,10 +115,57 @@ class ChatCLI:
                 print("\n\n👋 ¡Gracias por usar nuestro servicio!")
                 break
                 
+def run_load(args: argparse.Namespace) -> int:
+    """Replay a conversation script as many concurrent customers and print the report."""
+    runner = LoadRunner(
+        args.url,
+        load_script(args.script),
+        users=args.users,
+        rate=args.rate,
+        iterations=args.iterations,
+        duration=args.duration,
+        timeout=args.timeout,
+    )
+    print(f"Enviando a {args.url} con {args.users} números simulados...", file=sys.stderr)
+    summary = asyncio.run(runner.run()).summary()
+    if args.json:
+        print(json.dumps(summary, indent=2))
+        return 0 if summary["error_rate"] <= args.max_error_rate else 2
+
+    latency = summary["latency"]
+    print(f"Conversaciones:  {summary['conversations']}")
+    print(f"Mensajes:        {summary['requests']} ({summary['ok']} ok)")
+    print(f"Tiempo:          {summary['elapsed_seconds']:.1f} s ({summary['requests_per_second']:.2f} mensajes/s)")
+    print(f"Latencia (s):    p50 {latency['p50']:.3f}  p90 {latency['p90']:.3f}  "
+          f"p95 {latency['p95']:.3f}  p99 {latency['p99']:.3f}  máx {latency['max']:.3f}")
+    print(f"Tasa de error:   {summary['error_rate']:.2%}")
+    for kind, count in summary["errors"].items():
+        print(f"  {kind}: {count}")
+    return 0 if summary["error_rate"] <= args.max_error_rate else 2
+
+
 def main():
-    """Main entry point for the CLI application."""
+    """Main entry point for the CLI application.
+    
+    Without --script the chat is interactive; with it, the script is
+    replayed as a load test.
+    """
+    parser = argparse.ArgumentParser(description="Chat con el asistente de negocios")
+    parser.add_argument("--url", default=default_api_url(), help="Endpoint de chat (por defecto el servidor local)")
+    parser.add_argument("--script", help="Guion de conversaciones (.jsonl, o texto con conversaciones separadas por líneas en blanco)")
+    parser.add_argument("--users", type=int, default=10, help="Números simulados conversando a la vez")
+    parser.add_argument("--rate", type=float, default=0.0, help="Máximo de mensajes por segundo entre todos (0 sin límite)")
+    parser.add_argument("--iterations", type=int, default=1, help="Conversaciones por número simulado")
+    parser.add_argument("--duration", type=float, help="Dejar de iniciar conversaciones tras estos segundos")
+    parser.add_argument("--timeout", type=float, default=120.0, help="Segundos de espera por cada respuesta")
+    parser.add_argument("--max-error-rate", type=float, default=0.0, help="Tasa de error tolerada antes de salir con código 2")
+    parser.add_argument("--json", action="store_true", help="Imprimir el reporte como JSON")
+    args = parser.parse_args()
+    
     try:
-        cli = ChatCLI()
+        if args.script:
+            sys.exit(run_load(args))
+        cli = ChatCLI(args.url)
         cli.run()
     except Exception as e:
         print(f"\n❌ Error inesperado: {str(e)}")
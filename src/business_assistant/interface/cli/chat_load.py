@@ -0,0 +1,240 @@
+"""Scripted load generation against the chat endpoint.
+
+Scripted conversations are replayed by many simulated WhatsApp numbers at
+once over one pool of keep-alive connections. Each number sends the
+messages of its conversation in order, waiting for every answer like a
+real customer, while a shared pacer caps the total message rate.
+"""
+import asyncio
+import json
+import os
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+import httpx
+
+# Latency percentiles reported
+PERCENTILES = (50, 90, 95, 99)
+
+# Error kinds other than HTTP status codes
+ERROR_TIMEOUT = "timeout"
+ERROR_CONNECTION = "connection"
+
+
+@dataclass
+class ScriptedConversation:
+    """Messages a simulated customer sends, in order."""
+
+    messages: List[str]
+    business_id: Optional[int] = None
+
+
+def parse_conversations(text: str, script_format: str) -> List[ScriptedConversation]:
+    """Parse a conversation script.
+
+    Scripts are JSON lines with one conversation per line, or text with one
+    message per line and conversations separated by blank lines. JSON lines hold ``{"messages": [...], "business_id": 1}`` objects, or
+    bare lists of messages.
+
+    Args:
+        text: Content of the script.
+        script_format: "jsonl" or "text".
+
+    Returns:
+        The conversations with at least one message.
+
+    Raises:
+        ValueError: If a JSON line is not a conversation.
+    """
+    conversations = []
+    if script_format == "jsonl":
+        for line_no, line in enumerate(text.splitlines(), start=1):
+            if not line.strip():
+                continue
+            data = json.loads(line)
+            if isinstance(data, list):
+                data = {"messages": data}
+            if not isinstance(data, dict) or not isinstance(data.get("messages"), list):
+                raise ValueError(f"Línea {line_no}: se esperaba un objeto con 'messages'")
+            conversations.append(ScriptedConversation([str(m) for m in data["messages"]], data.get("business_id")))
+    else:
+        for block in text.split("\n\n"):
+            messages = [line.strip() for line in block.splitlines() if line.strip() and not line.startswith("#")]
+            conversations.append(ScriptedConversation(messages))
+    return [conversation for conversation in conversations if conversation.messages]
+
+
+def load_script(path: str) -> List[ScriptedConversation]:
+    """Read a conversation script, choosing the format by extension.
+
+    Args:
+        path: Path of the script; .jsonl and .json files are JSON lines.
+
+    Returns:
+        The conversations.
+    """
+    extension = os.path.splitext(path)[1].lower().lstrip(".")
+    with open(path, encoding="utf-8") as script_file:
+        return parse_conversations(script_file.read(), "jsonl" if extension in ("json", "jsonl") else "text")
+
+
+def simulated_number(index: int) -> str:
+    """WhatsApp number of the index-th simulated customer."""
+    return f"+57300{index:07d}"
+
+
+def percentile(ordered: List[float], pct: float) -> float:
+    """Nearest-rank percentile of sorted values."""
+    if not ordered:
+        return 0.0
+    rank = max(1, -(-len(ordered) * pct // 100))
+    return ordered[int(rank) - 1]
+
+
+@dataclass
+class LoadReport:
+    """Outcome of a load run."""
+
+    latencies: List[float] = field(default_factory=list)
+    errors: Dict[str, int] = field(default_factory=dict)
+    conversations: int = 0
+    elapsed: float = 0.0
+
+    @property
+    def requests(self) -> int:
+        """Messages sent, answered or not."""
+        return len(self.latencies) + sum(self.errors.values())
+
+    @property
+    def error_rate(self) -> float:
+        """Fraction of the messages that failed."""
+        return sum(self.errors.values()) / self.requests if self.requests else 0.0
+
+    def summary(self) -> Dict[str, Any]:
+        """Throughput, latency percentiles in seconds and errors by kind."""
+        ordered = sorted(self.latencies)
+        return {
+            "requests": self.requests,
+            "ok": len(ordered),
+            "conversations": self.conversations,
+            "elapsed_seconds": round(self.elapsed, 3),
+            "requests_per_second": round(self.requests / self.elapsed, 2) if self.elapsed else 0.0,
+            "error_rate": round(self.error_rate, 4),
+            "errors": dict(sorted(self.errors.items())),
+            "latency": {
+                **{f"p{pct}": round(percentile(ordered, pct), 3) for pct in PERCENTILES},
+                "max": round(ordered[-1], 3) if ordered else 0.0,
+            },
+        }
+
+
+class RatePacer:
+    """Spaces out sends so all customers together stay under a rate."""
+
+    def __init__(self, rate: float):
+        """Initialize the pacer.
+
+        Args:
+            rate: Messages per second; zero sends as fast as answers arrive.
+        """
+        self.interval = 1 / rate if rate > 0 else 0.0
+        self._next = 0.0
+        self._lock = asyncio.Lock()
+
+    async def wait(self) -> None:
+        """Wait for the next send slot."""
+        if not self.interval:
+            return
+        async with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next)
+            self._next = slot + self.interval
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+
+class LoadRunner:
+    """Replays scripted conversations from many simulated numbers at once."""
+
+    def __init__(
+        self,
+        url: str,
+        conversations: List[ScriptedConversation],
+        users: int = 10,
+        rate: float = 0.0,
+        iterations: int = 1,
+        duration: Optional[float] = None,
+        timeout: float = 120.0,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
+        """Initialize the runner.
+
+        Args:
+            url: Chat endpoint, e.g. http://localhost:8000/ai-business-assistant/api/v1/chat/message.
+            conversations: Scripts handed out to the customers round-robin.
+            users: Simulated numbers talking at the same time.
+            rate: Cap on messages per second across all numbers; zero for no cap.
+            iterations: Conversations each number goes through.
+            duration: Stop starting conversations after this many seconds.
+            timeout: Seconds to wait for each answer.
+            transport: HTTP transport, replaceable in tests.
+        """
+        if not conversations:
+            raise ValueError("El guion no tiene conversaciones")
+        self.url = url
+        self.conversations = conversations
+        self.users = users
+        self.iterations = iterations
+        self.duration = duration
+        self.timeout = timeout
+        self.transport = transport
+        self.pacer = RatePacer(rate)
+
+    async def run(self) -> LoadReport:
+        """Run every simulated customer until its conversations are done.
+
+        Returns:
+            The latencies and errors of all the messages sent.
+        """
+        report = LoadReport()
+        # One connection per customer at most, kept alive across its messages
+        limits = httpx.Limits(max_connections=self.users, max_keepalive_connections=self.users)
+        start = time.perf_counter()
+        deadline = start + self.duration if self.duration else None
+        async with httpx.AsyncClient(timeout=self.timeout, limits=limits, transport=self.transport) as client:
+            await asyncio.gather(*(self._customer(client, index, report, deadline) for index in range(self.users)))
+        report.elapsed = time.perf_counter() - start
+        return report
+
+    async def _customer(
+        self, client: httpx.AsyncClient, index: int, report: LoadReport, deadline: Optional[float]
+    ) -> None:
+        number = simulated_number(index)
+        for iteration in range(self.iterations):
+            if deadline is not None and time.perf_counter() >= deadline:
+                return
+            conversation = self.conversations[(index + iteration) % len(self.conversations)]
+            for message in conversation.messages:
+                await self.pacer.wait()
+                await self._send(client, number, message, conversation.business_id, report)
+            report.conversations += 1
+
+    async def _send(
+        self, client: httpx.AsyncClient, number: str, message: str, business_id: Optional[int], report: LoadReport
+    ) -> None:
+        payload = {"message": message, "whatsapp_number": number}
+        if business_id is not None:
+            payload["business_id"] = business_id
+        start = time.perf_counter()
+        try:
+            response = await client.post(self.url, json=payload)
+            error = None if response.status_code == 200 else str(response.status_code)
+        except httpx.TimeoutException:
+            error = ERROR_TIMEOUT
+        except httpx.HTTPError:
+            error = ERROR_CONNECTION
+        if error is None:
+            report.latencies.append(time.perf_counter() - start)
+        else:
+            report.errors[error] = report.errors.get(error, 0) + 1
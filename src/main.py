@@ -1,18 +1,12 @@
 """Main application module."""
 import logging
-import sys
 
+from business_assistant.config.logging_config import configure_logging
 from business_assistant.infrastructure.web.server import run_server, get_application
 from business_assistant.infrastructure.persistence.migration import run_migrations
 
 # Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.StreamHandler(sys.stdout)
-    ]
-)
+configure_logging()
 
 logger = logging.getLogger(__name__)
 
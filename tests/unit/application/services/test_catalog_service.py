@@ -0,0 +1,67 @@
+"""Unit tests for the catalog bulk import service."""
+import io
+
+import pytest
+
+from business_assistant.application.services.catalog_service import CatalogService
+
+
+class RecordingRepository:
+    """Repository double capturing what would be sent to COPY."""
+
+    def __init__(self):
+        self.columns = None
+        self.copied = None
+
+    def bulk_import(self, csv_stream, columns, create_missing_categories=False, reject_limit=100, business_id=1):
+        self.columns = list(columns)
+        self.copied = csv_stream.read()
+        return {"rows_received": 2, "rows_rejected": 1, "rejects": [{"line_no": 2, "sku": "B", "reason": "Precio inválido"}]}
+
+    def export(self, output, business_id=1):
+        output.write("category,product\n")
+        output.write("Alimentos,Miel\n")
+
+
+@pytest.fixture
+def service() -> CatalogService:
+    """Create a catalog service backed by the recording repository."""
+    catalog_service = CatalogService.__new__(CatalogService)
+    catalog_service.repository = RecordingRepository()
+    return catalog_service
+
+
+def test_import_csv_uses_header_as_copy_columns(service: CatalogService) -> None:
+    """Test the CSV header drives the COPY column list and is not copied as data."""
+    # Given
+    upload = io.BytesIO("﻿SKU, Price ,category\nA,100,Alimentos\nB,x,Alimentos\n".encode("utf-8"))
+    
+    # When
+    report = service.import_catalog(upload, "csv")
+    
+    # Then
+    assert service.repository.columns == ["sku", "price", "category"]
+    assert service.repository.copied == "A,100,Alimentos\nB,x,Alimentos\n"
+    assert report.rows_imported == 1
+    assert report.to_dict()["rejects"][0]["reason"] == "Precio inválido"
+
+
+def test_import_json_array_and_ndjson_render_same_csv(service: CatalogService) -> None:
+    """Test both JSON layouts are converted to the same CSV rows."""
+    service.import_catalog(io.StringIO('[{"sku": "A", "price": 100, "active": true}]'), "json")
+    from_array = service.repository.copied
+    
+    service.import_catalog(io.StringIO('{"sku": "A", "price": 100, "active": true}\n'), "json")
+    
+    assert service.repository.copied == from_array == ",,,,,A,100,true,,\n"
+
+
+def test_import_rejects_csv_without_required_columns(service: CatalogService) -> None:
+    """Test files missing SKU or price are refused before touching the database."""
+    with pytest.raises(ValueError):
+        service.import_catalog(io.StringIO("category,product\nAlimentos,Miel\n"), "csv")
+
+
+def test_stream_export_yields_copy_chunks(service: CatalogService) -> None:
+    """Test the export generator relays what COPY writes."""
+    assert "".join(service.stream_export()) == "category,product\nAlimentos,Miel\n"
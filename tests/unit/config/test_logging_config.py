@@ -0,0 +1,79 @@
+"""Unit tests for the logging pipeline."""
+import json
+import logging
+import queue
+
+from business_assistant.config.logging_config import (
+    CorrelationFilter,
+    DroppingQueueHandler,
+    JsonFormatter,
+    SamplingFilter,
+    log_context,
+    parse_log_sampling,
+)
+
+
+def make_record(name: str, level: int, msg: str, *args) -> logging.LogRecord:
+    return logging.LogRecord(name, level, __file__, 1, msg, args, None)
+
+
+def test_json_line_carries_the_correlation_ids():
+    # Given a record logged inside a request of a conversation
+    handler = DroppingQueueHandler(queue.Queue())
+    handler.addFilter(CorrelationFilter())
+    with log_context(request_id="req-1", conversation_id="abc123"):
+        handler.handle(make_record("business_assistant.test", logging.INFO, "Pedido %s listo", 42))
+
+    # When the listener formats it
+    line = JsonFormatter().format(handler.queue.get_nowait())
+
+    # Then the message is rendered and tagged with both ids
+    entry = json.loads(line)
+    assert entry["message"] == "Pedido 42 listo"
+    assert entry["request_id"] == "req-1"
+    assert entry["conversation_id"] == "abc123"
+    assert entry["level"] == "INFO"
+
+
+def test_ids_are_reset_after_the_block():
+    # Given a block that set a request id
+    with log_context(request_id="req-1"):
+        pass
+
+    # When a record is filtered afterwards
+    record = make_record("business_assistant.test", logging.INFO, "fuera")
+    CorrelationFilter().filter(record)
+
+    # Then it has no ids
+    assert record.request_id == "-"
+    assert record.conversation_id == "-"
+
+
+def test_full_queue_drops_records_instead_of_blocking():
+    # Given a queue with room for one record
+    handler = DroppingQueueHandler(queue.Queue(maxsize=1))
+
+    # When three records are logged
+    for i in range(3):
+        handler.handle(make_record("business_assistant.test", logging.INFO, "registro %d", i))
+
+    # Then the extra records are counted as dropped
+    assert handler.dropped == 2
+    assert handler.queue.qsize() == 1
+
+
+def test_sampling_drops_chatty_records_but_keeps_warnings():
+    # Given a logger sampled at zero and a more specific one kept in full
+    sampling = SamplingFilter(parse_log_sampling("business_assistant.infrastructure=0, business_assistant.infrastructure.web=1"))
+
+    # When records of each kind are filtered
+    info = make_record("business_assistant.infrastructure.langgraph.nodes", logging.INFO, "evento")
+    warning = make_record("business_assistant.infrastructure.langgraph.nodes", logging.WARNING, "alerta")
+    web = make_record("business_assistant.infrastructure.web.app", logging.INFO, "web")
+    other = make_record("uvicorn.access", logging.INFO, "GET /")
+
+    # Then only the sampled-out info record is dropped
+    assert not sampling.filter(info)
+    assert sampling.filter(warning)
+    assert sampling.filter(web)
+    assert sampling.filter(other)
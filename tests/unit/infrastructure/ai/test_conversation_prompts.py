@@ -0,0 +1,28 @@
+"""Unit tests for the per-business conversation prompts."""
+from business_assistant.domain.models.business import Business
+from business_assistant.infrastructure.ai.prompts.conversation_prompts import get_canned_response, get_system_prompt
+
+
+def test_system_prompt_is_rendered_per_business() -> None:
+    """Test each business gets its own identity and only the profile fields it has."""
+    # Given
+    bakery = Business(business_id=7, slug="panaderia", name="Panadería La Espiga", assistant_name="Lucía", hours="Todos los días")
+    
+    # When
+    prompt = get_system_prompt(bakery)
+    default_prompt = get_system_prompt()
+    
+    # Then
+    assert "a nombre de Panadería La Espiga. Tu nombre es Lucía" in prompt
+    assert "- Horario de Atención: Todos los días" in prompt
+    assert "Dirección" not in prompt
+    assert "Liwaisi Tech" in default_prompt and "Liwaisi Tech" not in prompt
+    assert get_system_prompt(bakery) is prompt
+
+
+def test_canned_greeting_uses_business_identity() -> None:
+    """Test fixed replies introduce the assistant of the business."""
+    bakery = Business(business_id=7, slug="panaderia", name="Panadería La Espiga", assistant_name="Lucía")
+    
+    assert get_canned_response("greeting", bakery) == "¡Hola! Soy Lucía de Panadería La Espiga. ¿En qué te puedo ayudar?"
+    assert get_canned_response("thanks", bakery) == "Con gusto."
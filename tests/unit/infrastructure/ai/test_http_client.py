@@ -0,0 +1,83 @@
+"""Unit tests for the resilient LLM transport."""
+import json
+
+import httpx
+import pytest
+
+from business_assistant.infrastructure.ai.http_client import CircuitOpenError, ResilientTransport
+from business_assistant.infrastructure.monitoring import metrics
+
+
+class ScriptedUpstream:
+    """Upstream double answering with a scripted status per model."""
+
+    def __init__(self, statuses):
+        self.statuses = statuses
+        self.models = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        model = json.loads(request.content)["model"]
+        self.models.append(model)
+        status = self.statuses[model].pop(0) if self.statuses[model] else 200
+        return httpx.Response(status, json={"model": model})
+
+
+@pytest.fixture(autouse=True)
+def reset_metrics():
+    """Start every test with empty metrics."""
+    metrics.reset()
+    yield
+    metrics.reset()
+
+
+def send(transport: ResilientTransport, model: str = "primary") -> httpx.Response:
+    """Send a chat completion request through the transport."""
+    with httpx.Client(transport=transport, base_url="https://llm.test") as client:
+        return client.post("/chat/completions", json={"model": model, "messages": []})
+
+
+def test_retries_rate_limited_requests(monkeypatch) -> None:
+    """Test a 429 is retried and the retry is counted."""
+    # Given
+    upstream = ScriptedUpstream({"primary": [429, 503]})
+    transport = ResilientTransport(httpx.MockTransport(upstream), max_retries=2, sleep=lambda _: None)
+    
+    # When
+    response = send(transport)
+    
+    # Then
+    assert response.status_code == 200
+    assert upstream.models == ["primary"] * 3
+    assert metrics.get_counter("llm_retries_total", model="primary", reason="429") == 1
+
+
+def test_falls_back_to_next_model_when_retries_run_out() -> None:
+    """Test the request body is rewritten with the fallback model."""
+    # Given
+    upstream = ScriptedUpstream({"primary": [500, 500], "backup": []})
+    transport = ResilientTransport(
+        httpx.MockTransport(upstream), max_retries=1, fallback_models=["backup"], sleep=lambda _: None
+    )
+    
+    # When
+    response = send(transport)
+    
+    # Then
+    assert response.json() == {"model": "backup"}
+    assert metrics.get_counter("llm_fallbacks_total", model="backup") == 1
+
+
+def test_open_circuit_fails_fast() -> None:
+    """Test requests are rejected without reaching upstream while the circuit is open."""
+    # Given
+    upstream = ScriptedUpstream({"primary": [503, 503, 503]})
+    transport = ResilientTransport(
+        httpx.MockTransport(upstream), max_retries=0, failure_threshold=2, reset_timeout=60, sleep=lambda _: None
+    )
+    send(transport)
+    send(transport)
+    
+    # When / Then
+    with pytest.raises(CircuitOpenError):
+        send(transport)
+    assert len(upstream.models) == 2
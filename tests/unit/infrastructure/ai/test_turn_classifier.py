@@ -0,0 +1,41 @@
+"""Unit tests for the local turn classifier."""
+import pytest
+
+from business_assistant.infrastructure.ai.turn_classifier import (
+    INTENT_CATALOG,
+    INTENT_FAQ,
+    INTENT_GOODBYE,
+    INTENT_GREETING,
+    INTENT_THANKS,
+    INTENT_UNKNOWN,
+    ROUTE_AGENT,
+    ROUTE_CANNED,
+    ROUTE_SMALL_MODEL,
+    classify_turn,
+)
+
+
+@pytest.mark.parametrize("message,route,intent", [
+    ("Hola", ROUTE_CANNED, INTENT_GREETING),
+    ("Buenos días!", ROUTE_CANNED, INTENT_GREETING),
+    ("Muchas gracias Sara", ROUTE_CANNED, INTENT_THANKS),
+    ("chao, feliz día", ROUTE_CANNED, INTENT_GOODBYE),
+    ("¿Cuál es el horario?", ROUTE_SMALL_MODEL, INTENT_FAQ),
+    ("¿Aceptan Nequi?", ROUTE_SMALL_MODEL, INTENT_FAQ),
+    ("Hola, ¿tienen miel?", ROUTE_AGENT, INTENT_CATALOG),
+    ("quiero 3 de la opción 2", ROUTE_AGENT, INTENT_CATALOG),
+    ("dale", ROUTE_AGENT, INTENT_UNKNOWN),
+    ("sí, confirmo", ROUTE_AGENT, INTENT_UNKNOWN),
+    ("listo, gracias", ROUTE_AGENT, INTENT_UNKNOWN),
+    ("dale gracias", ROUTE_AGENT, INTENT_UNKNOWN),
+    ("ok gracias", ROUTE_AGENT, INTENT_UNKNOWN),
+    ("perfecto gracias", ROUTE_AGENT, INTENT_UNKNOWN),
+    ("bueno, muchas gracias", ROUTE_AGENT, INTENT_UNKNOWN),
+])
+def test_classify_turn(message: str, route: str, intent: str) -> None:
+    """Test small talk is canned, FAQs go to the small model and the rest to the agent."""
+    # When
+    classification = classify_turn(message)
+    
+    # Then
+    assert (classification.route, classification.intent) == (route, intent)
@@ -0,0 +1,116 @@
+"""Unit tests for the LRU cache."""
+import pytest
+
+from business_assistant.infrastructure.cache import LRUCache
+from business_assistant.infrastructure.monitoring import metrics
+
+
+def test_lru_cache_evicts_least_recently_used() -> None:
+    """Test the oldest untouched entry is evicted when capacity is exceeded."""
+    # Given
+    cache = LRUCache(capacity=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    
+    # When
+    cache.get("a")
+    cache.put("c", 3)
+    
+    # Then
+    assert "a" in cache
+    assert "b" not in cache
+    assert cache.get("c") == 3
+    assert len(cache) == 2
+
+
+def test_lru_cache_zero_capacity_never_stores() -> None:
+    """Test a zero-capacity cache behaves as disabled."""
+    cache = LRUCache(capacity=0)
+    cache.put("a", 1)
+    
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+def test_lru_cache_rejects_negative_capacity() -> None:
+    """Test negative capacities are rejected."""
+    with pytest.raises(ValueError):
+        LRUCache(capacity=-1)
+
+
+class FakeClock:
+    """Controllable replacement for time.monotonic."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> FakeClock:
+    """Patch the cache clock."""
+    fake_clock = FakeClock()
+    monkeypatch.setattr("business_assistant.infrastructure.cache.lru_cache.time.monotonic", fake_clock)
+    return fake_clock
+
+
+def test_lru_cache_expires_idle_entries(clock: FakeClock) -> None:
+    """Test entries idle for longer than the TTL are dropped on access."""
+    # Given
+    evicted = []
+    cache = LRUCache(capacity=10, ttl=60, on_evict=lambda key, value, reason: evicted.append((key, reason)))
+    cache.put("a", 1)
+    
+    # When
+    clock.now += 61
+    
+    # Then
+    assert cache.get("a") is None
+    assert evicted == [("a", "expired")]
+
+
+def test_lru_cache_access_refreshes_idle_clock(clock: FakeClock) -> None:
+    """Test reading an entry keeps it alive."""
+    cache = LRUCache(capacity=10, ttl=60)
+    cache.put("a", 1)
+    
+    clock.now += 50
+    assert cache.get("a") == 1
+    clock.now += 50
+    
+    assert cache.get("a") == 1
+
+
+def test_lru_cache_purge_only_removes_expired_prefix(clock: FakeClock) -> None:
+    """Test purging drops expired entries and keeps recent ones."""
+    # Given
+    cache = LRUCache(capacity=10, ttl=60)
+    cache.put("old", 1)
+    clock.now += 45
+    cache.put("recent", 2)
+    clock.now += 30
+    
+    # When
+    removed = cache.purge_expired()
+    
+    # Then
+    assert removed == 1
+    assert cache.keys() == ["recent"]
+
+
+def test_lru_cache_records_eviction_metrics() -> None:
+    """Test named caches report evictions by reason."""
+    # Given
+    cache = LRUCache(capacity=1, name="test-evictions")
+    before = metrics.get_counter("cache_evictions_total", cache="test-evictions", reason="capacity")
+    
+    # When
+    cache.put("a", 1)
+    cache.put("b", 2)
+    cache.shrink(1)
+    
+    # Then
+    assert metrics.get_counter("cache_evictions_total", cache="test-evictions", reason="capacity") == before + 1
+    assert metrics.get_counter("cache_evictions_total", cache="test-evictions", reason="memory_pressure") == 1
@@ -0,0 +1,149 @@
+"""Unit tests for the agent iteration and time budget."""
+import time
+
+import pytest
+from langchain_core.language_models.fake_chat_models import FakeListChatModel
+from langchain_core.messages import AIMessage, HumanMessage, ToolMessage
+
+from business_assistant.infrastructure.langgraph.nodes.agent_budget import FALLBACK_ANSWER, run_agent_with_budget
+from business_assistant.infrastructure.monitoring import metrics
+
+
+class LoopingAgent:
+    """Agent double that keeps calling the search tool forever."""
+
+    def __init__(self, tool_seconds: float = 0):
+        self.steps = 0
+        self.tool_seconds = tool_seconds
+
+    def stream(self, inputs, stream_mode, config):
+        messages = list(inputs["messages"])
+        while True:
+            self.steps += 1
+            call_id = f"call-{self.steps}"
+            messages = messages + [AIMessage(content="", tool_calls=[
+                {"name": "search_available_variant_products", "args": {"product_search_term": "miel"}, "id": call_id},
+            ])]
+            yield {"messages": messages}
+            time.sleep(self.tool_seconds)
+            messages = messages + [ToolMessage(content="[]", tool_call_id=call_id)]
+            yield {"messages": messages}
+
+
+class SlowAnsweringAgent:
+    """Agent double whose model takes a long time to answer."""
+
+    def stream(self, inputs, stream_mode, config):
+        time.sleep(1)
+        yield {"messages": list(inputs["messages"]) + [AIMessage(content="Sí, tenemos miel")]}
+
+
+class SlowChatModel(FakeListChatModel):
+    """Model double that takes a long time to answer."""
+
+    def _call(self, *args, **kwargs):
+        time.sleep(1)
+        return super()._call(*args, **kwargs)
+
+
+class AnsweringAgent:
+    """Agent double that answers directly."""
+
+    def stream(self, inputs, stream_mode, config):
+        yield {"messages": list(inputs["messages"]) + [AIMessage(content="Sí, tenemos miel")]}
+
+
+@pytest.fixture
+def llm() -> FakeListChatModel:
+    """Create a model double for the degraded answer."""
+    return FakeListChatModel(responses=["Tenemos miel, te confirmo el precio en un momento"])
+
+
+@pytest.fixture(autouse=True)
+def reset_metrics():
+    """Start every test with empty metrics."""
+    metrics.reset()
+    yield
+    metrics.reset()
+
+
+def test_answer_within_budget_is_returned_unchanged(llm: FakeListChatModel) -> None:
+    """Test a turn that finishes in budget returns the agent's messages."""
+    # Given
+    inputs = {"messages": [HumanMessage(content="¿Tienen miel?")]}
+    
+    # When
+    messages = run_agent_with_budget(AnsweringAgent(), llm, inputs, {}, max_tool_iterations=3, deadline_seconds=30)
+    
+    # Then
+    assert [m.content for m in messages] == ["Sí, tenemos miel"]
+
+
+def test_iteration_budget_degrades_to_answer_without_pending_calls(llm: FakeListChatModel) -> None:
+    """Test a looping agent is stopped and answers with what it already has."""
+    # Given
+    inputs = {"messages": [HumanMessage(content="¿Tienen miel?")]}
+    
+    # When
+    messages = run_agent_with_budget(LoopingAgent(), llm, inputs, {}, max_tool_iterations=2, deadline_seconds=30)
+    
+    # Then
+    assert sum(1 for m in messages if isinstance(m, ToolMessage)) == 2
+    assert messages[-1].content == "Tenemos miel, te confirmo el precio en un momento"
+    assert not messages[-1].tool_calls
+    assert metrics.get_counter(
+        "agent_budget_exhausted_total", tool="search_available_variant_products", reason="iterations"
+    ) == 1
+
+
+def test_deadline_degrades_before_next_tool_round(llm: FakeListChatModel) -> None:
+    """Test an exhausted deadline stops the agent before it runs more tools."""
+    # Given an agent whose first tool round outlasts the deadline
+    agent = LoopingAgent(tool_seconds=0.1)
+    inputs = {"messages": [HumanMessage(content="¿Tienen miel?")]}
+    
+    # When
+    messages = run_agent_with_budget(agent, llm, inputs, {}, max_tool_iterations=10, deadline_seconds=0.05)
+    
+    # Then the second round is requested but not run
+    assert agent.steps == 2
+    assert sum(1 for m in messages if isinstance(m, ToolMessage)) == 1
+    assert not messages[-1].tool_calls
+    assert metrics.get_counter(
+        "agent_budget_exhausted_total", tool="search_available_variant_products", reason="deadline"
+    ) == 1
+
+
+def test_deadline_cuts_off_a_slow_model_step(llm: FakeListChatModel) -> None:
+    """Test a slow model call does not hold the turn past its deadline."""
+    # Given an agent whose model takes longer than the deadline
+    inputs = {"messages": [HumanMessage(content="¿Tienen miel?")]}
+    start = time.monotonic()
+
+    # When
+    messages = run_agent_with_budget(
+        SlowAnsweringAgent(), llm, inputs, {}, max_tool_iterations=3, deadline_seconds=0.1
+    )
+
+    # Then the turn answers without waiting for the model
+    assert time.monotonic() - start < 0.8
+    assert [m.content for m in messages] == ["Tenemos miel, te confirmo el precio en un momento"]
+    assert metrics.get_counter("agent_budget_exhausted_total", tool="none", reason="deadline") == 1
+
+
+def test_degraded_answer_is_bounded_after_the_deadline() -> None:
+    """Test the answer without tools gets only a short grace period once the deadline passed."""
+    # Given a slow model and an agent that outlasts the deadline
+    slow_llm = SlowChatModel(responses=["Tenemos miel"])
+    inputs = {"messages": [HumanMessage(content="¿Tienen miel?")]}
+    start = time.monotonic()
+
+    # When
+    messages = run_agent_with_budget(
+        SlowAnsweringAgent(), slow_llm, inputs, {}, max_tool_iterations=3,
+        deadline_seconds=0.1, degraded_answer_seconds=0.1,
+    )
+
+    # Then the fixed apology is sent instead of waiting for the model
+    assert time.monotonic() - start < 0.8
+    assert messages[-1].content == FALLBACK_ANSWER
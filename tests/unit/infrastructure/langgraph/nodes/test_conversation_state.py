@@ -0,0 +1,133 @@
+"""Unit tests for the structured conversation state."""
+import json
+
+import pytest
+from langchain_core.messages import AIMessage, HumanMessage, ToolMessage
+
+from business_assistant.infrastructure.langgraph.nodes.conversation_state import (
+    CART_KEY,
+    LAST_ORDER_KEY,
+    LISTED_PRODUCTS_KEY,
+    render_context,
+    resolve_references,
+    trim_history,
+    update_context,
+)
+
+
+def _variant(variant_id: int, name: str) -> dict:
+    return {
+        "product_id": variant_id,
+        "product_name": name,
+        "variant_id": variant_id,
+        "variant_name": f"{name} 500 g",
+        "sku": f"SKU-{variant_id}",
+        "price": "18000",
+        "quantity": 10,
+    }
+
+
+def _tool_turn(name: str, result, call_id: str = "call-1") -> list:
+    return [
+        AIMessage(content="", tool_calls=[{"name": name, "args": {}, "id": call_id}]),
+        ToolMessage(content=json.dumps(result), tool_call_id=call_id),
+    ]
+
+
+@pytest.fixture
+def listed_context() -> dict:
+    """Create a state with three listed products."""
+    results = [
+        {"search_term": "miel", "variants": [_variant(12, "Miel"), _variant(14, "Miel cruda")]},
+        {"search_term": "café", "variants": [_variant(12, "Miel"), _variant(7, "Café")]},
+    ]
+    return update_context({}, _tool_turn("search_catalog", results))
+
+
+def test_search_results_are_numbered_without_repeated_variants(listed_context):
+    # Given a search whose terms returned the same variant twice (fixture)
+    # When the listing is read
+    products = listed_context[LISTED_PRODUCTS_KEY]
+
+    # Then every variant is listed once, in the order the tool returned it
+    assert [(product["position"], product["variant_id"]) for product in products] == [(1, 12), (2, 14), (3, 7)]
+
+
+def test_quote_sets_the_cart_and_reservation_clears_it(listed_context):
+    # Given a quote of two units
+    quote = {"lines": [{"variant_id": 12, "sku": "SKU-12", "variant_name": "Miel 500 g", "quantity": 2,
+                        "unit_price": "18000", "total": "36000"}], "total": "36000"}
+    context = update_context(listed_context, _tool_turn("quote_order", quote))
+    assert context[CART_KEY]["lines"][0]["quantity"] == 2
+
+    # When the order is reserved
+    order = {"order_id": 45, "total": "36000", "lines": []}
+    context = update_context(context, _tool_turn("reserve_order", order, "call-2"))
+
+    # Then the cart is cleared, the order is remembered and the listing is kept
+    assert CART_KEY not in context
+    assert context[LAST_ORDER_KEY] == {"order_id": 45, "total": "36000"}
+    assert len(context[LISTED_PRODUCTS_KEY]) == 3
+
+
+def test_error_results_leave_the_state_unchanged(listed_context):
+    # Given a search that failed with a plain text error
+    messages = _tool_turn("search_catalog", None)
+    messages[-1] = ToolMessage(content="Error al buscar productos.", tool_call_id="call-1")
+
+    # When the state is updated
+    context = update_context(listed_context, messages)
+
+    # Then the previous listing is kept
+    assert context == listed_context
+
+
+@pytest.mark.parametrize("text, positions", [
+    ("quiero la opción 2", [2]),
+    ("las opciones 1 y 3", [1, 3]),
+    ("dame 3 de la 2", [2]),
+    ("la segunda opcion por favor", [2]),
+    ("mejor el último", [3]),
+    ("numero tres", [3]),
+    ("la 1 kg", []),
+    ("el 3 de mayo", []),
+    ("la opción 9", []),
+    ("mi pedido numero 45", []),
+])
+def test_ordinal_references_resolve_to_listed_variants(listed_context, text, positions):
+    # Given a listing of three products (fixture)
+    # When the customer's words are resolved
+    references = resolve_references(text, listed_context)
+
+    # Then only positions inside the listing are resolved
+    assert [reference["position"] for reference in references] == positions
+
+
+def test_render_includes_listing_and_resolved_references(listed_context):
+    # Given a reference to the second product
+    references = resolve_references("la segunda", listed_context)
+
+    # When the state is rendered
+    block = render_context(listed_context, references)
+
+    # Then the block numbers the products and names the referenced variant
+    assert "# Estado de la conversación" in block
+    assert "3. Café 500 g (variant_id 7" in block
+    assert "\"la segunda\" es el producto 2: Miel cruda 500 g (variant_id 14)" in block
+    assert render_context({}) == ""
+
+
+def test_trimmed_history_starts_at_a_customer_message():
+    # Given two turns, the last one with a tool call
+    history = [
+        HumanMessage(content="hola"),
+        AIMessage(content="¡Hola!"),
+        HumanMessage(content="tienen miel?"),
+    ] + _tool_turn("search_catalog", []) + [AIMessage(content="Sí")]
+
+    # When the history is trimmed to three messages
+    trimmed = trim_history(history, 3)
+
+    # Then the whole last turn is kept so tool results keep their call
+    assert trimmed == history[2:]
+    assert trim_history(history, 0) == history
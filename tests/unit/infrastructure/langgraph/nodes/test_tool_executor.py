@@ -0,0 +1,87 @@
+"""Unit tests for the parallel tool executor node."""
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from langchain_core.messages import AIMessage
+from langchain_core.tools import tool
+
+from business_assistant.infrastructure.langgraph.nodes.tool_executor import ParallelToolNode, parse_tool_timeouts
+
+
+@tool
+def slow_lookup(term: str, delay: float) -> str:
+    """Look up a term after a delay."""
+    time.sleep(delay)
+    return f"resultado {term}"
+
+
+@pytest.fixture
+def executor():
+    """Create a dedicated tool thread pool."""
+    pool = ThreadPoolExecutor(max_workers=4)
+    yield pool
+    pool.shutdown(wait=True)
+
+
+def tool_calls_message(delays):
+    """Build an assistant message calling slow_lookup once per delay."""
+    return AIMessage(content="", tool_calls=[
+        {"name": "slow_lookup", "args": {"term": f"t{i}", "delay": delay}, "id": f"call-{i}"}
+        for i, delay in enumerate(delays)
+    ])
+
+
+def test_tool_calls_run_concurrently_in_call_order(executor) -> None:
+    """Test the step takes as long as the slowest call and keeps the call order."""
+    # Given
+    node = ParallelToolNode([slow_lookup], default_timeout=5, timeouts={}, executor=executor)
+    message = tool_calls_message([0.3, 0.1, 0.2])
+    
+    # When
+    start = time.perf_counter()
+    result = node.invoke({"messages": [message]})
+    elapsed = time.perf_counter() - start
+    
+    # Then
+    assert [m.tool_call_id for m in result["messages"]] == ["call-0", "call-1", "call-2"]
+    assert [m.content for m in result["messages"]] == ["resultado t0", "resultado t1", "resultado t2"]
+    assert elapsed < 0.5
+
+
+def test_slow_tool_call_returns_timeout_error(executor) -> None:
+    """Test a call over its timeout becomes an error message without failing the step."""
+    # Given
+    node = ParallelToolNode([slow_lookup], default_timeout=5, timeouts={"slow_lookup": 0.1}, executor=executor)
+    message = tool_calls_message([0.5])
+    
+    # When
+    result = node.invoke({"messages": [message]})
+    
+    # Then
+    assert result["messages"][0].status == "error"
+    assert "no respondió a tiempo" in result["messages"][0].content
+
+
+def test_parse_tool_timeouts() -> None:
+    """Test per-tool timeout overrides are parsed from settings."""
+    # When
+    timeouts = parse_tool_timeouts("reserve_order=30, calculator=2,")
+    
+    # Then
+    assert timeouts == {"reserve_order": 30.0, "calculator": 2.0}
+
+
+def test_non_cancellable_tool_is_waited_for(executor) -> None:
+    """Test a tool with side effects is not answered with a timeout while it still runs."""
+    # Given a non-cancellable tool slower than its timeout
+    node = ParallelToolNode(
+        [slow_lookup], default_timeout=0.05, timeouts={}, executor=executor, non_cancellable=frozenset({"slow_lookup"})
+    )
+    message = tool_calls_message([0.2])
+
+    # When
+    result = node.invoke({"messages": [message]})
+
+    # Then its real result is returned
+    assert result["messages"][0].content == "resultado t0"
@@ -0,0 +1,67 @@
+"""Unit tests for conversation workflow thread restoration."""
+from langgraph.checkpoint.base import CheckpointTuple
+import pytest
+
+from business_assistant.infrastructure.langgraph.workflows import conversation_workflow
+from business_assistant.infrastructure.langgraph.workflows.conversation_workflow import ConversationWorkflow
+
+
+class RecordingCheckpointer:
+    """Checkpointer double that records latest-checkpoint lookups."""
+
+    def __init__(self, context: dict):
+        self.context = context
+        self.calls = []
+
+    def get_tuple(self, config: dict):
+        self.calls.append(config)
+        checkpoint = {"channel_values": {"context": self.context}}
+        return CheckpointTuple(config=config, checkpoint=checkpoint, metadata={})
+
+
+@pytest.fixture
+def workflow() -> ConversationWorkflow:
+    """Create a workflow without building the graph or connecting to services."""
+    conversation_workflow._thread_state_cache.clear()
+    instance = ConversationWorkflow.__new__(ConversationWorkflow)
+    instance.using_postgres = True
+    instance.shared_state = False
+    instance.checkpointer = RecordingCheckpointer({"last_product": "miel"})
+    return instance
+
+
+def test_restore_reads_latest_checkpoint_by_thread_id(workflow: ConversationWorkflow) -> None:
+    """Test context is restored through a single get_tuple lookup."""
+    # When
+    thread_id, context = workflow._restore_thread_from_checkpointer("+573001234567")
+    
+    # Then
+    assert thread_id == "thread-+573001234567"
+    assert context == {"last_product": "miel"}
+    assert workflow.checkpointer.calls == [{"configurable": {"thread_id": thread_id}}]
+
+
+def test_restore_serves_hot_threads_from_memory(workflow: ConversationWorkflow) -> None:
+    """Test a second restore for the same thread skips the checkpointer."""
+    # Given
+    workflow._restore_thread_from_checkpointer("+573001234567")
+    
+    # When
+    _, context = workflow._restore_thread_from_checkpointer("+573001234567")
+    
+    # Then
+    assert context == {"last_product": "miel"}
+    assert len(workflow.checkpointer.calls) == 1
+
+
+def test_restore_in_shared_mode_always_reads_checkpoint(workflow: ConversationWorkflow) -> None:
+    """Test shared deployment mode never serves context from process memory."""
+    # Given
+    workflow.shared_state = True
+    workflow._restore_thread_from_checkpointer("+573001234567")
+    
+    # When
+    workflow._restore_thread_from_checkpointer("+573001234567")
+    
+    # Then
+    assert len(workflow.checkpointer.calls) == 2
@@ -0,0 +1,70 @@
+"""Unit tests for the batch chat worker pool."""
+import threading
+import time
+from typing import List, Optional, Tuple
+
+from business_assistant.infrastructure.messaging.batch_processor import (
+    STATUS_DONE,
+    STATUS_FAILED,
+    BatchProcessor,
+)
+
+
+class RecordingHandler:
+    """Handler answering after a short delay and recording concurrency."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.calls: List[Tuple[str, str]] = []
+        self.running = 0
+        self.max_running = 0
+
+    def __call__(self, whatsapp_number: str, message: str, business_id: Optional[int]) -> str:
+        with self.lock:
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+        time.sleep(0.01)
+        with self.lock:
+            self.running -= 1
+            self.calls.append((whatsapp_number, message))
+        if message == "error":
+            raise RuntimeError("fallo del agente")
+        return f"respuesta a {message}"
+
+
+def test_batch_runs_each_number_in_order_within_the_worker_bound():
+    # Given a pool of two workers and a batch of three numbers
+    handler = RecordingHandler()
+    processor = BatchProcessor(handler, workers=2, max_jobs=10, job_ttl=60)
+    items = [(f"+5730000000{i % 3}", f"mensaje {i}", None) for i in range(12)]
+
+    # When the batch is submitted and read to the end
+    job = processor.submit(items)
+    results = list(job.iter_results(timeout=5))
+    processor.shutdown()
+
+    # Then every item is answered, at most two at a time, each number in order
+    assert len(results) == 12
+    assert job.status == STATUS_DONE
+    assert handler.max_running <= 2
+    for number in {number for number, _, _ in items}:
+        sent = [message for n, message in handler.calls if n == number]
+        assert sent == [message for n, message, _ in items if n == number]
+
+
+def test_failed_items_are_reported_and_the_rest_continue():
+    # Given a batch whose second message fails
+    processor = BatchProcessor(RecordingHandler(), workers=1, max_jobs=10, job_ttl=60)
+
+    # When it runs
+    job = processor.submit([(number, message, None) for number, message in (
+        ("+573000000001", "hola"), ("+573000000001", "error"), ("+573000000001", "adiós"),
+    )])
+    results = list(job.iter_results(timeout=5))
+    processor.shutdown()
+
+    # Then the failure is recorded and the following message still runs
+    assert [item.status for item in results] == [STATUS_DONE, STATUS_FAILED, STATUS_DONE]
+    assert results[1].error == "fallo del agente"
+    assert (job.completed, job.failed) == (2, 1)
+    assert processor.get(job.job_id) is job
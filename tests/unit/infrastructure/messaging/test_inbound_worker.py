@@ -0,0 +1,159 @@
+"""Unit tests for the inbound message worker pool."""
+from typing import Dict, List, Optional
+
+import pytest
+from langchain_core.language_models.fake_chat_models import FakeMessagesListChatModel
+from langgraph.checkpoint.memory import MemorySaver
+
+from business_assistant.domain.models.inbound_message import InboundMessage
+from business_assistant.infrastructure.langgraph.nodes import conversation_nodes
+from business_assistant.infrastructure.langgraph.workflows import conversation_workflow
+from business_assistant.infrastructure.langgraph.workflows.conversation_workflow import ConversationWorkflow
+from business_assistant.infrastructure.messaging.inbound_worker import (
+    OUTCOME_DEAD,
+    OUTCOME_RETRY,
+    InboundWorkerPool,
+)
+from business_assistant.infrastructure.messaging.outbound import LoggingOutboundSender
+from business_assistant.infrastructure.monitoring.usage_ledger import usage_ledger
+from business_assistant.infrastructure.services.business_registry import DEFAULT_BUSINESS
+
+
+class FakeQueueRepository:
+    """In-memory stand-in for the PostgreSQL queue."""
+
+    def __init__(self, messages: List[InboundMessage]):
+        self.messages = list(messages)
+        self.responses: Dict[int, str] = {}
+        self.completed: List[int] = []
+        self.retries: List[tuple] = []
+        self.dead: List[int] = []
+
+    def claim(self, batch_size: int = 1) -> List[InboundMessage]:
+        claimed, self.messages = self.messages[:batch_size], self.messages[batch_size:]
+        for message in claimed:
+            message.attempts += 1
+        return claimed
+
+    def save_response(self, message_id: int, response: str) -> None:
+        self.responses[message_id] = response
+
+    def complete(self, message_id: int) -> None:
+        self.completed.append(message_id)
+
+    def retry(self, message_id: int, delay_seconds: float, error: str) -> None:
+        self.retries.append((message_id, delay_seconds))
+
+    def dead_letter(self, message_id: int, error: str) -> None:
+        self.dead.append(message_id)
+
+
+class UnavailableChatModel(FakeMessagesListChatModel):
+    """Model double whose provider is down."""
+
+    def bind_tools(self, tools, **kwargs):
+        return self
+
+    def _generate(self, *args, **kwargs):
+        raise ConnectionError("LLM provider unavailable")
+
+
+class FailingSender(LoggingOutboundSender):
+    """Sender whose gateway is down."""
+
+    def send(self, whatsapp_number: str, text: str, message_id: int) -> None:
+        raise ConnectionError("gateway unavailable")
+
+
+@pytest.fixture
+def handled() -> List[str]:
+    return []
+
+
+def make_pool(repository, sender, handled: List[str], max_attempts: int = 3) -> InboundWorkerPool:
+    def handler(whatsapp_number: str, message: str, business_id: Optional[int]) -> str:
+        handled.append(message)
+        return f"respuesta a {message}"
+
+    return InboundWorkerPool(
+        handler, sender, repository=repository, workers=1, max_attempts=max_attempts, retry_backoff=2
+    )
+
+
+def test_run_once_processes_and_delivers_reply(handled: List[str]) -> None:
+    """Test a queued message is answered, stored, delivered and completed."""
+    # Given
+    repository = FakeQueueRepository([InboundMessage(message_id=1, whatsapp_number="+573001112233", body="hola")])
+    sender = LoggingOutboundSender()
+    pool = make_pool(repository, sender, handled)
+    
+    # When
+    processed = pool.run_once()
+    idle = pool.run_once()
+    
+    # Then
+    assert processed and not idle
+    assert repository.responses == {1: "respuesta a hola"}
+    assert sender.sent == [("+573001112233", "respuesta a hola", 1)]
+    assert repository.completed == [1]
+
+
+def test_failed_delivery_is_retried_without_rerunning_the_turn(handled: List[str]) -> None:
+    """Test a stored reply is only re-sent on retry, with exponential backoff."""
+    # Given
+    repository = FakeQueueRepository([])
+    pool = make_pool(repository, FailingSender(), handled)
+    first = InboundMessage(message_id=7, whatsapp_number="+573001112233", body="precio", attempts=1)
+    retried = InboundMessage(
+        message_id=7, whatsapp_number="+573001112233", body="precio", attempts=2, response="respuesta guardada"
+    )
+    
+    # When
+    outcomes = [pool.process(first), pool.process(retried)]
+    
+    # Then
+    assert outcomes == [OUTCOME_RETRY, OUTCOME_RETRY]
+    assert handled == ["precio"]
+    assert repository.retries == [(7, 2), (7, 4)]
+
+
+def test_message_is_dead_lettered_after_max_attempts(handled: List[str]) -> None:
+    """Test a message failing on its last attempt is parked instead of requeued."""
+    # Given
+    repository = FakeQueueRepository([])
+    pool = make_pool(repository, FailingSender(), handled, max_attempts=3)
+    message = InboundMessage(message_id=9, whatsapp_number="+573001112233", body="hola", attempts=3)
+    
+    # When
+    outcome = pool.process(message)
+    
+    # Then
+    assert outcome == OUTCOME_DEAD
+    assert repository.dead == [9]
+    assert repository.retries == []
+
+
+def test_failed_turn_is_retried_instead_of_answered(monkeypatch) -> None:
+    """Test a turn whose model fails is requeued, not answered with an apology."""
+    # Given a worker running the real workflow with a model that raises
+    monkeypatch.setattr(conversation_nodes, "get_business", lambda business_id=None: DEFAULT_BUSINESS)
+    monkeypatch.setattr(conversation_workflow, "get_business", lambda business_id=None: DEFAULT_BUSINESS)
+    monkeypatch.setattr(usage_ledger, "enabled", False)
+    llm = UnavailableChatModel(responses=[])
+    workflow = ConversationWorkflow(llm=llm, small_llm=llm, tools=[], checkpointer=MemorySaver())
+    repository = FakeQueueRepository([])
+    sender = LoggingOutboundSender()
+    pool = InboundWorkerPool(
+        lambda number, text, business_id: workflow.process_message(number, text, business_id, raise_errors=True),
+        sender, repository=repository, workers=1, max_attempts=3, retry_backoff=2,
+    )
+    message = InboundMessage(message_id=5, whatsapp_number="+573001112233", body="¿cuánto cuesta la miel?", attempts=1)
+
+    # When
+    outcome = pool.process(message)
+
+    # Then nothing was stored or sent and the message waits for its retry
+    assert outcome == OUTCOME_RETRY
+    assert repository.responses == {}
+    assert sender.sent == []
+    assert repository.retries == [(5, 2)]
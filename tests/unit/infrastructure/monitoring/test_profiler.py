@@ -0,0 +1,43 @@
+"""Unit tests for the sampling profiler and the allocation tracker."""
+import time
+
+from business_assistant.infrastructure.monitoring.profiler import AllocationTracker, profile_call
+
+
+def busy_loop(seconds: float) -> int:
+    """Spin the CPU for a while."""
+    end = time.perf_counter() + seconds
+    iterations = 0
+    while time.perf_counter() < end:
+        iterations += 1
+    return iterations
+
+
+def test_profile_call_samples_only_the_calling_thread():
+    # Given a function that keeps the CPU busy
+    # When it runs under the profiler
+    iterations, profile = profile_call(busy_loop, 0.2, interval=0.002)
+
+    # Then the result is returned and the samples land in the function
+    assert iterations > 0
+    assert profile.samples > 10
+    assert profile.top_frames(1)[0]["frame"] == "test_profiler.py:busy_loop"
+    assert all(line.split(";")[0] == "MainThread" for line in profile.collapsed().splitlines())
+
+
+def test_snapshot_attributes_growth_to_components():
+    # Given allocation tracing with this test module as a component
+    tracker = AllocationTracker({"tests": ("*/test_profiler.py",), "other": ("*/nowhere/*",)})
+    tracker.start(frames=5)
+    try:
+        # When memory is allocated between snapshots
+        retained = [bytearray(1024) for _ in range(1000)]
+        diff = tracker.snapshot()
+    finally:
+        tracker.stop()
+
+    # Then the growth is attributed to the component that allocated it
+    assert diff["components"]["tests"]["diff_kb"] >= 1000
+    assert diff["components"]["other"]["size_kb"] == 0
+    assert diff["top_lines"][0]["component"] == "tests"
+    assert len(retained) == 1000
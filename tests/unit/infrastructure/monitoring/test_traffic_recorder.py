@@ -0,0 +1,95 @@
+"""Unit tests for traffic capture and deterministic replay."""
+import pytest
+from langchain_core.language_models.fake_chat_models import FakeMessagesListChatModel
+from langchain_core.messages import AIMessage
+from langchain_core.tools import tool
+from langgraph.checkpoint.memory import MemorySaver
+
+from business_assistant.infrastructure.services.business_registry import DEFAULT_BUSINESS
+from business_assistant.infrastructure.langgraph.nodes import conversation_nodes
+from business_assistant.infrastructure.langgraph.workflows import conversation_workflow
+from business_assistant.infrastructure.langgraph.workflows.conversation_workflow import ConversationWorkflow
+from business_assistant.infrastructure.monitoring.traffic_recorder import (
+    TrafficRecorder,
+    read_traffic,
+    scrub_text,
+)
+from business_assistant.infrastructure.monitoring.traffic_replay import (
+    RecordedChatModel,
+    TrafficRecording,
+    recorded_tools,
+    replay_turns,
+)
+from business_assistant.infrastructure.monitoring.usage_ledger import usage_ledger
+
+
+class ScriptedChatModel(FakeMessagesListChatModel):
+    """Model double that accepts the agent's tools."""
+
+    def bind_tools(self, tools, **kwargs):
+        return self
+
+
+@tool
+def search_catalog(search_terms: list) -> str:
+    """Search the catalog."""
+    return '[{"search_term": "miel", "variants": [{"variant_id": 12, "price": "18000"}]}]'
+
+
+@pytest.fixture(autouse=True)
+def offline(monkeypatch):
+    """Serve the default business without a database and skip the usage ledger."""
+    monkeypatch.setattr(conversation_nodes, "get_business", lambda business_id=None: DEFAULT_BUSINESS)
+    monkeypatch.setattr(conversation_workflow, "get_business", lambda business_id=None: DEFAULT_BUSINESS)
+    monkeypatch.setattr(usage_ledger, "enabled", False)
+
+
+def test_scrub_removes_contact_data_but_keeps_prices():
+    # Given a message with an email, a phone number and a price
+    text = "Soy ana@correo.com, mi cel es +57 300 123 4567 y pago $18.000"
+
+    # When it is scrubbed
+    scrubbed = scrub_text(text)
+
+    # Then contact data is replaced and the price is kept
+    assert scrubbed == "Soy <email>, mi cel es <numero> y pago $18.000"
+
+
+def test_captured_turn_replays_to_the_same_answer(tmp_path):
+    # Given a workflow whose model searches the catalog and then answers
+    llm = ScriptedChatModel(responses=[
+        AIMessage(content="", tool_calls=[{"name": "search_catalog", "args": {"search_terms": ["miel"]}, "id": "c1"}]),
+        AIMessage(content="Tenemos miel a $18.000"),
+    ])
+    workflow = ConversationWorkflow(llm=llm, small_llm=llm, tools=[search_catalog], checkpointer=MemorySaver())
+    recorder = TrafficRecorder(enabled=True, directory=str(tmp_path), sample_rate=1.0, salt="test")
+
+    # When a turn is captured and written
+    capture = recorder.capture("573001234567", "¿tienen miel? mi correo es ana@correo.com", None)
+    answer = workflow.process_message("573001234567", "¿tienen miel? mi correo es ana@correo.com", callbacks=[capture])
+    recorder.record(capture, answer)
+    assert recorder.flush() == 1
+    turns = list(read_traffic([str(tmp_path)]))
+
+    # Then the log holds the anonymized turn with its model and tool events
+    assert answer == "Tenemos miel a $18.000"
+    assert turns[0]["user"].startswith("anon-") and "573001234567" not in str(turns[0])
+    assert "<email>" in turns[0]["text"]
+    assert [event["type"] for event in turns[0]["events"]] == ["llm", "tool", "llm"]
+
+    # When the log is replayed through a workflow with the recorded doubles
+    recording = TrafficRecording(turns, speed=0)
+    replayed_llm = RecordedChatModel(recording=recording)
+    replay_workflow = ConversationWorkflow(
+        llm=replayed_llm, small_llm=replayed_llm, tools=recorded_tools(recording), checkpointer=MemorySaver()
+    )
+    answers = []
+    report = replay_turns(
+        turns,
+        lambda number, text, business_id: answers.append(replay_workflow.process_message(number, text, business_id)),
+        recording,
+    )
+
+    # Then the same answer is produced without diverging from the capture
+    assert answers == ["Tenemos miel a $18.000"]
+    assert report.turns == 1 and report.errors == 0 and report.missing_events == 0
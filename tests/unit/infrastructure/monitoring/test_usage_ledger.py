@@ -0,0 +1,93 @@
+"""Unit tests for the per-turn usage ledger."""
+from decimal import Decimal
+
+from langchain_core.messages import AIMessage, HumanMessage, ToolMessage
+
+from business_assistant.domain.models.usage import TurnUsage
+from business_assistant.infrastructure.monitoring.usage_ledger import UsageLedger, build_turn_usage, parse_llm_prices
+
+
+class FakeUsageRepository:
+    """Ledger repository double recording each insert."""
+
+    def __init__(self, failures: int = 0):
+        self.batches = []
+        self.failures = failures
+
+    def insert_many(self, usages):
+        if self.failures:
+            self.failures -= 1
+            raise ConnectionError("database unavailable")
+        self.batches.append(list(usages))
+
+
+def _llm_message(model, input_tokens, output_tokens, cached=0, tool_calls=None) -> AIMessage:
+    return AIMessage(
+        content="" if tool_calls else "Listo",
+        tool_calls=tool_calls or [],
+        usage_metadata={
+            "input_tokens": input_tokens,
+            "output_tokens": output_tokens,
+            "total_tokens": input_tokens + output_tokens,
+            "input_token_details": {"cache_read": cached},
+        },
+        response_metadata={"model_name": model},
+    )
+
+
+def test_parse_llm_prices_accepts_model_names_with_colons() -> None:
+    """Test prices are parsed with an optional cached price."""
+    prices = parse_llm_prices("openai/gpt-4o-mini=0.15:0.6:0.075, meta-llama/llama-3:free=0:0")
+    
+    assert prices["openai/gpt-4o-mini"].cached == Decimal("0.075")
+    assert prices["meta-llama/llama-3:free"].input == Decimal("0")
+    assert prices["meta-llama/llama-3:free"].cached == Decimal("0")
+
+
+def test_turn_usage_sums_calls_tools_and_cost() -> None:
+    """Test every model call of a turn is counted and priced with its own model."""
+    # Given
+    prices = parse_llm_prices("big=10:30:1,*=1:2")
+    search = {"name": "search_available_variant_products", "args": {}, "id": "call_1"}
+    quote = {"name": "quote_order", "args": {}, "id": "call_2"}
+    messages = [
+        HumanMessage(content="¿Tienen miel?"),
+        _llm_message("big", 1000, 100, cached=800, tool_calls=[search, dict(search, id="call_3"), quote]),
+        ToolMessage(content="[]", tool_call_id="call_1"),
+        _llm_message("fallback", 2000, 50),
+    ]
+    
+    # When
+    usage = build_turn_usage(messages, "agent", "thread-+573001112233", 1.25, business_id=7, prices=prices)
+    
+    # Then
+    assert usage.llm_calls == 2
+    assert (usage.prompt_tokens, usage.completion_tokens, usage.cached_tokens) == (3000, 150, 800)
+    assert usage.tool_calls == {"search_available_variant_products": 2, "quote_order": 1}
+    assert usage.model == "fallback"
+    assert usage.wall_ms == 1250
+    # big: 200*10 + 800*1 + 100*30; fallback at the "*" price: 2000*1 + 50*2
+    assert usage.cost == Decimal(2000 + 800 + 3000 + 2000 + 100) / 1_000_000
+
+
+def test_ledger_writes_in_batches_and_keeps_rows_on_failure() -> None:
+    """Test buffered turns are inserted in batches and retried after a failed flush."""
+    # Given
+    repository = FakeUsageRepository(failures=1)
+    ledger = UsageLedger(repository, enabled=True, batch_size=2, flush_interval=3600, max_buffer=10)
+    ledger._ensure_started = lambda: None
+    for index in range(3):
+        ledger.record(TurnUsage(thread_id=f"thread-{index}", route="agent"))
+    
+    # When
+    first = ledger.flush()
+    second = ledger.flush()
+    
+    # Then
+    assert first == 0
+    assert second == 3
+    assert [[usage.thread_id for usage in batch] for batch in repository.batches] == [
+        ["thread-0", "thread-1"],
+        ["thread-2"],
+    ]
+    assert ledger.pending == 0
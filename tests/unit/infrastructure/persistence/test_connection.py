@@ -0,0 +1,55 @@
+"""Unit tests for the blocking database connection pool."""
+import threading
+import time
+
+import psycopg2.pool
+import pytest
+from psycopg2 import extensions
+from psycopg2.pool import PoolError
+
+from business_assistant.infrastructure.persistence.connection import BlockingConnectionPool
+
+
+class FakeConnection:
+    """Idle psycopg2 connection double."""
+
+    class info:
+        transaction_status = extensions.TRANSACTION_STATUS_IDLE
+
+    closed = False
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture(autouse=True)
+def fake_connect(monkeypatch) -> None:
+    """Open fake connections instead of connecting to PostgreSQL."""
+    monkeypatch.setattr(psycopg2.pool.psycopg2, "connect", lambda *args, **kwargs: FakeConnection())
+
+
+def test_getconn_waits_for_a_returned_connection() -> None:
+    """Test a thread over maxconn waits for a connection instead of failing."""
+    # Given a pool with every connection in use
+    pool = BlockingConnectionPool(1, 2, timeout=5)
+    held = [pool.getconn(), pool.getconn()]
+
+    # When one connection is returned while another thread waits
+    threading.Timer(0.05, pool.putconn, args=(held[0],)).start()
+    start = time.perf_counter()
+    connection = pool.getconn()
+
+    # Then the waiting thread gets it
+    assert connection is not None
+    assert time.perf_counter() - start >= 0.04
+
+
+def test_getconn_times_out() -> None:
+    """Test waiting for a connection is bounded."""
+    # Given a pool with its only connection in use
+    pool = BlockingConnectionPool(1, 1, timeout=0.05)
+    pool.getconn()
+
+    # When / Then
+    with pytest.raises(PoolError):
+        pool.getconn()
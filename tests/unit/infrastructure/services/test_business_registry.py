@@ -0,0 +1,61 @@
+"""Unit tests for the business registry."""
+import pytest
+
+from business_assistant.domain.exceptions import BusinessNotFoundError
+from business_assistant.domain.models.business import Business
+from business_assistant.infrastructure.services import business_registry
+from business_assistant.infrastructure.services.business_registry import (
+    DEFAULT_BUSINESS,
+    get_business,
+    tenant_user_key,
+)
+
+
+class FakeBusinessRepository:
+    """Repository double with a single registered business."""
+
+    loads = 0
+
+    def get_business(self, business_id):
+        FakeBusinessRepository.loads += 1
+        if business_id == 7:
+            return Business(business_id=7, slug="panaderia", name="Panadería La Espiga")
+        raise BusinessNotFoundError(business_id)
+
+
+@pytest.fixture(autouse=True)
+def repository(monkeypatch):
+    """Back the registry with the fake repository and an empty cache."""
+    FakeBusinessRepository.loads = 0
+    monkeypatch.setattr(business_registry, "PostgresBusinessRepository", FakeBusinessRepository)
+    business_registry._businesses.clear()
+
+
+def test_business_is_loaded_once_and_cached() -> None:
+    """Test repeated turns of a tenant reuse the cached profile."""
+    # When
+    first = get_business(7)
+    second = get_business(7)
+    
+    # Then
+    assert first is second
+    assert first.name == "Panadería La Espiga"
+    assert FakeBusinessRepository.loads == 1
+
+
+def test_unknown_business_raises_but_default_falls_back() -> None:
+    """Test unknown tenants are rejected while the default business always resolves."""
+    # When
+    default = get_business()
+    
+    # Then
+    assert default is DEFAULT_BUSINESS
+    with pytest.raises(BusinessNotFoundError):
+        get_business(99)
+
+
+def test_tenant_user_key_keeps_default_business_threads() -> None:
+    """Test the same number gets separate sessions per business, keeping legacy keys."""
+    assert tenant_user_key("+573001112233") == "+573001112233"
+    assert tenant_user_key("+573001112233", 1) == "+573001112233"
+    assert tenant_user_key("+573001112233", 7) == "7:+573001112233"
@@ -0,0 +1,93 @@
+"""Unit tests for the in-memory catalog search index."""
+from datetime import date, datetime
+from decimal import Decimal
+
+import pytest
+
+from business_assistant.infrastructure.services.catalog_index import CatalogIndex, REFRESH_OVERLAP, tokenize
+
+
+def _row(variant_id, product_name, variant_name, quantity=10, active=True, updated_at=datetime(2025, 12, 1)):
+    return {
+        "variant_id": variant_id,
+        "variant_name": variant_name,
+        "sku": f"SKU-{variant_id}",
+        "price": Decimal("25000.00"),
+        "active": active,
+        "product_id": variant_id * 10,
+        "product_name": product_name,
+        "product_description": None,
+        "category_name": "Alimentos",
+        "quantity": quantity,
+        "next_expiration_date": date(2026, 12, 31),
+        "updated_at": updated_at,
+    }
+
+
+class FakeLoader:
+    """Catalog loader double returning the rows changed since a timestamp."""
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.calls = []
+
+    def __call__(self, business_id, changed_since):
+        self.calls.append(changed_since)
+        return [row for row in self.rows if changed_since is None or row["updated_at"] > changed_since]
+
+
+@pytest.fixture
+def index() -> CatalogIndex:
+    """Create an index over a small catalog."""
+    catalog = CatalogIndex(1, FakeLoader([
+        _row(1, "Miel de abejas", "Miel 300g"),
+        _row(2, "Café de Casanare", "Café molido 500g", quantity=0),
+        _row(3, "Nuez de Brasil", "Nuez 200g"),
+        _row(4, "Postre de natas", "Postre individual"),
+        _row(5, "Café de Casanare", "Café en grano 500g", updated_at=datetime(2026, 1, 1)),
+    ]))
+    catalog.refresh()
+    return catalog
+
+
+def test_singular_and_plural_share_terms() -> None:
+    """Test the Spanish number variants of a word normalize to the same term."""
+    for singular, plural in [("miel", "mieles"), ("nuez", "nueces"), ("postre", "postres"), ("café", "cafés"), ("queso", "quesos")]:
+        assert tokenize(singular) == tokenize(plural)
+    assert tokenize("Café de Casanare") == tokenize("cafe casanare")
+
+
+@pytest.mark.parametrize("query, variant_ids", [
+    ("mieles", [1]),
+    ("nueces", [3]),
+    ("postres", [4]),
+    ("cafe", [5, 2]),
+    ("CAFÉS en grano", [5]),
+    ("meil", [1]),
+    ("casnare", [5, 2]),
+])
+def test_search_resolves_plurals_accents_and_typos(index: CatalogIndex, query, variant_ids) -> None:
+    """Test searches that used to need a retry find the product at the first attempt."""
+    results = index.search(query)
+    
+    # In-stock variants rank before sold-out ones with the same score
+    assert [result["variant_id"] for result in results] == variant_ids
+
+
+def test_incremental_refresh_reindexes_changed_variants(index: CatalogIndex) -> None:
+    """Test only recently changed variants are loaded and deactivated ones leave the index."""
+    # Given
+    loader = index._loader
+    changed_at = datetime(2026, 1, 2)
+    loader.rows[0] = _row(1, "Miel de abejas", "Miel 300g", active=False, updated_at=changed_at)
+    loader.rows.append(_row(6, "Panela orgánica", "Panela 1kg", updated_at=changed_at))
+    
+    # When
+    loaded = index.refresh()
+    
+    # Then the two changes are loaded, plus the last change of the previous refresh
+    assert loaded == 3
+    assert loader.calls[-1] == datetime(2026, 1, 1) - REFRESH_OVERLAP
+    assert index.search("miel") == []
+    assert [result["variant_id"] for result in index.search("panelas")] == [6]
+    assert index.size == 5
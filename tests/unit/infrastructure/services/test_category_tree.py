@@ -0,0 +1,108 @@
+"""Unit tests for the in-memory category tree."""
+import pytest
+
+from business_assistant.domain.exceptions import CategoryNotFoundError
+from business_assistant.infrastructure.services import category_tree
+from business_assistant.infrastructure.services.category_tree import (
+    CategoryTree,
+    get_category_tree,
+    invalidate_category_tree,
+)
+
+# Parents before children, as the recursive query returns them
+ROWS = [
+    {"category_id": 1, "parent_id": None, "name": "Alimentos", "description": None, "depth": 0, "product_count": 1},
+    {"category_id": 2, "parent_id": 1, "name": "Lácteos", "description": None, "depth": 1, "product_count": 3},
+    {"category_id": 3, "parent_id": 2, "name": "Quesos frescos", "description": None, "depth": 2, "product_count": 2},
+    {"category_id": 4, "parent_id": 1, "name": "Endulzantes", "description": None, "depth": 1, "product_count": 4},
+    {"category_id": 5, "parent_id": None, "name": "Bebidas", "description": None, "depth": 0, "product_count": 5},
+]
+
+
+class CountingRepository:
+    """Category repository double counting tree loads."""
+
+    def __init__(self):
+        self.loads = 0
+
+    def get_tree_rows(self, business_id):
+        self.loads += 1
+        return ROWS
+
+
+@pytest.fixture
+def tree() -> CategoryTree:
+    """Create the tree of a small catalog."""
+    return CategoryTree(1, ROWS)
+
+
+def test_subtree_ids_and_counts_cover_every_level(tree: CategoryTree) -> None:
+    """Test a subtree includes the category and all its descendants."""
+    # Given the Alimentos tree, three levels deep
+    # When resolving its subtree
+    ids = tree.subtree_ids(1)
+
+    # Then every descendant is included, and counts add up over them
+    assert ids[0] == 1 and sorted(ids) == [1, 2, 3, 4]
+    assert tree.subtree_product_count(1) == 10
+    assert tree.subtree_product_count(2) == 5
+
+
+def test_children_are_sorted_and_path_runs_from_root(tree: CategoryTree) -> None:
+    """Test browsing returns sorted subcategories and breadcrumbs."""
+    # Given / When / Then
+    assert [c.name for c in tree.children()] == ["Alimentos", "Bebidas"]
+    assert [c.name for c in tree.children(1)] == ["Endulzantes", "Lácteos"]
+    assert [c.category_id for c in tree.path(3)] == [1, 2, 3]
+    assert tree.is_descendant(3, 1) and not tree.is_descendant(1, 3)
+
+
+@pytest.mark.parametrize("name, category_id", [
+    ("alimento", 1),
+    ("LACTEOS", 2),
+    ("quesos", 3),
+    ("queso fresco", 3),
+])
+def test_find_ignores_case_accents_and_number(tree: CategoryTree, name: str, category_id: int) -> None:
+    """Test categories are found with the customer's words."""
+    # Given / When / Then
+    assert tree.find(name).category_id == category_id
+
+
+def test_unknown_category(tree: CategoryTree) -> None:
+    """Test unknown names and ids are reported."""
+    # Given / When / Then
+    assert tree.find("ferretería") is None
+    with pytest.raises(CategoryNotFoundError):
+        tree.subtree_ids(99)
+
+
+def test_to_dict_limits_depth(tree: CategoryTree) -> None:
+    """Test the browse representation stops at the requested depth."""
+    # Given / When
+    node = tree.to_dict(1, depth=1)
+
+    # Then
+    assert [child["name"] for child in node["subcategories"]] == ["Endulzantes", "Lácteos"]
+    assert "subcategories" not in node["subcategories"][1]
+    assert node["subcategories"][1]["product_count"] == 5
+
+
+def test_tree_is_cached_until_invalidated(monkeypatch) -> None:
+    """Test the tree is loaded once and reloaded after an edit."""
+    # Given a repository counting loads
+    repository = CountingRepository()
+    monkeypatch.setattr(category_tree, "PostgresCategoryRepository", lambda: repository)
+    invalidate_category_tree(42)
+
+    # When the tree is used twice, invalidated, and used again
+    get_category_tree(42)
+    get_category_tree(42)
+    loads_before_edit = repository.loads
+    invalidate_category_tree(42)
+    get_category_tree(42)
+
+    # Then it was loaded once before the edit and once after
+    assert loads_before_edit == 1
+    assert repository.loads == 2
+    invalidate_category_tree(42)
@@ -0,0 +1,71 @@
+"""Unit tests for the workflow registry of the conversation manager."""
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from business_assistant.infrastructure.cache import LRUCache
+from business_assistant.infrastructure.services import conversation_manager
+from business_assistant.infrastructure.services.conversation_manager import ConversationManager
+
+
+class FakeWorkflow:
+    """Workflow double recording whether it was closed."""
+
+    def __init__(self):
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+class SlowWorkflow(FakeWorkflow):
+    """Workflow double taking a while to build, counting the builds."""
+
+    builds = 0
+    builds_lock = threading.Lock()
+
+    def __init__(self):
+        super().__init__()
+        with SlowWorkflow.builds_lock:
+            SlowWorkflow.builds += 1
+        time.sleep(0.05)
+
+
+def test_evicted_workflows_are_closed(monkeypatch) -> None:
+    """Test a workflow pushed out of the registry releases its resources."""
+    # Given a per-user registry holding a single workflow
+    manager = ConversationManager()
+    monkeypatch.setattr(manager, "shared_state", False)
+    monkeypatch.setattr(manager, "workflow_factory", FakeWorkflow)
+    monkeypatch.setattr(manager, "_workflows", LRUCache(
+        capacity=1, name="workflows_test", on_evict=conversation_manager._close_evicted_workflow,
+    ))
+    first = manager.get_workflow("+573001111111")
+
+    # When another user needs a workflow
+    second = manager.get_workflow("+573002222222")
+
+    # Then the least recently used workflow was closed and the new one is open
+    assert first.closed
+    assert not second.closed
+
+
+def test_concurrent_first_turns_share_one_workflow(monkeypatch) -> None:
+    """Test two first turns of the same user do not build competing workflows."""
+    # Given an empty per-user registry
+    manager = ConversationManager()
+    monkeypatch.setattr(manager, "shared_state", False)
+    monkeypatch.setattr(manager, "workflow_factory", SlowWorkflow)
+    monkeypatch.setattr(SlowWorkflow, "builds", 0)
+    monkeypatch.setattr(manager, "_workflows", LRUCache(
+        capacity=10, name="workflows_test", on_evict=conversation_manager._close_evicted_workflow,
+    ))
+
+    # When the user's first two messages are served at the same time
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        workflows = list(executor.map(lambda _: manager.get_workflow("+573001111111"), range(2)))
+
+    # Then a single workflow was built and neither turn got a closed one
+    assert SlowWorkflow.builds == 1
+    assert workflows[0] is workflows[1]
+    assert not workflows[0].closed
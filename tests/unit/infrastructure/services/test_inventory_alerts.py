@@ -0,0 +1,224 @@
+"""Unit tests for the incremental inventory alert engine."""
+from contextlib import contextmanager
+from datetime import date, datetime, timedelta
+
+import pytest
+
+from business_assistant.domain.models.business import Business
+from business_assistant.domain.models.inventory_alert import ALERT_EXPIRING, ALERT_LOW_STOCK
+from business_assistant.infrastructure.messaging.alert_notifier import LoggingAlertNotifier
+from business_assistant.infrastructure.services import inventory_alerts
+from business_assistant.infrastructure.services.inventory_alerts import InventoryAlertEngine, WATERMARK_OVERLAP
+
+TODAY = date(2026, 3, 2)
+NOW = datetime(2026, 3, 2, 8, 0)
+
+
+class FakeAlertRepository:
+    """In-memory alert repository recording the watermarks it is queried with."""
+
+    def __init__(self, variants, lots):
+        self.variants = variants
+        self.lots = lots
+        self.alerts = {}
+        self.notified = set()
+        self.runs = []
+        self.calls = []
+        self.locked = False
+
+    @contextmanager
+    def run_lock(self):
+        acquired = not self.locked
+        self.locked = True
+        try:
+            yield acquired
+        finally:
+            if acquired:
+                self.locked = False
+
+    def get_last_run(self):
+        last = self.runs[-1] if self.runs else None
+        return {
+            "now": NOW,
+            "today": TODAY,
+            "started_at": last["started_at"] if last else None,
+            "run_date": last["run_date"] if last else None,
+            "horizon": last["horizon"] if last else None,
+        }
+
+    def changed_variant_stock(self, changed_since, expired_since):
+        self.calls.append(("stock", changed_since))
+        return [row for row in self.variants if changed_since is None or row["updated_at"] > changed_since]
+
+    def expiring_lots(self, horizon, previous_horizon, changed_since):
+        self.calls.append(("lots", changed_since))
+        return [
+            row for row in self.lots
+            if row["expiration_date"] <= horizon
+            and (previous_horizon is None or row["expiration_date"] > previous_horizon
+                 or (changed_since is not None and row["updated_at"] > changed_since))
+        ]
+
+    def open_alerts(self, alerts):
+        for alert in alerts:
+            self.alerts.setdefault(alert.key, alert)
+
+    def resolve_alerts(self, restocked_variant_ids):
+        keys = [(ALERT_LOW_STOCK, variant_id) for variant_id in restocked_variant_ids if (ALERT_LOW_STOCK, variant_id) in self.alerts]
+        for key in keys:
+            del self.alerts[key]
+            self.notified.discard(key)
+        return len(keys)
+
+    def pending_alerts(self):
+        return [alert for key, alert in self.alerts.items() if key not in self.notified]
+
+    def mark_notified(self, keys):
+        self.notified.update(keys)
+
+    def save_run(self, report, run_date, horizon):
+        self.runs.append({"started_at": report.started_at, "run_date": run_date, "horizon": horizon})
+
+
+class FailingNotifier(LoggingAlertNotifier):
+    """Notifier failing its first delivery."""
+
+    def __init__(self):
+        super().__init__()
+        self.failures = 1
+
+    def notify(self, business, alerts):
+        if self.failures:
+            self.failures -= 1
+            raise ConnectionError("WhatsApp API unavailable")
+        super().notify(business, alerts)
+
+
+def _variant(variant_id, quantity, updated_at=NOW - timedelta(days=3)):
+    return {
+        "business_id": 1,
+        "product_id": variant_id * 10,
+        "product_name": "Miel de abejas",
+        "variant_id": variant_id,
+        "variant_name": f"Miel {variant_id}00g",
+        "sku": f"MIEL-{variant_id}",
+        "quantity": quantity,
+        "updated_at": updated_at,
+    }
+
+
+def _lot(inventory_id, expiration_date, updated_at=NOW - timedelta(days=3)):
+    return {
+        "business_id": 1,
+        "product_id": 20,
+        "product_name": "Queso campesino",
+        "variant_id": 2,
+        "variant_name": None,
+        "sku": None,
+        "inventory_id": inventory_id,
+        "quantity": 4,
+        "expiration_date": expiration_date,
+        "updated_at": updated_at,
+    }
+
+
+@pytest.fixture(autouse=True)
+def business(monkeypatch) -> None:
+    """Resolve every business to the same test business."""
+    monkeypatch.setattr(
+        inventory_alerts, "get_business",
+        lambda business_id: Business(business_id=business_id, slug="tienda", name="Tienda Test", phone="+573001234567"),
+    )
+
+
+@pytest.fixture
+def repository() -> FakeAlertRepository:
+    """Create a repository with one low variant, one stocked variant and two lots."""
+    return FakeAlertRepository(
+        variants=[_variant(1, 2), _variant(3, 40)],
+        lots=[_lot(7, TODAY + timedelta(days=3)), _lot(8, TODAY + timedelta(days=30))],
+    )
+
+
+def test_first_run_scans_everything_and_notifies(repository) -> None:
+    """Test the first run reads every row and sends one message per business."""
+    # Given an engine that never ran
+    notifier = LoggingAlertNotifier()
+    engine = InventoryAlertEngine(repository, notifier, low_stock_threshold=5, expiration_days=7)
+
+    # When it runs
+    report = engine.run()
+
+    # Then it is a full scan alerting on the low variant and the lot inside the window
+    assert report.full_scan
+    assert report.rows_scanned == 3
+    assert report.alerts_emitted == 2
+    assert set(repository.alerts) == {(ALERT_LOW_STOCK, 1), (ALERT_EXPIRING, 7)}
+    assert len(notifier.sent) == 1
+    assert "Stock bajo" in notifier.sent[0][1] and "Próximos a vencer" in notifier.sent[0][1]
+
+
+def test_next_run_reads_only_changes_and_does_not_repeat(repository) -> None:
+    """Test a later run starts from the watermark and skips open alerts."""
+    # Given an engine that already notified its alerts
+    notifier = LoggingAlertNotifier()
+    engine = InventoryAlertEngine(repository, notifier, low_stock_threshold=5, expiration_days=7)
+    engine.run()
+
+    # When it runs again with nothing changed
+    report = engine.run()
+
+    # Then it reads rows changed after the overlapped watermark and notifies nothing
+    assert not report.full_scan
+    assert repository.calls[-1] == ("lots", NOW - WATERMARK_OVERLAP)
+    assert report.rows_scanned == 0
+    assert report.alerts_emitted == 0
+    assert len(notifier.sent) == 1
+
+
+def test_restock_resolves_alert(repository) -> None:
+    """Test a restocked variant closes its alert so a new shortage is notified again."""
+    # Given a notified low-stock alert
+    engine = InventoryAlertEngine(repository, LoggingAlertNotifier(), low_stock_threshold=5, expiration_days=7)
+    engine.run()
+
+    # When the variant is restocked
+    repository.variants[0].update(quantity=20, updated_at=NOW)
+    report = engine.run()
+
+    # Then the alert is resolved
+    assert report.alerts_resolved == 1
+    assert (ALERT_LOW_STOCK, 1) not in repository.alerts
+
+
+def test_failed_notification_is_retried(repository) -> None:
+    """Test alerts whose notification failed are sent by the next run."""
+    # Given a notifier failing its first delivery
+    notifier = FailingNotifier()
+    engine = InventoryAlertEngine(repository, notifier, low_stock_threshold=5, expiration_days=7)
+
+    # When the engine runs twice
+    first = engine.run()
+    second = engine.run()
+
+    # Then the alerts stay pending after the failure and are delivered next
+    assert first.alerts_emitted == 0
+    assert second.alerts_emitted == 2
+    assert len(notifier.sent) == 1
+
+
+def test_run_is_skipped_while_another_replica_holds_the_lock(repository) -> None:
+    """Test two replicas do not notify the same alerts."""
+    # Given a replica running the engine
+    notifier = LoggingAlertNotifier()
+    engine = InventoryAlertEngine(repository, notifier, low_stock_threshold=5, expiration_days=7)
+
+    # When another replica runs it in the meantime
+    with repository.run_lock():
+        skipped = engine.run()
+
+    # Then that run does nothing, and the next one notifies once
+    assert skipped is None
+    assert repository.runs == [] and notifier.sent == []
+    assert engine.run().alerts_emitted == 2
+    assert len(notifier.sent) == 1
@@ -0,0 +1,59 @@
+"""Unit tests for the decimal arithmetic engine."""
+from decimal import Decimal
+
+import pytest
+
+from business_assistant.infrastructure.tools.arithmetic import ArithmeticEngine, ExpressionError
+
+
+@pytest.fixture
+def engine() -> ArithmeticEngine:
+    """Create an engine with its own expression cache."""
+    return ArithmeticEngine(cache_size=8)
+
+
+@pytest.mark.parametrize("expression,expected", [
+    ("0.1 + 0.2 * 10", Decimal("2")),
+    ("$12.500 * 3", Decimal("38")),
+    ("10 / 4", Decimal("3")),
+    ("2 ** 10 - 24", Decimal("1000")),
+    ("descuento(50000, 15)", Decimal("42500")),
+    ("iva(10000)", Decimal("1900")),
+    ("con_iva(10000, 5)", Decimal("10500")),
+    ("total_linea(12000, 3, 10)", Decimal("32400")),
+])
+def test_evaluate_rounds_to_whole_pesos(engine: ArithmeticEngine, expression: str, expected: Decimal) -> None:
+    """Test expressions evaluate in Decimal and round half up to COP units."""
+    # When
+    result = engine.evaluate(expression)
+    
+    # Then
+    assert result == expected
+
+
+@pytest.mark.parametrize("expression", [
+    "__import__('os').system('ls')",
+    "(1).real",
+    "9 ** 9 ** 9",
+    "2 ** 11",
+    "10 ** 14 * 100",
+    "1 / 0",
+    "descuento(1)",
+    "+".join(["1"] * 100),
+    "",
+])
+def test_evaluate_rejects_unsafe_or_oversized_expressions(engine: ArithmeticEngine, expression: str) -> None:
+    """Test non-whitelisted syntax and limit violations raise ExpressionError."""
+    # When / Then
+    with pytest.raises(ExpressionError):
+        engine.evaluate(expression)
+
+
+def test_compile_reuses_cached_program(engine: ArithmeticEngine) -> None:
+    """Test a repeated expression is compiled only once."""
+    # When
+    first = engine.compile("  12000 * 2 ")
+    second = engine.compile("12000 * 2")
+    
+    # Then
+    assert first is second
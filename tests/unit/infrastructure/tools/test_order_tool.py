@@ -0,0 +1,120 @@
+"""Unit tests for the order reservation tool."""
+import json
+from decimal import Decimal
+
+import pytest
+
+from business_assistant.domain.exceptions import InsufficientStockError
+from business_assistant.domain.models.business import Business
+from business_assistant.domain.models.order import Order, OrderLine
+from business_assistant.infrastructure.services.business_registry import DEFAULT_BUSINESS
+from business_assistant.infrastructure.tools import order_tool
+from business_assistant.infrastructure.tools.order_tool import ReserveOrderTool
+
+
+class FakeOrderRepository:
+    """Repository double that reserves from a fixed stock."""
+
+    stock = 3
+
+    def reserve_order(self, whatsapp_number, items, business_id=1):
+        item = items[0]
+        if item.quantity > self.stock:
+            raise InsufficientStockError(item.variant_id, item.quantity, self.stock)
+        line = OrderLine(item.variant_id, "Miel 500g", 7, item.quantity, Decimal("12000.00"))
+        return Order(order_id=42, whatsapp_number=whatsapp_number, status="reserved", lines=[line])
+
+
+@pytest.fixture
+def tool(monkeypatch) -> ReserveOrderTool:
+    """Create the tool backed by the fake repository."""
+    monkeypatch.setattr(order_tool, "PostgresOrderRepository", FakeOrderRepository)
+    return ReserveOrderTool()
+
+
+def test_reserve_order_returns_order_for_config_user(tool: ReserveOrderTool) -> None:
+    """Test the order is reserved for the user in the runnable config."""
+    # Given
+    config = {"configurable": {"user_id": "+573001234567"}}
+    
+    # When
+    result = json.loads(tool.invoke({"items": [{"variant_id": 5, "quantity": 2}]}, config=config))
+    
+    # Then
+    assert result["order_id"] == 42
+    assert result["whatsapp_number"] == "+573001234567"
+    assert result["total"] == "24000.00"
+
+
+def test_reserve_order_reports_insufficient_stock(tool: ReserveOrderTool) -> None:
+    """Test a stock shortage is returned as a message instead of raising."""
+    # Given
+    config = {"configurable": {"user_id": "+573001234567"}}
+    
+    # When
+    result = tool.invoke({"items": [{"variant_id": 5, "quantity": 10}]}, config=config)
+    
+    # Then
+    assert result.startswith("Error al reservar el pedido")
+    assert "disponibles 3" in result
+
+
+def test_reserve_order_requires_user(tool: ReserveOrderTool) -> None:
+    """Test the tool refuses to reserve without a customer."""
+    # When
+    result = tool.invoke({"items": [{"variant_id": 5, "quantity": 1}]})
+    
+    # Then
+    assert "no se pudo identificar al cliente" in result
+
+
+class FakePricingRepository:
+    """Repository double returning fixed variant prices."""
+
+    def get_variant_prices(self, variant_ids, skus, business_id=1):
+        return [
+            {"variant_id": 5, "sku": "MIEL-500", "name": "Miel 500g", "price": Decimal("12000.00"), "available": 10},
+            {"variant_id": 8, "sku": "CAFE-250", "name": "Café 250g", "price": Decimal("18500.00"), "available": 1},
+        ]
+
+
+def test_quote_order_prices_lines_discounts_and_tax(monkeypatch) -> None:
+    """Test an order is quoted in one call with IVA included in the prices."""
+    # Given
+    monkeypatch.setattr(order_tool, "PostgresOrderRepository", FakePricingRepository)
+    monkeypatch.setattr(order_tool, "get_business", lambda business_id: DEFAULT_BUSINESS)
+    monkeypatch.setattr(order_tool.settings, "iva_rate", "19")
+    monkeypatch.setattr(order_tool.settings, "prices_include_iva", True)
+    items = [
+        {"variant_id": 5, "quantity": 3, "discount_percent": 10},
+        {"sku": "CAFE-250", "quantity": 2},
+        {"sku": "NO-EXISTE", "quantity": 1},
+    ]
+    
+    # When
+    result = json.loads(order_tool.QuoteOrderTool().invoke({"items": items}))
+    
+    # Then
+    assert [line["total"] for line in result["lines"]] == ["32400", "37000"]
+    assert result["discount"] == "3600"
+    assert result["total"] == "69400"
+    assert result["tax"] == "11081"
+    assert result["lines"][1]["enough_stock"] is False
+    assert result["not_found"] == ["NO-EXISTE"]
+
+
+def test_quote_uses_business_tax_settings(monkeypatch) -> None:
+    """Test a business's own IVA settings override the deployment defaults."""
+    # Given
+    monkeypatch.setattr(order_tool.settings, "iva_rate", "19")
+    monkeypatch.setattr(order_tool.settings, "prices_include_iva", True)
+    business = Business(business_id=7, slug="panaderia", name="Panadería", iva_rate=Decimal("5"), prices_include_iva=False)
+    items = [order_tool.QuoteOrderItemInput(variant_id=5, quantity=1)]
+    variants = FakePricingRepository().get_variant_prices([5], [])
+    
+    # When
+    quote = order_tool.build_quote(items, variants, business)
+    
+    # Then
+    assert quote.tax_rate == Decimal("5")
+    assert quote.prices_include_tax is False
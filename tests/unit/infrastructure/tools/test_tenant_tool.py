@@ -0,0 +1,47 @@
+"""Unit tests for tenant scoping of Toolbox tools."""
+from typing import Any, Dict, List, Optional, Type
+
+from langchain.tools import BaseTool
+from pydantic import BaseModel, create_model
+
+from business_assistant.infrastructure.tools.tenant_tool import TenantScopedTool, scope_to_tenant
+
+QUERIES: List[Dict[str, Any]] = []
+
+
+class FakeToolboxTool(BaseTool):
+    """Toolbox tool double recording the parameters it would send."""
+
+    name: str = "search_available_variant_products"
+    description: str = "Busca productos"
+    args_schema: Type[BaseModel] = create_model("Search", product_search_term=(str, ...), business_id=(int, ...))
+    bound_business_id: Optional[int] = None
+
+    def _run(self, **kwargs: Any) -> str:
+        QUERIES.append({**kwargs, "business_id": self.bound_business_id})
+        return "[]"
+
+    def bind_param(self, name: str, value: Any, strict: bool = True) -> "FakeToolboxTool":
+        return FakeToolboxTool(
+            args_schema=create_model("BoundSearch", product_search_term=(str, ...)),
+            bound_business_id=value,
+        )
+
+
+def test_business_id_is_hidden_and_bound_from_config() -> None:
+    """Test the model never sees business_id and each call queries the turn's business."""
+    # Given
+    QUERIES.clear()
+    tool = scope_to_tenant([FakeToolboxTool()])[0]
+    
+    # When
+    tool.invoke({"product_search_term": "miel"}, config={"configurable": {"business_id": 7}})
+    tool.invoke({"product_search_term": "café"}, config={"configurable": {}})
+    
+    # Then
+    assert isinstance(tool, TenantScopedTool)
+    assert list(tool.args) == ["product_search_term"]
+    assert QUERIES == [
+        {"product_search_term": "miel", "business_id": 7},
+        {"product_search_term": "café", "business_id": 1},
+    ]
@@ -0,0 +1,94 @@
+"""Unit tests for chat admission control."""
+import asyncio
+
+import pytest
+
+from business_assistant.infrastructure.web.admission import (
+    REJECTED_QUEUE_FULL,
+    REJECTED_QUEUE_TIMEOUT,
+    AdmissionController,
+    AdmissionRejected,
+    TokenBucketLimiter,
+)
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_token_bucket_allows_burst_then_refills() -> None:
+    """Test a number can burst, is limited, and recovers at the configured rate."""
+    # Given
+    clock = FakeClock()
+    limiter = TokenBucketLimiter(rate=0.5, burst=2, clock=clock)
+    
+    # When
+    burst = [limiter.acquire("+573001112233")[0] for _ in range(2)]
+    allowed, retry_after = limiter.acquire("+573001112233")
+    other_number_allowed = limiter.acquire("+573004445566")[0]
+    clock.now = 2.0
+    allowed_after_refill = limiter.acquire("+573001112233")[0]
+    
+    # Then
+    assert burst == [True, True]
+    assert (allowed, retry_after) == (False, 2.0)
+    assert other_number_allowed
+    assert allowed_after_refill
+
+
+def test_admission_sheds_when_queue_is_full() -> None:
+    """Test requests beyond the concurrency limit queue and the overflow is rejected."""
+    # Given
+    controller = AdmissionController(max_concurrent=1, max_queue=1, queue_timeout=5)
+    release = asyncio.Event()
+    
+    async def hold_slot() -> None:
+        async with controller.admit():
+            await release.wait()
+    
+    async def scenario():
+        holder = asyncio.create_task(hold_slot())
+        await asyncio.sleep(0.01)
+        queued = asyncio.create_task(hold_slot())
+        await asyncio.sleep(0.01)
+        with pytest.raises(AdmissionRejected) as rejected:
+            async with controller.admit():
+                pass
+        waiting = controller.waiting
+        release.set()
+        await asyncio.gather(holder, queued)
+        return rejected.value, waiting
+    
+    # When
+    rejection, waiting = asyncio.run(scenario())
+    
+    # Then
+    assert rejection.reason == REJECTED_QUEUE_FULL
+    assert waiting == 1
+    assert controller.in_flight == 0
+
+
+def test_admission_rejects_after_queue_timeout() -> None:
+    """Test a queued request is shed with a Retry-After once its wait times out."""
+    # Given
+    controller = AdmissionController(max_concurrent=1, max_queue=5, queue_timeout=0.05)
+    
+    async def scenario():
+        async with controller.admit():
+            with pytest.raises(AdmissionRejected) as rejected:
+                async with controller.admit():
+                    pass
+        return rejected.value
+    
+    # When
+    rejection = asyncio.run(scenario())
+    
+    # Then
+    assert rejection.reason == REJECTED_QUEUE_TIMEOUT
+    assert int(rejection.retry_after_header) >= 1
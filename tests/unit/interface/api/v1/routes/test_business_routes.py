@@ -0,0 +1,44 @@
+"""Unit tests for the business (tenant) routes."""
+import pytest
+from fastapi.testclient import TestClient
+
+from business_assistant.config.settings import settings
+from business_assistant.infrastructure.services.business_registry import DEFAULT_BUSINESS
+from business_assistant.infrastructure.web.app import create_app
+from business_assistant.interface.api.v1.routes import business_routes
+
+BUSINESSES_URL = f"{settings.api_prefix}/businesses"
+
+
+class FakeBusinessRepository:
+    """Business repository double holding the default business."""
+
+    def list_businesses(self, limit, offset):
+        return [DEFAULT_BUSINESS]
+
+
+@pytest.fixture
+def client(monkeypatch) -> TestClient:
+    """Create a test client whose business repository is a double."""
+    monkeypatch.setattr(settings, "admin_api_token", "secret")
+    monkeypatch.setattr(business_routes, "PostgresBusinessRepository", FakeBusinessRepository)
+    return TestClient(create_app())
+
+
+def test_business_routes_require_the_admin_token(client):
+    # When a business is registered and the businesses are listed without the admin token
+    created = client.post(BUSINESSES_URL, json={"slug": "intruso", "name": "Intruso"})
+    listed = client.get(BUSINESSES_URL)
+
+    # Then no tenant is created and no profile is shown
+    assert created.status_code == 401
+    assert listed.status_code == 401
+
+
+def test_operator_lists_the_businesses(client):
+    # When the operator lists the businesses
+    response = client.get(BUSINESSES_URL, headers={"X-Admin-Token": "secret"})
+
+    # Then the registered businesses are returned
+    assert response.status_code == 200
+    assert [business["slug"] for business in response.json()] == [DEFAULT_BUSINESS.slug]
@@ -0,0 +1,44 @@
+"""Unit tests for the catalog import and export routes."""
+import pytest
+from fastapi.testclient import TestClient
+
+from business_assistant.config.settings import settings
+from business_assistant.infrastructure.web.app import create_app
+from business_assistant.interface.api.v1.routes import catalog_routes
+
+CATALOG_URL = f"{settings.api_prefix}/catalog"
+
+
+class FakeCatalogService:
+    """Catalog service double exporting one product."""
+
+    def stream_export(self, business_id):
+        yield "product_name,sku,price\n"
+        yield "Miel de abejas,MIEL-1,18000\n"
+
+
+@pytest.fixture
+def client(monkeypatch) -> TestClient:
+    """Create a test client whose catalog service is a double."""
+    monkeypatch.setattr(settings, "admin_api_token", "secret")
+    monkeypatch.setattr(catalog_routes, "CatalogService", FakeCatalogService)
+    return TestClient(create_app())
+
+
+def test_catalog_routes_require_the_admin_token(client):
+    # When the catalog is imported and exported without the admin token
+    imported = client.post(f"{CATALOG_URL}/import", content=b"product_name,sku,price\n")
+    exported = client.get(f"{CATALOG_URL}/export")
+
+    # Then nothing is loaded or dumped
+    assert imported.status_code == 401
+    assert exported.status_code == 401
+
+
+def test_operator_exports_the_catalog(client):
+    # When the operator exports the catalog
+    response = client.get(f"{CATALOG_URL}/export", headers={"X-Admin-Token": "secret"})
+
+    # Then the CSV is streamed
+    assert response.status_code == 200
+    assert "MIEL-1" in response.text
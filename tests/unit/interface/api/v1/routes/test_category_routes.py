@@ -0,0 +1,65 @@
+"""Unit tests for the category hierarchy routes."""
+import pytest
+from fastapi.testclient import TestClient
+
+from business_assistant.config.settings import settings
+from business_assistant.infrastructure.web.app import create_app
+from business_assistant.interface.api.v1.routes import category_routes
+
+CATEGORIES_URL = f"{settings.api_prefix}/categories"
+
+
+class FakeCategoryService:
+    """Category service double recording the edits it receives."""
+
+    edits = []
+
+    def __init__(self, business_id):
+        self.business_id = business_id
+
+    def browse(self, category_id, depth):
+        return {"category": None, "path": [], "subcategories": []}
+
+    def create_category(self, name, description, parent_id):
+        self.edits.append(("create", name))
+        return {"category_id": 9, "name": name, "description": description, "parent_id": parent_id}
+
+    def update_category(self, category_id, name, description, parent_id):
+        self.edits.append(("update", category_id))
+        return {"category_id": category_id, "name": name, "description": description, "parent_id": parent_id}
+
+    def delete_category(self, category_id):
+        self.edits.append(("delete", category_id))
+
+
+@pytest.fixture
+def client(monkeypatch) -> TestClient:
+    """Create a test client whose category service is a double."""
+    monkeypatch.setattr(settings, "admin_api_token", "secret")
+    monkeypatch.setattr(FakeCategoryService, "edits", [])
+    monkeypatch.setattr(category_routes, "CategoryService", FakeCategoryService)
+    return TestClient(create_app())
+
+
+def test_category_edits_require_the_admin_token(client):
+    # When categories are created, edited and deleted without the admin token
+    responses = [
+        client.post(CATEGORIES_URL, json={"name": "Ofertas"}),
+        client.put(f"{CATEGORIES_URL}/3", json={"name": "Ofertas"}),
+        client.delete(f"{CATEGORIES_URL}/3"),
+    ]
+
+    # Then every edit is rejected before reaching the service
+    assert [response.status_code for response in responses] == [401, 401, 401]
+    assert FakeCategoryService.edits == []
+
+
+def test_browsing_is_public_and_operators_edit(client):
+    # When a customer browses and the operator creates a category
+    browsed = client.get(CATEGORIES_URL)
+    created = client.post(CATEGORIES_URL, json={"name": "Ofertas"}, headers={"X-Admin-Token": "secret"})
+
+    # Then both are served
+    assert browsed.status_code == 200
+    assert created.status_code == 201
+    assert FakeCategoryService.edits == [("create", "Ofertas")]
@@ -0,0 +1,107 @@
+"""Unit tests for the batch chat routes."""
+import json
+
+import pytest
+from fastapi.testclient import TestClient
+
+from business_assistant.config.settings import settings
+from business_assistant.domain.exceptions import TurnProcessingError
+from business_assistant.domain.models.business import DEFAULT_BUSINESS_ID
+from business_assistant.infrastructure.messaging import BatchProcessor
+from business_assistant.infrastructure.services.business_registry import DEFAULT_BUSINESS
+from business_assistant.infrastructure.web import app as app_module
+from business_assistant.infrastructure.web.app import create_app
+from business_assistant.interface.api.v1.routes import chat_routes
+
+BATCH_URL = f"{settings.api_prefix}/chat/batch"
+ADMIN_HEADERS = {"X-Admin-Token": "secret"}
+
+
+class UnavailableChatService:
+    """Chat service double whose turns fail, answering with an apology unless asked to raise."""
+
+    def process_message(self, phone_number, user_message, business_id=None, raise_errors=False):
+        if raise_errors:
+            raise TurnProcessingError("ConnectionError: LLM provider unavailable")
+        return "Lo siento, se me presentó un error y no puedo responderte ahora."
+
+
+@pytest.fixture
+def client(monkeypatch) -> TestClient:
+    """Create an operator's test client whose batches are answered by an echo handler."""
+    monkeypatch.setattr(chat_routes, "get_business", lambda business_id=None: DEFAULT_BUSINESS)
+    monkeypatch.setattr(settings, "admin_api_token", "secret")
+    app = create_app()
+    app.state.batch_processor = BatchProcessor(lambda number, message, business_id: message.upper(), workers=2)
+    yield TestClient(app, headers=ADMIN_HEADERS)
+    app.state.batch_processor.shutdown()
+
+
+def test_batch_streams_results_as_ndjson(client):
+    # Given a batch of two messages
+    items = [
+        {"whatsapp_number": "+573000000001", "message": "hola"},
+        {"whatsapp_number": "+573000000002", "message": "precio"},
+    ]
+
+    # When it is sent with streaming
+    response = client.post(BATCH_URL, json={"items": items})
+
+    # Then the stream opens with the job, has one line per message and closes with the summary
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    assert lines[0] == {"type": "job", "job_id": response.headers["X-Batch-Job-Id"], "total": 2}
+    assert sorted(line["response"] for line in lines[1:-1]) == ["HOLA", "PRECIO"]
+    assert lines[-1]["type"] == "summary" and lines[-1]["completed"] == 2
+
+
+def test_batch_job_can_be_polled(client):
+    # Given a batch submitted without streaming
+    items = [{"whatsapp_number": "+573000000001", "message": "hola", "business_id": DEFAULT_BUSINESS_ID}]
+    job_id = client.post(BATCH_URL, json={"items": items, "stream": False}).json()["job_id"]
+
+    # When the job is read to the end and polled
+    client.get(f"{BATCH_URL}/{job_id}/stream")
+    response = client.get(f"{BATCH_URL}/{job_id}")
+
+    # Then it reports the finished result and the next offset
+    body = response.json()
+    assert body["status"] == "done"
+    assert body["results"][0]["response"] == "HOLA"
+    assert body["next_offset"] == 1
+
+
+def test_batch_rejects_invalid_numbers(client):
+    # When a batch has a malformed number
+    response = client.post(BATCH_URL, json={"items": [{"whatsapp_number": "573000000001", "message": "hola"}]})
+
+    # Then nothing is queued
+    assert response.status_code == 400
+
+
+def test_batch_requires_the_admin_token(client):
+    # Given a batch
+    items = [{"whatsapp_number": "+573000000001", "message": "hola"}]
+
+    # When it is sent without the admin token or with a wrong one
+    anonymous = client.post(BATCH_URL, json={"items": items}, headers={"X-Admin-Token": ""})
+    wrong = client.post(BATCH_URL, json={"items": items}, headers={"X-Admin-Token": "wrong"})
+
+    # Then it is rejected before anything is queued
+    assert anonymous.status_code == 401
+    assert wrong.status_code == 401
+
+
+def test_failed_turns_are_reported_as_failed(client, monkeypatch):
+    # Given the application's batch handler with an agent that fails
+    monkeypatch.setattr(app_module, "ChatService", UnavailableChatService)
+    client.app.state.batch_processor.handler = app_module.process_inbound_message
+
+    # When a batch is sent
+    response = client.post(BATCH_URL, json={"items": [{"whatsapp_number": "+573000000001", "message": "hola"}]})
+
+    # Then the item fails instead of carrying the apology as its answer
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert lines[1]["status"] == "failed" and lines[1]["response"] is None
+    assert "LLM provider unavailable" in lines[1]["error"]
+    assert lines[-1]["failed"] == 1
@@ -0,0 +1,41 @@
+"""Unit tests for the admin profiler routes."""
+import pytest
+from fastapi.testclient import TestClient
+
+from business_assistant.config.settings import settings
+from business_assistant.infrastructure.web.app import create_app
+
+PROFILER_URL = f"{settings.api_prefix}/admin/profiler"
+
+
+@pytest.fixture
+def client() -> TestClient:
+    """Create a test client fixture."""
+    return TestClient(create_app())
+
+
+def test_admin_routes_are_hidden_without_a_configured_token(client, monkeypatch):
+    # Given no admin token configured
+    monkeypatch.setattr(settings, "admin_api_token", "")
+
+    # When the profiler status is requested
+    response = client.get(PROFILER_URL, headers={"X-Admin-Token": "anything"})
+
+    # Then the route does not exist
+    assert response.status_code == 404
+
+
+def test_cpu_profile_requires_the_admin_token(client, monkeypatch):
+    # Given a configured admin token
+    monkeypatch.setattr(settings, "admin_api_token", "secret")
+
+    # When a profile is started with a wrong token and then with the right one
+    rejected = client.post(f"{PROFILER_URL}/cpu/start", headers={"X-Admin-Token": "wrong"})
+    started = client.post(f"{PROFILER_URL}/cpu/start?seconds=0.05", headers={"X-Admin-Token": "secret"})
+    stopped = client.post(f"{PROFILER_URL}/cpu/stop?format=collapsed", headers={"X-Admin-Token": "secret"})
+
+    # Then only the authenticated calls are served and the stacks come back collapsed
+    assert rejected.status_code == 401
+    assert started.status_code == 202
+    assert stopped.status_code == 200
+    assert stopped.headers["content-type"].startswith("text/plain")
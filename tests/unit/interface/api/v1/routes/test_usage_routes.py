@@ -0,0 +1,46 @@
+"""Unit tests for the usage and cost routes."""
+import pytest
+from fastapi.testclient import TestClient
+
+from business_assistant.config.settings import settings
+from business_assistant.infrastructure.web.app import create_app
+from business_assistant.interface.api.v1.routes import usage_routes
+
+USAGE_URL = f"{settings.api_prefix}/usage"
+
+
+class FakeUsageRepository:
+    """Usage repository double with one expensive conversation."""
+
+    def cost_by_conversation(self, since, business_id, limit):
+        return [{
+            "thread_id": "1:+573001112233",
+            "whatsapp_number": "+573001112233",
+            "turns": 3,
+            "first_turn_at": since,
+            "last_turn_at": since,
+            "llm_calls": 4,
+            "prompt_tokens": 1200,
+            "completion_tokens": 300,
+            "cached_tokens": 0,
+            "cost": "0.0042",
+        }]
+
+
+@pytest.fixture
+def client(monkeypatch) -> TestClient:
+    """Create a test client reading a fake usage ledger."""
+    monkeypatch.setattr(settings, "admin_api_token", "secret")
+    monkeypatch.setattr(usage_routes, "PostgresUsageRepository", FakeUsageRepository)
+    return TestClient(create_app())
+
+
+def test_usage_requires_the_admin_token(client):
+    # When the conversations are listed without and with the admin token
+    rejected = client.get(f"{USAGE_URL}/conversations")
+    served = client.get(f"{USAGE_URL}/conversations", headers={"X-Admin-Token": "secret"})
+
+    # Then the customers' numbers are only shown to the operator
+    assert rejected.status_code == 401
+    assert served.status_code == 200
+    assert served.json()[0]["whatsapp_number"] == "+573001112233"
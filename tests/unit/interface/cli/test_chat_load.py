@@ -0,0 +1,57 @@
+"""Unit tests for the scripted chat load generator."""
+import asyncio
+import json
+
+import httpx
+
+from business_assistant.interface.cli.chat_load import LoadRunner, parse_conversations, percentile
+
+
+def test_text_script_splits_conversations_on_blank_lines():
+    # Given a text script with two conversations and a comment
+    script = "# saludo\nHola\n¿Qué venden?\n\n\nLa 2\nGracias\n"
+
+    # When it is parsed
+    conversations = parse_conversations(script, "text")
+
+    # Then each block is one conversation in order
+    assert [c.messages for c in conversations] == [["Hola", "¿Qué venden?"], ["La 2", "Gracias"]]
+
+
+def test_percentile_uses_nearest_rank():
+    # Given latencies from 1 to 100
+    ordered = [float(i) for i in range(1, 101)]
+
+    # Then the percentiles are the ranked values
+    assert percentile(ordered, 50) == 50.0
+    assert percentile(ordered, 99) == 99.0
+    assert percentile([], 95) == 0.0
+
+
+def test_customers_send_their_messages_in_order_and_errors_are_counted():
+    # Given a server that fails one specific message
+    received = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        payload = json.loads(request.content)
+        received.append((payload["whatsapp_number"], payload["message"]))
+        if payload["message"] == "falla":
+            return httpx.Response(503)
+        return httpx.Response(200, json={"response": "ok"})
+
+    conversations = parse_conversations('{"messages": ["a", "b", "c"]}\n["x", "falla"]\n', "jsonl")
+    runner = LoadRunner(
+        "http://test/chat/message", conversations, users=4, iterations=2, transport=httpx.MockTransport(handler)
+    )
+
+    # When four customers run two conversations each
+    report = asyncio.run(runner.run())
+
+    # Then every message was sent, each customer in script order, and the failures are counted
+    summary = report.summary()
+    assert summary["requests"] == 20
+    assert summary["conversations"] == 8
+    assert summary["errors"] == {"503": 4}
+    assert summary["error_rate"] == 0.2
+    first_customer = [message for number, message in received if number == "+573000000000"]
+    assert first_customer == ["a", "b", "c", "x", "falla"]